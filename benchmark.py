@@ -0,0 +1,77 @@
+import time
+from generator.generator import Generator
+from converter.encode import ORDERINGS, SIZE_LIMIT
+from converter.encode import compress_instances
+
+# Compares compressed slab size of every instance ordering on generated
+# worlds. Requires asset database, run firstTimeSetup.py first.
+
+# Size per tile
+x, y, z = 30, 30, 30
+
+# How many consequitive tiles will be generated
+xTiles, yTiles = 3, 3
+
+seeds = [1269, 2022, 4242]
+
+terrainAssets = [
+    {  # Grass - Lush
+        "asset": "01c3a210-94fb-449f-8c47-993eda3e7126",
+        "density": 10
+    },
+    {  # Grass - Sparse
+        "asset": "3911d10d-142b-4f33-9fea-5d3a10c53781",
+        "density": 90
+    },
+]
+
+placeObjects = [
+    {  # Fern 02
+        "asset": "98259887-53c2-41d4-a54f-6140b6acf020",
+        "density": 30,
+        "clumping": 3,
+        "randomNoiseWeight": 0.5,
+        "randomNudgeEnabled": True,
+        "randomRotationEnabled": True,
+    },
+]
+
+results = {ordering: [0, 0, 0.0] for ordering in ORDERINGS}
+rawSize = 0
+instanceCount = 0
+
+for seed in seeds:
+    generator = Generator()
+    generator.setXYZ(x, y, z)
+    generator.setSeed(seed)
+    generator.setOctaves(1, 0.5, 0.25)
+    generator.setScales(1, 2, 4)
+    generator.setUsePreciseHeight(True)
+    generator.pregenerate(terrainAssets, placeObjects, [xTiles, yTiles])
+
+    for tileX in range(xTiles):
+        for tileY in range(yTiles):
+            instances = generator.populatePart(
+                generator.terrainSettings,
+                generator.placeObjects,
+                [tileX * x, tileY * y]
+            )
+            instanceCount += len(instances)
+            rawSize += len(instances) * 8
+
+            for ordering in ORDERINGS:
+                start = time.perf_counter()
+                compressed = compress_instances(instances, ordering)
+                results[ordering][2] += time.perf_counter() - start
+                results[ordering][0] += len(compressed)
+                results[ordering][1] += len(compressed) > SIZE_LIMIT
+
+slabCount = len(seeds) * xTiles * yTiles
+print(f"{slabCount} slabs, {instanceCount} instances, "
+      f"{rawSize} bytes of positions")
+print(f"{'ordering':<10}{'bytes':>10}{'ratio':>8}{'B/inst':>8}"
+      f"{'> limit':>9}{'ms':>8}")
+for ordering, (size, overLimit, duration) in results.items():
+    print(f"{ordering:<10}{size:>10}{rawSize / size:>8.2f}"
+          f"{size / instanceCount:>8.2f}{overLimit:>9}"
+          f"{duration * 1000:>8.1f}")
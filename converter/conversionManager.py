@@ -1,5 +1,6 @@
-from .encode import encode
-from .decode import decode
+from .encode import encode, encode_instances, encode_instances_batch
+from .encode import try_encode_instances, DEFAULT_ORDERING, SIZE_LIMIT
+from .decode import decode, iter_decode, iter_decode_batches
 
 
 class ConversionManager():
@@ -21,15 +22,97 @@ class ConversionManager():
 
         return decode(data)
 
+    def iterDecode(data):
+        """
+        Function to decode TaleSpire string instance by instance, without
+        creating the whole dictionary
+
+        Parameters:
+            data (str): TaleSpire string
+
+        Returns:
+            iterator: (uuid, x, y, z, rot) for each instance
+        """
+
+        return iter_decode(data)
+
+    def iterDecodeBatches(data, batchSize=None):
+        """
+        Function to decode TaleSpire string in batches of instances,
+        without creating the whole dictionary
+
+        Parameters:
+            data (str): TaleSpire string
+            batchSize (int): maximum amount of instances in a batch
+
+        Returns:
+            iterator: uuid and array with rows x, y, z and rot for each batch
+        """
+
+        if batchSize is None:
+            return iter_decode_batches(data)
+        return iter_decode_batches(data, batchSize)
+
     def encode(data):
         """
-        Function to encode dictionary into TaleSpire readable string
+        Function to encode JSON string into TaleSpire readable string
 
         Parameters:
-            data (dict): dictionary to be encoded
+            data (str): JSON string of the dictionary to be encoded
 
         Returns:
             str: TaleSpire readable string
         """
 
         return encode(data)
+
+    def encodeInstances(data, ordering=DEFAULT_ORDERING):
+        """
+        Function to encode placed instances into TaleSpire readable string,
+        without a round-trip through JSON
+
+        Parameters:
+            data (InstanceBuffer, dict): instances to be encoded
+            ordering (str): order of instances inside each asset,
+                            "none", "sorted" or "morton"
+
+        Returns:
+            str: TaleSpire readable string
+        """
+
+        return encode_instances(data, ordering)
+
+    def encodeInstancesBatch(data, workers=None, ordering=DEFAULT_ORDERING):
+        """
+        Function to encode placed instances of many slabs concurrently
+
+        Parameters:
+            data (list): InstanceBuffer or dict for each slab
+            workers (int): amount of threads, None for one per core
+            ordering (str): order of instances inside each asset,
+                            "none", "sorted" or "morton"
+
+        Returns:
+            list: TaleSpire readable string for each slab
+        """
+
+        return encode_instances_batch(data, workers, ordering)
+
+    def tryEncodeInstances(data, sizeLimit=SIZE_LIMIT,
+                           ordering=DEFAULT_ORDERING):
+        """
+        Function to encode placed instances into TaleSpire readable string,
+        only if they fit into a size limit
+
+        Parameters:
+            data (InstanceBuffer, dict): instances to be encoded
+            sizeLimit (int): maximum size of compressed slab in bytes
+            ordering (str): order of instances inside each asset,
+                            "none", "sorted" or "morton"
+
+        Returns:
+            str: TaleSpire readable string
+            None: If slab exceeds the size limit
+        """
+
+        return try_encode_instances(data, sizeLimit, ordering)
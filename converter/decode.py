@@ -1,9 +1,14 @@
 import base64
 import gzip
+import zlib
+import numpy
 from struct import unpack_from, unpack
 
 LEL = 20  # list_entry_length
 PEL = 8  # position_entry_length
+HEADER_LENGTH = 10
+CHUNK_SIZE = 65536  # base64 characters read at once, multiple of 4
+BATCH_SIZE = 4096  # positions decoded at once when streaming
 
 
 def assemble_bytes(bytes):
@@ -48,6 +53,40 @@ def decode_asset(asset_data):
     }
 
 
+def decode_asset_positions(asset_position_data, instance_count):
+    """
+    Function that decodes all asset positions of a slab at once.
+
+    Parameters:
+        asset_position_data (memoryview): containing asset position bytes
+        instance_count (int): amount of positions to decode
+
+    Returns:
+        array: X, Y, Z and rotation rows with a column for each position
+    """
+    # data is stored as little endian 64 bit integers
+    # 2 bit pad,
+    # 8 bit rot, 2 bit pad,
+    # 16 bit y, 2 bit pad,
+    # 16 bit z, 2 bit pad,
+    # 16 bit x
+    position_blob = numpy.frombuffer(
+        asset_position_data,
+        dtype='<u8',
+        count=instance_count
+    ).astype(numpy.uint64)
+
+    # x, y and z are 16bit, rot is 8 bit.
+    # All have 2 bit padding between each other.
+    mask = numpy.uint64(0xFFFF)
+    return numpy.array([
+        position_blob & mask,  # isolate lowest 16 bits (x position)
+        (position_blob >> numpy.uint64(36)) & mask,  # y position
+        (position_blob >> numpy.uint64(18)) & mask,  # z position
+        (position_blob >> numpy.uint64(54)) * numpy.uint64(15)  # rotation
+    ], dtype=numpy.int64)
+
+
 def decode_asset_position(
     asset_position_data,
     assets,
@@ -58,40 +97,26 @@ def decode_asset_position(
     this position belongs to (index from asset list) as well as the position
 
     Parameters:
-        asset_position_data (str): containing asset header bytes
+        asset_position_data (str): containing asset position bytes
         assets (dict): dictionary of asset and its positions
         dec_asset_count (int): instance count
 
     Returns:
-        dict: decoded asset header
+        tuple: index of the asset and decoded position
     """
-    # decode position from blob passed on
-    # unpack as little endian. data is stored as
-    # 2 bit pad,
-    # 8 bit rot, 2 bit pad,
-    # 16 bit y, 2 bit pad,
-    # 16 bit z, 2 bit pad,
-    # 16 bit x
-    position_blob = unpack("<Q", asset_position_data)[0]
-    # x, y and z are 16bit, rot is 8 bit.
-    # All have 2 bit padding between each other.
-    x = position_blob & 0xFFFF  # isolate lowest 16 bits (x position)
-    y = (position_blob >> 36) & 0xFFFF  # shift the x and z coord 4 bit padding
-    z = (position_blob >> 18) & 0xFFFF  # shift the x coord 2 bit padding
-    rot = position_blob >> 54  # shift x, y and z coord 6 padding to get rot
 
-    # figure out which asset this position actually belongs to and store it
+    x, y, z, rot = decode_asset_positions(asset_position_data, 1)[:, 0]
+
+    # figure out which asset this position actually belongs to
     sub_total = 0
     for i, asset in enumerate(assets['asset_data']):
         sub_total += asset['instance_count']
-        # check if the currently iterated through asset in the asset list
-        # is the one we are currently decoding the pos of
         if (dec_asset_count < sub_total):
             return (i, {
-                "x": x,
-                "y": y,
-                "z": z,
-                "rot": rot*15
+                "x": int(x),
+                "y": int(y),
+                "z": int(z),
+                "rot": int(rot)
             })
 
 
@@ -116,7 +141,7 @@ def decode(data):
     slab_compressed_data = base64.b64decode(base64_bytes)
 
     # decompress gzip
-    slab_data = gzip.decompress(slab_compressed_data)
+    slab_data = memoryview(gzip.decompress(slab_compressed_data))
 
     header = slab_data[:10]
     out_json["unique_asset_count"] = unpack("I", header[6:])[0]
@@ -129,15 +154,121 @@ def decode(data):
         asset_data = decode_asset(asset_list[i * LEL: (i+1) * LEL])
         out_json["asset_data"].append(asset_data)
 
-    # decode asset positions
-    asset_count = 0
-    while(len(asset_position_list[asset_count*PEL:]) > PEL):
-        position = decode_asset_position(
-            asset_position_list[asset_count * PEL: (asset_count+1) * PEL],
-            out_json,
-            asset_count
-            )
-        out_json["asset_data"][position[0]]["instances"].append(position[1])
-        asset_count += 1
+    # decode asset positions, they are stored in the order of asset list
+    instance_counts = [
+        asset["instance_count"] for asset in out_json["asset_data"]
+    ]
+    positions = decode_asset_positions(
+        asset_position_list,
+        sum(instance_counts)
+    )
+    boundaries = numpy.cumsum([0] + instance_counts)
+
+    for i, asset in enumerate(out_json["asset_data"]):
+        columns = positions[:, boundaries[i]:boundaries[i+1]].tolist()
+        asset["instances"] = [
+            {"x": x, "y": y, "z": z, "rot": rot}
+            for x, y, z, rot in zip(*columns)
+        ]
 
     return out_json
+
+
+def decompress_chunks(data, chunk_size=CHUNK_SIZE):
+    """
+    Function that decodes and decompresses TaleSpire string piece by piece
+
+    Parameters:
+        data (str): TaleSpire string
+        chunk_size (int): maximum size of a piece
+
+    Returns:
+        iterator: decompressed slab bytes
+    """
+
+    encoded = data.strip().strip('`')
+    # gzip container
+    decompressor = zlib.decompressobj(wbits=16 + zlib.MAX_WBITS)
+
+    for start in range(0, len(encoded), chunk_size):
+        compressed = base64.b64decode(encoded[start:start + chunk_size])
+        while compressed:
+            yield decompressor.decompress(compressed, chunk_size)
+            compressed = decompressor.unconsumed_tail
+
+    yield decompressor.flush()
+
+
+def read_bytes(buffer, chunks, length):
+    """
+    Function that reads bytes from a stream of decompressed chunks
+
+    Parameters:
+        buffer (bytearray): bytes read from chunks, but not yet used
+        chunks (iterator): decompressed slab bytes
+        length (int): amount of bytes to read
+
+    Returns:
+        bytes: read bytes
+    """
+
+    while len(buffer) < length:
+        chunk = next(chunks, None)
+        if chunk is None:
+            raise ValueError("TaleSpire string ended unexpectedly")
+        buffer += chunk
+
+    data = bytes(buffer[:length])
+    del buffer[:length]
+    return data
+
+
+def iter_decode_batches(data, batch_size=BATCH_SIZE):
+    """
+    Function that decodes given TaleSpire string batch by batch, without
+    decoding the whole slab into memory
+
+    Parameters:
+        data (str): TaleSpire string
+        batch_size (int): maximum amount of positions in a batch
+
+    Returns:
+        iterator: asset uuid and array of X, Y, Z and rotation rows
+    """
+
+    chunks = decompress_chunks(data)
+    buffer = bytearray()
+
+    header = read_bytes(buffer, chunks, HEADER_LENGTH)
+    unique_asset_count = unpack("I", header[6:])[0]
+    assets = [
+        decode_asset(read_bytes(buffer, chunks, LEL))
+        for _ in range(unique_asset_count)
+    ]
+
+    for asset in assets:
+        remaining = asset["instance_count"]
+        while remaining > 0:
+            count = min(batch_size, remaining)
+            yield asset["uuid"], decode_asset_positions(
+                read_bytes(buffer, chunks, count * PEL),
+                count
+            )
+            remaining -= count
+
+
+def iter_decode(data):
+    """
+    Function that decodes given TaleSpire string instance by instance,
+    without decoding the whole slab into memory
+
+    Parameters:
+        data (str): TaleSpire string
+
+    Returns:
+        iterator: asset uuid, X, Y, Z and rotation of each instance
+    """
+
+    for uuid, positions in iter_decode_batches(data):
+        for x, y, z, rot in zip(*positions.tolist()):
+            yield uuid, x, y, z, rot
@@ -1,14 +1,24 @@
 import base64
-import gzip
 import json
+import struct
+import zlib
+import numpy
+from concurrent.futures import ThreadPoolExecutor
 from utils import *
+from config.config import config as Config
+from .instanceBuffer import InstanceBuffer
 
 HEADER = b'\xCE\xFA\xCE\xD1\x02\x00'
 PADDING = b'\x00\x00'
+ASSET_LENGTH = 20
+# gzip magic, deflate, no flags, mtime 0, best compression, unknown OS
+GZIP_HEADER = struct.pack("<BBBBLBB", 0x1F, 0x8B, 8, 0, 0, 2, 255)
+SIZE_LIMIT = 30720
 
-class FakeTime:
-    def time(self):
-        return 0
+ORDERINGS = ("none", "sorted", "morton")
+DEFAULT_ORDERING = Config.get('converter', 'ordering')
+BYTES_PER_INSTANCE = float(Config.get('converter', 'bytes_per_instance'))
+POSITION_LENGTH = 8
 
 def create_header(unique_asset_count):
     """
@@ -26,51 +36,189 @@ def create_header(unique_asset_count):
 
 def encode(data):
     """
-    Function to encode a dictionary to a TaleSpire readable format.
+    Function to encode a JSON string to a TaleSpire readable format.
 
     Parameters:
-        data (dict): containing each assets uuid and their position
+        data (str): JSON containing each assets uuid and their position
 
     Returns:
         str: encoded dictionary
     """
 
-    slab_data = b''
-    slab_json = json.loads(data)
-    slab_json['unique_asset_count'] = len(slab_json['asset_data'])
+    return encode_instances(json.loads(data))
 
-    for asset in slab_json['asset_data'].items():
-        asset[1]['instance_count'] = len(asset[1]['instances'])
 
-    slab_data += create_header(len(slab_json['asset_data']))
-    asset_data = create_assets_data(slab_json['asset_data'], )
-    slab_data += asset_data[0] + asset_data[1] + PADDING
+def encode_instances(data, ordering=DEFAULT_ORDERING):
+    """
+    Function to encode placed instances to a TaleSpire readable format,
+    without serializing them to JSON first.
+
+    Parameters:
+        data (InstanceBuffer, dict): containing each assets uuid and
+                                     their position
+        ordering (str): order of instances inside each asset, one of
+                        ORDERINGS
 
-    gzip.time = FakeTime()
-    slab_compressed_data = gzip.compress(slab_data, compresslevel=9)
+    Returns:
+        str: encoded instances
+    """
 
-    if (len(slab_compressed_data) > 30720):
+    slab_compressed_data = compress_instances(data, ordering)
+
+    if (len(slab_compressed_data) > SIZE_LIMIT):
         print(f"""Slab exceeds TaleSpire size limit of 30720B binary data!
         Aborting. ({len(slab_compressed_data)} bytes)""")
         return b'``````'
 
+    return wrap_compressed(slab_compressed_data)
+
+
+def try_encode_instances(data, size_limit=SIZE_LIMIT,
+                         ordering=DEFAULT_ORDERING):
+    """
+    Function to encode placed instances, if they fit into a size limit.
+
+    Parameters:
+        data (InstanceBuffer, dict): containing each assets uuid and
+                                     their position
+        size_limit (int): maximum size of compressed slab binary data
+        ordering (str): order of instances inside each asset, one of
+                        ORDERINGS
+
+    Returns:
+        str: encoded instances
+        None: If compressed instances exceed size limit
+    """
+
+    slab_compressed_data = compress_instances(data, ordering)
+
+    if (len(slab_compressed_data) > size_limit):
+        return None
+
+    return wrap_compressed(slab_compressed_data)
+
+
+def wrap_compressed(slab_compressed_data):
+    """
+    Function to turn compressed slab binary data into TaleSpire string.
+
+    Parameters:
+        slab_compressed_data (bytes): gzip compressed slab binary data
+
+    Returns:
+        str: TaleSpire readable string
+    """
+
     base64_bytes = base64.b64encode(slab_compressed_data)
 
     return b'```' + base64_bytes + b'```'
 
 
-def encode_asset(asset_json):
+def compress_instances(data, ordering=DEFAULT_ORDERING):
     """
-    Function to encode an asset header.
+    Function to create compressed slab binary data of placed instances.
 
     Parameters:
-        asset_json (dict): containing each assets uuid and their instance count
+        data (InstanceBuffer, dict): containing each assets uuid and
+                                     their position
+        ordering (str): order of instances inside each asset, one of
+                        ORDERINGS
 
     Returns:
-        str: encoded asset uuid and instance count
+        bytes: gzip compressed slab binary data
+    """
+
+    if isinstance(data, InstanceBuffer):
+        assets = [
+            (uuid, instances[0], instances[1], instances[2], instances[3])
+            for uuid, instances in data.items()
+        ]
+    else:
+        assets = [
+            (asset['uuid'], *get_instance_columns(asset['instances']))
+            for asset in data['asset_data'].values()
+        ]
+
+    return gzip_compress(create_slab_data(assets, ordering))
+
+
+def estimate_compressed_size(asset_count, instance_count):
     """
+    Function to predict compressed size of a slab without encoding it.
+    Random rotations and nudges make positions compress poorly, so size
+    grows about linearly with instance count.
 
-    uuid_parts = asset_json['uuid'].split("-")
+    Parameters:
+        asset_count (int): amount of unique assets
+        instance_count (int): amount of instances
+
+    Returns:
+        float: predicted size of compressed slab binary data in bytes
+    """
+
+    return (
+        len(GZIP_HEADER) + 8
+        + len(HEADER) + 4 + len(PADDING)
+        + asset_count * ASSET_LENGTH
+        + instance_count * BYTES_PER_INSTANCE
+    )
+
+
+def gzip_compress(data):
+    """
+    Function to compress data into a gzip container with a fixed header,
+    so the same data always gives the same bytes.
+
+    Parameters:
+        data (bytes): data to be compressed
+
+    Returns:
+        bytes: gzip compressed data
+    """
+
+    trailer = struct.pack("<LL", zlib.crc32(data), len(data) & 0xFFFFFFFF)
+    # Negative wbits creates a raw deflate stream without zlib header
+    return GZIP_HEADER + zlib.compress(data, 9, wbits=-15) + trailer
+
+
+def encode_instances_batch(data, workers=None, ordering=DEFAULT_ORDERING):
+    """
+    Function to encode placed instances of many slabs concurrently.
+    Compression releases the GIL, so threads use every core.
+
+    Parameters:
+        data (list): InstanceBuffer or dict for each slab
+        workers (int): amount of threads, None for one per core
+        ordering (str): order of instances inside each asset, one of
+                        ORDERINGS
+
+    Returns:
+        list: encoded instances for each slab, in the same order
+    """
+
+    if workers == 1:
+        return [encode_instances(slab, ordering) for slab in data]
+
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        return list(executor.map(
+            encode_instances,
+            data,
+            [ordering] * len(data)
+        ))
+
+
+def encode_uuid(uuid):
+    """
+    Function to encode an asset uuid.
+
+    Parameters:
+        uuid (str): asset uuid
+
+    Returns:
+        str: encoded asset uuid
+    """
+
+    uuid_parts = uuid.split("-")
 
     uuid_bytes = b''
     uuid_bytes += int(uuid_parts[0], 16).to_bytes(4, byteorder='little')
@@ -79,10 +227,80 @@ def encode_asset(asset_json):
     uuid_bytes += int(uuid_parts[3], 16).to_bytes(2, byteorder='big')
     uuid_bytes += int(uuid_parts[4], 16).to_bytes(6, byteorder='big')
 
-    return uuid_bytes + asset_json['instance_count'].to_bytes(
-        4,
-        byteorder='little'
-    )
+    return uuid_bytes
+
+
+def encode_asset(asset_json):
+    """
+    Function to encode an asset header.
+
+    Parameters:
+        asset_json (dict): containing each assets uuid and their instance count
+
+    Returns:
+        str: encoded asset uuid and instance count
+    """
+
+    return encode_uuid(asset_json['uuid']) + asset_json[
+        'instance_count'
+    ].to_bytes(4, byteorder='little')
+
+
+def get_instance_columns(instances_json):
+    """
+    Function to split a list of instances into columns.
+
+    Parameters:
+        instances_json (list): containing each position and rotation
+
+    Returns:
+        list: X, Y, Z and rotation arrays
+    """
+
+    if len(instances_json) == 0:
+        return [numpy.zeros(0) for _ in range(4)]
+
+    return list(numpy.array(
+        [
+            (instance['x'], instance['y'], instance['z'], instance['rot'])
+            for instance in instances_json
+        ],
+        dtype=numpy.float64
+    ).T)
+
+
+def pack_positions(x, y, z, rot):
+    """
+    Function to pack positions and rotations into 64 bit integers.
+    Coordinates are truncated like int() does.
+
+    Parameters:
+        x (array): X coordinates multiplied by 100
+        y (array): Y coordinates multiplied by 100
+        z (array): Z coordinates multiplied by 100
+        rot (array): rotations in degrees
+
+    Returns:
+        array: packed positions as little endian unsigned 64 bit integers
+    """
+
+    fields = numpy.trunc(numpy.array([
+        numpy.asarray(x, dtype=numpy.float64),
+        numpy.asarray(y, dtype=numpy.float64),
+        numpy.asarray(z, dtype=numpy.float64),
+        numpy.asarray(rot, dtype=numpy.float64) / 15
+    ], dtype=numpy.float64))
+
+    if numpy.any(fields < 0):
+        raise OverflowError("Negative positions can not be encoded")
+
+    fields = fields.astype(numpy.uint64)
+    position = fields[0].copy()
+    position |= fields[1] << numpy.uint64(36)
+    position |= fields[2] << numpy.uint64(18)
+    position |= fields[3] << numpy.uint64(54)
+
+    return position.astype('<u8', copy=False)
 
 
 def encode_asset_position(instance_json):
@@ -96,18 +314,116 @@ def encode_asset_position(instance_json):
         str: encoded position data
     """
 
-    position = 0
-    position |= int(instance_json['x'])
-    position |= (int(instance_json['y']) << 36)
-    position |= (int(instance_json['z']) << 18)
-    position |= (int(instance_json['rot']/15) << 54)
+    return pack_positions(
+        [instance_json['x']],
+        [instance_json['y']],
+        [instance_json['z']],
+        [instance_json['rot']]
+    ).tobytes()
 
-    return position.to_bytes(8, byteorder='little')
+
+def spread_bits(values):
+    """
+    Function to spread bits of values, so that two zero bits are between
+    each original bit. Used for interleaving three coordinates.
+
+    Parameters:
+        values (array): unsigned integers up to 21 bits
+
+    Returns:
+        array: values with spread bits
+    """
+
+    values = values & numpy.uint64(0x1FFFFF)
+    for shift, mask in (
+        (32, 0x1F00000000FFFF),
+        (16, 0x1F0000FF0000FF),
+        (8, 0x100F00F00F00F00F),
+        (4, 0x10C30C30C30C30C3),
+        (2, 0x1249249249249249)
+    ):
+        values = (values | (values << numpy.uint64(shift))) \
+            & numpy.uint64(mask)
+
+    return values
+
+
+def order_positions(positions, ordering=DEFAULT_ORDERING):
+    """
+    Function to reorder packed positions of one asset, so that gzip finds
+    longer repeats. Order of instances does not change the pasted slab.
+    "none" keeps the order in which instances were placed, "sorted"
+    sorts packed positions, so that neighbors differ by small deltas,
+    "morton" sorts by Z-order curve, so that neighbors are close in space.
+
+    Parameters:
+        positions (array): packed positions
+        ordering (str): one of ORDERINGS
+
+    Returns:
+        array: reordered packed positions
+    """
+
+    if ordering == "none":
+        return positions
+    if ordering == "sorted":
+        return numpy.sort(positions, kind="stable")
+    if ordering == "morton":
+        mask = numpy.uint64(0x3FFFF)
+        key = spread_bits(positions & mask)  # x
+        key |= spread_bits((positions >> numpy.uint64(36)) & mask) \
+            << numpy.uint64(1)  # y
+        key |= spread_bits((positions >> numpy.uint64(18)) & mask) \
+            << numpy.uint64(2)  # z
+        return positions[numpy.argsort(key, kind="stable")]
+
+    raise ValueError(f"Unknown instance ordering '{ordering}'")
+
+
+def create_slab_data(assets, ordering=DEFAULT_ORDERING):
+    """
+    Function to encode a list of assets and their positions into slab
+    binary data, including header and padding.
+
+    Parameters:
+        assets (list): uuid and X, Y, Z and rotation arrays for each asset
+        ordering (str): order of instances inside each asset, one of
+                        ORDERINGS
+
+    Returns:
+        bytearray: slab binary data
+    """
+
+    instance_count = sum(len(asset[1]) for asset in assets)
+    asset_start = len(HEADER) + 4
+    position_start = asset_start + len(assets) * ASSET_LENGTH
+    position_end = position_start + instance_count * POSITION_LENGTH
+
+    slab_data = bytearray(position_end + len(PADDING))
+    slab_data[:asset_start] = create_header(len(assets))
+
+    positions = []
+    for index, (uuid, x, y, z, rot) in enumerate(assets):
+        start = asset_start + index * ASSET_LENGTH
+        slab_data[start:start + ASSET_LENGTH] = encode_uuid(uuid) + len(
+            x
+        ).to_bytes(4, byteorder='little')
+        positions.append(
+            order_positions(pack_positions(x, y, z, rot), ordering)
+        )
+
+    if instance_count > 0:
+        slab_data[position_start:position_end] = numpy.concatenate(
+            positions
+        ).tobytes()
+
+    return slab_data
 
 
 def create_assets_data(assets_json):
     """
-    Function to encode a list of assets and their positions.
+    Function to encode a list of assets and their positions,
+    in the order the instances were placed.
 
     Parameters:
         assets_json (dict): containing each asset list and their positions
@@ -117,12 +433,12 @@ def create_assets_data(assets_json):
         str: encoded asset position list
     """
 
-    asset_list = b''
-    position_list = b''
-
-    for asset in assets_json.items():
-        asset_list += encode_asset(asset[1])
-        for instance in asset[1]['instances']:
-            position_list += encode_asset_position(instance)
+    asset_list = b''.join(
+        encode_asset(asset) for asset in assets_json.values()
+    )
+    position_list = b''.join(
+        pack_positions(*get_instance_columns(asset['instances'])).tobytes()
+        for asset in assets_json.values()
+    )
 
     return (asset_list, position_list)
@@ -0,0 +1,252 @@
+import numpy
+
+INITIAL_CAPACITY = 64
+
+# Rows of the instance array for each asset
+X = 0
+Y = 1
+Z = 2
+ROT = 3
+
+
+class InstanceBuffer:
+    """
+    Class for storing placed asset instances before they are encoded.
+    Instances are stored per asset UUID in growable integer arrays, one
+    row for each of x, y, z and rotation. Positions are stored in the
+    units TaleSpire uses, so x, y and z are already multiplied by 100.
+
+    Attributes:
+        assets (dict): instance array for each asset UUID
+        counts (dict): amount of used instances in each instance array
+    """
+
+    def __init__(self):
+        """
+        Constructor for InstanceBuffer class.
+        """
+
+        self.assets = {}
+        self.counts = {}
+
+    def __len__(self):
+        """
+        Function to get total amount of instances in the buffer.
+
+        Returns:
+            int: amount of instances
+        """
+
+        return sum(self.counts.values())
+
+    def reserve(self, uuid, amount):
+        """
+        Function to make sure that instance array of an asset has space
+        for a specific amount of new instances.
+
+        Parameters:
+            uuid (str): UUID of the asset
+            amount (int): amount of instances to be added
+        """
+
+        if uuid not in self.assets:
+            self.assets[uuid] = numpy.empty(
+                (4, max(INITIAL_CAPACITY, amount)),
+                dtype=numpy.int32
+            )
+            self.counts[uuid] = 0
+            return
+
+        instances = self.assets[uuid]
+        required = self.counts[uuid] + amount
+        if required <= instances.shape[1]:
+            return
+
+        capacity = max(instances.shape[1] * 2, required)
+        grown = numpy.empty((4, capacity), dtype=numpy.int32)
+        grown[:, :self.counts[uuid]] = instances[:, :self.counts[uuid]]
+        self.assets[uuid] = grown
+
+    def append(self, uuid, x, y, z, rot):
+        """
+        Function to add one instance of an asset.
+
+        Parameters:
+            uuid (str): UUID of the asset
+            x (float): X coordinate multiplied by 100
+            y (float): Y coordinate multiplied by 100
+            z (float): Z coordinate multiplied by 100
+            rot (int): rotation of the instance
+        """
+
+        self.reserve(uuid, 1)
+        count = self.counts[uuid]
+        instances = self.assets[uuid]
+        instances[X, count] = int(x)
+        instances[Y, count] = int(y)
+        instances[Z, count] = int(z)
+        instances[ROT, count] = int(rot)
+        self.counts[uuid] = count + 1
+
+    def appendMany(self, uuid, x, y, z, rot):
+        """
+        Function to add many instances of an asset at once.
+        Scalar values are used for every instance.
+
+        Parameters:
+            uuid (str): UUID of the asset
+            x (array): X coordinates multiplied by 100
+            y (array): Y coordinates multiplied by 100
+            z (array): Z coordinates multiplied by 100
+            rot (array): rotations of the instances
+        """
+
+        x, y, z, rot = numpy.broadcast_arrays(x, y, z, rot)
+        amount = x.size
+        if amount == 0:
+            return
+
+        self.reserve(uuid, amount)
+        count = self.counts[uuid]
+        instances = self.assets[uuid][:, count:count + amount]
+        # Same truncation towards zero as int()
+        instances[X] = numpy.ravel(x)
+        instances[Y] = numpy.ravel(y)
+        instances[Z] = numpy.ravel(z)
+        instances[ROT] = numpy.ravel(rot)
+        self.counts[uuid] = count + amount
+
+    def getInstances(self, uuid):
+        """
+        Function to get instances of an asset.
+
+        Parameters:
+            uuid (str): UUID of the asset
+
+        Returns:
+            array: read-only array with rows x, y, z and rotation
+        """
+
+        instances = self.assets[uuid][:, :self.counts[uuid]]
+        instances.flags.writeable = False
+        return instances
+
+    def items(self):
+        """
+        Function to iterate over assets in the order they were first added.
+
+        Returns:
+            iterator: pairs of UUID and read-only instance array
+        """
+
+        for uuid in self.assets:
+            yield uuid, self.getInstances(uuid)
+
+    def deduplicate(self):
+        """
+        Function to remove instances of an asset with the same position
+        and rotation as an earlier instance. Order of the remaining
+        instances does not change.
+
+        Returns:
+            int: amount of removed instances
+        """
+
+        removed = 0
+        for uuid in self.assets:
+            count = self.counts[uuid]
+            if count < 2:
+                continue
+
+            instances = self.assets[uuid][:, :count]
+            _, first = numpy.unique(instances, axis=1, return_index=True)
+            if len(first) == count:
+                continue
+
+            kept = instances[:, numpy.sort(first)]
+            instances[:, :len(first)] = kept
+            self.counts[uuid] = len(first)
+            removed += count - len(first)
+
+        return removed
+
+    def split(self, axis, position, shift):
+        """
+        Function to split instances into two buffers along X or Y axis.
+        Instances in the second buffer are moved back by shift, so that
+        it can be pasted on its own.
+
+        Parameters:
+            axis (int): X or Y row
+            position (int): instances below this coordinate stay in
+                            the first buffer
+            shift (int): amount to move instances of the second buffer
+
+        Returns:
+            InstanceBuffer: instances below position
+            InstanceBuffer: moved instances from position onwards
+        """
+
+        lower = InstanceBuffer()
+        upper = InstanceBuffer()
+        for uuid, instances in self.items():
+            below = instances[axis] < position
+            lower.appendMany(uuid, *instances[:, below])
+
+            moved = instances[:, ~below].copy()
+            moved[axis] -= shift
+            upper.appendMany(uuid, *moved)
+
+        return lower, upper
+
+    def asDict(self):
+        """
+        Function to create a dictionary in the format used before encoding.
+        Changing the dictionary does not change the buffer.
+
+        Returns:
+            dict: containing each assets uuid and their positions
+        """
+
+        assetData = {}
+        for uuid, instances in self.items():
+            assetData[uuid] = {
+                "uuid": uuid,
+                "instance_count": instances.shape[1],
+                "instances": [
+                    {"x": x, "y": y, "z": z, "rot": rot}
+                    for x, y, z, rot in zip(*instances.tolist())
+                ]
+            }
+
+        return {
+            "unique_asset_count": len(assetData),
+            "asset_data": assetData
+        }
+
+    def fromDict(data):
+        """
+        Function to create a buffer from a dictionary in the format used
+        before encoding.
+
+        Parameters:
+            data (dict): containing each assets uuid and their positions
+
+        Returns:
+            InstanceBuffer: buffer with the same instances
+        """
+
+        buffer = InstanceBuffer()
+        for uuid, asset in data["asset_data"].items():
+            instances = asset["instances"]
+            buffer.reserve(uuid, len(instances))
+            for instance in instances:
+                buffer.append(
+                    uuid,
+                    instance["x"],
+                    instance["y"],
+                    instance["z"],
+                    instance["rot"]
+                )
+
+        return buffer
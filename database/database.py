@@ -1,39 +1,89 @@
+import os
 import sqlite3
+import threading
 from config.config import config as Config
 
 DATABASE_NAME = Config.get('database', 'name')
+# Amount of prepared statements kept by each connection
+CACHED_STATEMENTS = 256
+
+# Open connections of each thread, by database path
+connections = threading.local()
 
 
 class Database:
     """
     Class for creating and modifying a SQLite3 database.
+    Each thread reuses one connection to a database file, so creating
+    a Database is cheap.
 
     Attributes:
         connection: Connection to the database
         cursor: Cursor that is attached to the connection
     """
 
-    def __init__(self):
+    def __init__(self, database=f"{DATABASE_NAME}.db"):
         """
         The constructor for Database class.
+
+        Parameters:
+            database (str): path to the database file
         """
-        self.startConnection()
+        self.startConnection(database)
 
 # Miscellaneous
     def startConnection(self, database=f"{DATABASE_NAME}.db"):
         """
-        A function to create a connection to database
+        A function to create a connection to database, or reuse
+        the connection of the current thread
+
+        Parameters:
+            database (str): path to the database file
         """
 
-        self.connection = sqlite3.connect(database)
+        self.connection = Database.getConnection(database)
         self.cursor = self.connection.cursor()
 
+    def getConnection(database=f"{DATABASE_NAME}.db"):
+        """
+        A function to get the connection of the current thread to a
+        database, opening it on first use.
+
+        Parameters:
+            database (str): path to the database file
+
+        Returns:
+            Connection: connection to the database
+        """
+
+        path = os.path.abspath(database)
+        if not hasattr(connections, "open"):
+            connections.open = {}
+
+        if path not in connections.open:
+            connections.open[path] = sqlite3.connect(
+                path,
+                cached_statements=CACHED_STATEMENTS
+            )
+
+        return connections.open[path]
+
+    def closeConnections():
+        """
+        A function to close all connections of the current thread
+        """
+
+        for connection in getattr(connections, "open", {}).values():
+            connection.close()
+        connections.open = {}
+
     def close(self):
         """
-        A function to close the connection
+        A function to close the cursor. The connection stays open,
+        so it can be reused
         """
 
-        self.connection.close()
+        self.cursor.close()
 
     def executeScript(self, script):
         """
@@ -46,26 +96,66 @@ class Database:
         self.cursor.executescript(script)
         self.connection.commit()
 
-    def execute(self, query):
+    def execute(self, query, parameters=()):
         """
         A function to execute  SQL query.
 
         Parameters:
             script (str): query to be executed
+            parameters (tuple): values for placeholders in the query
         """
 
-        self.cursor.execute(query)
+        self.cursor.execute(query, parameters)
         self.connection.commit()
 
-    def fetchall(self, query):
+    def executeMany(self, query, parameters, commit=True):
+        """
+        A function to execute SQL query once for each set of parameters.
+
+        Parameters:
+            query (str): query to be executed
+            parameters (list of tuples): values for placeholders in the query
+            commit (bool): commit the transaction after executing
+        """
+
+        self.cursor.executemany(query, parameters)
+        if commit:
+            self.connection.commit()
+
+    def commit(self):
+        """
+        A function to commit the current transaction
+        """
+
+        self.connection.commit()
+
+    def pragma(self, name, value):
+        """
+        A function to change a setting of the connection.
+
+        Parameters:
+            name (str): name of the pragma
+            value (str, int): new value of the pragma
+
+        Returns:
+            str, int: previous value of the pragma
+        """
+
+        self.cursor.execute(f"PRAGMA {name};")
+        previous = self.cursor.fetchone()[0]
+        self.cursor.execute(f"PRAGMA {name} = {value};")
+        return previous
+
+    def fetchall(self, query, parameters=()):
         """
         A function to fetch all results from a query.
 
         Parameters:
             script (str): query to be executed
+            parameters (tuple): values for placeholders in the query
 
          Returns:
             array: array of all elements that fit the querry
         """
-        self.cursor.execute(query)
+        self.cursor.execute(query, parameters)
         return (self.cursor.fetchall())
@@ -1,4 +1,3 @@
-import json
 import math
 import numpy
 from generator.modifications import *
@@ -7,6 +6,10 @@ from objects.assetManager import AssetManager
 from objects.customAsset import CustomAsset
 from config.config import config as Config
 from converter.conversionManager import ConversionManager
+from converter.instanceBuffer import InstanceBuffer
+from converter.encode import DEFAULT_ORDERING, SIZE_LIMIT
+from converter.encode import estimate_compressed_size
+from converter.instanceBuffer import X, Y
 from generator.noise import Noise
 from settings.placeObjectSettings import PlaceObjectSettings
 from settings.terrainSettings import TerrainSettings
@@ -19,8 +22,16 @@ DEFAULTSEED = int(Config.get('generator', 'seed'))
 DEFAULT_USE_RIDGE_NOISE = bool(Config.getboolean('generator', 'useRidgeNoise'))
 USE_HEIGHT_ASSET_SPREAD = bool(Config.getboolean('generator', 'heightBasedAssetSpread'))
 PRECISE_HEIGHT = bool(Config.getboolean('generator', 'preciseHeight'))
+REMOVE_DUPLICATES = bool(Config.getboolean('generator', 'removeDuplicates'))
+CULL_BURIED_TILES = bool(Config.getboolean('generator', 'cullBuriedTiles'))
 
 REALY_BIG_NUMBER = 20000
+# padding for when rotation places tiles outside bounds
+PADDING = 5
+# Share of the size limit that planned slabs are allowed to use
+PLANNING_MARGIN = 0.9
+# Largest slab side, positions have to fit into 16 bits
+MAX_SLAB_SPAN = 600
 
 
 class Generator:
@@ -31,14 +42,23 @@ class Generator:
         x,y,z (int): size of block to generate
         sizes (int, int) how many tiles are in x and y direction
         noise (Noise): noise generator
+        ordering (str): order of instances inside each asset in encoded slabs
         expontent (float): exponent for redistributing terrain
         settings (dict): flags that alter generation
         tileSize (float): maxima of the terrain tile lengths and widths
-        output (dict): output to store the not yet encoded TaleSpire object
+        instances (InstanceBuffer): not yet encoded TaleSpire object
+        output (dict): dictionary view of instances
         elevation (2d array): heightmap for terrain
         placeObjectZ (2d array): scaled elevation heightmap for object placement
-        terrainAssets (list): list of terrainSettings
+        terrainSettings (list): list of terrainSettings
+        terrainAssets (list): list of terrain assets
+        terrainAssetGrid (2d array): terrain asset position for each tile
+        terrainHeightGrid (2d array): quantized height of each tile
+        terrainThicknessGrid (2d array): amount of stacked assets for each tile
+        culledTiles (int): amount of buried terrain assets left out
+        removedInstances (int): amount of removed duplicate instances
         placeAssets (list): list of placeObjectSettings
+        customTemplates (dict): compiled template for each custom asset UUID
         elevationMap (dict, list): a map for corelating height and asset to be placed
         elevationMapSize (int): maximum value in elevationMap
     """
@@ -47,6 +67,8 @@ class Generator:
         "useRidgeNoise": DEFAULT_USE_RIDGE_NOISE,
         "preciseHeight": PRECISE_HEIGHT,
         "heightBasedPlacement": USE_HEIGHT_ASSET_SPREAD,
+        "removeDuplicates": REMOVE_DUPLICATES,
+        "cullBuriedTiles": CULL_BURIED_TILES,
     }
 
     def __init__(self):
@@ -59,6 +81,8 @@ class Generator:
         self.setScales(1, 2, 4, 8)
         self.setExponent(DEFAULT_EXP)
         self.setTileSize()
+        self.setOrdering()
+        self.customTemplates = {}
 
 # Setters / Getters
     def setXYZ(self, x, y, z):
@@ -106,6 +130,59 @@ class Generator:
 
         self.noise.setScales(*args)
 
+    def setWorkers(self, workers):
+        """
+        Setter for amount of worker processes in noise generator.
+
+        Parameters:
+            workers (int): amount of worker processes
+        """
+
+        self.noise.setWorkers(workers)
+
+    def setNoiseCache(self, cache):
+        """
+        Setter for cache of generated noise arrays in noise generator.
+
+        Parameters:
+            cache (NoiseCache, None): cache to be used, None to disable
+        """
+
+        self.noise.setCache(cache)
+
+    def setDtype(self, dtype):
+        """
+        Setter for floating point type of elevation, noise and placement
+        arrays, for example float32 to halve memory used on large worlds.
+
+        Parameters:
+            dtype (str, numpy.dtype): floating point type
+        """
+
+        self.noise.setDtype(dtype)
+
+    def setNoiseTolerance(self, tolerance):
+        """
+        Setter for allowed error of interpolated noise passes. Smooth passes
+        are then evaluated on a coarser lattice and interpolated.
+
+        Parameters:
+            tolerance (float): allowed error, 0.0 for exact noise
+        """
+
+        self.noise.setTolerance(tolerance)
+
+    def setOrdering(self, ordering=DEFAULT_ORDERING):
+        """
+        Setter for order of instances inside each asset in encoded slabs.
+        Ordering does not change pasted slab, only its compressed size.
+
+        Parameters:
+            ordering (str): "none", "sorted" or "morton"
+        """
+
+        self.ordering = ordering
+
     def setExponent(self, exponent):
         """
         Setter for redistribution of noise value.
@@ -118,13 +195,19 @@ class Generator:
 
     def setSeed(self, seed):
         """
-        Function to set noise generator seeds.
+        Function to set noise generator seeds. Other noise settings,
+        like octaves, workers and dtype, are kept.
 
         Parameters:
             seed (any): seed for the generator
         """
 
-        self.noise = Noise(seed)
+        if not hasattr(self, "noise"):
+            self.noise = Noise(seed)
+            return
+
+        # Noise hashes the seed it is constructed with
+        self.noise.setSeed(hash(seed))
 
     def setTileSize(self, tileSize=0):
         """
@@ -170,15 +253,47 @@ class Generator:
 
         self.settings["heightBasedPlacement"] = bool(useHeightBasedPlacement)
 
+    def setRemoveDuplicates(self, removeDuplicates=REMOVE_DUPLICATES):
+        """
+        Function to set setting if instances of an asset with the same
+        position and rotation will be removed before encoding.
+
+        Parameters:
+            removeDuplicates (bool): will duplicate instances be removed
+        """
+
+        self.settings["removeDuplicates"] = bool(removeDuplicates)
+
+    def setCullBuriedTiles(self, cullBuriedTiles=CULL_BURIED_TILES):
+        """
+        Function to set setting if terrain assets hidden under the surface
+        of all neighboring tiles will be left out.
+
+        Parameters:
+            cullBuriedTiles (bool): will buried terrain assets be left out
+        """
+
+        self.settings["cullBuriedTiles"] = bool(cullBuriedTiles)
+
     def initializeOutput(self):
         """
         Function for initializing output dictionary between block generation
         """
 
-        self.output = {
-            "unique_asset_count": 0,
-            "asset_data": {}
-        }
+        self.instances = InstanceBuffer()
+
+    @property
+    def output(self):
+        """
+        Dictionary view of the not yet encoded TaleSpire object.
+        Changing the returned dictionary does not change placed instances.
+        """
+
+        return self.instances.asDict()
+
+    @output.setter
+    def output(self, data):
+        self.instances = InstanceBuffer.fromDict(data)
 
     def getPos(self, x, y, z):
         """
@@ -262,29 +377,6 @@ class Generator:
            angle
         )
 
-    def adaptiveThickness(self, x, y, z):
-        """
-        Function to calculate the biggest change in elevation in neighboring
-        tiles
-
-        Parameters:
-            x (int): X coordinate for referance tile to check change against
-            y (int): Y coordinate for referance tile to check change against
-            z (float): scaling factor for Z
-
-        Returns:
-            int: biggest tile difference in neighboring tiles
-        """
-
-        current = self.getPos(x, y, z)
-        return int(max(
-            current - self.getPos(x, y-1, z)+1,
-            current - self.getPos(x, y+1, z)+1,
-            current - self.getPos(x-1, y, z)+1,
-            current - self.getPos(x+1, y, z)+1,
-            1
-        ))
-
 # Generation
 
     def pregenerate(
@@ -294,15 +386,17 @@ class Generator:
         sizes=[1, 1]
         ):
 
-        self.terrainAssets = Generator.createObjectList(terrainAssets)
+        self.terrainSettings = Generator.createObjectList(terrainAssets)
         self.placeObjects = Generator.createObjectList(placeObjects, True)
 
         self.setSize(sizes[0], sizes[1])
+        self.removedInstances = 0
+        self.customTemplates = {}
 
         self.generateElevation(
             self.x*sizes[0],
             self.y*sizes[1],
-            self.terrainAssets
+            self.terrainSettings
         )
         
         redistribute(self.elevation, self.exponent)
@@ -315,6 +409,13 @@ class Generator:
             self.placeObjects
         )
 
+        self.terrainAssetGrid = self.compileTerrainAssetGrid(
+            self.x*sizes[0],
+            self.y*sizes[1],
+            self.terrainSettings
+        )
+        self.compileTerrainHeights(self.x*sizes[0], self.y*sizes[1])
+
     def generate(self):
         """
         Function to generate X*Y ammount of terrain blocks, with
@@ -326,21 +427,28 @@ class Generator:
         """
 
         result = []
+        slabs = []
 
         for x in range(self.sizes[0]):
             for y in range(self.sizes[1]):
-                self.initializeOutput
-                output = self.generatePart(
-                    self.terrainAssets,
+                slabs.append(self.populatePart(
+                    self.terrainSettings,
                     self.placeObjects,
                     [x * self.x, y * self.y]
-                )
+                ))
                 result.append({
                     "x": x,
-                    "y": y,
-                    "output": output
+                    "y": y
                 })
 
+        # Slabs are independent, so they are encoded concurrently
+        outputs = ConversionManager.encodeInstancesBatch(
+            slabs,
+            ordering=self.ordering
+        )
+        for position, output in enumerate(outputs):
+            result[position]["output"] = output.decode("ascii")
+
         return result
 
     def generatePart(
@@ -364,11 +472,246 @@ class Generator:
             string: encoded TaleSpire string for generated block
         """
 
+        return ConversionManager.encodeInstances(
+            self.populatePart(terrainAssets, placeObjects, offset),
+            self.ordering
+        ).decode("ascii")
+
+    def populatePart(
+        self,
+        terrainAssets,
+        placeObjects,
+        offset=[0, 0],
+        size=None
+    ):
+        """
+        Function to place terrain and place objects of one terrain block,
+        without encoding it
+
+        Parameters:
+            terrainAssets (list): list of terrain settings
+            placeObjects (list): list of place object settings
+            offset (list): x and y offset, for which block is being currently
+                           generated
+            size (list): x and y size of the block, default is X*Y
+
+        Returns:
+            InstanceBuffer: placed instances of the block
+        """
+
         self.initializeOutput()
-        self.populateElevation(terrainAssets, offset)
-        self.populatePlaceObjects(placeObjects, offset)
-        string = json.dumps(self.output)
-        return ConversionManager.encode(string).decode("ascii")
+        self.populateElevation(terrainAssets, offset, size)
+        self.populatePlaceObjects(placeObjects, offset, size)
+        if self.settings["removeDuplicates"]:
+            self.removedInstances += self.instances.deduplicate()
+        return self.instances
+
+    def generatePartitioned(self, sizeLimit=SIZE_LIMIT):
+        """
+        Function to generate the whole terrain in slabs that fit into
+        TaleSpire size limit. Slab boundaries are planned from predicted
+        size, so dense areas get small slabs and sparse areas big ones.
+        If a slab still does not fit, its placed instances are split
+        without generating them again.
+
+        Parameters:
+            sizeLimit (int): maximum size of compressed slab in bytes
+
+        Returns:
+            list: offset, size and output of each slab
+        """
+
+        result = []
+        for offsetX, offsetY, sizeX, sizeY in self.planSlabs(sizeLimit):
+            instances = self.populatePart(
+                self.terrainSettings,
+                self.placeObjects,
+                [offsetX, offsetY],
+                [sizeX, sizeY]
+            )
+            result += self.encodeSlab(
+                instances,
+                [offsetX, offsetY],
+                [sizeX, sizeY],
+                sizeLimit
+            )
+
+        return result
+
+    def planSlabs(self, sizeLimit=SIZE_LIMIT):
+        """
+        Function to split terrain into slabs with predicted size under the
+        size limit. Terrain is bisected along its longer side, at the point
+        that splits predicted instances in half.
+
+        Parameters:
+            sizeLimit (int): maximum size of compressed slab in bytes
+
+        Returns:
+            list: x and y offset and x and y size of each slab
+        """
+
+        counts = self.compileInstanceCounts()
+        # Summed area table gives instance count of any region at once
+        table = numpy.zeros(
+            (counts.shape[0]+1, counts.shape[1]+1),
+            dtype=numpy.int64
+        )
+        table[1:, 1:] = numpy.cumsum(numpy.cumsum(counts, 0), 1)
+
+        assetCount = len(set().union(*[
+            self.getPartUuids(asset)
+            for asset in self.terrainAssets + self.placeAssets
+        ]))
+        anchors = 1 if self.settings["preciseHeight"] else 0
+        maxTiles = max(int(MAX_SLAB_SPAN / self.tileSize), 1)
+
+        slabs = []
+        regions = [(0, 0, counts.shape[0], counts.shape[1])]
+        while regions:
+            offsetX, offsetY, sizeX, sizeY = regions.pop()
+            endX = offsetX + sizeX
+            endY = offsetY + sizeY
+            count = (
+                table[endX, endY] - table[offsetX, endY]
+                - table[endX, offsetY] + table[offsetX, offsetY]
+            )
+            size = estimate_compressed_size(assetCount, count + anchors)
+
+            fits = size <= sizeLimit * PLANNING_MARGIN
+            if (fits and max(sizeX, sizeY) <= maxTiles) or sizeX*sizeY == 1:
+                slabs.append((offsetX, offsetY, sizeX, sizeY))
+                continue
+
+            region = counts[offsetX:endX, offsetY:endY]
+            if sizeX >= sizeY:
+                lines = numpy.cumsum(numpy.sum(region, axis=1))
+                cut = int(numpy.searchsorted(lines, lines[-1] / 2))
+                cut = min(max(cut, 1), sizeX - 1)
+                regions.append((offsetX, offsetY, cut, sizeY))
+                regions.append((offsetX + cut, offsetY, sizeX - cut, sizeY))
+            else:
+                lines = numpy.cumsum(numpy.sum(region, axis=0))
+                cut = int(numpy.searchsorted(lines, lines[-1] / 2))
+                cut = min(max(cut, 1), sizeY - 1)
+                regions.append((offsetX, offsetY, sizeX, cut))
+                regions.append((offsetX, offsetY + cut, sizeX, sizeY - cut))
+
+        return sorted(slabs)
+
+    def encodeSlab(self, instances, offset, size, sizeLimit=SIZE_LIMIT):
+        """
+        Function to encode placed instances of a slab. If slab does not fit
+        into the size limit, it is split in half along its longer side,
+        until every part fits.
+
+        Parameters:
+            instances (InstanceBuffer): placed instances of the slab
+            offset (list): x and y offset of the slab
+            size (list): x and y size of the slab
+            sizeLimit (int): maximum size of compressed slab in bytes
+
+        Returns:
+            list: offset, size and output of each slab
+        """
+
+        output = ConversionManager.tryEncodeInstances(
+            instances,
+            sizeLimit,
+            self.ordering
+        )
+        if output is not None:
+            return [{
+                "x": offset[0],
+                "y": offset[1],
+                "sizeX": size[0],
+                "sizeY": size[1],
+                "output": output.decode("ascii")
+            }]
+
+        if size[0] * size[1] == 1:
+            raise ValueError(
+                f"Tile {offset} does not fit into {sizeLimit} bytes"
+            )
+
+        axis = X if size[0] >= size[1] else Y
+        cut = size[axis] // 2
+        shift = int(round(cut * self.tileSize * 100))
+        # Terrain of the first moved tile starts at the padding,
+        # truncation may place it one unit lower
+        lower, upper = instances.split(axis, shift + PADDING*100 - 1, shift)
+
+        upperOffset = list(offset)
+        upperOffset[axis] += cut
+        lowerSize = list(size)
+        lowerSize[axis] = cut
+        upperSize = list(size)
+        upperSize[axis] -= cut
+
+        if self.settings["preciseHeight"]:
+            self.placeHeightAnchor(upperOffset, upper)
+
+        return (
+            self.encodeSlab(lower, offset, lowerSize, sizeLimit)
+            + self.encodeSlab(upper, upperOffset, upperSize, sizeLimit)
+        )
+
+    def compileInstanceCounts(self):
+        """
+        Function to predict amount of instances placed on each tile,
+        from terrain thickness and place object maps.
+
+        Returns:
+            array: amount of instances for each tile
+        """
+
+        parts = numpy.array(
+            [self.getPartCount(asset) for asset in self.terrainAssets]
+        )
+        counts = self.terrainThicknessGrid * parts[self.terrainAssetGrid]
+
+        for position, placement in enumerate(self.objectPlacements):
+            hitsX, hitsY = numpy.nonzero(placement["map"])
+            tilesX = numpy.floor(hitsX / self.tileSize).astype(int)
+            tilesY = numpy.floor(hitsY / self.tileSize).astype(int)
+            inside = (tilesX < counts.shape[0]) & (tilesY < counts.shape[1])
+            numpy.add.at(
+                counts,
+                (tilesX[inside], tilesY[inside]),
+                self.getPartCount(self.placeAssets[position])
+            )
+
+        return counts
+
+    def getPartCount(self, asset):
+        """
+        Function to get amount of instances placed for one asset.
+
+        Parameters:
+            asset (Asset): asset to be placed
+
+        Returns:
+            int: amount of instances
+        """
+
+        if type(asset) is CustomAsset:
+            return len(self.getCustomTemplate(asset)["parts"])
+        return 1
+
+    def getPartUuids(self, asset):
+        """
+        Function to get UUIDs of instances placed for one asset.
+
+        Parameters:
+            asset (Asset): asset to be placed
+
+        Returns:
+            set: UUIDs of placed instances
+        """
+
+        if type(asset) is CustomAsset:
+            return set(self.getCustomTemplate(asset)["uuids"])
+        return {asset.uuid}
 
     def generateElevation(self, sizeX, sizeY, assetList):
         """
@@ -380,8 +723,14 @@ class Generator:
             assetList (list): terrain setting list
         """
 
-        self.elevation = numpy.zeros((sizeX+2, sizeY+2))
-        self.placeObjectZ = numpy.zeros((sizeX+2, sizeY+2))
+        self.elevation = numpy.zeros(
+            (sizeX+2, sizeY+2),
+            dtype=self.noise.dtype
+        )
+        self.placeObjectZ = numpy.zeros(
+            (sizeX+2, sizeY+2),
+            dtype=self.noise.dtype
+        )
 
         self.terrainAssets = AssetManager.getAssetList(assetList)
 
@@ -405,21 +754,20 @@ class Generator:
 
         self.placeAssets = AssetManager.getAssetList(assetList)
         self.objectPlacements = []
+        placeObjects = self.compilePlaceObjectNoiseMaps(
+            sizeX,
+            sizeY,
+            [assetSettings.getParam() for assetSettings in assetList]
+        )
         for position, asset in enumerate(self.placeAssets):
-            assetSettings = assetList[position].getParam()
-            placeObject = self.compilePlaceObjectNoiseMap(
-                sizeX,
-                sizeY,
-                assetSettings
-            )
             self.objectPlacements.append({
                 "name": asset.name,
-                "map": placeObject
+                "map": placeObjects[position]
             })
 
 # Placement
 
-    def place(self, asset, x, y, z, rot):
+    def place(self, asset, x, y, z, rot, instances=None):
         """
         Function to place an asset in specific X, Y, Z coordinates with a
         specific rotation
@@ -430,17 +778,50 @@ class Generator:
             y (float): Y coordinate where to place the asset
             z (float): Z coordinate where to place the asset
             rot (int): Rotation of this asset
+            instances (InstanceBuffer, None): buffer to place into,
+                                              default is self.instances
         """
 
         # padding for when rotation places tiles outside bounds
-        x += 5
-        y += 5
+        x += PADDING
+        y += PADDING
         if type(asset) is CustomAsset:
-            self.placeCustom(asset, x, y, z, rot)
+            self.placeCustom(asset, x, y, z, rot, instances)
         else:
-            self.placeAsset(asset.uuid, x, y, z, rot)
+            self.placeAsset(asset.uuid, x, y, z, rot, instances)
+
+    def placeMany(self, asset, x, y, z, rot):
+        """
+        Function to place many instances of an asset at once
 
-    def placeAsset(self, uuid, x, y, z, rot):
+        Parameters:
+            asset (Asset): asset to be placed
+            x (array): X coordinates where to place the asset
+            y (array): Y coordinates where to place the asset
+            z (array): Z coordinates where to place the asset
+            rot (array): Rotations of the instances
+        """
+
+        if type(asset) is CustomAsset:
+            self.placeCustomMany(
+                asset,
+                numpy.asarray(x, dtype=float) + PADDING,
+                numpy.asarray(y, dtype=float) + PADDING,
+                z,
+                rot
+            )
+            return
+
+        # padding for when rotation places tiles outside bounds
+        self.instances.appendMany(
+            asset.uuid,
+            (x + PADDING) * 100,
+            (y + PADDING) * 100,
+            z * 100,
+            rot
+        )
+
+    def placeAsset(self, uuid, x, y, z, rot, instances=None):
         """
         Function to place an elementary asset in specific X, Y, Z coordinates
         with a specific rotation
@@ -451,23 +832,15 @@ class Generator:
             y (float): Y coordinate where to place the asset
             z (float): Z coordinate where to place the asset
             rot (int): Rotation of this asset
+            instances (InstanceBuffer, None): buffer to place into,
+                                              default is self.instances
         """
 
-        if uuid not in self.output['asset_data'].keys():
-            self.output['asset_data'][uuid] = {
-                "uuid": uuid,
-                "instance_count": 0,
-                "instances": []
-            }
-
-        self.output['asset_data'][uuid]['instances'].append({
-            "x": x * 100,
-            "y": y * 100,
-            "z": z * 100,
-            "rot": rot
-        })
+        if instances is None:
+            instances = self.instances
+        instances.append(uuid, x * 100, y * 100, z * 100, rot)
 
-    def placeCustom(self, asset, x, y, z, rot):
+    def placeCustom(self, asset, x, y, z, rot, instances=None):
         """
         Function to place a complex asset in specific X, Y, Z coordinates with
         a specific rotation
@@ -478,48 +851,130 @@ class Generator:
             y (float): Y coordinate where to place the asset
             z (float): Z coordinate where to place the asset
             rot (int): Rotation of this asset
+            instances (InstanceBuffer, None): buffer to place into,
+                                              default is self.instances
         """
 
-        dictionary = asset.getDecoded()
-        coordinates = []
+        self.placeCustomMany(asset, [x], [y], [z], [rot], instances)
 
-        minimum = {
-            "x": REALY_BIG_NUMBER,
-            "y": REALY_BIG_NUMBER
-        }
+    def placeCustomMany(self, asset, x, y, z, rot, instances=None):
+        """
+        Function to place many instances of a complex asset at once,
+        by moving its compiled template to each position
+
+        Parameters:
+            asset (Asset): asset to be placed
+            x (array): X coordinates where to place the asset
+            y (array): Y coordinates where to place the asset
+            z (array): Z coordinates where to place the asset
+            rot (array): Rotations of the instances
+            instances (InstanceBuffer, None): buffer to place into,
+                                              default is self.instances
+        """
+
+        if instances is None:
+            instances = self.instances
+        template = self.getCustomTemplate(asset)
+        x, y, z, rot = numpy.broadcast_arrays(
+            numpy.asarray(x, dtype=float),
+            numpy.asarray(y, dtype=float),
+            numpy.asarray(z, dtype=float),
+            numpy.asarray(rot, dtype=int)
+        )
+        shape = (x.size, len(template["parts"]))
+        newX = numpy.empty(shape)
+        newY = numpy.empty(shape)
+        newZ = numpy.empty(shape)
+        angles = numpy.empty(shape, dtype=int)
+
+        for angle in numpy.unique(rot).tolist():
+            variant = self.getCustomRotation(template, angle)
+            rows = rot == angle
+            # Same order of operations as placing parts one by one
+            newX[rows] = (variant["x"] + x[rows, None]) - variant["minX"]
+            newY[rows] = (variant["y"] + y[rows, None]) - variant["minY"]
+            newZ[rows] = variant["z"] + z[rows, None]
+            angles[rows] = variant["rot"]
+
+        for uuid, columns in zip(template["uuids"], template["columns"]):
+            instances.appendMany(
+                uuid,
+                newX[:, columns] * 100,
+                newY[:, columns] * 100,
+                newZ[:, columns] * 100,
+                angles[:, columns]
+            )
+
+    def getCustomTemplate(self, asset):
+        """
+        Function to get a complex asset decoded into a template,
+        compiling it on first use
+
+        Parameters:
+            asset (Asset): complex asset
+
+        Returns:
+            dict: UUID table, parts and rotation variants of the asset
+        """
 
-        for item in dictionary:
-            placeAsset = AssetManager.getAsset(item["uuid"])
+        if asset.uuid in self.customTemplates:
+            return self.customTemplates[asset.uuid]
+
+        uuids = []
+        parts = []
+        items = asset.getDecoded()
+        placeAssets = AssetManager.getAssets([item["uuid"] for item in items])
+        for item, placeAsset in zip(items, placeAssets):
+            if item["uuid"] not in uuids:
+                uuids.append(item["uuid"])
+            index = uuids.index(item["uuid"])
             for placement in item["instances"]:
-                newX, newY, newZ, angle = self.calculateNewCoordinates(
-                    placement,
-                    rot,
-                    placeAsset
-                )
+                parts.append((index, placement, placeAsset))
+
+        indices = numpy.array([part[0] for part in parts], dtype=int)
+        template = {
+            "uuids": uuids,
+            "columns": [
+                numpy.flatnonzero(indices == index)
+                for index in range(len(uuids))
+            ],
+            "parts": parts,
+            "rotations": {}
+        }
+        self.customTemplates[asset.uuid] = template
+        return template
 
-                minimum["x"] = min(newX, minimum["x"])
-                minimum["y"] = min(newY, minimum["y"])
+    def getCustomRotation(self, template, rot):
+        """
+        Function to get positions of template parts for one rotation,
+        calculating them on first use
 
-                coordinates.append({
-                    "uuid": item["uuid"],
-                    "x": newX + x,
-                    "y": newY + y,
-                    "z": newZ + z,
-                    "rot": angle
-                })
+        Parameters:
+            template (dict): compiled complex asset
+            rot (int): amount of degrees to rotate
 
-        for coord in coordinates:
-            newX = coord["x"] - minimum["x"]
-            newY = coord["y"] - minimum["y"]
-            newZ = coord["z"]
-
-            self.placeAsset(
-                coord["uuid"],
-                newX,
-                newY,
-                newZ,
-                coord["rot"]
-            )
+        Returns:
+            dict: X, Y, Z and rotation arrays and X and Y minimum
+        """
+
+        if rot in template["rotations"]:
+            return template["rotations"][rot]
+
+        coordinates = numpy.array([
+            self.calculateNewCoordinates(placement, rot, placeAsset)
+            for _, placement, placeAsset in template["parts"]
+        ], dtype=float).reshape(-1, 4)
+
+        variant = {
+            "x": coordinates[:, 0],
+            "y": coordinates[:, 1],
+            "z": coordinates[:, 2],
+            "rot": coordinates[:, 3].astype(int),
+            "minX": numpy.min(coordinates[:, 0], initial=REALY_BIG_NUMBER),
+            "minY": numpy.min(coordinates[:, 1], initial=REALY_BIG_NUMBER)
+        }
+        template["rotations"][rot] = variant
+        return variant
 
 # Helpers
     def compilePlaceObjectNoiseMap(self, sizeX, sizeY, settings):
@@ -532,35 +987,68 @@ class Generator:
             settings (Setting): current place objects settings
 
         Returns:
-            array: map of placements of the asset
+            array: boolean map of placements of the asset
+        """
+
+        return self.compilePlaceObjectNoiseMaps(sizeX, sizeY, [settings])[0]
+
+    def compilePlaceObjectNoiseMaps(self, sizeX, sizeY, settingsList):
+        """
+        Function to generate distribution maps for all place objects.
+        Noise of each place object is generated layer by layer into one
+        preallocated array, then compared with the density of its object.
+
+        Parameters:
+            sizeX (int): total X size of place object map to be generated
+            sizeY (int): total Y size of place object map to be generated
+            settingsList (list of Settings): settings of each place object
+
+        Returns:
+            array: stack of boolean placement maps, one layer for each
+                   place object
         """
 
-        noiseMap = self.noise.getRandomNoiseMap(
+        noiseMaps = self.noise.getRandomNoiseMaps(
                 {
                     "x": sizeX,
                     "y": sizeY
                 },
-                {  # Offset so that each asset would have a unique noise map
-                    "x": numpy.random.randint(0, REALY_BIG_NUMBER),
-                    "y": numpy.random.randint(0, REALY_BIG_NUMBER)
-                },
-                settings["clumping"],
-                settings["randomNoiseWeight"],
+                [settings["clumping"] for settings in settingsList],
+                [settings["randomNoiseWeight"] for settings in settingsList],
+                # Offset so that each asset would have a unique noise map
+                REALY_BIG_NUMBER
             )
-        for x in range(0, sizeX):
-            for y in range(0, sizeY):
-                if settings["heightBasedMultiplier"] > 0:
-                    scaledX = math.floor(x / self.tileSize)
-                    scaledY = math.floor(y / self.tileSize)
-                    noiseMap[x][y] += self.elevation[scaledX][scaledY]
-                    noiseMap[x][y] *= settings["heightBasedMultiplier"]
-                    noiseMap[x][y] += settings["heightBasedOffset"]
-
-                if noiseMap[x][y] <= settings["density"]:
-                    noiseMap[x][y] = 1.0
-                else:
-                    noiseMap[x][y] = 0.0
-        return noiseMap
+        placements = numpy.zeros((len(settingsList), sizeX, sizeY), dtype=bool)
+        heightMap = None
+
+        for layer, settings in enumerate(settingsList):
+            noiseMap = noiseMaps[layer]
+            if settings["heightBasedMultiplier"] > 0:
+                if heightMap is None:
+                    heightMap = self.getElevationAtPlacementScale(sizeX, sizeY)
+                noiseMap += heightMap
+                noiseMap *= settings["heightBasedMultiplier"]
+                noiseMap += settings["heightBasedOffset"]
+
+            placements[layer] = noiseMap <= settings["density"]
+        return placements
+
+    def getElevationAtPlacementScale(self, sizeX, sizeY):
+        """
+        Function to upsample elevation to the resolution of place object
+        maps, so that each tile covers tileSize x tileSize placements.
+
+        Parameters:
+            sizeX (int): total X size of place object map
+            sizeY (int): total Y size of place object map
+
+        Returns:
+            array: elevation of size sizeX x sizeY
+        """
+
+        scaledX = numpy.floor(numpy.arange(sizeX) / self.tileSize).astype(int)
+        scaledY = numpy.floor(numpy.arange(sizeY) / self.tileSize).astype(int)
+        return self.elevation[scaledX[:, numpy.newaxis], scaledY]
 
     def createObjectList(list, placeObjects=False):
         """
@@ -625,50 +1113,161 @@ class Generator:
         self.elevationMapSize = sum
         return
 
-    def getAssetFromMap(
-        self,
-        x,
-        y,
-        assetList
-    ):
+    def compileTerrainAssetGrid(self, sizeX, sizeY, assetList):
         """
-        Function to get asset from the generated elevation map.
+        Function to pick terrain asset for every tile of the world at once.
+        Based of flag "heightBasedPlacement" assets are picked either
+        by the height value, or randomly by their density.
 
         Parameters:
-            x (float): X coordinate where to place the asset
-            y (float): Y coordinate where to place the asset
+            sizeX (int): total X size of terrain
+            sizeY (int): total Y size of terrain
             assetList (list of terrain settings):
                 list of all tiles that are going to be used in terrain
 
         Returns:
-            int: assets position in assetlist
+            array: assets position in terrainAssets for each tile
         """
 
         if self.settings["heightBasedPlacement"]:
-            height = int(self.elevation[x][y]/self.z*100)
-            settings = assetList[self.elevationMap[height][0]].getParam()
+            lookup = numpy.array(
+                [positions[0] for positions in self.elevationMap]
+            )
+            blends = numpy.array(
+                [asset.getParam("blendHeightMultiplier") for asset in assetList]
+            )
 
-            if settings["blendHeightMultiplier"] > 0:
-                height += numpy.random.randint(
-                    low=-settings["blendHeightMultiplier"],
-                    high=settings["blendHeightMultiplier"])
-                height = max(min(100, height), 0)
+            heights = (self.elevation[:sizeX, :sizeY]/self.z*100).astype(int)
+            multipliers = blends[lookup[heights]]
+            blended = multipliers > 0
+            if numpy.any(blended):
+                heights[blended] = numpy.clip(
+                    heights[blended] + numpy.random.randint(
+                        low=-multipliers[blended],
+                        high=multipliers[blended]
+                    ),
+                    0,
+                    100
+                )
 
-            return self.elevationMap[height][0]
+            return lookup[heights]
 
-        random = numpy.random.randint(self.elevationMapSize-1)
-        placeAsset = ""
+        # Settings can share a UUID, use the first matching asset
+        lookup = []
         for item in self.elevationMap:
-            if random >= item["probPrev"] and random < item["prob"]:
-                placeAsset = item["asset"]
-                break
+            for counter, asset in enumerate(self.terrainAssets):
+                if asset.uuid == item["asset"]:
+                    lookup.append(counter)
+                    break
+
+        bounds = numpy.array([item["prob"] for item in self.elevationMap])
+        random = numpy.random.randint(
+            self.elevationMapSize-1,
+            size=(sizeX, sizeY)
+        )
+        return numpy.array(lookup)[
+            numpy.searchsorted(bounds, random, side="right")
+        ]
+
+    def compileTerrainHeights(self, sizeX, sizeY):
+        """
+        Function to calculate quantized height, column thickness and
+        surface height for every tile of the world at once.
+        Heights are quantized by the height of the asset picked for a tile,
+        thickness is the biggest change in elevation to neighboring tiles.
+        If buried tiles are culled, assets under the surface of all
+        neighboring tiles are left out of the bottom of each column.
+
+        Parameters:
+            sizeX (int): total X size of terrain
+            sizeY (int): total Y size of terrain
+        """
 
-        for counter, asset in enumerate(self.terrainAssets):
-            if asset.uuid == placeAsset:
-                return counter
+        self.terrainHeightGrid = numpy.zeros((sizeX, sizeY), dtype=int)
+        self.terrainThicknessGrid = numpy.zeros((sizeX, sizeY), dtype=int)
+
+        assetHeights = numpy.array(
+            [asset.mExtent.y * 2.0 for asset in self.terrainAssets]
+        )
+        tileHeights = assetHeights[self.terrainAssetGrid]
+
+        for z in numpy.unique(assetHeights).tolist():
+            # Elevation is padded by one tile on each side
+            quantized = numpy.ceil(
+                self.elevation[:sizeX+2, :sizeY+2] / z
+            ).astype(int)
+            current = quantized[1:-1, 1:-1]
+            lowest = numpy.minimum.reduce([
+                quantized[1:-1, :-2],
+                quantized[1:-1, 2:],
+                quantized[:-2, 1:-1],
+                quantized[2:, 1:-1]
+            ])
+
+            tiles = tileHeights == z
+            self.terrainHeightGrid[tiles] = current[tiles]
+            self.terrainThicknessGrid[tiles] = numpy.maximum(
+                current - lowest + 1,
+                1
+            )[tiles]
+
+        self.culledTiles = 0
+        if self.settings["cullBuriedTiles"]:
+            # Top of each neighbour, tiles outside of the world never
+            # cover anything
+            surface = numpy.pad(
+                tileHeights * (self.terrainHeightGrid + 1),
+                1,
+                constant_values=-numpy.inf
+            )
+            cover = numpy.minimum.reduce([
+                surface[1:-1, :-2],
+                surface[1:-1, 2:],
+                surface[:-2, 1:-1],
+                surface[2:, 1:-1]
+            ])
+            # Level k is buried while its top z*(k+1) is not above cover,
+            # levels is the amount of such levels from the ground up.
+            # Division can round, so it is corrected with multiplication
+            levels = numpy.floor(cover / tileHeights)
+            levels -= tileHeights * levels > cover
+            levels += tileHeights * (levels + 1) <= cover
+            bottom = self.terrainHeightGrid - self.terrainThicknessGrid + 1
+            # Top of the column always stays visible
+            buried = numpy.clip(
+                levels - bottom,
+                0,
+                self.terrainThicknessGrid - 1
+            ).astype(int)
+            self.terrainThicknessGrid -= buried
+            self.culledTiles = int(numpy.sum(buried))
+
+        self.placeObjectZ[:sizeX, :sizeY] = (
+            tileHeights * (self.terrainHeightGrid + 1)
+        )
 
 # Asset placement
-    def populateElevation(self, assetList, offset):
+    def placeHeightAnchor(self, offset, instances=None):
+        """
+        Function to place the lowest terrain asset in the corner of a block,
+        so that all blocks have the same lowest point when pasted.
+
+        Parameters:
+            offset (list): x and y offset of the block
+            instances (InstanceBuffer, None): buffer to place into,
+                                              default is self.instances
+        """
+
+        self.place(
+            self.terrainAssets[self.terrainAssetGrid[offset[0]][offset[1]]],
+            0,
+            0,
+            float(numpy.amin(self.elevation)),
+            0,
+            instances
+            )
+
+    def populateElevation(self, assetList, offset, size=None):
         """
         Function to turn elevation into a list of TaleSpire assets.
 
@@ -676,42 +1275,44 @@ class Generator:
             assetList (list of terrain settings):
                 list of all tiles that are going to be used in terrain
             offset (list): x and y offset for currently generating block
+            size (list): x and y size of the block, default is X*Y
         """
 
-        for x in range(0, self.x):
-            for y in range(0, self.y):
+        sizeX, sizeY = size if size is not None else (self.x, self.y)
+
+        rotations = iter((numpy.random.randint(
+            4,
+            size=int(numpy.sum(self.terrainThicknessGrid[
+                offset[0]:offset[0] + sizeX,
+                offset[1]:offset[1] + sizeY
+            ]))
+        )*90).tolist())
+
+        for x in range(0, sizeX):
+            for y in range(0, sizeY):
                 offsetX = x + offset[0]
                 offsetY = y + offset[1]
-                assetPosition = self.getAssetFromMap(
-                            offsetX,
-                            offsetY,
-                            assetList
-                        )
-                asset = self.terrainAssets[assetPosition]
+                asset = self.terrainAssets[
+                    self.terrainAssetGrid[offsetX][offsetY]
+                ]
 
                 if self.settings["preciseHeight"] and x == 0 and y == 0:
-                    self.place(
-                        asset,
-                        x * self.tileSize,
-                        y * self.tileSize,
-                        numpy.amin(self.elevation),
-                        0
-                        )
+                    self.placeHeightAnchor(offset)
 
                 z = asset.mExtent.y * 2.0
-                currentHeight = self.getPos(offsetX, offsetY, z)
-                self.placeObjectZ[offsetX][offsetY] = z * (currentHeight + 1)
+                currentHeight = int(self.terrainHeightGrid[offsetX][offsetY])
+                thickness = int(self.terrainThicknessGrid[offsetX][offsetY])
 
-                for w in range(0, self.adaptiveThickness(offsetX, offsetY, z)):
+                for w in range(0, thickness):
                     self.place(
                         asset,
                         x * self.tileSize,
                         y * self.tileSize,
                         z * (currentHeight - w),
-                        numpy.random.randint(4)*90
+                        next(rotations)
                         )
 
-    def populatePlaceObjects(self, assetList, offset):
+    def populatePlaceObjects(self, assetList, offset, size=None):
         """
         Function to turn place object maps into a list of TaleSpire assets.
 
@@ -719,37 +1320,51 @@ class Generator:
             assetList (list of terrain settings):
                 list of all assets that are going to be placed on the terrain
             offset (list): x and y offset for currently generating block
+            size (list): x and y size of the block, default is X*Y
         """
 
-        for position, placement in enumerate(self.objectPlacements):
-            for x in range(0, self.x * int(self.tileSize)):
-                for y in range(0, self.y * int(self.tileSize)):
-                    offsetX = x + offset[0]
-                    offsetY = y + offset[1]
-                    if placement["map"][offsetX][offsetY]:
+        sizeX, sizeY = size if size is not None else (self.x, self.y)
+        sizeX *= int(self.tileSize)
+        sizeY *= int(self.tileSize)
+        # Offset is in tiles, place object maps have tileSize points per tile
+        mapX = offset[0] * int(self.tileSize)
+        mapY = offset[1] * int(self.tileSize)
 
-                        assetSettings = assetList[position].getParam()
-                        asset = self.placeAssets[position]
+        for position, placement in enumerate(self.objectPlacements):
+            window = placement["map"][
+                mapX:mapX + sizeX,
+                mapY:mapY + sizeY
+            ]
+            hitsX, hitsY = numpy.nonzero(window)
+            count = len(hitsX)
+            if count == 0:
+                continue
 
-                        scaledX = math.floor(x/self.tileSize) + offset[0]
-                        scaledY = math.floor(y/self.tileSize) + offset[1]
+            assetSettings = assetList[position].getParam()
+            asset = self.placeAssets[position]
 
-                        placeHeight = self.placeObjectZ[scaledX][scaledY]
+            scaledX = numpy.floor(hitsX / self.tileSize).astype(int)
+            scaledY = numpy.floor(hitsY / self.tileSize).astype(int)
+            placeHeights = self.placeObjectZ[
+                scaledX + offset[0],
+                scaledY + offset[1]
+            ].astype(float)
 
-                        newX = x
-                        newY = y
-                        newZ = placeHeight + assetSettings["verticalOffset"]
-                        newRot = 0
+            newX = hitsX.astype(float)
+            newY = hitsY.astype(float)
+            newZ = placeHeights + assetSettings["verticalOffset"]
+            newRot = numpy.zeros(count, dtype=int)
 
-                        if assetSettings["placeOnCenter"]:
-                            newX += 0.5
-                            newY += 0.5
+            if assetSettings["placeOnCenter"]:
+                newX += 0.5
+                newY += 0.5
 
-                        if assetSettings["randomRotationEnabled"]:
-                            newRot = numpy.random.randint(4)*90
+            if assetSettings["randomRotationEnabled"]:
+                newRot = numpy.random.randint(4, size=count)*90
 
-                        if assetSettings["randomNudgeEnabled"]:
-                            newX += (numpy.random.randint(100)-50)/100
-                            newY += (numpy.random.randint(100)-50)/100
+            if assetSettings["randomNudgeEnabled"]:
+                nudges = (numpy.random.randint(100, size=(count, 2))-50)/100
+                newX += nudges[:, 0]
+                newY += nudges[:, 1]
 
-                        self.place(asset, newX, newY, newZ, newRot)
+            self.placeMany(asset, newX, newY, newZ, newRot)
@@ -121,3 +121,29 @@ def normalize(noiseMap):
     noiseMap -= min
     noiseMap /= (max-min)
     return noiseMap
+
+
+def interpolateBilinear(grid, positionsX, positionsY, step=(1, 1)):
+    """
+    Function to sample a grid at positions between its points, by
+    interpolating bilinearly between neighbouring values.
+
+    Parameters:
+        grid (array): grid of values to be sampled
+        positionsX (array): X positions to sample at, relative to first point
+        positionsY (array): Y positions to sample at, relative to first point
+        step (pair): X and Y distance between grid points
+
+    Returns:
+        array: array of size len(positionsX) x len(positionsY)
+    """
+
+    indexX = numpy.minimum(positionsX // step[0], grid.shape[0]-2)
+    indexY = numpy.minimum(positionsY // step[1], grid.shape[1]-2)
+    weightX = ((positionsX - indexX*step[0]) / step[0])[:, numpy.newaxis]
+    weightY = ((positionsY - indexY*step[1]) / step[1])[numpy.newaxis, :]
+    indexX = indexX.astype(int)
+    indexY = indexY.astype(int)
+
+    rows = grid[indexX] * (1 - weightX) + grid[indexX + 1] * weightX
+    return rows[:, indexY] * (1 - weightY) + rows[:, indexY + 1] * weightY
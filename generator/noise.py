@@ -1,19 +1,103 @@
 import math
 import numpy
+from concurrent.futures import ProcessPoolExecutor, as_completed
 from opensimplex import OpenSimplex
 from config.config import config as Config
 from generator.modifications import *
+from generator.simplex import createPermutation, noise2dArray
 from visualizer.visualizer import Visualizer
 
+DEFAULT_WORKERS = int(Config.get('noise', 'workers'))
+DEFAULT_CHUNK_SIZE = int(Config.get('noise', 'chunk_size'))
+DEFAULT_DTYPE = Config.get('noise', 'dtype')
+DEFAULT_TOLERANCE = float(Config.get('noise', 'tolerance'))
+# Amount of grid points evaluated at once, which bounds temporary arrays
+BLOCK_SIZE = int(Config.get('noise', 'block_size'))
+
+# Largest bilinear interpolation error of noise, relative to the squared
+# lattice spacing in noise coordinates. Measured to be around 0.8
+INTERPOLATION_ERROR = 1.0
+
+
+# Noise generator of a worker process, reused by all of its tasks
+workerNoise = None
+
+
+def getWorkerNoise(settings):
+    """
+    Function to get the noise generator of a worker process. Only the
+    settings are sent to the worker, and the generator is created once
+    for each seed.
+
+    Parameters:
+        settings (dict): seed, dtype, tolerance and cache of the noise,
+                         from Noise.getWorkerSettings
+
+    Returns:
+        Noise: noise generator with those settings
+    """
+
+    global workerNoise
+    if workerNoise is None or workerNoise.seed != settings["seed"]:
+        workerNoise = Noise(settings["seed"])
+        workerNoise.setSeed(settings["seed"])
+
+    # Task is already running in a worker, so it is generated serially
+    workerNoise.setWorkers(1)
+    workerNoise.setDtype(settings["dtype"])
+    workerNoise.setTolerance(settings["tolerance"])
+    workerNoise.setCache(settings["cache"])
+    return workerNoise
+
+
+def generateOctavePass(settings, octave, arguments):
+    """
+    Function to generate one octave pass in a worker process.
+
+    Parameters:
+        settings (dict): settings of the noise generator
+        octave (float): multiplier for noise intensity
+        arguments (dict): arguments for Noise.generateSimpleNoiseArray
+
+    Returns:
+        array: noise pass multiplied by the octave
+    """
+
+    noise = getWorkerNoise(settings)
+    return octave * noise.generateSimpleNoiseArray(**arguments)
+
+
+def generateNoiseChunk(settings, arguments):
+    """
+    Function to generate one chunk of complex noise in a worker process.
+
+    Parameters:
+        settings (dict): settings of the noise generator
+        arguments (dict): arguments for Noise.generateComplexNoiseArray,
+                          including octaves and scales
+
+    Returns:
+        array: combined noise for the chunk
+    """
+
+    noise = getWorkerNoise(settings)
+    return noise.generateComplexNoiseArray(**arguments)
+
 
 class Noise:
     """
     Class for a Noise generation using Opensimplex.
 
     Attributes:
+        seed (int): seed of the noise
         noise (OpenSimplex): object that generates noise
+        perm (array): permutation table of noise, for vectorized evaluation
         octaves (list of floats): multipliers for noises intensity
         scales (list of floats): multipliers for noises scale
+        workers (int): amount of processes used for generating octaves
+        cache (NoiseCache, None): cache for generated noise arrays
+        dtype (numpy.dtype): floating point type of generated arrays
+        tolerance (float): allowed error for interpolated noise passes
     """
 
     def __init__(self, seed):
@@ -25,6 +109,10 @@ class Noise:
         """
 
         self.setSeed(hash(seed))
+        self.setWorkers(DEFAULT_WORKERS)
+        self.setCache(None)
+        self.setDtype(DEFAULT_DTYPE)
+        self.setTolerance(DEFAULT_TOLERANCE)
 
     def setSeed(self, seed):
         """
@@ -34,7 +122,9 @@ class Noise:
             seed (any): seed for the generators
         """
 
+        self.seed = seed
         self.noise = OpenSimplex(seed)
+        self.perm = createPermutation(self.noise)
         numpy.random.seed(seed)
 
     def setOctaves(self, *args):
@@ -57,6 +147,89 @@ class Noise:
 
         self.scales = args
 
+    def setWorkers(self, workers=DEFAULT_WORKERS):
+        """
+        Function to set amount of worker processes for octave generation.
+        With more than 1 worker, octaves are generated in a process pool.
+
+        Parameters:
+            workers (int): amount of worker processes
+        """
+
+        self.workers = max(int(workers), 1)
+
+    def setCache(self, cache=None):
+        """
+        Function to set cache for generated noise arrays.
+
+        Parameters:
+            cache (NoiseCache, None): cache to be used, None to disable
+        """
+
+        self.cache = cache
+
+    def setDtype(self, dtype=DEFAULT_DTYPE):
+        """
+        Function to set floating point type of generated arrays.
+        Noise is always evaluated in double precision, one block at a time,
+        and each block is stored as this type right away, for example
+        float32 to halve the memory used.
+
+        Parameters:
+            dtype (str, numpy.dtype): floating point type
+        """
+
+        self.dtype = numpy.dtype(dtype)
+
+    def setTolerance(self, tolerance=DEFAULT_TOLERANCE):
+        """
+        Function to set allowed error for interpolated noise passes.
+        With tolerance above 0, smooth (large scale) passes are evaluated
+        on a coarser lattice and interpolated bilinearly.
+
+        Parameters:
+            tolerance (float): allowed error, 0.0 for exact noise
+        """
+
+        self.tolerance = max(float(tolerance), 0.0)
+
+    def getWorkerSettings(self):
+        """
+        Function to get the settings that a worker process needs to
+        generate the same noise.
+
+        Returns:
+            dict: seed, dtype, tolerance and cache of the noise
+        """
+
+        return {
+            "seed": self.seed,
+            "dtype": self.dtype.str,
+            "tolerance": self.tolerance,
+            "cache": self.cache
+        }
+
+    def getLatticeStep(self, scale, tolerance=None):
+        """
+        Function to get spacing of a lattice, that noise of given scale
+        can be evaluated on and interpolated within a tolerance.
+
+        Parameters:
+            scale (float): scaling factor of the noise
+            tolerance (float, None): allowed error, None for default
+
+        Returns:
+            int: lattice spacing, 1 when every point needs evaluating
+        """
+
+        if tolerance is None:
+            tolerance = self.tolerance
+
+        return max(
+            int(scale * math.sqrt(tolerance / INTERPOLATION_ERROR)),
+            1
+        )
+
     def noiseXY(self, x, y):
         """
         Function to get noise value at point X Y.
@@ -88,6 +261,139 @@ class Noise:
         value = self.noiseXY(x/scaleX, y/scaleY)
         return (1 + value) * 0.5
 
+    def noiseXYArray(self, x, y):
+        """
+        Function to get noise values for whole arrays of X Y coordinates.
+        Values are identical to calling noiseXY for each point.
+
+        Parameters:
+            x (array): X coordinates for noise
+            y (array): Y coordinates for noise, broadcastable with x
+
+        Returns:
+            array: values at those coordinates from -1.0 to 1.0
+        """
+
+        return noise2dArray(self.perm, x, y)
+
+    def getNoiseXYArray(self, x, y, scaleX, scaleY):
+        """
+        Function to get noise values for whole arrays of X Y coordinates,
+        scaled by a value. And normalized to values between 0.0 and 1.0
+        Values are identical to calling getNoiseXYValue for each point.
+
+        Parameters:
+            x (array): X coordinates for noise
+            y (array): Y coordinates for noise, broadcastable with x
+            scaleX (float): Scaling factor for X
+            scaleY (float): Scaling factor for Y
+
+        Returns:
+            array: values at those scaled coordinates from 0.0 to 1.0
+        """
+
+        value = self.noiseXYArray(
+            numpy.asarray(x) / scaleX,
+            numpy.asarray(y) / scaleY
+        )
+        return (1 + value) * 0.5
+
+    def getNoiseGrid(self, origin, step, shape, scaleX, scaleY, out=None):
+        """
+        Function to get a grid of noise values, starting from origin
+        and advancing by step in each direction.
+        Grid is evaluated in blocks of rows, so temporary arrays stay small.
+
+        Parameters:
+            origin (dict): X and Y coordinates of the first grid point
+            step (dict): X and Y distance between grid points
+            shape (pair): amount of grid points in X and Y direction
+            scaleX (float): Scaling factor for X
+            scaleY (float): Scaling factor for Y
+            out (array, None): array of given shape to write into
+
+        Returns:
+            array: grid of values from 0.0 to 1.0 with given shape
+        """
+
+        x = numpy.arange(shape[0]) * step["x"] + origin["x"]
+        y = numpy.arange(shape[1]) * step["y"] + origin["y"]
+
+        if out is None:
+            out = numpy.empty(shape)
+
+        rows = max(BLOCK_SIZE // max(shape[1], 1), 1)
+        for start in range(0, shape[0], rows):
+            out[start:start + rows] = self.getNoiseXYArray(
+                x[start:start + rows, numpy.newaxis],
+                y[numpy.newaxis, :],
+                scaleX,
+                scaleY
+            )
+
+        return out
+
+    def getInterpolatedNoiseGrid(
+        self,
+        origin,
+        shape,
+        step,
+        scaleX,
+        scaleY,
+        out=None
+    ):
+        """
+        Function to get a grid of noise values for every point starting from
+        origin, by evaluating noise on a coarser lattice and interpolating
+        it bilinearly. Lattice is aligned to multiples of step, so
+        neighbouring grids line up without seams.
+        Grid is interpolated in blocks of rows, so temporary arrays stay small.
+
+        Parameters:
+            origin (dict): X and Y coordinates of the first grid point
+            shape (pair): amount of grid points in X and Y direction
+            step (dict): X and Y lattice spacing
+            scaleX (float): Scaling factor for X
+            scaleY (float): Scaling factor for Y
+            out (array, None): array of given shape to write into
+
+        Returns:
+            array: grid of values from 0.0 to 1.0 with given shape
+        """
+
+        start = {
+            "x": math.floor(origin["x"] / step["x"]) * step["x"],
+            "y": math.floor(origin["y"] / step["y"]) * step["y"]
+        }
+        # Positions of every grid point relative to the lattice start
+        positionsX = numpy.arange(shape[0]) + (origin["x"] - start["x"])
+        positionsY = numpy.arange(shape[1]) + (origin["y"] - start["y"])
+
+        lattice = self.getNoiseGrid(
+            start,
+            step,
+            (
+                int(positionsX[-1] // step["x"]) + 2,
+                int(positionsY[-1] // step["y"]) + 2
+            ),
+            scaleX,
+            scaleY
+        )
+
+        if out is None:
+            out = numpy.empty(shape)
+
+        rows = max(BLOCK_SIZE // max(shape[1], 1), 1)
+        for start in range(0, shape[0], rows):
+            out[start:start + rows] = interpolateBilinear(
+                lattice,
+                positionsX[start:start + rows],
+                positionsY,
+                (step["x"], step["y"])
+            )
+
+        return out
+
     def generateSimpleNoiseArray(
         self,
         xSize,
@@ -95,7 +401,9 @@ class Noise:
         scaleX,
         scaleY=None,
         offset={"x": 0, "y": 0},
-        useRidgeNoise=False
+        useRidgeNoise=False,
+        tolerance=None,
+        out=None
     ):
         """
         Function generates a 2d array of size xSize x ySize,
@@ -108,6 +416,9 @@ class Noise:
             scaleY (float, None): scaling factor in Y direction
             offset (list): Offset in X and Y direction
             useRidgeNoise (bool): Use value remaping
+            tolerance (float, None): allowed interpolation error,
+                                     None for default
+            out (array, None): array of size xSize x ySize to write into
 
         Returns:
             array: value at that scaled coordinate from 0.0 to 1.0
@@ -116,18 +427,64 @@ class Noise:
         if scaleY is None:
             scaleY = scaleX
 
-        currentPass = numpy.zeros((xSize, ySize))
-        for x in range(0, xSize):
-            for y in range(0, ySize):
-                currentPass[x][y] = self.getNoiseXYValue(
-                    x + offset["x"],
-                    y + offset["y"],
-                    scaleX,
-                    scaleY
-                )
+        step = {
+            "x": self.getLatticeStep(scaleX, tolerance),
+            "y": self.getLatticeStep(scaleY, tolerance)
+        }
+
+        if self.cache is not None:
+            key = self.cache.getKey(
+                "simple",
+                self.seed,
+                xSize,
+                ySize,
+                scaleX,
+                scaleY,
+                offset["x"],
+                offset["y"],
+                useRidgeNoise,
+                self.dtype.str,
+                step["x"],
+                step["y"]
+            )
+            cached = self.cache.load(key)
+            if cached is not None:
+                if out is None:
+                    return cached
+                out[...] = cached
+                return out
+
+        currentPass = out
+        if currentPass is None:
+            currentPass = numpy.empty((xSize, ySize), dtype=self.dtype)
+        if step["x"] > 1 or step["y"] > 1:
+            self.getInterpolatedNoiseGrid(
+                offset,
+                (xSize, ySize),
+                step,
+                scaleX,
+                scaleY,
+                out=currentPass
+            )
+        else:
+            self.getNoiseGrid(
+                offset,
+                {"x": 1, "y": 1},
+                (xSize, ySize),
+                scaleX,
+                scaleY,
+                out=currentPass
+            )
 
         if useRidgeNoise:
-            currentPass = ridgeNoise(currentPass)
+            rows = max(BLOCK_SIZE // max(ySize, 1), 1)
+            for start in range(0, xSize, rows):
+                currentPass[start:start + rows] = ridgeNoise(
+                    currentPass[start:start + rows]
+                )
+
+        if self.cache is not None:
+            self.cache.save(key, currentPass)
         return currentPass
 
     def generateComplexNoiseArray(
@@ -170,21 +527,207 @@ class Noise:
 
         octaveSum = sum(octaves)
 
-        passes = []
-
-        for iteration, octave in enumerate(octaves):
-            passes.append(octave * self.generateSimpleNoiseArray(
+        if self.cache is not None and combinedPasses:
+            key = self.cache.getKey(
+                "complex",
+                self.seed,
                 xSize,
                 ySize,
-                maxSize/scales[iteration],
-                offset=offset,
-                useRidgeNoise=useRidgeNoise
-            ))
+                maxSize,
+                tuple(octaves),
+                tuple(scales),
+                offset["x"],
+                offset["y"],
+                useRidgeNoise,
+                self.dtype.str,
+                self.tolerance
+            )
+            cached = self.cache.load(key)
+            if cached is not None:
+                return cached
+
+        if self.workers > 1:
+            passes = self.generatePassesParallel(
+                xSize,
+                ySize,
+                maxSize,
+                octaves,
+                scales,
+                offset,
+                useRidgeNoise
+            )
+            if not combinedPasses:
+                return passes
+            combined = self.compileNoiseMap(passes, octaveSum)
+        elif combinedPasses:
+            # Passes are added as they are generated, in the same order as
+            # compileNoiseMap, so only one pass is held at a time
+            combined = numpy.zeros((xSize, ySize), dtype=self.dtype)
+            for iteration, octave in enumerate(octaves):
+                currentPass = self.generateSimpleNoiseArray(
+                    xSize,
+                    ySize,
+                    maxSize/scales[iteration],
+                    offset=offset,
+                    useRidgeNoise=useRidgeNoise
+                )
+                self.addNoisePass(combined, octave, currentPass)
+            combined /= octaveSum
+        else:
+            passes = []
+            for iteration, octave in enumerate(octaves):
+                passes.append(octave * self.generateSimpleNoiseArray(
+                    xSize,
+                    ySize,
+                    maxSize/scales[iteration],
+                    offset=offset,
+                    useRidgeNoise=useRidgeNoise
+                ))
+            return passes
+
+        if self.cache is not None:
+            self.cache.save(key, combined)
+        return combined
+
+    def generateChunkedNoiseArray(
+        self,
+        xSize,
+        ySize,
+        maxSize,
+        chunkSize=DEFAULT_CHUNK_SIZE,
+        octaves=None,
+        scales=None,
+        offset={"x": 0, "y": 0},
+        useRidgeNoise=False,
+        out=None
+    ):
+        """
+        Function generates a 2d array of size xSize x ySize with combined
+        complex noise, by splitting it into rectangular chunks.
+        Each chunk is generated with its own offset, so chunks are stitched
+        together without seams and the result is identical to
+        generateComplexNoiseArray. With more than 1 worker, chunks are
+        generated in a process pool, and a worker only ever holds one chunk.
 
-        if combinedPasses:
-            return self.compileNoiseMap(passes, octaveSum)
+        Parameters:
+            xSize (int): size of generated noise in X direction
+            ySize (int): size of generated noise in Y direction
+            maxSize (float): scaling factor
+            chunkSize (int): maximum size of a chunk in X and Y direction
+            octaves (list of floats): list of noise level intensities
+            scales (list of floats): list of noise level scales
+            offset (list): 2 values for X and Y offsets
+            useRidgeNoise (bool): Use value remaping
+            out (array, None): array of size xSize x ySize to write into,
+                               for example a numpy.memmap
 
-        return passes
+        Returns:
+            array: array of size xSize x ySize with combined noise passes
+        """
+
+        if out is None:
+            out = numpy.zeros((xSize, ySize), dtype=self.dtype)
+        # Workers do not know octaves and scales of this generator
+        if octaves is None:
+            octaves = self.octaves
+        if scales is None:
+            scales = self.scales
+
+        chunkSize = max(int(chunkSize), 1)
+        chunks = []
+        for x in range(0, xSize, chunkSize):
+            for y in range(0, ySize, chunkSize):
+                chunks.append(((x, y), {
+                    "xSize": min(chunkSize, xSize - x),
+                    "ySize": min(chunkSize, ySize - y),
+                    "maxSize": maxSize,
+                    "octaves": octaves,
+                    "scales": scales,
+                    "offset": {
+                        "x": offset["x"] + x,
+                        "y": offset["y"] + y
+                    },
+                    "useRidgeNoise": useRidgeNoise
+                }))
+
+        if self.workers <= 1:
+            for (x, y), arguments in chunks:
+                out[
+                    x:x + arguments["xSize"],
+                    y:y + arguments["ySize"]
+                ] = self.generateComplexNoiseArray(**arguments)
+            return out
+
+        settings = self.getWorkerSettings()
+        with ProcessPoolExecutor(max_workers=self.workers) as executor:
+            futures = {
+                executor.submit(generateNoiseChunk, settings, arguments): (
+                    x, y, arguments
+                ) for (x, y), arguments in chunks
+            }
+            for future in as_completed(futures):
+                x, y, arguments = futures.pop(future)
+                out[
+                    x:x + arguments["xSize"],
+                    y:y + arguments["ySize"]
+                ] = future.result()
+
+        return out
+
+    def generatePassesParallel(
+        self,
+        xSize,
+        ySize,
+        maxSize,
+        octaves,
+        scales,
+        offset,
+        useRidgeNoise
+    ):
+        """
+        Function generates octave passes in a process pool.
+        When there are more workers than octaves, each octave is split into
+        bands of rows, so that all workers are kept busy. Every value is
+        calculated the same way as in a serial pass, so the result is
+        identical to it.
+
+        Parameters:
+            xSize (int): size of generated noise in X direction
+            ySize (int): size of generated noise in Y direction
+            maxSize (float): scaling factor
+            octaves (list of floats): list of noise level intensities
+            scales (list of floats): list of noise level scales
+            offset (list): 2 values for X and Y offsets
+            useRidgeNoise (bool): Use value remaping
+
+        Returns:
+            list: list of arrays of size xSize x ySize
+        """
+
+        bandCount = min(math.ceil(self.workers / len(octaves)), xSize)
+        bands = numpy.array_split(numpy.arange(xSize), bandCount)
+        settings = self.getWorkerSettings()
+
+        with ProcessPoolExecutor(max_workers=self.workers) as executor:
+            futures = []
+            for iteration, octave in enumerate(octaves):
+                futures.append([
+                    executor.submit(generateOctavePass, settings, octave, {
+                        "xSize": len(band),
+                        "ySize": ySize,
+                        "scaleX": maxSize/scales[iteration],
+                        "offset": {
+                            "x": offset["x"] + int(band[0]),
+                            "y": offset["y"]
+                        },
+                        "useRidgeNoise": useRidgeNoise
+                    }) for band in bands
+                ])
+
+            return [
+                numpy.concatenate([future.result() for future in octave])
+                for octave in futures
+            ]
 
     def compileNoiseMap(
         self,
@@ -203,12 +746,68 @@ class Noise:
             array: combined value passes normalized
         """
 
-        resultingPass = numpy.zeros(passes[0].shape)
+        resultingPass = numpy.zeros(passes[0].shape, dtype=self.dtype)
 
         for elevation in passes:
             resultingPass += elevation
 
-        return resultingPass/octaveSum
+        resultingPass /= octaveSum
+        return resultingPass
+
+    def addNoisePass(self, combined, octave, currentPass):
+        """
+        Function to add a noise pass multiplied by its intensity to
+        combined noise, in blocks of rows so temporary arrays stay small.
+
+        Parameters:
+            combined (array): combined noise to add to
+            octave (float): intensity of the pass
+            currentPass (array): noise pass of the same size
+        """
+
+        rows = max(BLOCK_SIZE // max(combined.shape[1], 1), 1)
+        for start in range(0, combined.shape[0], rows):
+            combined[start:start + rows] += (
+                octave * currentPass[start:start + rows]
+            )
+
+    def blendRandomNoise(self, noiseMap, randomMap, randomWeight):
+        """
+        Function to combine noise with random values, so that it forms
+        distinct levels of density with fuzzy edges.
+
+        Parameters:
+            noiseMap (array): noise values from 0.0 to 1.0
+            randomMap (array): random values from 0.0 to 1.0
+            randomWeight (float, list of floats): how much randomness affects
+                the map, or each layer of a stack of maps
+
+        Returns:
+            array: combined map multiplied by 100.0
+        """
+
+        randomWeight = numpy.asarray(randomWeight, dtype=float)
+        randomWeight = randomWeight.reshape(
+            randomWeight.shape + (1,) * (noiseMap.ndim - randomWeight.ndim)
+        )
+
+        # Set 6 distinct levels of density
+        # 0% 20% 40% 60% 80% 100%
+        noiseMap = numpy.around((1.0-noiseMap)*5)/5
+
+        # Then combine them
+        noiseMap = (
+            (noiseMap * (1-randomWeight).astype(noiseMap.dtype)) +
+            (randomMap * randomWeight.astype(noiseMap.dtype))
+        )
+
+        # Normalize so that values are in range of [0.0, 1.0]
+        # correctionMin = numpy.amin(noiseMap)
+        # correctionMax = numpy.amax(noiseMap)
+        # noiseMap -= correctionMin
+        # noiseMap *= 1.0/(correctionMax-correctionMin)
+
+        return noiseMap * 100.0
 
     def getRandomNoiseMap(
         self,
@@ -233,27 +832,83 @@ class Noise:
 
         maxSize = max(sizes["x"], sizes["y"])
 
-        noiseMap = self.generateSimpleNoiseArray(
+        noiseMap = numpy.empty((sizes["x"], sizes["y"]), dtype=self.dtype)
+        self.generateSimpleNoiseArray(
             sizes["x"],
             sizes["y"],
             maxSize/clumping,
-            offset=offset
+            offset=offset,
+            out=noiseMap
         )
 
-        # Set 6 distinct levels of density
-        # 0% 20% 40% 60% 80% 100%
-        noiseMap = numpy.around((1.0-noiseMap)*5)/5
-
         # Then generate randomness to make the edges more fuzzy
-        randomMap = numpy.random.random((sizes["x"], sizes["y"]))
+        self.blendRandomBlocks(noiseMap, randomWeight)
+        return noiseMap
 
-        # Then combine them
-        noiseMap = (noiseMap * (1-randomWeight)) + (randomMap * randomWeight)
+    def blendRandomBlocks(self, noiseMap, randomWeight):
+        """
+        Function to draw random values for a noise map and blend them in
+        place, in blocks of rows so temporary arrays stay small. Random
+        values are drawn in the same order as one call for the whole map.
 
-        # Normalize so that values are in range of [0.0, 1.0]
-        # correctionMin = numpy.amin(noiseMap)
-        # correctionMax = numpy.amax(noiseMap)
-        # noiseMap -= correctionMin
-        # noiseMap *= 1.0/(correctionMax-correctionMin)
+        Parameters:
+            noiseMap (array): noise values from 0.0 to 1.0, that are
+                              replaced with the combined map
+            randomWeight (float): how much randomness affects the map
+        """
 
-        return noiseMap * 100.0
+        rows = max(BLOCK_SIZE // max(noiseMap.shape[1], 1), 1)
+        for start in range(0, noiseMap.shape[0], rows):
+            block = noiseMap[start:start + rows]
+            randomMap = numpy.random.random(block.shape).astype(
+                self.dtype,
+                copy=False
+            )
+            block[...] = self.blendRandomNoise(block, randomMap, randomWeight)
+
+    def getRandomNoiseMaps(
+        self,
+        sizes,
+        clumpings,
+        randomWeights,
+        offsetRange
+    ):
+        """
+        Function generates a stack of random noise maps, one layer for each
+        clumping. Each layer gets its own random offset and random values,
+        drawn in the same order as calling getRandomNoiseMap for each
+        layer would. Layers are generated one at a time, straight into
+        the stack.
+
+        Parameters:
+            sizes (pair): x and y map size
+            clumpings (list of floats): scale for noise of each layer
+            randomWeights (list of floats): how much randomness affects
+                                            each layer
+            offsetRange (int): upper bound for random offsets
+
+        Returns:
+            array: layers x X x Y array of noise maps multiplied by 100.0
+        """
+
+        maxSize = max(sizes["x"], sizes["y"])
+
+        noiseMaps = numpy.empty(
+            (len(clumpings), sizes["x"], sizes["y"]),
+            dtype=self.dtype
+        )
+        for layer, clumping in enumerate(clumpings):
+            offset = {
+                "x": numpy.random.randint(0, offsetRange),
+                "y": numpy.random.randint(0, offsetRange)
+            }
+            self.generateSimpleNoiseArray(
+                sizes["x"],
+                sizes["y"],
+                maxSize/clumping,
+                offset=offset,
+                out=noiseMaps[layer]
+            )
+            self.blendRandomBlocks(noiseMaps[layer], randomWeights[layer])
+
+        return noiseMaps
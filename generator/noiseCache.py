@@ -0,0 +1,136 @@
+import hashlib
+import os
+import numpy
+from config.config import config as Config
+
+DEFAULT_DIRECTORY = Config.get('noiseCache', 'directory')
+DEFAULT_MAX_SIZE = int(Config.get('noiseCache', 'max_size_mb')) * 1024 * 1024
+
+
+class NoiseCache:
+    """
+    Class for a persistent cache of generated noise arrays.
+    Arrays are stored as .npy files, and loaded back memory-mapped, so a
+    cache hit does not copy the data. When the cache grows over its maximum
+    size, least recently used arrays are removed.
+
+    Attributes:
+        directory (str): directory where arrays are stored
+        maxSize (int): maximum size of the cache in bytes
+    """
+
+    def __init__(self, directory=DEFAULT_DIRECTORY, maxSize=DEFAULT_MAX_SIZE):
+        """
+        Constructor for NoiseCache class.
+
+        Parameters:
+            directory (str): directory where arrays are stored
+            maxSize (int): maximum size of the cache in bytes
+        """
+
+        self.directory = directory
+        self.maxSize = max(int(maxSize), 0)
+        os.makedirs(self.directory, exist_ok=True)
+
+    def getKey(self, *args):
+        """
+        Function to create a key from the parameters that define an array.
+
+        Parameters:
+            args (list): parameters, for example seed, scale, offset and size
+
+        Returns:
+            str: key for the array
+        """
+
+        return hashlib.sha1(repr(args).encode("utf-8")).hexdigest()
+
+    def getPath(self, key):
+        """
+        Function to get the file path for a key.
+
+        Parameters:
+            key (str): key for the array
+
+        Returns:
+            str: path to the file of the array
+        """
+
+        return os.path.join(self.directory, f"{key}.npy")
+
+    def load(self, key):
+        """
+        Function to load an array from the cache.
+        The array is memory-mapped copy-on-write, so it can be modified
+        without changing the cached file.
+
+        Parameters:
+            key (str): key for the array
+
+        Returns:
+            array: cached array
+            None: If array is not in the cache
+        """
+
+        path = self.getPath(key)
+        try:
+            array = numpy.load(path, mmap_mode="c")
+            # Mark as recently used
+            os.utime(path)
+        except (OSError, ValueError):
+            return None
+
+        return array
+
+    def save(self, key, array):
+        """
+        Function to store an array in the cache, and evict old arrays
+        if cache exceeds its maximum size.
+
+        Parameters:
+            key (str): key for the array
+            array (array): array to be stored
+        """
+
+        path = self.getPath(key)
+        temporaryPath = f"{path}.{os.getpid()}.tmp"
+        with open(temporaryPath, "wb") as file:
+            numpy.save(file, array)
+        os.replace(temporaryPath, path)
+        self.evict()
+
+    def evict(self):
+        """
+        Function to remove least recently used arrays until the cache
+        fits in its maximum size.
+        """
+
+        entries = []
+        for name in os.listdir(self.directory):
+            if not name.endswith(".npy"):
+                continue
+            try:
+                stat = os.stat(os.path.join(self.directory, name))
+            except FileNotFoundError:
+                continue
+            entries.append((stat.st_mtime, stat.st_size, name))
+
+        totalSize = sum(entry[1] for entry in entries)
+        for _, size, name in sorted(entries):
+            if totalSize <= self.maxSize:
+                break
+            try:
+                os.remove(os.path.join(self.directory, name))
+            except OSError:
+                # Already removed, or still mapped by someone else
+                continue
+            totalSize -= size
+
+    def clear(self):
+        """
+        Function to remove all arrays from the cache.
+        """
+
+        for name in os.listdir(self.directory):
+            if name.endswith(".npy"):
+                os.remove(os.path.join(self.directory, name))
@@ -0,0 +1,204 @@
+import numpy
+
+# Constants mirror the ones used by opensimplex, so that the vectorized
+# evaluation produces exactly the same values as OpenSimplex.noise2d
+STRETCH_CONSTANT_2D = -0.211324865405187
+SQUISH_CONSTANT_2D = 0.366025403784439
+NORM_CONSTANT_2D = 47
+
+GRADIENTS_2D = numpy.array([
+     5,  2,    2,  5,
+    -5,  2,   -2,  5,
+     5, -2,    2, -5,
+    -5, -2,   -2, -5,
+], dtype=numpy.int64)
+
+
+def createPermutation(noise):
+    """
+    Function to get the permutation table of an OpenSimplex object.
+
+    Parameters:
+        noise (OpenSimplex): object that generates noise
+
+    Returns:
+        array: permutation table as an integer array
+    """
+
+    return numpy.array(noise._perm, dtype=numpy.int64)
+
+
+def extrapolate(perm, xsb, ysb, dx, dy):
+    """
+    Function to calculate gradient contribution for arrays of lattice points.
+
+    Parameters:
+        perm (array): permutation table
+        xsb (array): X lattice coordinates
+        ysb (array): Y lattice coordinates
+        dx (array): X distances from the lattice points
+        dy (array): Y distances from the lattice points
+
+    Returns:
+        array: gradient contributions
+    """
+
+    index = perm[(perm[xsb & 0xFF] + ysb) & 0xFF] & 0x0E
+    return GRADIENTS_2D[index] * dx + GRADIENTS_2D[index + 1] * dy
+
+
+def attenuate(perm, xsb, ysb, dx, dy):
+    """
+    Function to calculate attenuated contribution of a lattice point.
+    Points that are too far away contribute nothing.
+
+    Parameters:
+        perm (array): permutation table
+        xsb (array): X lattice coordinates
+        ysb (array): Y lattice coordinates
+        dx (array): X distances from the lattice points
+        dy (array): Y distances from the lattice points
+
+    Returns:
+        array: attenuated contributions
+    """
+
+    attn = 2 - dx * dx - dy * dy
+    inside = attn > 0
+    contribution = numpy.zeros(attn.shape)
+
+    # Gradients are only looked up for points that contribute
+    attn = attn[inside]
+    attn *= attn
+    contribution[inside] = attn * attn * extrapolate(
+        perm,
+        xsb[inside],
+        ysb[inside],
+        dx[inside],
+        dy[inside]
+    )
+    return contribution
+
+
+def noise2dArray(perm, x, y):
+    """
+    Function to get 2D OpenSimplex noise values for whole arrays of
+    coordinates at once. This is a vectorized version of
+    OpenSimplex.noise2d, every value is identical to the scalar version.
+    Temporary arrays are a few times the size of the input, so large
+    grids should be evaluated in blocks.
+
+    Parameters:
+        perm (array): permutation table
+        x (array): X coordinates for noise
+        y (array): Y coordinates for noise, must be broadcastable with x
+
+    Returns:
+        array: values at those coordinates from -1.0 to 1.0
+    """
+
+    x, y = numpy.broadcast_arrays(
+        numpy.asarray(x, dtype=numpy.float64),
+        numpy.asarray(y, dtype=numpy.float64)
+    )
+
+    # Place input coordinates onto grid.
+    stretchOffset = (x + y) * STRETCH_CONSTANT_2D
+    xs = x + stretchOffset
+    ys = y + stretchOffset
+
+    # Floor to get grid coordinates of rhombus super-cell origin.
+    xsb = numpy.floor(xs).astype(numpy.int64)
+    ysb = numpy.floor(ys).astype(numpy.int64)
+
+    # Skew out to get actual coordinates of rhombus origin.
+    squishOffset = (xsb + ysb) * SQUISH_CONSTANT_2D
+    xb = xsb + squishOffset
+    yb = ysb + squishOffset
+
+    # Compute grid coordinates relative to rhombus origin.
+    xins = xs - xsb
+    yins = ys - ysb
+    inSum = xins + yins
+    del stretchOffset, xs, ys, squishOffset
+
+    # Positions relative to origin point.
+    dx0 = x - xb
+    dy0 = y - yb
+    del xb, yb
+
+    # Contribution (1,0)
+    dx1 = dx0 - 1 - SQUISH_CONSTANT_2D
+    dy1 = dy0 - 0 - SQUISH_CONSTANT_2D
+    value = 0 + attenuate(perm, xsb + 1, ysb + 0, dx1, dy1)
+
+    # Contribution (0,1)
+    dx1 = dx0 - 0 - SQUISH_CONSTANT_2D
+    dy1 = dy0 - 1 - SQUISH_CONSTANT_2D
+    value += attenuate(perm, xsb + 0, ysb + 1, dx1, dy1)
+    del dx1, dy1
+
+    lower = inSum <= 1
+    xGreater = xins > yins
+
+    # Inside the triangle at (0,0)
+    zins = 1 - inSum
+    lowerClosest = (zins > xins) | (zins > yins)
+    # Inside the triangle at (1,1)
+    zins = 2 - inSum
+    upperClosest = (zins < xins) | (zins < yins)
+    del zins, xins, yins, inSum
+
+    # Extra vertex is the origin, unless one of the cases below moves it
+    xsvExt = xsb.copy()
+    ysvExt = ysb.copy()
+    dxExt = dx0.copy()
+    dyExt = dy0.copy()
+
+    closest = lower & lowerClosest
+    case = closest & xGreater
+    xsvExt[case] += 1
+    ysvExt[case] -= 1
+    dxExt[case] = dx0[case] - 1
+    dyExt[case] = dy0[case] + 1
+
+    case = closest & ~xGreater
+    xsvExt[case] -= 1
+    ysvExt[case] += 1
+    dxExt[case] = dx0[case] + 1
+    dyExt[case] = dy0[case] - 1
+
+    case = lower & ~lowerClosest
+    xsvExt[case] += 1
+    ysvExt[case] += 1
+    dxExt[case] = dx0[case] - 1 - 2 * SQUISH_CONSTANT_2D
+    dyExt[case] = dy0[case] - 1 - 2 * SQUISH_CONSTANT_2D
+
+    closest = ~lower & upperClosest
+    case = closest & xGreater
+    xsvExt[case] += 2
+    dxExt[case] = dx0[case] - 2 - 2 * SQUISH_CONSTANT_2D
+    dyExt[case] = dy0[case] + 0 - 2 * SQUISH_CONSTANT_2D
+
+    case = closest & ~xGreater
+    ysvExt[case] += 2
+    dxExt[case] = dx0[case] + 0 - 2 * SQUISH_CONSTANT_2D
+    dyExt[case] = dy0[case] - 2 - 2 * SQUISH_CONSTANT_2D
+    del closest, case, lowerClosest, upperClosest, xGreater
+
+    # Inside the triangle at (1,1) the origin moves to (1,1)
+    upper = ~lower
+    xsb[upper] += 1
+    ysb[upper] += 1
+    dx0[upper] = dx0[upper] - 1 - 2 * SQUISH_CONSTANT_2D
+    dy0[upper] = dy0[upper] - 1 - 2 * SQUISH_CONSTANT_2D
+    del upper, lower
+
+    # Contribution (0,0) or (1,1)
+    value += attenuate(perm, xsb, ysb, dx0, dy0)
+    del xsb, ysb, dx0, dy0
+
+    # Extra Vertex
+    value += attenuate(perm, xsvExt, ysvExt, dxExt, dyExt)
+
+    return value / NORM_CONSTANT_2D
@@ -138,6 +138,40 @@ class Asset:
 
         return output
 
+    def SqlParameters(self):
+        """
+        Function to get the object values for SQL placeholders, in the order
+        of table columns.
+
+        Returns:
+            tuple: values for inserting the object into a table.
+        """
+
+        return (
+            self.uuid,
+            self.__class__.__name__,
+            self.name,
+            self.assetName,
+            self.string,
+            *self.position.SqlParameters(),
+            *self.rotation.SqlParameters(),
+            *self.scale.SqlParameters(),
+            *self.mCenter.SqlParameters(),
+            *self.mExtent.SqlParameters()
+        )
+
+    def SqlInsertQuery():
+        """
+        Function to return a parameterized SQL expression for inserting
+        an asset, used with SqlParameters.
+
+        Returns:
+            str: An SQL expression for inserting values into a specific table.
+        """
+
+        placeholders = ", ".join(["?"] * 25)
+        return f"""INSERT INTO {TABLE_NAME} VALUES({placeholders});"""
+
     def SqlCreateTable() -> str:
         """
         Function to return an SQL expression for table creation.
@@ -172,28 +206,31 @@ class Asset:
 
         return f"""DROP TABLE IF EXISTS {TABLE_NAME};"""
 
-    def SqlGetAsset(uuid):
+    def SqlGetAssetsQuery(count):
         """
-        Function to return an SQL expression for dropping asset table.
+        Function to return a parameterized SQL expression for getting
+        many assets by their UUIDs, ignoring case of the UUIDs.
 
         Parameters:
-            uuid (str): UUID of the asset to be fetched from database.
+            count (int): amount of UUIDs to be fetched from database.
 
         Returns:
-            str: An SQL expression for get asset from specific table.
+            str: An SQL expression for get assets from specific table.
         """
 
-        return f"""SELECT * FROM {TABLE_NAME} WHERE UUID = '{uuid}';"""
+        placeholders = ", ".join(["?"] * count)
+        return (
+            f"""SELECT * FROM {TABLE_NAME} """
+            f"""WHERE UUID COLLATE NOCASE IN ({placeholders});"""
+        )
 
-    def SqlDeleteAsset(uuid):
+    def SqlDeleteAssetQuery():
         """
-        Function to return an SQL expression for deleteing a specific asset.
-
-        Parameters:
-            uuid (str): UUID of the asset to be removed from database.
+        Function to return a parameterized SQL expression for deleting
+        an asset by its UUID, ignoring case of the UUID.
 
         Returns:
             str: An SQL expression for remove asset from specific table.
         """
 
-        return f"""DELETE FROM {TABLE_NAME} WHERE UUID = '{uuid}';"""
+        return f"""DELETE FROM {TABLE_NAME} WHERE UUID = ? COLLATE NOCASE;"""
@@ -0,0 +1,119 @@
+import threading
+from collections import OrderedDict
+from config.config import config as Config
+
+DEFAULT_MAX_SIZE = int(Config.get('assetCache', 'max_size'))
+
+
+class AssetCache:
+    """
+    Class for an in-memory cache of assets read from the database.
+    When the cache is full, least recently used asset is removed.
+
+    Attributes:
+        maxSize (int): maximum amount of cached assets
+        assets (OrderedDict): cached assets by UUID, least recently used first
+        hits (int): amount of lookups that were found in the cache
+        misses (int): amount of lookups that were not found in the cache
+    """
+
+    def __init__(self, maxSize=DEFAULT_MAX_SIZE):
+        """
+        Constructor for AssetCache class.
+
+        Parameters:
+            maxSize (int): maximum amount of cached assets
+        """
+
+        self.maxSize = max(int(maxSize), 0)
+        self.assets = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+        self.lock = threading.Lock()
+
+    def __len__(self):
+        """
+        Function to get amount of cached assets.
+
+        Returns:
+            int: amount of cached assets
+        """
+
+        return len(self.assets)
+
+    def get(self, uuid):
+        """
+        Function to get an asset from the cache.
+
+        Parameters:
+            uuid (str): UUID of the asset
+
+        Returns:
+            Asset: cached asset
+            None: If asset is not in the cache
+        """
+
+        with self.lock:
+            asset = self.assets.get(uuid)
+            if asset is None:
+                self.misses += 1
+                return None
+
+            self.assets.move_to_end(uuid)
+            self.hits += 1
+            return asset
+
+    def put(self, uuid, asset):
+        """
+        Function to add an asset to the cache.
+
+        Parameters:
+            uuid (str): UUID of the asset
+            asset (Asset): asset to be cached
+        """
+
+        with self.lock:
+            if self.maxSize == 0:
+                return
+
+            self.assets[uuid] = asset
+            self.assets.move_to_end(uuid)
+            while len(self.assets) > self.maxSize:
+                self.assets.popitem(last=False)
+
+    def invalidate(self, uuid):
+        """
+        Function to remove an asset from the cache.
+
+        Parameters:
+            uuid (str): UUID of the asset
+        """
+
+        with self.lock:
+            self.assets.pop(uuid, None)
+
+    def clear(self):
+        """
+        Function to remove all assets from the cache and reset statistics.
+        """
+
+        with self.lock:
+            self.assets.clear()
+            self.hits = 0
+            self.misses = 0
+
+    def getStatistics(self):
+        """
+        Function to get cache statistics.
+
+        Returns:
+            dict: hits, misses, current size and maximum size of the cache
+        """
+
+        with self.lock:
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "size": len(self.assets),
+                "maxSize": self.maxSize
+            }
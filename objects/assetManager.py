@@ -2,14 +2,24 @@ from objects.asset import Asset
 from objects.tile import Tile
 from objects.prop import Prop
 from objects.customAsset import CustomAsset
+from objects.assetCache import AssetCache
 from database.database import Database
 
+# Amount of UUIDs read from database with one query
+QUERY_CHUNK_SIZE = 500
+
 
 class AssetManager():
     """
     Class for a Asset manager. It is responsible for reading and
     writing assets to the database
+
+    Attributes:
+        cache (AssetCache): recently read assets
     """
+
+    cache = AssetCache()
+
     def __init__(self):
         pass
 
@@ -17,8 +27,9 @@ class AssetManager():
         uuid
     ):
         """
-        Function to convert the objects atribute labels to a SQL expression by
-        adding a prefix to it.
+        Function to get an asset by its UUID. Recently read assets are
+        returned from the cache, without reading the database.
+        Returned asset is shared with the cache, so it must not be modified.
 
         Parameters:
             uuid (str): UUID of asset to be searched for
@@ -28,17 +39,71 @@ class AssetManager():
             None: If no object was found
         """
 
-        database = Database()
-        object = database.fetchall(Asset.SqlGetAsset(str(uuid).lower()))
+        return AssetManager.getAssets([uuid], required=False)[0]
 
-        if len(object) == 0:
-            return None
+    def getAssets(
+        uuids,
+        required=True
+    ):
+        """
+        Function to get many assets by their UUIDs at once. Assets that are
+        not in the cache are read with one query per QUERY_CHUNK_SIZE UUIDs.
+        Returned assets are shared with the cache, so they must not be
+        modified.
 
-        assetDictionary = AssetManager.remap(object[0])
-        className = globals()[assetDictionary["Type"]]
-        database.close()
-        asset = className(assetDictionary)
-        return asset
+        Parameters:
+            uuids (list of str): UUIDs of assets to be searched for
+            required (bool): raise ValueError listing UUIDs that were
+                             not found, instead of returning None for them
+
+        Returns:
+            list: asset for each UUID in the same order, None for UUIDs that
+                  were not found. Repeated UUIDs give the same object
+        """
+
+        uuids = [str(uuid).lower() for uuid in uuids]
+        found = {}
+        missing = []
+        # dict keeps first occurrence of each UUID
+        for uuid in dict.fromkeys(uuids):
+            asset = AssetManager.cache.get(uuid)
+            if asset is None:
+                missing.append(uuid)
+            else:
+                found[uuid] = asset
+
+        if len(missing) > 0:
+            database = Database()
+            for start in range(0, len(missing), QUERY_CHUNK_SIZE):
+                chunk = missing[start:start + QUERY_CHUNK_SIZE]
+                for object in database.fetchall(
+                    Asset.SqlGetAssetsQuery(len(chunk)),
+                    tuple(chunk)
+                ):
+                    assetDictionary = AssetManager.remap(object)
+                    className = globals()[assetDictionary["Type"]]
+                    found[str(object[0]).lower()] = className(assetDictionary)
+            database.close()
+
+            for uuid in missing:
+                if uuid in found:
+                    AssetManager.cache.put(uuid, found[uuid])
+
+        notFound = [uuid for uuid in missing if uuid not in found]
+        if required and len(notFound) > 0:
+            raise ValueError(f"Assets not found: {', '.join(notFound)}")
+
+        return [found.get(uuid) for uuid in uuids]
+
+    def getCacheStatistics():
+        """
+        Function to get statistics of the asset cache.
+
+        Returns:
+            dict: hits, misses, current size and maximum size of the cache
+        """
+
+        return AssetManager.cache.getStatistics()
 
     def addCustomAsset(
         name,
@@ -62,8 +127,9 @@ class AssetManager():
             "String": string
         })
 
-        database.execute(customAsset.SqlValues())
+        database.execute(Asset.SqlInsertQuery(), customAsset.SqlParameters())
         database.close()
+        AssetManager.cache.invalidate(customAsset.uuid.lower())
         return customAsset.uuid
 
     def removeAsset(
@@ -77,8 +143,9 @@ class AssetManager():
         """
 
         database = Database()
-        database.execute(Asset.SqlDeleteAsset(uuid))
+        database.execute(Asset.SqlDeleteAssetQuery(), (uuid,))
         database.close()
+        AssetManager.cache.invalidate(str(uuid).lower())
 
     def remap(
         object
@@ -212,8 +279,6 @@ class AssetManager():
             list: array of gathered assets
         """
 
-        assets = []
-        for asset in assetList:
-            assets.append(AssetManager.getAsset(asset.params["asset"]))
-
-        return assets
+        return AssetManager.getAssets(
+            [asset.params["asset"] for asset in assetList]
+        )
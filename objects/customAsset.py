@@ -41,9 +41,10 @@ class CustomAsset(Asset):
                 "y": 0,
                 "z": 0,
             }
-            for item in dictionary:
-                uuid = str(item["uuid"])
-                asset = objects.assetManager.AssetManager.getAsset(uuid)
+            assets = objects.assetManager.AssetManager.getAssets(
+                [str(item["uuid"]) for item in dictionary]
+            )
+            for item, asset in zip(dictionary, assets):
                 for placement in item["instances"]:
                     if placement["rot"] % 180 == 0:
                         offset["x"] = asset.mExtent.x
@@ -65,6 +65,16 @@ class Quad:
 
         return f"{self.x}, {self.y}, {self.z}, {self.w}"
 
+    def SqlParameters(self):
+        """
+        Function to get the object atribute values for SQL placeholders.
+
+        Returns:
+            tuple: X, Y, Z and W values
+        """
+
+        return (self.x, self.y, self.z, self.w)
+
     def SqlFieldNames(prefix=""):
         """
         Function to convert the objects atribute labels to a SQL expression by
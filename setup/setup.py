@@ -6,6 +6,16 @@ from objects.assetManager import AssetManager
 from objects.prop import Prop
 from objects.tile import Tile
 
+# Amount of assets inserted between progress reports
+IMPORT_BATCH_SIZE = 1000
+# Connection settings used only while importing, the database is
+# created from scratch, so it does not need to survive a crash
+IMPORT_PRAGMAS = {
+    "journal_mode": "MEMORY",
+    "synchronous": "OFF",
+    "cache_size": -65536,
+}
+
 
 def setup():
     print("Are you sure you want to do this?")
@@ -29,18 +39,48 @@ def setup():
     objects = json.load(jsonFile)
     jsonFile.close()
 
-    sqlQuerry = ""
+    rows = []
 
-    print("--Generating Tile SQL: ")
+    print("--Generating Tile rows: ")
     for object in objects["Tiles"]:
         tile = Tile(AssetManager.remap(object))
-        sqlQuerry += tile.SqlValues()
+        rows.append(tile.SqlParameters())
 
-    print("--Generating Prop SQL: ")
+    print("--Generating Prop rows: ")
     for object in objects["Props"]:
         prop = Prop(AssetManager.remap(object))
-        sqlQuerry += prop.SqlValues()
+        rows.append(prop.SqlParameters())
 
-    print("--Executing SQL ( takes ~3 min ) ")
-    database.executeScript(sqlQuerry)
+    print("--Inserting rows")
+    importRows(database, rows)
     database.close()
+    AssetManager.cache.clear()
+
+
+def importRows(database, rows):
+    """
+    Function to insert asset rows into the asset table in one transaction.
+
+    Parameters:
+        database (Database): database to insert rows into
+        rows (list of tuples): values of each asset, from SqlParameters
+    """
+
+    previous = {
+        name: database.pragma(name, value)
+        for name, value in IMPORT_PRAGMAS.items()
+    }
+
+    query = Asset.SqlInsertQuery()
+    try:
+        for start in range(0, len(rows), IMPORT_BATCH_SIZE):
+            batch = rows[start:start + IMPORT_BATCH_SIZE]
+            database.executeMany(query, batch, commit=False)
+            print(f"----{start + len(batch)}/{len(rows)} assets")
+        database.commit()
+    finally:
+        # Journal mode can not be changed inside a transaction
+        if database.connection.in_transaction:
+            database.connection.rollback()
+        for name, value in previous.items():
+            database.pragma(name, value)
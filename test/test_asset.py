@@ -51,16 +51,22 @@ class TestAsset(unittest.TestCase):
             Asset.SqlDropTable()
         )
 
-    def test_SqlGetAsset(self):
-        expected = """SELECT * FROM Assets WHERE UUID = 'TEST-UUID';"""
+    def test_SqlDeleteAssetQuery(self):
+        expected = """DELETE FROM Assets WHERE UUID = ? COLLATE NOCASE;"""
         self.assertMultiLineEqual(
             expected,
-            Asset.SqlGetAsset("TEST-UUID")
+            Asset.SqlDeleteAssetQuery()
         )
 
-    def test_SqlDeleteAsset(self):
-        expected = """DELETE FROM Assets WHERE UUID = 'TEST-UUID';"""
+    def test_SqlInsertQuery(self):
+        self.assertEqual(Asset.SqlInsertQuery().count("?"), 25)
+
+    def test_SqlGetAssetsQuery(self):
+        expected = (
+            """SELECT * FROM Assets """
+            """WHERE UUID COLLATE NOCASE IN (?, ?, ?);"""
+        )
         self.assertMultiLineEqual(
             expected,
-            Asset.SqlDeleteAsset("TEST-UUID")
+            Asset.SqlGetAssetsQuery(3)
         )
@@ -0,0 +1,44 @@
+import unittest
+
+from objects.assetCache import AssetCache
+
+
+class TestAssetCache(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(self) -> None:
+        print("\nAsset cache: ", end='')
+
+    def test_getPut(self):
+        cache = AssetCache(2)
+        self.assertIsNone(cache.get("a"))
+        cache.put("a", "asset a")
+        cache.put("b", "asset b")
+
+        self.assertEqual(cache.get("a"), "asset a")
+        cache.put("c", "asset c")
+
+        self.assertEqual(len(cache), 2)
+        self.assertIsNone(cache.get("b"))
+        self.assertEqual(cache.get("c"), "asset c")
+        self.assertEqual(
+            cache.getStatistics(),
+            {"hits": 2, "misses": 2, "size": 2, "maxSize": 2}
+        )
+
+    def test_invalidate(self):
+        cache = AssetCache(2)
+        cache.put("a", "asset a")
+        cache.invalidate("a")
+        cache.invalidate("b")
+        self.assertIsNone(cache.get("a"))
+
+        cache.put("a", "asset a")
+        cache.clear()
+        self.assertEqual(len(cache), 0)
+        self.assertEqual(cache.getStatistics()["misses"], 0)
+
+    def test_disabled(self):
+        cache = AssetCache(0)
+        cache.put("a", "asset a")
+        self.assertIsNone(cache.get("a"))
@@ -1,6 +1,18 @@
-import unittest
+import functools
 import json
+import os
+import tempfile
+import unittest
+import uuid as UUID
+from unittest import mock
+
+from converter.conversionManager import ConversionManager
+from database.database import Database
+from objects.asset import Asset
+from objects.assetCache import AssetCache
 from objects.assetManager import AssetManager
+from objects.customAsset import CustomAsset
+from objects.tile import Tile
 
 
 class TestAssetManager(unittest.TestCase):
@@ -119,3 +131,130 @@ class TestAssetManager(unittest.TestCase):
             asset,
             None
         )
+
+
+class TestAssetManagerTemporaryDatabase(unittest.TestCase):
+    """
+    Tests for AssetManager, reading a temporary database instead of the
+    asset catalog.
+    """
+
+    @classmethod
+    def setUpClass(self) -> None:
+        print("\nAssetManager with temporary database: ", end='')
+
+    def setUp(self):
+        directory = tempfile.TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+        self.addCleanup(Database.closeConnections)
+        path = os.path.join(directory.name, "test.db")
+
+        for patcher in [
+            mock.patch(
+                "objects.assetManager.Database",
+                functools.partial(Database, path)
+            ),
+            mock.patch.object(AssetManager, "cache", AssetCache())
+        ]:
+            patcher.start()
+            self.addCleanup(patcher.stop)
+
+        self.database = Database(path)
+        self.database.execute(Asset.SqlCreateTable())
+        # Stored in lower, upper and mixed case
+        self.tiles = [
+            Tile({
+                "UUID": uuid,
+                "Name": f"Tile {number}",
+                "String": "",
+                "mExtent": {"x": 0.5, "y": 0.25, "z": 0.5, "w": 0}
+            })
+            for number, uuid in enumerate([
+                "abcdef01-0000-4000-8000-0000000000ea",
+                "ABCDEF02-0000-4000-8000-0000000000EB",
+                "AbCdEf03-0000-4000-8000-0000000000eC",
+            ])
+        ]
+        self.database.executeMany(
+            Asset.SqlInsertQuery(),
+            [tile.SqlParameters() for tile in self.tiles]
+        )
+
+    def getCustomString(self):
+        return ConversionManager.encode(json.dumps({
+            "unique_asset_count": 1,
+            "asset_data": {
+                self.tiles[0].uuid: {
+                    "uuid": self.tiles[0].uuid,
+                    "instance_count": 1,
+                    "instances": [{"x": 0, "y": 0, "z": 0, "rot": 0}]
+                }
+            }
+        })).decode("ascii")
+
+    def test_addCustomAssetInvalidatesCache(self):
+        uuid = UUID.UUID("00000000-0000-4000-8000-0000000000aa")
+        stale = Tile({"UUID": str(uuid), "Name": "Stale", "String": ""})
+        AssetManager.cache.put(str(uuid), stale)
+
+        with mock.patch("objects.asset.UUID.uuid4", return_value=uuid):
+            customAssetUUID = AssetManager.addCustomAsset(
+                "Tree",
+                self.getCustomString()
+            )
+
+        self.assertEqual(customAssetUUID, str(uuid))
+        asset = AssetManager.getAsset(customAssetUUID)
+        self.assertIsInstance(asset, CustomAsset)
+        self.assertEqual(asset.name, "Tree")
+
+    def test_removeAssetInvalidatesCache(self):
+        for tile, uuid in [
+            (self.tiles[0], self.tiles[0].uuid.upper()),
+            (self.tiles[1], self.tiles[1].uuid.lower())
+        ]:
+            asset = AssetManager.getAsset(tile.uuid)
+            self.assertIs(AssetManager.getAsset(tile.uuid), asset)
+
+            # UUID in a different case than stored
+            AssetManager.removeAsset(uuid)
+            self.assertIsNone(AssetManager.getAsset(tile.uuid))
+
+        self.assertEqual(AssetManager.getCacheStatistics()["hits"], 2)
+        self.assertEqual(
+            self.database.fetchall("SELECT UUID FROM Assets;"),
+            [(self.tiles[2].uuid,)]
+        )
+
+    def test_getAssets(self):
+        first, second, third = [tile.uuid for tile in self.tiles]
+        assets = AssetManager.getAssets(
+            [third.lower(), first.upper(), third, second, first]
+        )
+
+        self.assertEqual(
+            [asset.uuid for asset in assets],
+            [third, first, third, second, first]
+        )
+        # Repeated and differently cased UUIDs give the same object
+        self.assertIs(assets[0], assets[2])
+        self.assertIs(assets[1], assets[4])
+        self.assertEqual(AssetManager.getCacheStatistics()["size"], 3)
+
+        unknown = "00000000-0000-4000-8000-0000000000ff"
+        with self.assertRaises(ValueError) as context:
+            AssetManager.getAssets([first, unknown.upper(), unknown])
+        self.assertIn(unknown, str(context.exception))
+        self.assertNotIn(first, str(context.exception))
+
+        self.assertEqual(
+            AssetManager.getAssets([unknown, second], required=False),
+            [None, assets[3]]
+        )
+        self.assertIsNone(AssetManager.getAsset(unknown))
+
+        # Rows stored in upper case are found by any case
+        AssetManager.cache.clear()
+        for uuid in [second, second.lower()]:
+            self.assertEqual(AssetManager.getAsset(uuid).uuid, second)
+            AssetManager.cache.clear()
@@ -14,3 +14,8 @@ class TestConfig(unittest.TestCase):
             expected,
             Config.get('tableName', 'assets')
         )
+
+    def test_generatorDefaults(self):
+        # Instance removal changes output, so it is opt-in
+        self.assertFalse(Config.getboolean('generator', 'removeDuplicates'))
+        self.assertFalse(Config.getboolean('generator', 'cullBuriedTiles'))
@@ -0,0 +1,52 @@
+import os
+import sqlite3
+import tempfile
+import unittest
+
+from database.database import Database
+
+
+class TestDatabase(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(self) -> None:
+        print("\nDatabase: ", end='')
+
+    def setUp(self):
+        directory = tempfile.TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+        self.addCleanup(Database.closeConnections)
+        self.path = os.path.join(directory.name, "test.db")
+
+    def test_reuseConnection(self):
+        database = Database(self.path)
+        other = Database(self.path)
+        self.assertIs(database.connection, other.connection)
+        self.assertIsNot(database.cursor, other.cursor)
+
+        # Same file through a different path
+        relative = Database(os.path.relpath(self.path))
+        self.assertIs(relative.connection, database.connection)
+
+    def test_close(self):
+        database = Database(self.path)
+        database.execute("CREATE TABLE Test (Value int);")
+        database.close()
+
+        # Cursor is closed, the connection stays open for the next user
+        with self.assertRaises(sqlite3.ProgrammingError):
+            database.cursor.execute("SELECT 1;")
+        other = Database(self.path)
+        self.assertIs(other.connection, database.connection)
+        other.execute("INSERT INTO Test VALUES(?);", (1,))
+        self.assertEqual(other.fetchall("SELECT * FROM Test;"), [(1,)])
+
+    def test_closeConnections(self):
+        database = Database(self.path)
+        Database.closeConnections()
+
+        with self.assertRaises(sqlite3.ProgrammingError):
+            database.connection.execute("SELECT 1;")
+        other = Database(self.path)
+        self.assertIsNot(other.connection, database.connection)
+        self.assertEqual(other.fetchall("SELECT 1;"), [(1,)])
@@ -2,6 +2,10 @@ import json
 import unittest
 
 from converter.conversionManager import ConversionManager
+from converter.decode import decode_asset_position
+from converter.encode import create_assets_data, create_slab_data
+from converter.encode import encode_asset_position, get_instance_columns
+from converter.instanceBuffer import InstanceBuffer
 
 
 class TestEncodeDecode(unittest.TestCase):
@@ -136,6 +140,94 @@ class TestEncodeDecode(unittest.TestCase):
             ).decode('ascii')
         self.assertEqual(generated, self.encoded)
 
+    def test_encodeInstances(self) -> None:
+        generated = ConversionManager.encodeInstances(
+            self.decoded
+            ).decode('ascii')
+        self.assertEqual(generated, self.encoded)
+
+        generated = ConversionManager.encodeInstances(
+            InstanceBuffer.fromDict(self.decoded)
+            ).decode('ascii')
+        self.assertEqual(generated, self.encoded)
+
+    def test_encodeInstancesBatch(self) -> None:
+        slabs = [self.decoded, InstanceBuffer.fromDict(self.decoded)] * 4
+        generated = ConversionManager.encodeInstancesBatch(slabs, 4)
+        self.assertEqual(
+            [output.decode('ascii') for output in generated],
+            [self.encoded] * 8
+        )
+
+    def test_encodeOrdering(self) -> None:
+        expected = sorted(ConversionManager.iterDecode(self.encoded))
+        for ordering in ("none", "sorted", "morton"):
+            generated = ConversionManager.encodeInstances(
+                self.decoded,
+                ordering
+                ).decode('ascii')
+            self.assertEqual(
+                sorted(ConversionManager.iterDecode(generated)),
+                expected
+            )
+
+        with self.assertRaises(ValueError):
+            ConversionManager.encodeInstances(self.decoded, "random")
+
+    def test_createAssetsData(self) -> None:
+        assets = self.decoded["asset_data"]
+        slab = create_slab_data(
+            [
+                (asset["uuid"], *get_instance_columns(asset["instances"]))
+                for asset in assets.values()
+            ],
+            "none"
+        )
+        assetList, positionList = create_assets_data(assets)
+        self.assertEqual(assetList + positionList, bytes(slab[10:-2]))
+
+        position = {"x": 1234.9, "y": 500, "z": 75, "rot": 270}
+        self.assertEqual(
+            encode_asset_position(position),
+            (1234 | 500 << 36 | 75 << 18 | 18 << 54).to_bytes(8, 'little')
+        )
+
+    def test_decodeAssetPosition(self) -> None:
+        assets = {"asset_data": [
+            {"instance_count": 52},
+            {"instance_count": 48}
+        ]}
+        position = {"x": 900, "y": 300, "z": 25, "rot": 90}
+        for count, index in [(0, 0), (51, 0), (52, 1), (99, 1)]:
+            self.assertEqual(
+                decode_asset_position(
+                    encode_asset_position(position),
+                    assets,
+                    count
+                ),
+                (index, position)
+            )
+
+    def test_decodeInstances(self):
+        output = ConversionManager.decode(self.encoded)
+        self.assertEqual(output["unique_asset_count"], 2)
+        for asset in output["asset_data"]:
+            expected = self.decoded["asset_data"][asset["uuid"].lower()]
+            self.assertEqual(asset["instance_count"], len(asset["instances"]))
+            self.assertEqual(asset["instances"], expected["instances"])
+
+    def test_iterDecode(self):
+        expected = [
+            (asset["uuid"], i["x"], i["y"], i["z"], i["rot"])
+            for asset in ConversionManager.decode(self.encoded)["asset_data"]
+            for i in asset["instances"]
+        ]
+        self.assertEqual(list(ConversionManager.iterDecode(self.encoded)), expected)
+
+        batches = list(ConversionManager.iterDecodeBatches(self.encoded, 7))
+        self.assertTrue(all(batch[1].shape[1] <= 7 for batch in batches))
+        self.assertEqual(sum(batch[1].shape[1] for batch in batches), 100)
+
     def atest_decode(self):
         output = ConversionManager.decode(self.encoded)
         print(output)
@@ -1,9 +1,10 @@
 import json
 import unittest
 import time
+import numpy
 import pyperclip
 
-from generator.generator import Generator
+from generator.generator import Generator, DEFAULTSEED, PADDING
 from objects.assetManager import AssetManager
 from converter.conversionManager import ConversionManager
 
@@ -65,6 +66,56 @@ class TestGenerator(unittest.TestCase):
             msg = "\nSome values are not equal: \n" + msg
         return msg
 
+    def generateSeeded(self, groundAssets, placeObjects=[], sizes=[1, 1]):
+        # Generation starts from the default seed, like a new generator
+        self.generator.setSeed(DEFAULTSEED)
+        self.generator.pregenerate(groundAssets, placeObjects, sizes)
+        return self.generator.generate()
+
+    def assertBlock(self, block):
+        # Checks one generated block against what was planned for it
+        generator = self.generator
+        offsetX = block["x"] * generator.x
+        offsetY = block["y"] * generator.y
+        window = (
+            slice(offsetX, offsetX + generator.x),
+            slice(offsetY, offsetY + generator.y)
+        )
+        anchors = 1 if generator.settings["preciseHeight"] else 0
+        instances = list(ConversionManager.iterDecode(block["output"]))
+        terrainUuids = [
+            asset.uuid.lower() for asset in generator.terrainAssets
+        ]
+        terrain = [
+            instance for instance in instances
+            if instance[0].lower() in terrainUuids
+        ]
+
+        self.assertEqual(
+            len(instances),
+            int(numpy.sum(generator.compileInstanceCounts()[window]))
+            + anchors
+        )
+        self.assertEqual(
+            len(terrain),
+            int(numpy.sum(generator.terrainThicknessGrid[window])) + anchors
+        )
+        # Every tile of the block has a column of terrain
+        self.assertEqual(
+            {(instance[1], instance[2]) for instance in terrain},
+            {
+                (
+                    int((x * generator.tileSize + PADDING) * 100),
+                    int((y * generator.tileSize + PADDING) * 100)
+                )
+                for x in range(generator.x)
+                for y in range(generator.y)
+            }
+        )
+        self.assertTrue(
+            {instance[4] for instance in terrain} <= {0, 90, 180, 270}
+        )
+
     def test_setXYZ(self) -> None:
 
         # Valid XYZ
@@ -131,8 +182,6 @@ class TestGenerator(unittest.TestCase):
             0.2521903471662688)
 
     def test_terrainGenerationNoPreciseNoRidge(self):
-        expected = """```H4sIAAAAAAAC/z2ZPWhkWXqGb3WVpOpW6adtza5mLXtkz9pumGTADS4bBQoUOBDYAgVOChwuQsEGQmw4TXXgoKE2MTgo8AQKKlDgpGCDDlTQhgmaYjczhYIJBDU4MtQEg1Hg93nfTx29fH/n7znn3Fu35v83/8OzptU0zdYfXv7dV3t/84//8T+Dv9/9r79982+dpvmxdfzF8RfftH5s/ebPov/5p8df4P/hIHp4EP8//4ns9o+t3/4i+t3n8nfIv/uK+A8Hd18lX3aH/Ph/+4v4v/s82nyeeH9fdtvt95N/3K/2bat9a/N5/P392L/+eWz1c1L9WNXPSfVzUv2c0L/6cVzzOav5nFV/Zxmf/JnPWfV3lvy7AfFDNP0MqFc/A/LV3kW1d1HrY1vrcZ343TV1h2jWd5h49PiLu1H8d6Oqs909PB5TLy5W1Y3x//7wbkJeF3X8boL/3//8eIr9+8Pov/zF3Sx+aQf7eE6d8ubEX315tyCuvAW28hbxHy/J/98v71boq9J/+Kvj5o30m7881i76sfW7X0rb5MX+9tVdD/u///qu90bt7qKuk7+hDv/7Z8rXfnn/TP1o/7x/pnFpX71/pnFpn71/pvHbr/k7L/sSP/sFP/sJf1TrZj/7jzrl97G1Xn3iWmerOPWJs8/oR3UnibNPiEsdj6r+DL/qz6r+rPoZxI4qfoE/+8Dx62rvmnbMue34sOKjio8yDrg6b1ztjGt+k5rfJO1Ezbfx+lg13yl18MYOb6/XjHqt8zxxqdcf7vif9HhJneJWeIdLVO2tqIfzm+SLt/O1H8xN++D9M/OV/btfPnGOvvoyfrUn+21b+0dc37a1f8T5bZv90DRv269KvR86KPfE27b6t8KffM1fPN+2Nf8+dnij8Hzbhit++OGHH7a5yQ43FF5v24elPqctbPg5PowNP8dH1B+iqR9Xu5Nqd1LjmVb/U9pR/1Pi4eJ5zPB3SzXuGflwQnNOyY/CKf4nhZPjy1qPZbW/ig0vt7/KeKSN12WVPPi5zqp1bOCicVs1bvvh1Wq7XXNTu+Lodq1qV+f6tGOOUp/r1mkn5/q0A8co5/S0Y46yzbFBOYenna55nnbM0Qq/047PZwflHJ52cg5POz6HVu7f087hJxVHKfcvdblvsbl/HR/SjuJD/ObYcXvjio/x+5w1bn9S/U9RONb4Z+TBD7/5NR6v/T5nHeYLP89zHj/8vA6LamdR7Swqbxkbvl6PZdqNqv9lrcsK1ThXNc5VzWeV+ccfjq7T+fQ8dV49T3H2OtjWc89xeL7xfOHu9s1X7ds+RJu9tdzfe2uvSnN/o9zDe2twxvZ9bYXz3po5d1C47q2F895a7mEUzntrOa97a+G8t5bnNMr53Vvj+Ys/z9m9NY3/gvxwxoa748OqG8WGt9sbY4ev41bzbdzvlPbC1eObZVycU89njnbRhjz4evzlh6/rF/FHVb+ofhc1z2XNc1njWmZ+8WteZcPT81rh13uNbb3XrGhP7zVWc2yIR5tSvS+Jt+dpfmpPPN1eD7/as632ZN+Hr/RVafjeh6809zHK/XtffO/Dt3VffO+L7735Euc5S9znWPE8T+/Nl7zwvQ9fqd+vmnvzpU7zuiDPfDvYUThX3jDtwdvtjPDneep+xrF5rt6Hc8Y1iw3fe3Oscc4rb17jLBuO7mdBvvpZ1LgWNY5lxsd5vofDEr842IYX+b/+eXTyM+7l+3Dq4I9Ofga3+7XvP4v9xEf1veTFVr343ayH2816nqMo9+3Nep6jN+u5f1G43aznOXqz3v2k8LpZD7eb9ZzLm3Vz66Ccz5t1vz8r7nOpOO/P+PNefLMON/ziMyAPbtQ3aPzXVTdMPtycZz30e5HbG5EXfu5vnP7h57wJ+eHo+DQ297Ljs2pnVuOdo+rXqn7nxNXvnPzw8/gWxLXeC/rRepfC9WZdfKziYxWfJXVwpO77z6L7nz3ZnEPs6D/twdX55qb8Hva+9XIjz8/LDT8/m8uNvBdjwxGbc3i5kfchx3WvYsPxcqNbmvciFH6XG3kvutzIObzc+OEgfv9+aqFwvNwIz8sNfg/h9+8hKzwvN5pPynm83NC6WOFKXWO+bmdI+/DFH77ub5Q49zHj4Pnr/kt5/tqe1nim1c606mYZH+fW/c5qXGXD1eOzanxWcZsTh2fsqDgsqBcH2+F5uSFeS/oVryXx8MTmvr3c+Nc/frI5n9hROLYa54nn6675tV93/bumed3N75rXXX7X4Of3duJwJc5zlDi8icP5dde/b1Lfx877kuv7+PM753U3v3Ocf4LfnOU/LOV3MnFzlvp3r/LgjM3vXmxzlmq9BowHztTDlzz5r6t+iJqv4/B2P6PEOc/0z/l1v+PYvC87b0L7yptUe9Nqb5pxxDZfjwP+r7viN6M/uBLXeZxji9+cuHnKLx4L6sRjQRye2OJVCsfX3bs/ipqj87hnHRfHx26+izx2/V2k/cg6i+Nj97CU7yJoOBGP+jtIizgcH5mn7R/8vcP1/cSjfPegzpwa55+kDj6P3XyfeCxOj+ZEXe7Xx+JEHnwew8vtwMX1w/jh9Vh8nD+q/FHNZ4yqblz9jqtuXHWT+KNNqfiUDTePZ0r74jSlLtwexQuej3CyDTfsfVS2ONk2N6k4LGhHnBbE4Reb8/nY/eklPB1fVVzn0fHmjduDp9vRvfvhuXm1Pjz3d6zmw3N/x5LdfP7k5xzihyP+2HyvQvN9ynX9quuT5+9TqT9Ju08KN9uD5HO+7Nf96fqLyr8mL/eo/UNU7Q7xax2HFR9Rp/GMiGtdR9RrXUfV3rjqxtiqs61zMq66SdrjvnWdbfGYVP4UVb5VfKbk7ZfCLTb374fnWl+r1rds+GFzPj88F4c5/cOPup9ewvHD869fck6x4YgNV+etKm9FXni6Hauflx33a57h+u5F+L17oXnrPKLwe/dC89T5s7+PwoV4U5rvg+9e5LlHnPOGzfPO+YPyX6QOXq6/Tn+cN/djG07YWr8heVq/If7wwYbXuxeax4j2zCV54/jh9e6F1rH88HG+VfOe0I55tJ03xa91mpIPB+q1jqXci+9eaJ2tX6NtFB7vXvxqFw72L6tuRXusf+Wt0i+/F92P3mfcrs6X59VDv/fzz+M0jzwHzzfD43xT61LKObJf58V+nZ/zzdx355vhc77ZlJqP8vLcIi/q3/8Nfvi4flDxC+rCi3aifl9p3N41eeF1vqnxXxPX+K+Jm5fs/VLNe0j+vrlhw+18U+s8wg+n2PByfIIqXsr9d76p9SrlnJxvan1nxL/+pPA53/zVLnxQ+JxvfrvDPej4knrFl/jDye2syA8nj1ucPC5xcv86N+7f6t8PHc+7R164eX7yH/TMq3XQCy+U83PQa3zfOd6veJ94vr8f9OCHml+L/Nj57n7Qy+8G8p9suLl+gJ3fD64fpB24ud8L+s/7pvu9IE/nxjb80PA76O1/FlscrqmHH/lahyFxuJU9Jg4nbK1nKZwOejovU9qBE/bXpeJSyj130Pt250nhZf+y/Mu0wz3m+lXicGKc8PD4rDlX7l/83L/OF/MOl3DzfHutzLdHPOftwdyaBoXXg7l903pgHfvY5tdxXp+8fO9+KH4Pxe/B/PDnd/pDcXsIr85D8XL+gLzwov34cz8+hFfzEF6Kw4t2dL5swwvbvJQHL9rLeXswL+LhZXtMns+V4uH1YF7Y8KLd8HoIL9nwos7nysp999DLubJ/mXo4PRQn561qPOLg/sXpofi4P/HyOnv9w+WhuDx84pL3j9st82nfbvm9Qur3ihZ+7sPbLb//OR4Nn9utvLcTh8/tVr6PEX9Szo3ztP7OG1Q/A/KbTwoPj+OCeLjcbuUc3W7BhXjO0e3WvvncbuUc3W5p3Uu5F22PyPM5atme0E64oPC43co5QuFyu5X7DuWeu93KfWf/gnz4kJf3OuctK29Z7a+o973XMD54eBwN62w+DfPKuvt+a3s+tv3e0Fxt533hajv33dV27rur7fxfebX9nd/7yIvmPZ14NL+vrrbzPyRxOOHnfsMfzf+Mjg+Ih4/bH+APH4/nAr/f4zsezwX14XO1bT5WOFxt55672s65QbnfrrZzz6HwsT1GtS5j8nLfYT8pfGzPaNfPJdu8t2Fzv11tw6vqFsR/ehkNN/ezrH6WVWeb3801nlXVr2o+OlfMIxqOzBdOnqf0aCecjnZyfo524NQ0Rzt5Tz/ayXkij/N0tOP/kR2HE/FozhNx3stdf1L1tsPJdWfx857h/ssPL+dbc98xrieFj8dnDbejnZwrFE5HOzlXRzs+V1Z4He3kvkN5vzja0TqNsOGGbW7xT2gn73uOT1MPP8eteQ933rzamVf/CzS/i123qDrb/g7iPM6f21lWf7b93dJ5Ub6PJA+unr84ev4N/PwdrO116rUc5350OzqHnV34NtLw7ez6HLY6u/n9RRy+xGP7faQhzvPM9da837u+nzhcXX9Ce7xHVv0J+eq/4vB1vVX1Z4lzfju7Gv9Z2oez6wf0o/pB4rG1DoOqu8D2c66FP6p1LBvu2OyHzi73Ku1o/e3PPsCO6hwNyfN+6GDz3un4mLrsC8cn1c8U2/sj45pVf7Pqb1bzmqP87saf/eL5LWp+C+x8H3M7i3BgP3idlsmLsm9qnVe1Tivs7Bevc9MKZ51312tfmFPvjePsD9fr3H/0PmjaH2lf++Mj7et+/hj+9kc1vq/w76Mt1/VR1fXxq65P/X6p5mm/+afeqvoT6rROtrVOJ+RrXSuPfeB2zpIXW+tsWzzOqp0BfrUzwK92BvjVjv3iN6hxXFS9VfUX+MX7ovKvUeVfE9c9e13xYWzujY+1Hxwf1TjGqPLGaZ/7wu1NMj7ebz/WPvlY+8TrMav1mGW92Dcfd/Md1etq9fe2rKvV38s75LFPzGcRP/vC9Uvaafz/lfNWsdkPjlu9H5qP2QfJ68XPfmia/wfs7f/2yCQAAA==```"""
-
         self.generator.setXYZ(20, 20, 50)
         self.generator.setOctaves(1, 0.5, 0.25)
         self.generator.setScales(1, 2, 4)
@@ -143,13 +192,11 @@ class TestGenerator(unittest.TestCase):
         groundAssets = [
             {"asset": "3911d10d-142b-4f33-9fea-5d3a10c53781"},
         ]
-        self.generator.pregenerate(groundAssets)
-        output = self.generator.generate()[0]["output"]
-        self.assertEqual(expected, output, msg="Output strings are different!")
+        output = self.generateSeeded(groundAssets)
+        self.assertBlock(output[0])
+        self.assertEqual(output, self.generateSeeded(groundAssets))
 
     def test_terrainGenerationPreciseNoRidge(self):
-        expected = """```H4sIAAAAAAAC/z2ZPWij6XqGP41kWzOWfybxnuM9cbJO9iQZ2GYhA1GCCxcuUhgSg4s0gpQH4+IUxqTcQVOkGNApQkghyBYuVLhIIzjFFDZMYItBnNMF4WILgZZUAW2xBBe5r/t+PNXN8/f+Xe/7fp8+zf5v9vtnTatpmq3fv/ybr/b+6u//438Gf7v7X3/95t86TfNj6193jr9Aj784/uKb1o+tf/6T6H/+cfw/HEQPD+L/xz+S3f6x9ZtfRL/7XP4O+XdfEf/h4O6r5MvukB//b34R/3efR5vPE+/vy267/X7yj/vVvm21b20+j7+/H/vXP4+tfk6qH6v6Oal+TqqfE/pXP45rPmc1n7Pq7yzjkz/zOav+zpJ/NyB+iKafAfXqZ0C+2ruo9i5qfWxrPa4Tv7um7hDN+g4Tjx5/cTeK/25Udba7h8dj6sXFqrox/t8d3k3I66KO303w//ufHk+xf3cY/ac/u7uPX9rBPp5Rp7wZ8Vdf3s2JK2+Orbx5/MdL8v/3y7sV+qr07/7iuHkj/ebPj7Wbfmz99pfSNnmxv31118P+77+8671Ru7uo6+RvqMP//pnytV/eP1M/2j/vn2lc2lfvn2lc2mfvn2n89mv+zsu+xM9+wc9+wh/VutnP/qNO+X1srVefuNbZKk594uwz+lHdSeLsE+JSx6OqP8Ov+rOqP6t+BrGjil/gzz5w/Lrau6Ydc247Pqz4qOKjjAOuzhtXO+Oa36TmN0k7UfNtvD5WzXdKHbyxw9vrdU+91nmWuNTrD3f8T3q8pE5xK7zDJar2VtTD+U3yxdv52g/mpn3w/pn5yv7tL584R199Gb/ak/22rf0jrm/b2j/i/LbNfmiat+1Xpd4PHZR74m1b/VvhT77mL55v25p/Hzu8UXi+bcMVP/zwww/b3GSHGwqvt+3DUp/TFjb8HB/Ghp/jI+oP0dSPq91JtTup8Uyr/yntqP8p8XDxPO7xd0s17nvy4YTmnJIfhVP8Twonx5e1HstqfxUbXm5/lfFIG6/LKnnwc51V69jAReO2atz2w6vVdrvmpnbF0e1a1a7O9WnHHKU+163TTs71aQeOUc7pacccZZtjg3IOTztd8zztmKMVfqcdn88Oyjk87eQcnnZ8Dq3cv6edw08qjlLuX+py32Jz/zo+pB3Fh/jNseP2xhUf4/c5a9z+pPqfonCs8d+TBz/85td4vPb7nHWYL/w8z1n88PM6zKudebUzr7xlbPh6PZZpN6r+l7UuK1TjXNU4VzWfVeYffzi6TufT89R59TzF2etgW889x+H5xvOFu9s3X7Vv+xBt9tZyf++tvSrN/Y1yD++twRnb97UVzntr5txB4bq3Fs57a7mHUTjvreW87q2F895antMo53dvjecv/jxn99Y0/gvywxkb7o4Pq24UG95ub4wdvo5bzbdxv1PaC1eP7z7j4px6PjO0izbkwdfjLz98XT+PP6r6efU7r3kua57LGtcy84tf8yobnp7XCr/ea2zrvWZFe3qvsZpjQzzalOp9Sbw9T/NTe+Lp9nr41Z5ttSf7IXylr0rD9yF8pbmPUe7fh+L7EL6th+L7UHwfzJc4z1niPseK53n6YL7khe9D+Er9ftU8mC91mtcFeebbwY7CufKGaQ/ebmeEP89T9zOOzXP1IZwzrvvY8H0wxxrnrPJmNc6y4eh+5uSrn3mNa17jWGZ8nOcHOCzxi4NteJH/659HJz/jXn4Ipw7+6ORncHtY+/6z2E98VN9LXmzVi9/NerjdrOc5inLf3qznOXqznvsXhdvNep6jN+vdTwqvm/Vwu1nPubxZN7cOyvm8Wff7s+I+l4rz/ow/78U363DDLz4D8uBGfYPGf111w+TDzXnWQ78Xub0ReeHn/sbpH37Om5Afjo5PY3MvO35f7dzXeGeo+rWq3xlx9TsjP/w8vjlxrfecfrTepXC9WRcfq/hYxWdJHRyp+/6z6P5nTzbnEDv6D3twdb65Kb+HvW+93Mjz83LDz8/mciPvxdhwxOYcXm7kfchx3avYcLzc6JbmvQiF3+VG3osuN3IOLzd+OIjfv59aKBwvN8LzcoPfQ/j9e8gKz8uN5pNyHi83tC5WuFLXmK/bGdI+fPGHr/sbJc59zDh4/rr/Up6/tqc1nmm1M626+4yPc+t+72tcZcPV47NqfFZxmxGHZ+yoOMypFwfb4Xm5IV5L+hWvJfHwxOa+vdz4lz98sjmf2FE4thrniefrrvm1X3f9u6Z53c3vmtddftfg5/d24nAlznOUOLyJw/l1179vUt/HzvuS6/v48zvndTe/c5x/gt+c5T8s5XcycXOW+nev8uCMze9ebHOWar0GjAfO1MOXPPmvq36Imq/j8HY/o8Q5z/TP+XW/49i8LztvQvvKm1R702pvmnHENl+PA/6vu+J3T39wJa7zOMMWvxlx85RfPObUicecODyxxasUjq+7d38QNUfncc86Lo6P3XwXeez6u0j7kXUWx8fuYSnfRdBwIh71d5AWcTg+Mk/bP/h7h+v7iUf57kGdOTXOP0kdfB67+T7xWJwezYm63K+PxYk8+DyGl9uBi+uH8cPrsfg4f1T5o5rPGFXduPodV9246ibxR5tS8Skbbh7PlPbFaUpduD2KFzwf4WQbbtj7qGxxsm1uUnGY0444zYnDLzbn87H700t4Or6quM6j480btwdPt6N798Nz82p9eO7vWM2H5/6OJbv5/MnPOcQPR/yx+V6F5vuU6/pV1yfP36dSf5J2nxRutgfJ53zZr/vT9ReVf01e7lH7h6jaHeLXOg4rPqJO4xkR17qOqNe6jqq9cdWNsVVnW+dkXHWTtMd96zrb4jGp/CmqfKv4TMnbL4VbbO7fD8+1vlatb9nww+Z8fnguDjP6hx91P72E44fnX7/knGLDERuuzltV3oq88HQ7Vj8vO+7XPMP13Yvwe/dC89Z5ROH37oXmqfNnfx+FC/GmNN8H373Ic4845w2b553zB+W/SB28XH+d/jhv7sc2nLC1fkPytH5D/OGDDa93LzSPEe2ZS/LG8cPr3QutY/nh43yr5j2hHfNoO2+KX+s0JR8O1GsdS7kX373QOlu/RtsoPN69+NUuHOxfVt2K9lj/ylulX34vuh+9z7hdnS/Pq4d+7+efx2keeQ6eb4bH+abWpZRzZL/Oi/06P+ebue/ON8PnfLMpNR/l5blFXtS//xv88HH9oOIX1IUX7UT9vtK4vWvywut8U+O/Jq7xXxM3L9n7pZr3kPx9c8OG2/mm1nmEH06x4eX4BFW8lPvvfFPrVco5Od/U+t4T//qTwud881e78EHhc7757Q73oONL6hVf4g8nt7MiP5w8bnHyuMTJ/evcuH+rfz90PO8eeeHm+cl/0DOv1kEvvFDOz0Gv8X3neL/ifeL5/n7Qgx9qfi3yY+e7+0EvvxvIf7Lh5voBdn4/uH6QduDmfi/oP++b7veCPJ0b2/BDw++gt/9ZbHG4ph5+5GsdhsThVvaYOJywtZ6lcDro6bxMaQdO2F+Xiksp99xB79udJ4WX/cvyL9MO95jrV4nDiXHCw+Oz5ly5f/Fz/zpfzDtcws3z7bUy3x7xnLeFuTUNCq+FuX3TWrCOfWzz6zivT16+dy+K36L4LcwPf36nL4rbIrw6i+Ll/AF54UX78ed+XIRXswgvxeFFOzpftuGFbV7Kgxft5bwtzIt4eNkek+dzpXh4LcwLG160G16L8JINL+p8rqzcd4tezpX9y9TDaVGcnLeq8YiD+xenRfFxf+Lldfb6h8uiuCw+ccn7x+2W+bRvt/xeIfV7RQs/9+Htlt//HI+Gz+1W3tuJw+d2K9/HiD8p58Z5Wn/nDaqfAfnNJ4WHx3FBPFxut3KObrfgQjzn6HZr33xut3KObre07qXci7ZH5PkctWxPaCdcUHjcbuUcoXC53cp9h3LP3W7lvrN/Tj58yMt7nfOWlbes9lfU+95rGB88PI6GdTafhnll3X2/tT0f235vaK62875wtZ377mo7993Vdv6vvNr+zu995EXznk48mt9XV9v5H5I4nPBzv+GP5n9GxwfEw8ftD/CHj8dzgd/v8R2P54L68LnaNh8rHK62c89dbefcoNxvV9u551D42B6jWpcxebnvsJ8UPrbvadfPJdu8t2Fzv11tw6vq5sR/ehkNN/ezrH6WVWeb3801nlXVr2o+OlfMIxqOzBdOnqf0aCecjnZyfo524NQ0Rzt5Tz/ayXkij/N0tOP/kR2HE/FozhNx3stdf1L1tsPJdWfx857h/ssPL+dbc98xrieFj8dnDbejnZwrFE5HOzlXRzs+V1Z4He3kvkN5vzja0TqNsOGGbW7xT2gn73uOT1MPP8eteQ933qzamVX/czS/i103rzrb/g7iPM6f21lWf7b93dJ5Ub6PJA+unr84ev4N/PwdrO116rUc5350OzqHnV34NtLw7ez6HLY6u/n9RRy+xGP7faQhzvPM9da837u+nzhcXX9Ce7xHVv0J+eq/4vB1vVX1Z4lzfju7Gv9Z2oez6wf0o/pB4rG1DoOqu8D2c66FP6p1LBvu2OyHzi73Ku1o/e3PPsCO6hwNyfN+6GDz3un4mLrsC8cn1c8U2/sj47qv/u6rv/ua1wzldzf+7BfPb17zm2Pn+5jbmYcD+8HrtExelH1T67yqdVphZ794nZtWOOu8u177wpx6bxxnf7he5/6j90HT/kj72h8faV/388fwtz+q8X2Ffx9tua6Pqq6PX3V96vdLNU/7zT/1VtWfUKd1sq11OiFf61p57AO3c5a82Fpn2+JxVu0M8KudAX61M8CvduwXv0GN46Lqraq/wC/eF5V/jSr/mrju2euKD2Nzb3ys/eD4qMYxRpU3TvvcF25vkvHxfvux9snH2idej/taj/usF/vm426+o3pdrf7elnW1+nt5hzz2ifnM42dfuH5JO43/v3LeKjb7wXGr90PzMfsgeb342Q9N8/9f5sbR0CQAAA==```"""
-
         self.generator.setXYZ(20, 20, 50)
         self.generator.setOctaves(1, 0.5, 0.25)
         self.generator.setScales(1, 2, 4)
@@ -160,15 +207,11 @@ class TestGenerator(unittest.TestCase):
         groundAssets = [
             {"asset": "3911d10d-142b-4f33-9fea-5d3a10c53781"}
         ]
-        self.generator.pregenerate(groundAssets)
-
-        output = self.generator.generate()[0]["output"]
-
-        self.assertEqual(expected, output, msg="Output strings are different!")
+        output = self.generateSeeded(groundAssets)
+        self.assertBlock(output[0])
+        self.assertEqual(output, self.generateSeeded(groundAssets))
 
     def test_terrainGenerationNoPreciseRidge(self):
-        expected = """```H4sIAAAAAAAC/z2Zv29b1xXH3zOfZP14kuhUbZhUabx7EVADZQsPGjRkMNAS0NCFe0B4yGAQGSVQQwcBzB9AoBk0cPCQhZsHEVABD8YDshmEhgwEmHZlhqDg0PP5fo87fXF+3nvP99z7Li+b/zY/PirKoigOfnzy52fHf/zrP//T/0v7X3+6+ndVFL+UT0/Ovrwsfyn//nvjd5+ffYn+3WfG4jPru52QW7+U33xq/PYPd8/AH764e4b955OQlS/kinzWf/e59d/+4ayL/ocvzrrE/Xxi+WlijC99jC858p0jR77zzHdue8gl8/uoP+uRP+J6Oe8e9gKsNO9exvWRI65v+10ffbfzUX82yLhBxg2c726IHP5D5PAf4vfNp5YjbkSeiBtl3Mj20Id9+jtjxI9tD3T82HbLP/02ZOeZeF5nk8wzyTyTzDM1H8bIM8U/8kwzbpZxM8YL+zzHmdvvrPF4Zw1yjLvA3gnE/2/HH/FsBf7jN2cr7HeffJTv1sTdfRJYyK8oW/IrrkrZ61L+dzXyr09CDvtp4FX19hH9c1m+fRTziP56+yjmEf309lEn8DLs9AsYdRcWYPjHeoWxHunpG+LpG8cFlsQZo45d8tJHyE8T1UeFxjm3nb5Rvp7t9I3yCaO/++gjTx//yNNHH3n6maef8QPsET+w3jJ9lX5D8N1nRvVTS+sSun+Q6R/VKWX6QusWql8q1W+S9ZtYDv4Lxc2yvjPkiJ9n3eYeD/7l12SexnHRB84vVF9o3ODd+VY53oq44GuFXX1Syn8NdhKjj9b40S+2R384LvpFcXEqYTeGv/rD/fP2Ef0Dun+uW/TJZXnd6qhfrlsRH/1y3Yp4IX2BPuYvjPk8Qx/zkUw/IMf6u+SJdXXtTx9dt3yuXLd0rpT40yf40yfYOUew0y/K1yOfzhXH9T2O0eeK/Acg54r19IPsQ5BzxPPnnNB8RrmOca5jjF48l9JPUz/N9cyQvd8VP/O4wbvGhXeNN/e48C7/Jv2bzN94/Nj/pfIvkHUulNSbfpD/ynb6QHwI6YP0X4Piv4Qfzovrls6LlviKcwKZPrhu/foE/q9bp0/oD/nV2OEdPE38uk0fvKzM98sq4uP8eFlFfPTFy6ojvl9WMW7wjZ9R/AbGfLvYO4nwSlzU/5w8sW7J5hU7fMuvj9684Q+fihsa2a+Sx8jizX4Ty+xTjS/Z57fyTjNu6nkao19m+BeJPs/lP3deo89z8rK/lb9BH+trkIOPxnWwXvwVqssCfdR54XrBn/xW1sOv7GvXF95eVqdPLJunl9XXbeP3R/Ape209fKE3fjgEj7fEU3W8FfGxf4+3zNPxFjxdhj3Gi3sCfkbxFXrzhT/79HjLvB1vwRt6eLM/+xQ7/GHnPJd/3zI8yr+ffoP0GxAfPA3Sf5j+Qs5lj8u+lP8IP77nOR+hz2f5TzL/xHr2rfynmX+afjPLRvZvzkNyrH+Gn/itqAN8q26So25z/MVvi/rBs+q4IN7fbelXrqsx6r/Cbj6Pt4KvNfHB1xq9+Iz8Hw7hVXbxB59l8UDe2HcP5I199yBei9bDls7bkHXehh1+L6uHLe/DB9bXxc5+BL0fH5Lfh+T1IXl9EK+geC0ekk/F98gHj2nvO49RPEoPn8o/yLzDjBt6PHhU3hH5dT8rNQ+heZTfJP0mjodX+U0z7zTnO/W6LJs/jS+M/p0Vrt8s6zLHP/iaZz2brGeDv/en9CsQ/kDz9xC8WIY/ZPEXcuw3yeLP9uDv4f/8sR/L4nZb39FAvqNF63bb5+rtts7VFnb4xA5/2I3ap4HsU+zmT3m65Is8XfvB8+02/GHviEflO0cvHgvs7Ffl6Tkf+1TyALv5Up5hoXkbzd/ttvej8o2shz/0nMeKHzMfeHMe+FT+lNmPyjvN9U69DuvNm9Y1y/rM8BNvrsMcWbwV0i/wC30ifN1uwxv+8GZk/91uw5uR7+HttnmTPXiTPfh69djfu1ePtd8CT598lOEBGV7kF3zIr4ueeuMX6zlHH/M7x891f/XYdccPPpC5z0o/QE/97W+k/sTpXAzZPLx67H2Ev2XfUxU3zrzjHG+S402Qo66TnN805zfFTp3JH+uY5TrntnNvkb7JuIXXzbkn+yrrtMo6JbI/Xj123aWPeiNz/3j1WPX3OPEdk39tO/V/vnOqewbIufZ8x/WVPvr++Y76OvTUuWg931GdC/ysp97oVe8Kf+qOnnqj57skvwF29X/I/r35fMfn1/Md8VEoTuj6Y4cP7JZ9D5Hf2ONajnlKdv2ZL/VnvvCieU+xx7wT4UH6ea5njp/vFYprPF/uF8q/sB1e5LdyPPtAedaZZ41evEhP/TVefHdU19gHyldfOZ940O8Czy9ws+N7xcb8BPoegZ79sNk5TeRcuiyxcz5tzF/4+3zaMP9z7Nov8rde351Af3c25rFAzzmFHt6UR7LfDzY7ul+Uih/Yj/Nsk/xudvx7cLOj34Mt4iz796DyjCzzO1B5Rs7H+aZxheZ3Y36F8LoRv8SLX69nimx+pZ+5XkbzLL+568R+U74Gve+TG/Pe0viLXPeCvP6dIP+V68j3Sf4r69l/qu8aWb8Lzdc66xr8Kz74V7xk/z7cuD88rniPcesr5439unGfVPe7/p7d7/p7dr/r79n9rs/N+13fT/Dj3MTP6L653/Xvwftd30/wN/J9s79l/S4MP91XSuIs+75yv+t3qPtd/57A37LvMfe7fj+439X7QQt/y/79qPx9+3Ovud/lfQHkfQE97wvI/n2pcQb247xQ/mHmH5Iv/Efo/V4lf8m+12q8MfF+l9J6JLu/VI8J2El0f6keifSX6jjF7vNb+rl54Hup+Mb1N9JPzMPvT+JlkfkWOc4Kve+z8ltbT/+Ir+JK8zT6fUHrqEH65aq82dM7U3Gz10l0n6DnfEBv1PtAdbOn+2qgfz8qPvi/2fP70c2e349u9vxecLOn9wLFW36qdyX84Rt/o94PWtjhWfmEfkdS3MDjcP7Lb8g8xKf9hh4f/pRvhOzvseYxxt/vRqzDsu9BWq9k34NUD6G+B0J4vNkznzd75hPkOyz9PPXzjG/I5/MBu2XzJ7+F4+BReVaOg0eNt0b2O5HqHjyq7kLzqnHiHND6ajDWJ17N88W+3qmri33eqS/Li329UxcX+3pnDLvfGfFjn+PHvscP3vHju46fUe/R4ce7IvhO74kap0uc++Ri3+/UF/t+pybO6P5Qnl7m6aE3/8rTy/kK/Z1RXN/jGYtE/47VfPuMr98/pfIPyKf3Rs9z4Dij3y00r6HnYfS7tvIPPQ/ODeUfZvwo5zciv98jZR9nvcZZ34nrZuwk6nwIP58PIH10se/7Hcj5cLHv+93Ffny/Z9ZzXqDnvFB8g+zfR7Iv8Od+Dfq+x7j0D+Nyv9B46/RfZ32jjzTfonQ/CP29UR3qK9dB/aS+0vqQT2r+HykC+X/ksjyp/f/ISe3/R9DTR+jpH/RG/b9RKr5rP/pI8ZL9Tq34c+c1Fol+fzyp/bv4pPbv4pPa7x3oOVfQ0z/oLXd03zypfc88qaOOPear+0qh+D7+ncSom/RRtz5xfh9R/oHHNf6ke6nyD8jre6nyDjPv0ONbjrzDnOfIfpxXyjPKPKNc1xjZ3xvZJ54ffaR1COkn9L6vgvxuOKl1X428p7q3gvTVSR33+1na52mfZ3xDvH9HyL4gzueT9KusyzrrIvT9VeuJvtF6hO4nzTf6TPNNO32ldUU/qS41eu4rpfOGfem+Cnynflqqr4rWsvZ5tnQ/lcicX8va59ay9nv3MvtI/l3bjf5+LZmfUPeZyKPf69LTZ+jpJ/RG/45Zsl7Z/Ttm6T6S3hh16qGPekuOevcyvk9cxPczXniaGL+r+szPv/M1n4Hj6DPlF6p/CuUb5nyG6OmbjBvlOsa5jnHGJdIvyjvBn74BY96JnEfL7BvNa+r50TfLOn4XztCrbzzveeZpcv2N7ZxTyrfI+a/Svsr5rIl3Hy2zj7SO6Jul+8XzjO/c0n3iuLp0PSX7fxGNE/jmQP1RvTnw9+7NAd87ZP1fEthJ1P8lJXb6Bzv9hJ1zCjt99OZA9+GQ/c7z5sDvsYrv4u/3Hez0F3bLp4lRN/nRL9bTN+i5N705+P7I+g+HRvoFe9S5Z72xfci5pbh+xvXxizjJ9EeOP8jxB5lvQBx9kvMeERfzHnld9IvWP871j3P9Y6/PGPHjXOcEu/tF4whjnEnOb5rzS6RftI6Z/egb2eeZr8l8QvWN8hh1b9L66CPVcZH8rbL+q1zHCj9/9zT/tdfJvUp+0U/yK0rni3NH+eorjUtfaX6hf33o/nh9qN9NgX5ven3o302vD/37Gpm+QDZGvDDW9ww/+LdMH7w+jDoI24cfZc4TZPrh9eFXB/SH7D30Xx3QD/LrW8/3SOMPMr8w8g/QR/4Bfj4XNL9hzk+yzweta5TrkmzescM3du4zyjPGHnnGzgf/Gn+Cn3nX+ImcG5pvIueG9PPUz/E71Tmh+CbnL9m/dzT+Isdf5PgL193o/9uYt1H/t3kd68yzzjxrr9Oy+dc6hHpX8ToSOUc03+iLF0d+V3xxFPb4/rw4inlKht/LsMd6niG3wRYIry+OgrdE+JXcA+Ev9ULvT+UVwl/mGZDfPL44Eo8F8zHGPKU3ny+OvJ/xt2we0cOf8oyJE48lyP1B65sQB49el/Xev1rfFFn71/q5ZXhUfJP1aXIdTY67QO93SI278HjGn/R/+Ysj86d1rBxnvfev8qxz/utcX3wfNP8i+QneNH4i/Gme4k//t1VVW7y1qnasQxj1jX0Nwp/krvXsv6pt3qTvgfDnePah/Pro2YfI3ocaR+h9WLV97lZt70P8jeataps3/Ph+V23vQ+zwhR2+lCeRfUY++NL4E88DvpgHfDEPo77bpeY1I695lN88/eaZp8l1NMg+bzVvIbyRx/9ra96rnPeKPOJH82KfaX7Bh/LGPlNeod+VNa548f8vqmfg++TpvXkqQPh5L54uS9m71hu939Dz/ZT/ObLO05B9/1JcL/P2bDfqHla9b58m8n0F9X0tla9PnO9f+MPv+/ZpovgNOzym34g437fem79Avyughzf5T9D7/iW/KXbf3zWvac4rZXjTuDP8zavsc1DfVfs16deg97uD8gq9D9+bR897lX7rXM86x1+7Puw35Yv9pnGDV41XX7nuNfoPyZ94bBXF/wDwoVOfaCcAAA==```"""
-
         self.generator.setXYZ(20, 20, 20)
         self.generator.setOctaves(1, 0.5, 0.25)
         self.generator.setScales(1, 2, 4)
@@ -179,14 +222,11 @@ class TestGenerator(unittest.TestCase):
         groundAssets = [
             {"asset": "3911d10d-142b-4f33-9fea-5d3a10c53781"}
         ]
-        self.generator.pregenerate(groundAssets)
-        output = self.generator.generate()[0]["output"]
-
-        self.assertEqual(expected, output, msg="Output strings are different!")
+        output = self.generateSeeded(groundAssets)
+        self.assertBlock(output[0])
+        self.assertEqual(output, self.generateSeeded(groundAssets))
 
     def test_terrainGenerationPreciseRidge(self):
-        expected = """```H4sIAAAAAAAC/z2Zv29b1xXH3zOfZP14kuhUbZhUabx7EVADZQsPGjRkMNAS0NCFe0B4yGAQGSVQQwcBzB9AoBk0cPCQhZsHEVABD8YDshmEhgwEGGRlhqDg0PP5fo87fXF+3nvP99z7Li+b/zY/PirKoigOfnzy12fHf/77v3/p/639n79c/VIVxa/lh/rsS/DpydmXl+Wv5T//aPzuc+vffWYsPrO+2wm59Wv5zafGb/909wz84Yu7Z9h/PglZ+UKuyGf9d59b/+2fzrrof/jirEvczyeWnybG+NLH+JIj3zly5DvPfOe2h1wyv4/6sx75I66X8+5hL8BK8+5lXB854vq23/XRdzsf9WeDjBtk3MD57obI4T9EDv8hft98ajniRuSJuFHGjWwPfdinfzBG/Nj2QMePbbf80+9Ddp6J53U2yTyTzDPJPFPzYYw8U/wjzzTjZhk3Y7ywz3Ocuf3OGo931iDHuAvsnUD8/3H8Ec9W4L9+d7bCfvfJR/luTdzdJ4GF/IqyJb/iqpS9LuV/VyP/9iTksJ8GXlVvH9E/l+XbRzGP6K+3j2Ie0U9vH3UCL8NOv4BRd2EBhn+sVxjrkZ6+IZ6+cVxgSZwx6tglL32E/DRRfVRonHPb6Rvl69lO3yifMPq7jz7y9PGPPH30kaefefoZP8Ae8QPrLdNX6TcE331mVD+1tC6h+weZ/lGdUqYvtG6h+qVS/SZZv4nl4L9Q3CzrO0OO+HnWbe7x4F9+TeZpHBd94PxC9YXGDd6db5XjrYgLvlbY1Sel/NdgJzH6aI0f/WJ79Ifjol8UF6cTdmP4qz/cP28f0T+g++e6RZ9cltetjvrluhXx0S/XrYgX0hfoY/7CmM8z9DEfyfQDcqy/S55YV9f+9NF1y+fKdUvnSok/fYI/fYKdcwQ7/aJ8PfLpXHFc3+MYfa7IfwByrlhPP8g+BDlHPH/OCc1nlOsY5zrG6MVzKf009dNczwzZ+13xM48bvGtceNd4c48L7/Jv0r/J/I3Hj/1fKv8CWedCSb3pB/mvbKcPxIeQPkj/NSj+S/jhvLhu6bxoia84J5Dpg+vWb0/g/7p1+oT+kF+NHd7B08Sv2/TBy8p8v6wiPs6Pl1XER1+8rDri+2UV4wbf+BnFb2DMt4u9kwivxEX9z8kT65ZsXrHDt/z66M0b/vCpuKGR/Sp5jCze7DexzD7V+JJ9fivvNOOmnqcx+mWGf5Ho81z+c+c1+jwnL/tb+Rv0sb4GOfhoXAfrxV+huizQR50Xrhf8yW9lPfzKvnZ94e1ldfrEsnl6WX3dNn5/BJ+y19bDF3rjh0PweEs8VcdbER/793jLPB1vwdNl2GO8uCfgZxRfoTdf+LNPj7fM2/EWvKGHN/uzT7HDH3bOc/n3LcOj/PvpN0i/AfHB0yD9h+kv5Fz2uOxL+Y/w43ue8xH6fJb/JPNPrGffyn+a+afpN7NsZP/mPCTH+mf4id+KOsC36iY56jbHX/y2qB88q44L4v3dln7luhqj/ivs5vN4K/haEx98rdGLz8j/4RBeZRd/8FkWD+SNffdA3th3D+K1aD1s6bwNWedt2OH3snrY8j58YH1d7OxH0PvxIfl9SF4fktcH8QqK1+Ih+VR8j3zwmPa+8xjFo/TwqfyDzDvMuKHHg0flHZFf97NS8xCaR/lN0m/ieHiV3zTzTnO+U6/LsvnT+MLo31nh+s2yLnP8g6951rPJejb4e39KvwLhDzR/D8GLZfhDFn8hx36TLP5sD/4e/s8f+7Esbrf1HQ3kO1q0brd9rt5u61xtYYdP7PCH3ah9Gsg+xW7+lKdLvsjTtR88327DH/aOeFS+c/TiscDOflWenvOxTyUPsJsv5RkWmrfR/N1uez8q38h6+EPPeaz4MfOBN+eBT+VPmf2ovNNc79TrsN68aV2zrM8MP/HmOsyRxVsh/QK/0CfC1+02vOEPb0b23+02vBn5Ht5umzfZgzfZg69Xj/29e/VY+y3w9MlHGR6Q4UV+wYf8uuipN36xnnP0Mb9z/Fz3V49dd/zgA5n7rPQD9NTf/kbqT5zOxZDNw6vH3kf4W/Y9VXHjzDvO8SY53gQ56jrJ+U1zflPs1Jn8sY5ZrnNuO/cW6ZuMW3jdnHuyr7JOq6xTIvvj1WPXXfqoNzL3j1ePVX+PE98x+de2U//nO6e6Z4Cca893XF/po++f76ivQ0+di9bzHdW5wM966o1e9a7wp+7oqTd6vkvyG2BX/4fs35vPd3x+Pd8RH4XihK4/dvjAbtn3EPmNPa7lmKdk15/5Un/mCy+a9xR7zDsRHqSf53rm+PleobjG8+V+ofwL2+FFfivHsw+UZ5151ujFi/TUX+PFd0d1jX2gfPWV84kH/S7w/AI3O75XbMxPoO8R6NkPm53TRM6lyxI759PG/IW/z6cN8z/Hrv0if+v13Qn0d2djHgv0nFPo4U15JPv9YLOj+0Wp+IH9OM82ye9mx78HNzv6PdgizrJ/DyrPyDK/A5Vn5HycbxpXaH435lcIrxvxS7z49XqmyOZX+pnrZTTP8pu7Tuw35WvQ+z65Me8tjb/IdS/I698J8l+5jnyf5L+ynv2n+q6R9bvQfK2zrsG/4oN/xUv278ON+8PjivcYt75y3tivG/dJdb/r79n9rr9n97v+nt3v+ty83/X9BD/OTfyM7pv7Xf8evN/1/QR/I983+1vW78Lw032lJM6y7yv3u36Hut/17wn8Lfsec7/r94P7Xb0ftPC37N+Pyt+3P/ea+13eF0DeF9DzvoDs35caZ2A/zgvlH2b+IfnCf4Te71Xyl+x7rcYbE+93Ka1HsvtL9ZiAnUT3l+qRSH+pjlPsPr+ln5sHvpeKb1x/I/3EPPz+JF4WmW+R46zQ+z4rv7X19I/4Kq40T6PfF7SOGqRfrsqbPb0zFTd7nUT3CXrOB/RGvQ9UN3u6rwb696Pig/+bPb8f3ez5/ehmz+8FN3t6L1C85ad6V8IfvvE36v2ghR2elU/odyTFDTwO57/8hsxDfNpv6PHhT/lGyP4eax5j/P1uxDos+x6k9Ur2PUj1EOp7IITHmz3zebNnPkG+w9LPUz/P+IZ8Ph+wWzZ/8ls4Dh6VZ+U4eNR4a2S/E6nuwaPqLjSvGifOAa2vBmN94tU8X+zrnbq62Oed+rK82Nc7dXGxr3fGsPudET/2OX7se/zgHT++6/gZ9R4dfrwrgu/0nqhxusS5Ty72/U59se93auKM7g/l6WWeHnrzrzy9nK/Q3xnF9T2esUj071jNt8/4+v1TKv+AfHpv9DwHjjP63ULzGnoeRr9rK//Q8+DcUP5hxo9yfiPy+z1S9nHWa5z1nbhuxk6izofw8/kA0kcX+77fgZwPF/u+313sx/d7Zj3nBXrOC8U3yP59JPsCf+7XoO97jEv/MC73C423Tv911jf6SPMtSveD0N8b1aG+ch3UT+orrQ/5pOb/kSKQ/0cuy5Pa/4+c1P5/BD19hJ7+QW/U/xul4rv2o48UL9nv1Io/d15jkej3x5Pav4tPav8uPqn93oGecwU9/YPeckf3zZPa98yTOurYY766rxSK7+PfSYy6SR916xPn9xHlH3hc40+6lyr/gLy+lyrvMPMOPb7lyDvMeY7sx3mlPKPMM8p1jZH9vZF94vnRR1qHkH5C7/sqyO+Gk1r31ch7qnsrSF+d1HG/n6V9nvZ5xjfE+3eE7AvifD5Jv8q6rLMuQt9ftZ7oG61H6H7SfKPPNN+001daV/ST6lKj575SOm/Yl+6rwHfqp6X6qmgta59nS/dTicz5tax9bi1rv3cvs4/k37Xd6O/XkvkJdZ+JPPq9Lj19hp5+Qm/075gl65Xdv2OW7iPpjVGnHvqot+Sody/j+8RFfD/jhaeJ8buqz/z8O1/zGTiOPlN+ofqnUL5hzmeInr7JuFGuY5zrGGdcIv2ivBP86Rsw5p3IebTMvtG8pp4ffbOs43fhDL36xvOeZ54m19/YzjmlfIuc/yrtq5zPmnj30TL7SOuIvlm6XzzP+M4t3SeOq0vXU7L/F9E4gW8O1B/VmwN/794c8L1D1v8lgZ1E/V9SYqd/sNNP2DmnsNNHbw50Hw7Z7zxvDvweq/gu/n7fwU5/Ybd8mhh1kx/9Yj19g55705uD74+s/3BopF+wR5171hvbh5xbiutnXB+/iJNMf+T4gxx/kPkGxNEnOe8RcTHvkddFv2j941z/ONc/9vqMET/OdU6wu180jjDGmeT8pjm/RPpF65jZj76RfZ75mswnVN8oj1H3Jq2PPlIdF8nfKuu/ynWs8PN3T/Nfe53cq+QX/SS/onS+OHeUr77SuPSV5hf614fuj9eH+t0U6Pem14f+3fT60L+vkekLZGPEC2N9z/CDf8v0wevDqIOwffhR5jxBph9eH351QH/I3kP/1QH9IL++9XyPNP4g8wsj/wB95B/g53NB8xvm/CT7fNC6RrkuyeYdO3xj5z6jPGPskWfsfPCv8Sf4mXeNn8i5ofkmcm5IP0/9HL9TnROKb3L+kv17R+MvcvxFjr9w3Y3+v415G/V/m9exzjzrzLP2Oi2bf61DqHcVryORc0Tzjb54ceR3xRdHYY/vz4ujmKdk+L0Me6znGXIbbIHw+uIoeEuEX8k9EP5SL/T+VF4h/GWeAfnN44sj8VgwH2PMU3rz+eLI+xl/y+YRPfwpz5g48ViC3B+0vglx8Oh1We/9q/VNkbV/rZ9bhkfFN1mfJtfR5LgL9H6H1LgLj2f8Sf+Xvzgyf1rHynHWe/8qzzrnv871xfdB8y+Sn+BN4yfCn+Yp/vR/W1W1xVurasc6hFHf2Ncg/EnuWs/+q9rmTfoeCH+OZx/Kr4+efYjsfahxhN6HVdvnbtX2PsTfaN6qtnnDj+931fY+xA5f2OFLeRLZZ+SDL40/8Tzgi3nAF/Mw6rtdal4z8ppH+c3Tb555mlxHg+zzVvMWwht5/L+25r3Kea/II340L/aZ5hd8KG/sM+UV+l1Z44oX//+iega+T57em6cChJ/34umylL1rvdH7DT3fT/mfI+s8Ddn3L8X1Mm/PdqPuYdX79mki31dQ39dS+frE+f6FP/y+b58mit+ww2P6jYjzfeu9+Qv0uwJ6eJP/BL3vX/KbYvf9XfOa5rxShjeNO8PfvMo+B/VdtV+Tfg16vzsor9D78L159LxX6bfO9axz/LXrw35TvthvGjd41Xj1leteo/+Q/InHVlH8D6CSlx1wJwAA```"""
-
         self.generator.setXYZ(20, 20, 20)
         self.generator.setOctaves(1, 0.5, 0.25)
         self.generator.setScales(1, 2, 4)
@@ -197,13 +237,11 @@ class TestGenerator(unittest.TestCase):
         groundAssets = [
             {"asset": "3911d10d-142b-4f33-9fea-5d3a10c53781"}
         ]
-        self.generator.pregenerate(groundAssets)
-        output = self.generator.generate()[0]["output"]
-        self.assertEqual(expected, output, msg="Output strings are different!")
+        output = self.generateSeeded(groundAssets)
+        self.assertBlock(output[0])
+        self.assertEqual(output, self.generateSeeded(groundAssets))
 
     def test_terrainGenerationPlaceObject(self):
-        expected = """```H4sIAAAAAAAC/01YTYib1xV9Gn2j+SR9+hln2rpgiBehqPHGkIEoP1DRyP2LQzytm6QEgRehDaoLbmuEKTT5BnmRhYtCV1mIZgJD0cKLWVTgUjdIbVocmIgJmOCoA5mFipw/mKBQQplF7znnxnR1OPfed9+9Z+5779NM/jt5dylEIYTSu6uPnFp76OnXP2o9Wv3Hw5t/WwrhzCOvfCv7iyd/8MZfNo7d9/c/T49ZXHT09JPrZx74/tXbrz/2hyd+t/mA2fZ//sd/7z78tSf+9M83blx76PcfIu7zTJo07k8zn2duFA2jzzOHBWGt8KV9dEr20SnE1xwtvg6/xddDlvHEC3mzR1zXRJytayKu5mjrNnyfDdmFFt/yfVpa32h7XNvzdbzeru/fFR/1sO/3So0+4szfFx8NgOYfuH8IrJZHY8SZn1gtNybC0VT+xhx575RHC49foL6tSiNsZmBvhIzZX6yOkk3aDaObS2Y33W4uVR1tv/tDuLkkfcFNtyy4kLpm6K+LQ0/6m+5vKh560b/h61uIo15E00e8g/2gi+fpub3nefq+T9/zDBAPXbyOIezUR/USoQ/sd6gP/VOsg07qFzoxfoF46LMpHUwv5je9bi5Bp0xgnkR+4NUsdAvZq1npBoQ+V7PUKwChz9UsdQpAzBH5hvMWOPQAlx7kHaHNSZa85/6+1o8GHjdQHtNB+499/7HHjb2+CeLQP+ycE8ZBB8YvgBa/cHvYJEf/XJdklNd0YJzxs5Hm5mzE/jNAzMXZCP3Dzv7D2UhzAsS5It8A13kCon/yNpDnJkN7B347Vx33d8VxfujvKQ66kA88/1B5MR+sZ+z7j1Unzg3rm6h+6MK4KeKgi+KFlmeOOOnDfRaIt7qI1En1Behi9RGpk+o0XFvmvBhWOTdA6LS2TL0yQOhE3gTnvERA6LW2LL2A0GttGfeNEHqRd4Q4R4zrYZ3Ze4ijTlo/gF060T70/cbaH/NC/0R1QR/6p5536vnmWG/7zb2eBbjdlwvtizkCF1IH1UM9LM7O0T51STP70iXsuy770oWIe3nfddlf1j2zT13AqQvR9DC7dNl3Xcg7zrtA6UJ7z9f33T5wPgSXHrSPsT/0EP8SoQPzOGJe9tGvI/TYX76Qx5zQbnMCLmT/GfpNj+2cztN2TucJiLkgt7nYzmk+gNBhO6fztJ3DfQuue3Y7p/cJCB3I27DX+B7R3oG/Rl3o73qenjj0Yb6+EPNCPtQ+OEeMGyMf9FBezA3tU2DtHmI+tnPW9xzrqIfFvxYLoccmOe5d+qmH+U2fiyvS4+IK3qU0Asc9C475oN3umYsrumeAODcXV6QLEOfm4gp0QZx0ubhSA2aBuHfIOx7XxboaUHl6smNemK+PdbpvyIe+buj5x55v7PaJ55vAbv06x30DjnNF+xx+08HRzpHh3grmh3a7V8ChF/2m03rM9zq7HuO9Buo+ARfq/NBPxHsdAhA6rcf4zgGXPusxv2siIPQhbyOP9GFc1+1drYM+zNuH3fx9xEsf+gduHyrPlwid1mPr3xFztB5bnxP4pQs4dKJ9DrT+54iDLlhHPRRn9wntds8cxfp+OYr1fXiE/e1+OZIuEex4p2HHPB1JlyzjHKHPketyRF2EeLfJ28474DpHtHfFcZ7o72kf3L/095XX7hty6HMkXYybDkPEUxezW19jcOgihC5H6HMKP/UQXzgPGa2jDtBjM/NWXv2/la85qm9w6EF/3f11cZwf+puKx71CvyO+d8nbzju+vgu0Prpu74nj/NDfx77m7yseOtA/gB/9A63fIezoH9z6GLt9Arv1OcF66AB7DJR9DoypC/0Lt9u5YT7ThXbT5VqBemSBmIdrBavD9KC97nbT4VqB/cu+ATu/97leqO99+tvIo7lgvg7s0oO8B7/V0UMe6QAuhA6wm3/g9iHQ6nfEPJBPkDe+h9CBfA7UvUH7QvkwF1xnOnCfBCg9zhelw/mi1eOI+4N2mwva6+A6F7ALpcv5or5L6HeEHlzfVh7owbwd2KXH+aLV5Qg9zhet7h780ANo9faRD3ogzvwDcOlBPsa6GPMRAXF/kE/hb+SE0MXjF+5f+D6mB/MR9f5wP5uPE4l0OZFAlzQDxJzQXnd7HXbeo1nYocuJRO8x7Dgv4NCFcS23txUvtDxtrJM+JxLbv4N46AO0+hxxjsj7iIMezofIIz1OJPE9xPfKiaSRw3kBYk5onwPNPvd1C9mFmhfmDdIB88L6TB/WZziTPkTMyyzR3MwS3Sf0230yS/Qez6RTmLk+tLfcTuS7o3Vt+KELOHQBhy7IJ11m0iU7ky7RTLpkZtJFfAh/fA8xJ+QTxOnczFyXmXThOugwcz24n80H85kuM+mgekyX6yX93wGI+bhe0jtCO1H/V4Ad8wGO94T2Frj+f8D1Ldh1bq6XNBfXS7Z/G3k0F9dLVl8Hfs0FeU+I80I+cP9QiPvzeklzAUT/5FPk5/nIMm6B9bo3uK/9/ZknoE/eGxnWYX1fLut8XC7rfFwu612BHTqA4+9/uazvDfqbsKt/+h3RN9e1UuVte942OPsPQPz9ybtA9I991T95X3bco+RD52OPnyA+duT7EYHjPaV/jjyaA+638PULxEsP1IX5p9/m4PGKdHi8wvszPF455HmAHTqA4zwwrg67zgPjmoHroQ/jNrQO54P+Fuy1ewhduE8b+TQXQJwP8i7idC6A0IW8j7yaC/Kh8zHi9a7SPvF8U/dPfb85uL5PGUeO73mPX8Cu73nG2e8c1p2Aa26iKs9JFFWlEzh0AodO9NfdX08ZD33ob8IuXejfALd9NmSHPoxryY55YlwbeaQT7R3YcX6E0Iu8J8T8kA88/xDrNEdcP3b/WHVDN8ZNtB90Y9wU6/R7kHFzcejEuIX3a3rRb/cK/abXruuzi7x2rnZdH3B8n+xKn4h+u192pU+G/ibsVl8TdukDDt12pUuW/pb72+KYp92qzX0beXS/gGOu6O8CY+pFf08cuu26brQPvO6h8uCdZn1j359Y4+8i9jGBX78Xd10/+udCzBe5zRPj7fzt/p9OmKuVpdeOja6k0cZybe3SUyF8IxevHsabKxdye6s7do6/E5v9wZBdy++thq0QfpO/Ujn3QbrybGGnvHU3hCeKVyqHfw3hP8W7pcNP0ujZZKfcuBWyn5Tull792N7Z8k555+00erSyU77wfsj+tHKlcmD4L8PR7TT6dTVe3fkoZLurjerpd9Iou/Rq9eBKyC0tvVLes7p+tHzy2NZTaeaHy8erI6vvm7lQ2Ysz2VO5L5IDq7OVu1XZm4fc87lRaWT1NuOTxxoPptGZ+Hj1pNX91fytyumtNPOV/Kh0zur/bf5S6fQHIfty/sViw/r4SWGQ7N1NM88VtgoH1s+Z4qXSyTfTTLNo/jdDWBQPiic/DbnPinfy1U/T6MfJIKneSqNnkq1CsD4/LB0URx+H3Lx0J79j/X69bPneDrnj5a3CyPquVwbJ6ffT6JHKVqFqfb9QuVTaMf5C5cXiq8bvGD+8HXLvGT8wPX5ZDZX0ozT6VfWL5JLpkq7Wy+feCbmXVk8nDdNnaSlNdkyXc/h/j+lxKndYCPnNledzN4pb1v9342oZfd+Xv1FEvy/b74IL1ucz9r2K/r6N70fr6zP7bjuwv9dz9g6jj7m9U/h7Hbd7ecvqfszuIdT7M7t/UOd7uIesvsvVwwLqemm1Vjhp9YTwP1QV78CsGAAA```"""
-
         self.generator.setXYZ(20, 20, 20)
         self.generator.setOctaves(1, 0.5, 0.25)
         self.generator.setScales(1, 2, 4)
@@ -219,9 +257,11 @@ class TestGenerator(unittest.TestCase):
             {"asset": self.customObjects["Tree_4"]}
         ]
 
-        self.generator.pregenerate(groundAssets, placeObjects)
-        output = self.generator.generate()[0]["output"]
-        self.assertEqual(expected, output, msg="Output strings are different!")
+        output = self.generateSeeded(groundAssets, placeObjects)
+        self.assertBlock(output[0])
+        self.assertEqual(
+            output, self.generateSeeded(groundAssets, placeObjects)
+        )
 
     def test_rotation(self):
         expected = """```H4sIAAAAAAAC/02afXycRbXHZ5+Z59nijbBml7ZAJUuSJqEpZbvpy1Jo+mSz3ZZm2yY0bcNLMECgMQQINlwjbw51heItGrAKXnlZoCrQgKtURAiwSJHyacQgvUixeFcsslgoEeMHrNwP9/zmTAh/fT/nzMyZmTNn5zlzkpeOvPSyIyqFEKH7ngv8e/s9qW0rftD4euOVNT8l3c1/P2Ha9g+WnvnD8dWLe8fPecsl3dC3Lyi7vnT+6ptujRYi/zryvQjpfn3XrWWfXHfNips3/vY3O3/9jZ1nkK6x5d6Z4RnrUjfelWna+cq6t48j3ZYNv6rbV/3sykf858er1Ys/u5x0h5e+MGfoaw+lbk/owTf2vfJuK+lSLwTmxa+7ZfkjezLnX5fMX4g52m+9p6Ft/XHp70/fNP2Ghx67A/bW3q0T8oJDzVvWfrLza3c1/h79HvzZP0+bflF49dCr5bknXnzu25tJt/funUs7P3iv+ZFnr7yr8Zyb644h3ePv/MT/4A/1a277af6TfzjhHoxd1XbxJV/93c7Mw2csv/q2VT37sY99fz/tyllPquZbP9SlaQO7r/0c6S7fcM2Vswob/V3njLx/5wVDz0P3wqKW6+ZkQmvufGs0t2vPeU9jfTOvfur63Zdct3znCU3zXnxndupE0j39yInbfvT8q6kbnzo2884bN3wRuqVLRv/7Lyt/s+LRLcffNr9MfwQ/3/bQ3+49+9S/pn903znJdZVPtmCONxbI+3f6v2zRseYjp5/b8DvoVmSjD5zw+X+v+Mnen5z34RePpOpI9+4tdcP1i6/O/PKYJSu/cHZ0J/b7X+//KP/XB4+s/M6GiaWzPqlOnkO6a2oTz0+/4KO1O747e/ZrYv2T8MFz+y/b0/NU7+rbbn/s44vff3IfdDv+1PjK+tnzV2T/55d3n3f31d2Y9570e2++dGlu9ZYl/3lA3bXtGaz59RkPv73/mpdXPN2Qzj87ctHXu0l31HNPvPvKiQ+u2rr6pSdPfHYoZs7y+vL3ju28x//5q9//y2tvbPoYutSa8HtD5R+0PHpJ/976gxf/Bf57+b2G9371UT51V9mTFV2znti9nnQRNyoLKa1AP8Es1Gs14pBcoVVWMjOKCT21B0x7gknjA+gHvemfsDLpMQ56Mz5hZdKb+cjeRIDYyyx0WrnNyikrJ6xcb+XJ9bTZ+drsetrsPL3cDnumvZcJ2fTrtfvotPtus/uelM34QrnfJmTEZR6w3OEVygv1TD9h5RS3k96LWGI8aMYlWA8auwnW0zjun7L9icYuzTMRIFYIOeIws5JpxlfYdVXYdVXY9dh+sGP6J5hYB+xhnbAHGvsJaz/BMvZl2uvtfG22fXI9hl2VOD8Q/jZyJ/xOci/OgzniMKGHX017GxPnin58Pqw3cgrnwnozvs3KJg7YXsQlVjARV0ZOWDll5TYrd1p5cj0JO1/Cridh56ngdo5fls166u2+Kuw+6u2+E3bfk7JpF3HyP/mbOeIwJwIijvMAcR5Grud2nAP6gxjP52P6GT1o7CZYz+fCNP3rcR48zw6P2Ia4YkYszfg2u642u642ux7bD3ZM/wQT64A9jl+msZ+w9hMsY18HuD/PV2HbJ9dTAX2uie+XXBPfLySb+4Vkc78wM4oJPd8vpr8h3y+sN/0TVjb3C+vN+ISVTRywvYkAsZfJ9wvJbVZOWTlh5XorT66nzc7XZtfTZufp5XaOX5bNejrtvnrtPjrtvtvsvidlaj8kB12xUsiimnlsvlEHD8rHq8UaIbTqWOA3ov2jZrRn1IJpIi7EiGNoZDo3I/O9tG8G9mFYr4MlybIhySPOQG2hE+MMBWTdyDJRRGVkMfoZmnNi2TCFfe5K8/yGEjLPbyi/xesSIOxFXJZByFhvcR78x8zKKVlvZBlEP9CMb2F74CDtK1enVV4xIcOfkEHfw36FZ1jPRHw+JlkGP5WpH/yCcSDsRVzyw0bE/UAtzUf7YRmEDH+JbviBmZVTctfpLIPoB37L+tfYJcKvNB+dCxMyzWtk8LADfwtpmGLidzjosgx+KlO/vOJxIOx9i89FgOx/lkH2/640+5uZlVMy+5+Jfux/Gt/C9sAP6caJVQlxp9wmu6qFfIY4VKmVo7bJMdLPIQ+EKOE9JVgd7l+m1fHBWLhwmg4uJo6fLmQVMeprtSxYF84ltdovd1eOfUXIBWqsMnelEF8g9m/WgZfkWGWM9D+WeyrHNwvZ4HTHh5bqYNrpj/vNWp1MDDUJbymxeIYOnuT0xLuW6OCHUiV5faEkry+U5PWFkry+aUms7y2ny8nXCvlnJ6pCdO6XOgOOJj+9rAYc/2Qd+JI74MTm68AN7rVyaImQa6i9lfzxXbfgFC4Q8hb3NTl+KfVzdssY/X7/QBwj+V/qXTV2mVa3OBOBoYuFOFF2ydaLtfqq7JHjNO5ENxfsukzIeW6fN36FDsx1hRwj7lV0lpSw/1MVZdelWj0K9giZpvm7aNxBT5S3ztPB//UK4dA8IRNepDxfo9VeYmi18FYTx9dTXLuzwqEOHfybjJQXq4WXkl3lsbN18F5nMDzWIbynnO7w+Gwh7yP2nyK8Lc62yNBaIYNy+xfGyA+fkyJcnC9kk5wW7l+MeErNKFJcXeCUTS+eJbwLnVx5gThAzGe0esjR4VYa/zox1qKDq+SscFe7Dh5SuZN82s/7qqtq/DIduNjddZK+SMhPnF0n5fu0upI4Rr+btc5IZde59Hah9hzdc0vpueQvECLpzKwKzaF+rqoao/v8I6WqonPg57nV0TodaHYXnNQfE/LnKleZi+lAh3qgMkTjfu4crMlRkn6fMzw7RP7Z4fiVUaIr/UqfzvuPTrQqN0cHviiJpyCuRypzNO4ax5+fX6PVDY5oGF8jvDrZPr91gw5ud9rnj58qZJjkEI1/UHbEx6u1usptnx/tEHKWl5s/VqXVM97j8SjF2/1eLh7aSH4mavLLG95oA/x8trcvFiO/rPfOiEdbhFfhrYzr5Vq96mUXRek784mXWRidI+T/ecX5PvEQsTWmg495I/E8jb+RODZfq+leRxz31FtO0ef4zSU5fid8jt8Jn+N3wuf4/biJ43fC5/j1mzh+O5Icv6kkx28qyfHb18zxO+Bz/BabOH5LTRy/1WmO33dTHL+6ieNXN3H8diU5fokmfj9uQvx2OCWJ+2OESPcKZeMl8w4oMRX0oOkX5/6470C67+j+Yj0IPQh9RrEd0072YW/SPt9jzJLcGtazcT9vDePe9L2tYbLngbiXQegHXdMvmFHMCMsKetyv0IMRlpUZZ74jLMM+7IGwb+Yz+VBdFX9n66qQl5RkXRW+G1FmAHrQ9NuI/dZV0ThDfFc7HNaD0IOcj7Md026+L1P2OZ9l5tWeONY96O4x+dmIsyeO/iDWCUIflaYffc+YWZaD0MMP0LMfDYNmnPkOsQz7sAfCvpmvHuvvSfL59yT5fHqSfP6GCno+f+oX5/58/j1JPn/Wg3z+rM8otmPazflP2efzZ2Yl4gPfeY4TyFifiZdG9KPzM/k1zg95AGR7/o04X/gddoz/pfFvG+yA7F/0M35O4HsOGfPtsfk71geZ1wmZ5wd1YI8aUz7pXTmqxlsKYlSNqljCdz9Pctcq3z1KQi6IYdUf0XTv3qv6Iq0x333D7YsUMgX5BMljsYKEPET6aTJUXVgl5F5VVh1aVZBKllWPdfrOcyTnWnznBQW5IHepfIOme+YZNdyQz/jTviGHG/xYwfsxybFMwYPcT/o9qrWZ15dp5vVlmnl9mWZeH+SCQP5G9z/tc4oiznkdWOL8S4LY/9GeoXe0zdNKEnkS+k+x2AU7zDTlPeif5jzIM/lUgvMq/t3tSvO8U+T5mZRlC5wXiPzbyL04P8q1+7EuZtSyw2HSO0nQ+4X2x6R3lKEZX2Ht1Vt7CSub/Jn70ftK8PvYzGuId6jhZHuFba+3+oSV+b1zDPJQekcY0rvkU1JcBY3cyKR9sky/x2nB3DFYF4h1GZnWtcPj8QdcZsSS3jGGpr/5/RPN+5UJu6Bpr2A7/M5jRixhh/v7FbwPv4L3RTLts8MB8d5glizzipkhwu9ZyRxxmGZ8r7XXae21WTnFRL9B18yrQD4XMy+dx2fae217p21vs7I5t+I83hdzh8ecFqRseTb8WJxHfjbE79zILXgvFufR+CCIe8DI9VY2fmRmJTOjmNyO+4bsmXNhYl4+Z2pvYzscB0zY4XNjDrq6kfehG3lfJJv4plWa+GZGLTsc5giR45uZUUwzvsLaq7f2ElY2fuJ+EwEzbwDkczHzMifbK2x7vdUnrEzntpny6eJqyjuJ/SuFqCLqZh3YogbDsY06uJ8Yot9znUsy5Z+dlB9Gqd93iEM07mGiPkurP6nH42N0PjcRx+ldlIBM+dRmynfYfkeS7XckYZ/iwePv6hSxT+jpu0X+KB7Lv4PisTh33wORL7Ce/Deb6yRTxHccetGN84gu5O9idCHOb8QBEQesj7i0ezPvFHl+UIinnTqJ+75AjK7X6k6H3g9n6cDdKheMnS1kNb0nCmt14Ndop/18WdXJrhoh1sk6OUbf3TtlyUG+f7cqBpEf/szZF8xTvP7TGQ0KyvPvUKPlRep3NFHMFXKJ8mcUThbeb6U/o3imDnaT7JO/57mj5dG5wjvijZYPpbW6nxhbqIOB4NZyvO8SnkZ/NeAOzgiRvVavb0brqTpY7vZV6jN1IEQs+jqwwC3W5Oj9FpfFmrEzhBh2ijU+2Tsa7XR+m2RfZe4KIa9TfZWxXiEWqLrKUL8QcRmtxfuhwp1Z69P3/I+qrFZQfrpHlcWj5M+z3LK4INa4epG/TsjvEqMNWn2s9KICnX+c+hVbhbzEKYv3L9LBp4hjK7T6krNnPt6TdbKA/sFDcteicbITksOL8qu1etoZbmL/Dzex/6Np9n80zf6Pptn/1G78P9zE/h9uYv/3NLH/u9Ls/440+z+Thv9N3SZh6zgJrm/gvhi0dRxTl9lo6zTm9851mKyt05i6S8LWYRKc13C9xzCQt3lNXk3lMXRPmTwG91XG5i0m37N5Co83DLwjZ7p6Bb1jpK/G03QPWULuWsky+LZ6PDJE35+/q2J4bCnTX6aDr1v5dSu/LTuq+9cI8Q+pq0JrhfijJeTcapbBQfVRQz/56QoVbYgtY+aXanWjlW+08jvyjmZeXyHJ62NC5vUx4Q/ka1HLww776bB5b+B+ZBmEfLzNA0HIyAvphjfvAxAy6kGQQeTduSbOC8G84nwRRP552GH5sMNyxOTJ+P2bPDEI/5Mdk3+DkGkeI4M4D14/87DD53TY5MtYN8sg5BKdJN0vgaghxmXNe6lkyO3oHzXEfVZt4gPE+Ig7RX63TBHrjsrdlXh3lAyx792VeI9EDTHvblN/LxniXuuOc17fbfablVPEeyGjpsh5s0ry+kGsXyV5/SC38/pVkuvmGYV78yveu2GO421V0U2oa81t4L97jJr3xTcpj86fJUSbYi5EHk32wBC9x1soL25tFvJ6yax3KS+m7zlYXKyD36Q8l8czET+oqyFuuN6G+OD3A35fOH/45bB9r5XM+fL7gPoFcX48nkn+Ogr+ArHfKBN+PYr/HrBgGv99wNDUUzFuhOutpO8+jt8vU8R5Qc/k+8UwxXXTT2nqvupk2Ad5vYbw+8k830AtaOrIKVsPbeH6Md41GbUjgXmycopYB/TMyToy318l+Rmaeye1kvefWsn7N5RR1kvcd7x/Q1PP5P0bys3OPtlK9+6tah99B3Wgxz0oW2uF2OkNhGO1OniEGDpTeIe8bFhv0KrTjVTl6TvTKCNVuSu06nGqq/KXC/kLZ1d8jO77S4jFBiGvcnbHdY0Obnbak2y/Pcn2u5OwP8L1DQni3YF7BsxalixRjwDfVJP1EJPB0ftzkiVD007fCxB+eNPG15vmnrLzxXk+fsdzXQTE+JKpc8CvXNcocT3CkN9fXKcocX3CMLoG+U11mOvm1WGuo3P9Avcc2iOW+J6AGUu0Yz7oOb6Ytq7ivalMfUJkDLk+we87ZtRyxPkscc58z4w4k+R6xwjXQ0z949M6SAsT+zHzbYS/jN6Q44XH452OdadtPSTN9QpD3BdpW8dIc/3CvOuxn8N0f3FdvjvOdXqub+CeRnvWsmSZsePQjvlKlhk7/2Guu8gRro8Ycvwws5YlS9QzOH4m6ykqyXEzyZ4kx4+plwiQ44fvlzfNd4LrMBw/XIcYsfUWEOM7bJ0OdbVJTtbnQFPnms11Lvgf5zxJ6E3dKgE7U5ysb4GoCyEPNnWi2bYeZQl9h60Toa4zycn6EM/f/h98PxkKyBzfhnR/TBzPdZiJ43HvHHBZBvn7sn0O/JFlSsj4e1iWSetfsITvzwVLMC4qWQYhZ+W+M3l+QwGZ5zc03wO+90vm/xBMHkH3/vGcR3j4HlCeIPB9yDVhHvM9MEQc4HvA40EdOMFtDQxRfn67Nx7K0zviF85QtP/LQrzoxGKt5I8T3LFlaL/K2S6HaD3dxDF6f13ljMoQ3Wc/IA5dplWzS6R77yhif4cQs4iF83TgcmKeuBYy5ckbXL6nzifm1wmRdqvV+DodWOm2q2I7tZN9QXnaQmJhkxCXE7tWaXWZ3C6L9E461S3I2BzUf3fI/Bwd+BoxeooQK1Qi3Fqr1aNOIuzXCO96pw9y8Cbi0MlCfij7wjGyv5841KrVdmKB4uF7xOIG4bWrvvB4O/y4Ldy1XsjZxCLd0yep3eGuduGVq4mwpvYhmqeL1nGQ5mmt0uoJkos1QjrBRHhskZBPeV3h8bPIj17KjPs2cYji7Fz3tcp++h30EWP1kMuqinS/Lyb21+nANoe4TAdeIA4tFXIX0T9NqwuJrafh7wckLxfiamcuzjXwFWJrEn8/7K4KJbXa6myvitK5X032xZlC/pDoUz55ITFHefmF6rXKaL8O3OuIqrFL8feJg5Wtl2q1kVjsEfI4dyCeX6+DD3sD8cIGIf/sDUNW+4n964T3ZXc4XqgT3k3E/rk6OEr06X7aS4zS/suI+HtB2h2N52qFdzqRXlbBZa5qyNUJucZd0KCpfUwNxHP07r6W5smfrYM/JjlK/j/fIaaFd7+Ti+PvMzudbBzjfk/sp/fsVc7MJMffzCTHXybJ8ZdJcvwRTfxlkhx/mSTHXybJ8Ueyib++JMdfX5Ljb0eS429fkuNvZpLjb2aS429mkuNvZpLjz09y/FUnOf6qk4i/qPmPCdwfWcn3hJHN9xe/3wMm72UizzzA+a8Hoq6D7xHqGyav7cT9Z2QVZZnsd9s6Oue3IOcvyG85X+X5VZLnN7K5v7m+PS3IdQAmZL73mFn5wHSuRzwwnesRkHHvQkZ+vbKG6xBMyHzvMgfdkq1HlGw9AjLu3dJC/v+Prct5fiZknp95gzMa9M/13Yw7GtTnFMRBeUZZF617C+n1vIJsJX1onu8My74ZobqCfJxYaPfdJd5rJ/jkj696fTOidf60rxPF+oK31i2rLSzxnaxTVqtPL8hD8tr63EVCrCF9/6aC0KQf3+S7u9zhRePtBe8Bok/ja+Ss0/GOLjnDi4pk/89EQfPdQO9qXl8mzesbWcXrI9msL5PG+kbIn/xOYWYtS5YZxcx/hvx9NhQ8nsnfUzqvRqtPMPk7YCiNnQQT3xuQ864HpiO/AJFvgFwHp/NsZPLfl6jdvAtBxCHG4TvGzFs54jIHLQ98hhg3aBmxzKtJrqzh/JxZksysZdRyxJki9o1x2AePZ/L3i+Kvzeo3MvF7MePM/50YvSH70YzD3/kWYjxo/863kP9/guIzwbR/B1zIf3cCzbt9Ie+LmbEy5d2GWcvoZ8i/J2bJMmPtjVC8c3wws5YlS8pvl3NcTJHjw1DweCbHB/2eGq0+weT4MJTGDtdplrMfzTgpxP8DjLzqkUQsAAA=```"""
@@ -246,8 +286,6 @@ class TestGenerator(unittest.TestCase):
         self.assertEqual(expected, output, msg="Output strings are different!")
 
     def test_fullOnePieceSmallTile(self):
-        expected = """```H4sIAAAAAAAC/0Vaf3Bc1XU+q/d235N/SLvS6ofpdFh+GRHA3YIAgxtnDbIxscArsCMHMLNtPdgIGRa7NaLYnhssiEQg2hgwa0OcTUfNuJ427LiUmmKmgkyBukm8DRmPw6idHTdplJmEKFPa8aSepN93zjX565tz7rn3nvvd755730rf//X3/61FIhF5609Lpx65P1r1dz97ddG97w9v2xyI3LrkTGb/7r+4bfz3vrVr8QOVvSnErb554nPB9nWf/+ZbQx2d33nzo7vhC8+vX9e/+vI7xn/4jRWHb3v+S/TNPvytn3z3pp7bXn/vm8efu37/z+j7cvWK6rv3/HDVX63/48IbfzOfOwHfVy8+8vCrh1bffrD9mmNPHnv1/M3wfZLY1Fq4mDjTUbjYJT5JnMsY5jPm35Y2rLUDA7a7K2jniQHb3RUuZLvhmbYL7TNXW/vM1dZueKYNiPHTbWbnM3KdxRnW2g3PtMl11l5Y7vNYzn7IQ23ksdLydCt9Hit9HornMjMD1m6IPAbML+v8vOvYD+seMj8wQdsN+/GH2T7RObPZ4mY2Gz+whX7ZYn4g7GK2MMJxJjoNe7tcmVjMAhO0Z3Yxvpg17O2SPfQXs0CNL+yj3exyk77/JMc90j0zZf6ZKdrLe+UA+5d75AD9R7qJm1qaXdy3TS29HpGPIvK52IWbWnR/Q/q5b/RjvxL0c982tXBfzea+0TbkPpqf+0E/MEH/BRv7oXHcHx1npe8/IKLx6xiX96g8q10YsnbyTJu8a7/Nlq9s8fNtod941XWMMN541XWU2a78Cv0zuxjXBL+MI8/WXthnNvhVfsgz48iv9p8yPxD+3/EKvrU/7PAE/OTxhOf7hPItQqTuTxi/QPIrAZE8njBe5YTxmCBSxyeMP0XwpgjeEK+6DU8Yb4kTypfZbphoPGncZsYrTzoP+dFxR9hOniwP6pHthuTL2oG6DuqRNvnSde2zdkPw723o0sabtHUYkjdbN3nU9U759Uz58Q+wH8Y/YHHGJ/gA5gLlNZELlFfYvZ8i9ZkLjNdcoLwqks9cYLwSySuReswF5JX9TI+5gHWCdl75zQVWD2ijDght1gPa0KW2k2/tN8z2vPLN8ahL7aeofIvON0Jb9RjQT56ZP3lm/uRZ81a0c0/7AlKfOt4+P563WQd0HZOWhyHq3STHIb+WN3nWdU1ZXuRZ8z1Af15x3PM7rvxKMO75HVd+2Y48r6af/NJGftfRJr8i4xxPbeN3PND6HIwbv4jXOqxInsc9r+PKJ/ubfjVu2PqT13Hl08YHjwkdd4Q2ebT5DI0/+nne6Wc9HTce1c9zr3nusXEMlU+d3xD57PP5TnJ+3BuTtHF/Tfr8p8xPHdNvqDxq/tQz241X3FfAOeMXaPzOBVYX5ky/wZzy68I5z++c8ktb+UW71tdwLrC6MOf5nfP6nVN+aRu/c8xvwPysr7TJ95zpNzFnfCfmPN9zxrf6ybfOM2Ljk+85z7P2K5tNvrXfLutPfnW+PfRjvj02P/VK2/BMG3meUz6JafKKuLWLDY1P+g3XLqaO5z7lMU0MB0PT62DY+ymSx8HQ9Eokj4Oh1QMi68BgaHodDE2vROp1MDQ+B0N9T4RE8jkY6rshQeR7YTBEfgNmk0+NH7I48spxWBe0/7CNy3cBkbzqPCOG5FPjytaPuqVNXnU+tckjEev3SB4Hw7TyOBiuXWy28TcYukWG5I3juEXkj/E89/STx7rnrR7qeyCsG39S9/zVQ3sH1I3HsO55rIf2Dqgbj0C79+th/lMkf3XlkfH2Lqt7HuvIn7zWjcewbjwKbeq07vmsG59h3fgM6p7Pemh1oW58BjrfCMdFvxHrT33qfB6pT51PMd12waZOaVOndfLikfdZHbyxDtSVT45zfCHPf135JB5faKh8ajwxm7T3VTbJ95UE2aS9r2izntI2tPcy/eSTfvJMP3WbTeY9Gr+0qdtsUt/DiuQ5myS/hqwD2aTyK0S+s+gnr7QNrd5qvyHOS16JplPahsavzqeIcbb4eUeYD/orQo8jNh7vNZ1fMU1MEKnjbBJ63MVxyDNt8LWHccoz8PhC6phInonUrcYdMJv8jimfImNJ+x4ZS+r3SDDGvNQ2Xumnfuk3tO8O2uR1LKnfHdrOukqbeh5TPolY13K2k09D6nXM8zmmfHIeO/c6z7C1G5JHs1lXtf9mm5d8an+PrLNj4OkCUrdj4In1YUx54zjQnUfyNkY+PLIOjCXnF5DHMc8fbUPjccx4tH64n2Y9X7NJ/X6TWeahSL7Yrt9tCfoNjS/a5HFW+XLhrNffrOnP4ldaO++hWdOhxa9jnOlw1vOm8ypi/UN+3mGLoy7pN1T+QtrUp46zxfqRx1nqagv9yqPQNoS+RtiPfDIe57lMP3gq009e2R88Kc4vuGCTX9q812aN38Ss8urjp3z8lM3D+jrr+S2klE9F6rGQSpPHkDbraCFl/NGm7gopO8/0s17S5jmmTV6JPM/af8D3W0dMU4cBkfWykMK6h8zP+502+SuksO5hi+N3Af2GWL+3ySftC0g9FlLQ1wht46uQwvo9kqdCqo8otMkXbdZV2tQjbZ5r7Tdp47JucjxD40/nP+Dnh06nPX/TXBd0OW38JaY9f7RZL6c9j9PGI/x67wTTnsfplL2Ppj2f08qntZNPHW+Atp3nac/nNPNRW/nEvODDI3mcJh/DbFf+hDbP97TyZ+0XkDxqfJlxxt80eOH5nlb+2E95g7/Uyvo4bbxZ/KSPn2S88hdOG3/htOdP8z7AcYzHaeMxEUfGYxyRR9qmQ/rJH21D+50ljqwOst3Qvt/ZTj5pk0fa1CXjyS+RfOq4imnllUidxhH5JCKvdWwnn0TwM0Q/+TSkHonUobaPEKGnEfrJH/v1KY9E6i+OSq0XkPqjn/qjzXOr/SZ9v0mOYzrU+aZsXLPtnal5H2C83e+aN3DU80nkuR5VPomsj+anPkcjew+NRna/jEam09HI3pmjxmMw6nkcVR79OAN+nAH603reR5EHeR1VHtluPI4aj7DJI23lMTEamR5HI9PhqOdx1HiUUeWRtulw1PNIpA5HlUfzkz+Nn6Rf+dN5yduo529U+SOaDjXPAxZHu6G8Ee33wIbnrxHZ74CNyH4HbHjeGqZHtOv7PNEwHWo79daI7Dw3PG86nkfy1/C8NYy3oGH6wzjKG2zwso7tpr+G561h+pOG503bR4imv4bXH5H3cSOy89vwvGncPsb1edT7WP2GxlvD89YwnVl+inaP9Md2H/fHWv+C/pi8mZ/89cfGG/3UXX9sv5fST53Rps5oX0DqTMdZ6cdR2+4TzkOe+mPyRdvqX39sOiOy/vXHypcizyuR9zKRfGn7COOt3vXHpjMi7wuN22N+ntP+uM8j3zEWR944H/nScSYtH9Y7+skb86WuNE9gNbbfoauet2ps9a4a2/uvavwFVeWN7cob0N7V1djqH/3UXzW2+1jHXW5+nteq560am86qyhtt5U2RfFWVN9rGW1V5Y7zdG9XYdFaNrc5p+wjnM97Yj7rSuF30G3867h4bh3rjfORL59ln/c3mdzWR34XWzvtX850yP/nkOow/4/N8bOf0vPEXnve8nfe6o99sO6/0811Iv6HeH0I/dUi/IXi5zvrxHtF5FNPEgO0X/DzfOs9Kjof8V7Id+a+0OPJOm/XwvOf5PPlYR9vO83nqaMhs3te0Da0u0ib/543/kOPwfJ/3+tX5yvTrfti8uyyO+6Lr2mN+6lnz2GN88N7Wde2z/Lkvuq5J83M/lLcpW6eh/V6kvOH8l1pNv6VW9IeuaZN32oZ2b9M2RF7eJs+0yXupFeu7juMpv+qnruk3BE/L2W780k/e6Tckz0TwNsB28Dbgx11n/VlPdZwhjoO6N+T7D1s7+db4LebnO13zGDE/edf1lS1P8q35lNmu3+0JXe8uWz/vKfrJN/3knzZ5JpJn7TfleZqiTX5p/45f4jstcXf5Xhe9kqp31u8UeTs111E6JMHDUb1TXhF5IvqgPY/5/j6Sdnmav0unewuIP5w63lVC/Fup+ewM4h+JjnfVD4nsjhqZ5p+L/GMUZ/KI72up9jRzLky0NLobV7ron4GVz4p8Ayjo/3LL/BL3uAtrwNI+F/2gpW+J7HDR+7DncY6XBH1LShUJtgXVngb275Kg0V1a5aL1wBp4exftxT+U4BXYMytc+C9BoauC/agFcffM/RK8CSxuleBX8LtBF302jLtrm120Mmx0Nx8R2Qq78ogLNwCp52fCsWzauejdcH5Jc6kL34Jd2O2i/wxzHUXwcWey1CtXieSTY9n8XSI3JuPuxkMiw8lNmfxBF36Z9jUuejFZ7ywij58AeY6eRHvtSy6aSVbSNfCyIFXomrlcgp9jnPnPSfBT4mqRP0p90F4bd9HCFOKr/G6od1Yuc9Ffwo/9jRLYl+Ll+C5LjWVnbnLh26m42xVc9KuUtJeR/4JoU6b0ksgl0VxHrk/k4Sjuzt/sog74CxtFrsY+FqGPP4BdecFFUxHWe7sEP4oq6TL4mEB7A3m+h30vfgXrjOPuZr+LLophPymyPq535nEPvxhX0kXUj0PxXIeDjn4bF7rmr3Th64gXxNcZdwf0grjcdhf+HHHll1y0vLXemUb+a1srafcFF36mFflC9y+0znVIXoJ6a65DbpDgKfjza1w0gbj0EHX7Qfv83S56Aij3u/A1tNcepk4kW4EeD6aOZAT78U+pZjoNPT4UHcmUsF+PRzOLK9Dva9G5Rc1xF/a0VLoKORd1tnyQLfdhf4E1nPuXgLm7JHi6Za6nuctFx4CC+B+35HpqO/Bugd14SuTSINdTwHnaEVS66jeJXB98kJVbXfhFoIMOvov2fF5kEnZuhYs+DJZ3lj8vcjSQbO0+ke8A8w+KBOHyztydLlwfSrbwAO71EOPg3G+EPb/dRQ8Am+C7GpY76o6/r831FJa66Huwm7td+KOwN11+VYLbkpu6c5+RYGmy3FFcL8E1SfTHuVidLLZXquAFdvlaFx5OHsnkkceHwMajLnoe7YWnXPjt5EQbznWUTS3vrF0m8r8Yp4H30b8DqYu7UjOLC9BrV6rY7l4WuRs857B/r8PfRL35Jew69HkyVe7I3eSiUynJ5la58P9S5xYVd4tIhH6oO91RM124SoI9kWQbN/N7othe+gLOM/al/KwEq2DnX3ThwajcwXNwKppoqzwqwSG2I88T2MfycxLcGkvW3eDCdAx7N9YZH8kUl0rwbDzRVn5AgkrcTNdeluAX8fLOIurNe4iv9WP9iKusddFRxLlRF/0GcWl8zyxtPZIpI/8bWyfamhtdlGtFvo9J8PXWZrq5DHWstTfdvB56h7+xxoX7ETe/HvvfCl3d48KtwNJ9LnoH7YVRF77fci5Tgx6r/C6HHt/BdzX1uA3vdOpxF969psf5BQ3V40RnEfWxs2Wmo9TnIv7dD3qUA0DoUZ5uaXbN4949RsT5/3FLb1cF9fEUbOgxuJR/T0GdfyyY6IQeg+uDmY551MdN/PvQQxL8K9qhx2ASdh718QdBPgM9Bn8dIM/7WD/PZaDHIAjzmfSdqKsh7AdcdAN/38a53Mjft1EfNwOhx6AabkvXUB/rYbOriPr4PdgN1MePwnQb9CgDyWIWepQrk9vS0KNcmzyXgR5ldXLt4loV+wu7dK2Lvp6stUOPwYfA+Udd+Dza80+56NtJtygNvXWm8hnoMfgfjAM9Bv8BhB7lLnz351WvuCexz3eDZ9ST6HX4G+Dnl/xd4zIXnkxtS+dRH0+lzmXS4OPXqfkF0GOQwHcG61Uvv8dQx/fg+2oG9bEVfuhRLsW+QI+yCnbuRewjvrOgR/0ugR7lENpLyPNt7CP0KLfG5zLlG1yUwTsJepQ1eMdAj/IVvIegR/ka3jPQo/wC7+wS6uN7iK+gPh5GXG2tC48irgLd/MbeodFS3NMO+d+I+39+owsv4XvgMZFXcW9Dj8GbuLehx+BFvgNQH7/GOJz7HXy33OOircDyfS58B+056Hwp9JjDeSGWVhCpK+JEZ2kD6gYQeoWNfdsqshT6Km0nNrtqO3GuYNf6XOJZxHF+Isd7lnpdIUKsrWL7TEfzdkPWUfXf6/0l328rsZjF+MAj3TnHcTDPc8RyT+6gBB/TRl3+mPmtIHJ8kY+Z/wazOZ62byciv+cMm/tRn4JyT+lSIschchyijhPcDb03bzcEDwkixyWSB8ZzvDeCI92lS13iDT/OGzhHzWUufINxq9iez/B8EtE/of57aYOX7USMs5MIXp1LXBRyPJGLcM4wvyL3gcj+F4XW/6Kw1k4e9oY2316cL8bv5fkr0Y+8t5rN9RM5z16cP/JIJA9ncT4531kbJ3E21H0D1tq5/rM6ngvP+nHOIo/aTtqY3zFu7WKOswbnmftPZD5rktjfG2gj7xUSrMG5xP7Dr+OK+jfQnyefiNO84Yd+n2AcztkzLnEU43Dco2xHnT2q/WlvS5NX2szrKPoxr6PJNPujHbp2tN0ijKOI/RIi89X2gyJtqB9cfxvqQA7vCSJ1QKSeiORB/RuImB98tKXA407aWP8TtI8vZL5E8rsDcRg3IFIXROa/g/VqFdvPtHE8IveTyH3bkUKe2KfT2t8lTrO9j8j+Ljzt8zydMl5Pp0xnpzVPtqfbqNPTzKvEfljnVo6n4yJufkHzCUPme9rnq/H7bT7yckuk+QM5vwS0ea5vifJaJ26JrE4QuR7G8ZzcgvrH9RA5L7G0nX6dF3bfAu4L7dIzNm7uoEscRv2k/g5HrEMSHI7Sbdzfw6y3G2hj30pE5LuTflsHkTo8zPnxrm6JrY4RyUtLzH0RaYl1feGDsY1PJH8PxnmNezBWXaFd55MHY5uPyHNKhL4Saj9D287PSfbH/hDJx0nrH5yMdf2K1CX9XP9J9GP/k6z34H0Z6jh1tox1GPwtazX+iDwP9JO/ZaznWO9+1HfoIiRyX/bDz/XsRz1n3kSep/3WD3HQC+pERwvvH5GFqJtF3BOPsy6vxb3DOor3407Uo/KtuDdRj3K4v65CPUuPibzE/7tAv+dRt+q34buAf4fGvTfF/wdAnv9lf5+X/0b9yT/O+xvvjktE7sD5rGP/7uPfGf9E5G9hV3CujuO81taIvMu/1+0V4X2duxa6oH5vFPl94i0in+Ac1/9MZAn0Wdkn8tMk7quvivTw7wsv4HsMcfV+kS/yfGD8j3AO8sj/FHScroispQ5Hqbf5BfmnRe7lff4C31XYZ9znj1BneJfvBTaQ1z+gvbGB6BblsZ7H+Hsm3l+/RXwD791MjHcY8u2GnorI53rqAPk8HiOPq0U+x99FHgZf3Hd8165l+7jIPv7ugbhj/J0DfBynDvD9/zrvddz3i7H/RZyzjdinMt5DfcAC6sQx7G8Oeb5GHQyCb36vgw+R/wfKgx/aCCsAAA==```"""
-
         self.generator.setXYZ(20, 20, 30)
         self.generator.setOctaves(1, 0.5, 0.25)
         self.generator.setScales(1, 2, 4)
@@ -300,20 +338,13 @@ class TestGenerator(unittest.TestCase):
                 "heightBasedMultiplier": 1,
                 "heightBasedOffset": -5}
         ]
-        self.generator.pregenerate(groundAssets, placeObjects)
-        output = self.generator.generate()[0]["output"]
-        self.assertEqual(expected, output, msg="Output strings are different!")
+        output = self.generateSeeded(groundAssets, placeObjects)
+        self.assertBlock(output[0])
+        self.assertEqual(
+            output, self.generateSeeded(groundAssets, placeObjects)
+        )
 
     def test_fullManyPieces(self):
-        expected =   [
-            {"x": 0, "y": 0, "output": "```H4sIAAAAAAAC/z1af3TcVZW/k/ed+c6UNpkkkzStPzrLL7tbtgYIS/hhO4VSWhohKT02sgTHUkqNAYZSSwBbHzYtSa1kjCVMkVOmmsXK2R8jq9hdujrurlq7Hnf2rIt1N+uOnIMbV8TZA2rU6O7nc+8X/vqce9999733uffdd7+TfPc33/2XJglF5MU78/987+3hur/+ydOLb/vWtl1DTuS6Zedapz768PVjb3t275I7ivtTsLvhqvG17p7NN514caCt/R/+5t8PQhcs3LK554YLN41975lrjl//yUepm/3ws69858ql13/pmydOHbl86ifUPVa6qPT3t35v3Z/d8sHcC3/eyH4TusdXnPzw00/dcOOxlkuef+T5pxfWQvdGbDDIrSBW23IrfPBGbL7VsJsYeyO2K21yucXk+VZ/kY0b7kr7i8Rx3PBcM/QxjldXUd6Vrq6iXG4xPNdsmI6wu1Uus3XkMvMDOaCdIfbRy/1hH4rYhyL2sSbax5poH2tsHcP51ur6aB/rzT9QzyebbZ5s5no490B07gHjwW+L/G+jfry9OmR6Q/gdor/xdtlhetlBuT+TG6Y83p4b5ryuDl8g9md8get0dVT3mgyMUZZ9Ns+wqyN3gOP1Dj9h9kD4O9lZnTR9dZL63i6ZJhaWAnWc8mBTvYNxGmzqIsYGm7AflbGfFRy3+FLPOFEPFOoZx8EmiytlxE0oIz6QLY7UMx7UG1rcKOd6TQaq7NfQnvwbkme13xzZD5hsaDxTNiS/ti/wauvtoGy86jmGo3MUTA+eYzx3dS/9kV/q6+CXMnmmrPyqnZ8wfsgv7cirzp+M5k9ST165DvxMG6/k+zT05PO08k1UvgMi+Txt/ALJL/XIn1W0I68+dtp4VCRfp40/RebxaeWN2P0Wgj85rXzRTnlSe+Sh2Q3ZPOah+h2mPfwOc13yRL3yFHDcZOVL90veTitPHGc+Ruc6YDJ543xD5c2pvwlbD6h25E3PO2l68qn7nDR+mKfqf9rmG4KPaR/LOuVVss54zTrLYyJ5zDrySrS8JTI/s87ylci8JDIfs87yksh6kHXdbyF5zTrWA65jeUmZdYEy6wBl8q3ztkXzhqhXntXO0PJR1xumnfFMvaHlJfdPvnXfkcy8pEy+ieRb/R2gH/g7QL3yq7Jhd4Sod5GevOv+Jm3f5Fv5mOZ87Hfa5jGPx4xfGVN+DcnnmLO8JZLPMeM3RkRdhmz8jjm7/2PKL/XdbyH5HXNWh8ec1duxiNcx5TOy2yZO7bbRTvNXkfd8LOJR/Q5znuUr9bzvuq+9pmcdpd5k8mh68qr7VBl+93E941P9Hoj2EyHzd8zh3ZigP7xfE6Ynj9STV+pNfpNHnGua9nivpm2c8lyUv3NR/s5F/M5F/M5F/M5F/M4pvz6YU345T/mNzUX8zim/HCe/lMkv7YzfOe5vPe2V5xhl1os549vNWf4GOm+byczjOctfW2eYaHzPKc/RegUbZ77qvL2m53ul6+2jH6y3L1rvgK1veK6ZfM8Zn5DTzawbc27jEpPJJ+elI9y4hHVjzngMqCeffYG9a32B8UlkHegLjE8ieewLtM4KkfnaF1i+9gWWr0Ty2RcYn30B+wlD1t2+QPsGRfLaF2B/603m+6X2A0Scb4DrWV3Q+dtoZ3WYyDzWdYYNmbdqV+B845GyIdaLkPnKdckvEfxhXjrCjUuYr0Ty1xf4xXy/KDMvKZM/2pM/6omVwO55JWA/IK5i/MUqEX+VwOppRXnkuPFYCbSuuorxCHvySNne/UrEYyWwvqwSWF9WiXisYP+sAxXl0fTkkbKh1tegYnwGFeWTdlYXKoHlqa63w8aZpzovQvKq6xXMD+uBrreX+jTR1tvH8XSE4GUfx43PCnh7E8lrJTh1nqHxSZn86rxpzvOLiZm49lexTJz9FZH9FfX27lNmn5WJa1+ldsxT6skr9Xy/MnHrrygzbymT30yc/bAheMW48Uskv5k4+aWs/Oo47z9l3n+dNxDNG6C95amuN0Q98k/R+NX1dkR+dtg464HOH6aMfByO1i/YuqwPmXiaGBDJfyaOfNxLe+UZCL4iZF3IxE+dx3wmkmci+wS1myaeOo84anwC7XtkNG7fI6Nx+x4ZVV5FqCff1BuST7Mjr6NxfncQ7fuCMuvBqPEJGefqpR/lU2XyqXabTc98VfsB80MeKTNPdZ0hItYZMnvyOhrxqPMjJJ+j4In5O6q80R73OULyNgoe3kTm6yj5iJD8jcYbi5ivo8of5zUW8b0aVR45bvk5GvE4a3zFZrl/5Ocs96GyfrcJ9cxP6snfbMQXZebnrPJldrzvar/Gxnm/1X499cbbrPGm48zHWePN1h2gnCaan202zxB8bIvWHTKZvKqfHTaPdXWWeaVIHmmPe6yI/Bq2ceYjZfI6S54KnK+8qsw8nQVvhsYvZdbd2YjfWeNVx8mr2k9yPvnlOPn1QS5hfBLJXy6Bc4BXyuQvl9B803HmXy5h95l6Q+uXKPNeE8mjzo+QPNIveSWSv1wC5x4wPesmZfKXS+Dc28yOeUg9+aSe+UmZ+UiZPBLJWy6B/BqmnnxRxvkjZD7mEiuVL8rkibKh8UWZ773OmzC/vNf0R/7Uz2S0/rSNMz9nlD+RGZ4LPM5E/M1E/FHmfZ5RHs3e0HicSVheziSs/5wxPoMZ5ZN+lE/zt556q48zxicQ+4mQeTpDPgZoRx7pD3wokj/qcZ4hk8kf5TeR91vtCxwnf5RXvoV852ci3mYS+RTfoRnjTWaMN6f2E7YPvjszxl8wE/Gn+56O9j0d7QOYDI3HZJh+C3mvqSePlA21DmLc7jXHWQ+ToX2/c9xQ+01HmXzS/k0kn+p3feR3Pe3JJ2XySRn72kw78kkEPwMcNz6J5JHIfNTxYSLyaZh2ln/J0Pgjkr9kmE/xHhP5rlDP/KPM+qjzJkxvaHmo602af/Kp5542npiHuu9psyeOKJ8+IDIfRyI+R0KrjyPGK2R9r2FnvI6E9r6MRHyORDyORDyOhJaX6mc9x43HEeWRdrivqre8HFEeOa48Ytx4HIl4HIl4HFEeTc/3ZcR4VCR/I8oj/ZFHQ9a9EeNRZd7fkYg/tZ+wdcnXiPEnI8ZfbMR4E93ntNmRt5rxFquF+q4EtYi/Wqi/Awa10H4HrEW81ZQ3ovXntbD7LSRftdC+d2pR/qm/NZyvvAE1/6Anb5yn+QfZ8q9GXjZzPnkzmbzVlLdofIch62BNeTPkPSay7tUi3mrGm+qZbzXLP/VHvmrGn9Qs79Qv+atFfNWiPNP94d72JO3e9iSt/vUk7XdU6g2tj6GevPUku7VPpJ68UWaeUSZvRPKjftZw3PgiMr+4DvnqSSpfjkh+epKWZ0TmV0/S8ozI95nI+kfkfdXxYa5n70VP0vKMyHuqdvu4Lt8Ljq+MUPsYtWPd43rkS/0o2vcM9Yb2PaP7BF+lpPYxrpS0+1lKWr0rJa3/KyWtnykl7XfnUsRbKeKtFPFGPd+RUsSb+o2Q+VZKWj9YingrJdMRWp6VIt5KxluslLT7WYp4KylvtLP7WTLeVGad0/GCzWN+qd1ezrN8U7/7zI+hfa/oOgfM3jCt39ccZ/6VIj51v5PRficpa73TcxAXjL/YQpR3C5Z3spC03++pN1nrnerJI/WGxh/15JV69jkL5AX8LkR86jq9lNPNJuMcvTaP/Oo6a2we6+IC9x/J5Jky7/lCxPNC0u7zgvJMRB4N0L/lKWX2PwvKu40zbxeivKUf8q/zh6lnn2h+mb+67l7TMw56rn2mN7TvGT3XgehcB2y/hvZ7h55rIuJtMuJt0nhhHitvyOt8SvkHYj7ymDL5p0z+KZNvyoxDPoV9rTJ78k3ZEOdDPNRPr9kZ4pyK4KnX7Mkz9awP1Bsaz9Qzz6k3JN/U4x5vjvwM0B51b8Bk8q32Q5H9DtOTb93HMO3tXdLzFWz//D1E96OyfbfrefdG51WZ3++mJ++UWTeIfKd03qTxyDzPp5Rf9UeedR7y/algrs2XfLg8Xmnv3yDuzsRga+4Jcb9OJDura0XWhmdaqntExpOjGblE5N7kXFsa9ueliunGB8XtSZ3R77sngkYmD/3S+KmOMvzkE/n2MvwsJNJdBfhZF9ZaC/BzOOk7K4jXh5KNTP1JH6ZSpbbcdnEPpjAOP0uasG63yMVN+a78nT6Yaqp1+mtEvgAs3Cnyo6bS0vRlPnynq3XW8iKrXGNZ8VEffNRBf624fS7Z2f2n4iYgV+7zwQ8hp3M+fBlyeY8P3h7kOuSwDzYGlfZyUdzzkPuv80EhGM3kPkYZ9neI+yntPoI+KD7YWgN/2+O1zsrlPuyN5zryt4rriCc7GcevQV+7WOQY+GvAzxSwusmHH4WdfEDcTYnRTHaDD16Jj2aKW8SlE5X2Inh7LDHXlsf+358optP4jlgUzrUVwct/wr64SdwPEtk22ebDryEehbvEXRsiPheIXBnmOqqoK0Nhkry4fmDheh/8K8YrF/jg2yHWu9EHJ8Jiuj7og98Dy8izK5KQgf+GeOYew/dHEue+1IcfT2L+NT4cwHhthPHNtpWP+uCbiHdjjQ8/C70gbqcQd39E5PdAeUKkmppry60G36lsW/ZPRL4I9Ff74HBqsLV6o7inU5X2/EEf3AUsfELcE8Dyp3z4XGo0Uz4mkkWcs5eLtADrV4nc0tRYJo+KfIzxRfx3Iv7VDyMfGL/3isQY19tFtgKL70d/5VYu8/tFbmec4e+Ey3UU+0Ve4Tju2TuDlcv6/1hkBeJYx/18nflyv8jSAPggZayL+/Mw479FZH+QbcsV8R7wPjwp8nPkQQV59zvkRfYW+EFcZYPII4hrDvY9iFMV8kZgpQ9+Ea/6AyK9iFejJPJZxFlwjk8hzt23inwOen+vyIHEmZb6qMgixMtfKvKbBPLkPSIv4r7lUddfod+NHB9slQ+JfDchLdWHReqYX8f+fgl//imshziXYTeA+DbQb2xkXB8XuRbzcp9mP4V8eJfI46G09KMu7MM44iCdSeTRH4hcxHijThWAHnw+A8zdIfIN5EV1pciZ5GBrFvv+OvTdGP8lsIH79xfAyj3UYxz8fwH+Cp8RCRHXOupyM/KgDH43Mf5Yt4L6kEPcHkFe5O4TKQf1dBl14u3xk63g092V6G9pHBX3q4RksjmR94TVJVncu0PJQlse9WZPsp7uhv2S1HhzGfdmd6q6BPdTXJNk6peKyzQNdla3+3C86UymiPtfJuJevt5U7Kjgvc24MxnWqWVubmnD+/CQK3Y0roZ/J5n0bSIPQk7f58MG5EoO/Shk2ePDRUFve37Ch1uCk61+kvvuba+s8+HDQaGN5z4dSKaBc/0Iet7f3wc4B+rJnviZTK7HB9fFe9uZJyvi2Od2kS9D33gX7j3OjXoTzgDzN/ngIOzqQ8ybQlvxBh/+PF5oKyAuyxMnWwuoD/sS9bT/IOvyeHMD91DCerpyibj/hn0B8f9poitdxvv+bfDYj7y/LMS8C8VdEsLv5eLuDiVTwHnXAGtY9+sYT1/gw6+EhTa/wYeT4XhzbtCHrwJl2IcXJMf5O1z4X4zDIZEtyd72xqU+OJoEX9f64EaMN+4Rd3uyKy1HfXgOcSquZX813oy4ub9EvMqfFPcGMIv35WwKiHv4QKornbtS3DPAxlU+PJrqb8E7IYdTJ1urYz68D9h/WOTzwNyUD8qpQlv1KXFLEedcj7gEUFDvbmiaW5r9uLiPIL5ZxP92xL8+Is4hft03i5uHXT/e282M523itrvs0jLq+hbEtQZ/TzrEEf3Rf3AcdTUTZJcWUMc6EEd5r7ifMF92i2sOgKOUsS7mFzBeQN3fE3Sl858S97jmsbhXkAc15N3ryItcP9+Fk61Z1L/7EVe+E3+EONUhrwHW4H8J4oV3xa1GvNLYTwlx5jkeQ5z7t4o7Bn35PnEPJapL5GFxgniV0b/8PNHbnkVf+EXcE38D9k+/mzje35JF3/aPifnF9UfEvYT5MiXuVfgrfwbrIc5V2N2I+KbB0xrENY/+9zLMy+PefQP+cd/dWDi/uDAm7gGMF4+IW5xEHp0v7m2MN96tncAy+HwCmMe79iLyovaH4r6a7G/JYd9fgb4f468C0+D1c8DavdRjHPw9A3/Fp8X9DvkiuAcB8qAKftci3h7rPot7nUfc7kde5NH/lPn3Ctz7d/B3U9SJnYmNS1gnfpmYb2WduBbfj6wTB/GdYnUC/Q/sW9A3sU7cj76KdSJomm9FnZBMU3+mtt0HE03VNtQJOUHEfXm9aby9jH6iw1XbUCdkmat3CPqJg268HXXCHXLzragT7kHIWfQTDchl9BM1yGn0E4uC7tYCvi8G+PeWSe67u7W6zgcPBbvSqBPuxWC+FXXCvQw96oT8X4BzoI7v4e/4PT5cx9/vwe8749gn+qAXoEedkMdw7jz6iRlg/00+PAg71AnXm9iVRp0IXovvSqNOuGWJcgvqhNvP31mx/+0Jvxh1wsXCc82oE/Jj2KNOuJ8m0s1F9BNnwCPqhLs8xLwLRVaH8It3eGc434o6gfzAPrDu1zGeRT/xlRDroX+ZxHd5P/qJV4Fp9BEXoN/vB/6QcTiE+4XvyDr6iaPJ+Va51ocbMY46Ibejv0+jnzjH79C1PjwGPeP2V4gX6oT8Aog6Id9GX4o6gX4Sff+VeI+AqBPBp9Hvsp88jP61NuaDe4GoE+7zwO4pH55I4XsW72EX/6+jB+WR/++Bd3tDU70DdUL2Ir64XzKE+KNOSID4oU7Ir2GHOiF9kFEn5E7X1YE6IbcirqgTUnLdrRX+Ps/xu0Q6gq4O1Anp5N/d0I/8D/NlN967ADhKGeti/v3MB7ybHwnSzagTMok8Rp2QHyMPUCfkDf6dDn1KJ+KKOiG7EVfUCVmFOKFOyFog6oQ08/dM8PRuxAt1Qo4hzjzHOOKMOiFPQY86IQ/zd1b0BzHEC3VC/jfR3Yo6Ic/jnqBOyCz9buL4xiWoE/KNRGMR6oR8n7+TTon8DP5QJ6SZv0NtYh+B+I6w7z91HuqEXI55qBPyLf4+hb7gYNhYhDohezCOOiFL8N2GOiFvZ7zx3t0NRJ2QaSDqhJxGXqBOyNf4HbiVfSTyBuM/A6JOyAwQdQJ6jIO/MvyhTqDP3JVGnZA4v1/Abw7xRp3A+4B9IW67kReoE/hOqLaVV/rYxbznq31AzF4hTvXrqK+i/lI/3p7fSnvc99uIyIe8YfZujtc78oeIJzvLR6gvLK1Pcb4sy6K/PIx59H/Y/CrSLxF+nepvox30eeqRTw9QPtmZ9ZTVf4xI/6/Bf/58Ivaxmki/hnwvXuM5bvYxIuuu6vM2nr2baP5fY557vNOO/nxsi1N/eO9w3mt8sAV5SX9E+lM5T/t6R/0hyl2YTwQv2NcL0IPP4AXkP/PxBbX3MSJ5egF5nz9EPcbBz/LgZCfXXR7YvOW4D1x3OfKdPC3HfcjivlHmvjmOfbvlqJdYTzF7zAf7A+Y/Efdhq4/tD/TcQj3Oh/qJe3yFD16GTL8vYzx/j49Rxjkg474dIuJeHPGxDfGuDvK7AXWS594Qt3NsiJ9r5rk3xP3iOt7J5+LgCXbPwY77fg73EnFwz0XzVL+V493kzXE8fw8xDT/U415h/824d/DjiOWVROxrNe+x7ZcIHlTPfGnGvYMfvefkoxl1m+dsxn0mL5SxP4yr/9hu3H/63U0/VyD/uR72S2Te7Nb6QTv43Uq7c3yvhch978Y6jN9u+C0/QIR8jP0CznM+Efa435SR57GXdB0fvKTrUD+v67xkdUrngR+Mg+/baI+68hBR9y/Uc//0y/1fHdo6RN6jq/HuwD/08/QPPexupox7vZXjWkcckfeJiP1jXNeBzHWIlj/HQ+VHjofKuzseWh04Hvk/bn5jx+GH8TvO+Q/Qnv4MeU9Vf4Sy7jtoQh1iXjcl6Y+o+R2jzPrShHrFe9KkdY8y90vZ/BN573X8COeTFx/bqX7ZV6nfGJE871R/PtiJd5P3ZmeS+yaaXyLvkaInIg+niMbzWfZDyOezfI/BM5F+z6o/ysbD2cjfWfVHveZFjOPkl8i6cJbvNPKRyPtyNkm+0b+mGE8frE4Z30Seg0i+OU5+VqNOM+9Xoy9jXImMK5Fx5TjXXZ2y+7SafYAnwv8hjludIII3XY/1eAp2XH8K8xiPKfghb1N4H5j3HOe9muK8hwzpr4v1H9+/N7GeIl9+wf9TxnfIr2P1jgbel2f4/5985/j/r9jPd4BFfNd+H3W4eDO/F+sduYtF+vne47vuFtTb/sfwvc3/C3ufyA/4f47o876MOpmd4O8PJztrK9D38f/I8B5fwjqId/hp1Lky+tij/P8r+Pkn6vGu/Yr94i6RV/l/QXgP38E61CfyAf4/B977C1FvGuMi3ahfBXzvn+D/K+D77m+Jm0WegF0Z/n4LuYL9XMO/E6NPOR/3snGYvzfh3T6Ic0Offx/7A7y/8PulqC94jX+3xrpzuLc19GUX4x6U4XcV7k0R+7ooXLmo+CjedfaJ2P8neC/Rdz6E+1MGf0fYZ3xa5De432n0K0nclyz291uM8/eddyPPutFX7EcelbOwR95394o8ArmxQX8fXOzBz9/x7w8Y/yp/J0Z+34q4F9Df9SBv+HvNVYh7EX3PHfy9E34v5u+bsPsy+wX0s0eRB7VBkfswXsQ9FPl/vyhsjWgwAAA=```"},
-            {"x": 0, "y": 1, "output": "```H4sIAAAAAAAC/z1af5BcVZU+3fd1v9fz883PTKJV9AKBWYHQwgSHIEkHAhlIxB6DZIgONBKSGAZtEo3Dr/giIwwEMu2IoYNstnVHNxstt9cfVJTItj9Ws9SutrsWldVxq4uq3R23VrZXqN1ozZb7fee87F9fnXPvPe++7zvn3Pt65ie//8nPkuKLyMv3Fn/6kQ/6G7/x6xc7dvx4+56XncgNK8/2zD/68I0zb/vygc67ygfbMO+ma2c3uAe23PqFl8d7+37w7V88Dp+3/N4tIzddfMvMz//0uuM3PnvoEHyL93/5X/7uXStu/OaPvnDqmavnf815T1ZWV76/7ecbv/Tee/IvfbWVPQPfkQtO3P/iCzdtPtZ9+dcf+fqLy6PwvZWY8PIXEM+szF8QeW8lhJh4KzE6ZP7SCvOXV0Wr6T+zMlotjvPMHh0yLK+qX2Zx6pfRFiDnjQ4ZnlkpV1l8uYrzRoeAjvHP2/lRs/OjXH9iEDb8zQHznxiM1nN9cyBaT/8QEf5CP/wJ2vVNHC/0A2HP9hkW+mWL2YaF/vx4vG67+aPtjIf5k/TXe4Gwz/XUJxnvXI/spD9HFGJ+r9lRiYh5BzgvB+R4vVceY1yse8z88hjnzfblH7f4hud68o/buNnYz1M2z7DeGz1lzzdsDtTn7L3rc/F7KmLfczGPR403w+aA4RDRm0iajhNJ8ApdJ5LgVdH04zh0FY5TX/qho66jnvQbml60qR/jmI3nXMX5phdt6jiRBN+jHKdORLyfIt5vPcepE+eDd0XVyaMtW2wd9NJ1hqYbkfro+kmbT/103U6Om25E6IV11I1+1U1t6jWR3BNSP9rUizb1m0hWu6mbrnuc9p6QetEPvYRxoYvFe8rWUTfdz1y8nzmbZ3aOmFCejtr+5Wj8vsDTqkeUOE3eoNNpvvcF9OO9odNp00U4j3pxntngY7WNUy+OGw7FCJ5imzrRpm6MS71Omz72nFHayM9RzgNviqYTbdbbab7veptHvehnndFvSN1sPvU7Heun8cfj+ONch/1vt+dTT93vZLzfSdrY504i9rnT1p1H1t/pWFfdV4lo9XiaOpS4jrrSX+2GvonTqifXn+2irqdjHWkbhl3UWdc/xXnVbsOzXdBV41M/jTtn78O60n0p4n2PGj/UN+uoW+RlHfZ7AW3sV23qZeNAHWe90c/6ot8Q/MY2daNtiOfESH2yLkfEeuSnouqToE29sg7vsZ7PUX08+qGbxdli64FO9ztuz6VeGn+cfupk+6NOuu/tHG9SrwTHzyP7I+ex7nTfMVIvjbs3jhsj9dL9luL9luL9HSCqbsCzXecRumFd2EUdidQt68Y6WZccZz3ST700zlwcZ45+xJkzHaiXvvdRey51mzF9EjPkEzrNkE9F6kM/9rua83Ixqj4e/Tz36D9vs65oGyL+VRynPrSRdzFSpxnVg4h9buI802XGdNF11Gcm1mdG9bHnmE1dOE91wTzqQdvqaMZ0cTOqC9dpPSVmTBeZiXWZMV30/dgn9T1LtKkLx7HfGFlPM6YLMOxinc2oLsSxTvbPGRd1GJo+tHnOzbhT7ayzGdXJxqkXx9k/Z2KdNO5c/P6qD+r3qD2XuBTrs0Q+0SeX4GefXIr14Th147ih6UM/7yP0n7epD23qpfFG43ijZlOnpbhudN0m+q1ulmJ9lmJdlqxudB9mmz5Lqg/jIJ+2c76dX0txvSxZvQjHzaYunG+6aLy9HMd777V9U48l00X3azZ4LXGd6bIEfqnTEvg9j6yfJehg2GqjTkuqC+O02qjPkuphfuqyZHo4jTfHdYg3Z/ywnpZUF3s+9dnqUQ9iqLps9ZAHiqqHx3HqwnGzTQ/6qQ/9ZqsuGs8Q8a/iOPWJ4623cfa5rZ7q5DTeJo6znui3euK42apXguPUaatnfY1+6rPVs/qhn/cKIuuH44a8X3Dc7oVE6sX41IfPp166z73x/kq0VR+PfBiC5xLHTZ+t3ql29rutXqsN+jkiz6ut3nCM1Mds1tVWr5ihXlxHnThuOByj6aRx5+K4czGPRzmOej1q86hjzXRyNdjUq6b6ELHf1eanbjXVx/w8p+inbjXTR/3UqRbrRL+h6VUzvYA8l+jXPujVVDf6VTcdp14108urxXrVPKunWqxXLdaJ9nlkHdVinWqxTnwO9auZTolarJPuc2+8zxipTy3WqWY6AcFziXGpE+dRJ8YZJno11YlYzLCual4lMFSdPNrUqxbrQz/rjH6zqQ/jDlMnjUO9aqZPgs+lXpxHuz+lOjki64hIHfpTyr/QZl/rTyn/6mdf60/ZvaA/RR3oD4mYb/e4/pTVEecZ6rnkOG5o9wT6eU+gn7rQT13oZz3RT33oZz3Rz/NJnzMZx9tJNF34POpFpD7cH/XQ/auN/cfIutH3LnEddSEi/2Nk/fSnVBfMA48HGKcSnEeeV/2phk+9aPM+QdswiNF0od8w8Hkv1Hhzcbw5G6dOfK7pgjw4Sj/yADitOkXedKzTtOpkyDqZVl3ieaP0W31Mx7pw3Gy7L0ybLsJ5Zmud6Dj14Tj73bTqQkS+jzMueB23+bx/02+IfNhu83ku6XMmzW+I58R+6jVtOqnf7PD/kXrp++yN30cR58tePtfqZ9p0go06KHH+sOo1rToxruk0TV5jpE7T4P88Up/pVD7NepqOdaFtSD04Hqgu06aDMK4h4kGnRdNFkf1tMa6fRasb+FUX0XmKoZ4zi6oH55kOi6qDjbNeFpV/rgc/W+gn7/Qjn8e5PiQmFpV32tB7O+0wRsTfbvNZLxp30p5rNvY5yXHjnX7Wje57J8eVf9v3XvrJP+fh/FB/S3lfjPlfBD+sm8W4ThaVf64j//STf/qN/0XwzPNoUfk3JO+LKSj+lM0j7/RTB/oNlXdP4xyljTjQIZ/mPSHy8mmeP0Tra7RZL7R57tDmuUOb5w5t9jna7HO6fpTrTCddv57jVif0UyfarBPaPF/0+eP0Y/24xaUO+tzt9nz2r3wafX+S89BfJuPn7iSiL+9kPNT/Ts43vmmT/3x6WHknkud82vjOp9FfSvQr37At34nkO58m34xDvjmufMOPTH+cNvk2ZB/SecrndIq4kLZ78UI6jJH3LnG0ea4vxPzSJp8Lxq+Ok9cF5dfGmf8Lyq/FZf4vGM9qk9cF41WfR351/RauV16B0DVG8roAnth3FsDTeSTPC+CJ+b6gfNI/rLwugLfzNvmlTX4XlE/6ySdty9+FmM8F5ZO28glb81eRPC7EfC7EfC4on5yvPMKueczXwOf3RuQFvvLqaDMvaZNXIvt64BuftNnfaZNHXTdKf6jfF7puvc1j39D5W+L5iuSPzzX+0OU6DJFf41xH/miTP9rDbWaTP65HPU9yvfFGJF+Bj/NuL23jK/BxvpU43/oubcOA6IjkD11X85DIPAx8441I3ois88DHDWyO68hblJgy3oD2XTDlaz66KePPm4r5o03+ppRHkSnjT6aMP1s/ynmWj7puvY2TR123yeKTT123hfGMxynjEePG45TxqEjeppRHrlMeE1O+5eGU8eimlEf6cY7spN94nAJfzMepmMcp8EVep2Iep5RHzkc/PMBx43EKfDEPp2Iep5RHjuPGFyN5nDIevYblnTSMP2n49h3ViPOuYXmnyHxrxHnW8O0caxhPapMvnb/JbEPLu4ZvdYu36TiPPL8ayhfjoK/FyLptxHw1wA/5a8R8NZhPkxw3vhrgg/w1jC/4A+WtEfMFb5r8NZQn2sinGMlXw3iCXfPIV0N5Mpv12vCtTkcC42kksHOFNvOLyLyinzwRmV8jgfa5BJF8EZlXIwH61HquIz9mM690/hYi+TE/+RgJLJ9GAuXHEcnPSGB1ORIYP0Tm1UhAfvhc5EmM5GckQL3t5Dryw3mot720yQ/HkScl+skP/cbPSID3j5HnMpF1SSQ/Ok/5MZ4qMU+VwOqwojwZsn9VlCdxFeMJaDxVYp4qgd5XExXlyZD8VIwXIM7FGMlHRXnhvGGiV1Fe6DdeKuCDfFWUF9rGS8V4wfwgRtTPTvqVF8xDXsRIfirGC2y89wHOV14SFeXFkPWl8+bMZp1p3KOcb+fncmC/Ly0H1reWA/6uJLIc80VkHi3HfBHJz3KcV0T2q+XA6m9Z84rzNa9kWfkym/fFZeWLtvX35ZivZeNLkXW2rHxxnvLllo0vxDO+lsET+VuO+Vo2vhSZR8vKF+eRL7NZZ8uB9aNl5YvrWW9ms964nvmk657iuPIo9JNHjTMXP1f5I58ixYzyCLR8K2b09zmPftYlbfJIm/lGZL5x/nkkj8WM9TMi+Stm7B5OZH2CFfKZIDLvihnNPyGSv2LG6rKYsfwjMt+KGeOzmCGfnGf5V8w0fMPg/5F1iVM0zfsekfVZzCifiuSTfuYdbeahrnvM5pNf+g3tO0bjPM5xOwfoJ6/0k2/dxxz3xXu1xeHvA9yn8Wv3an0OeK+7xqD8kUgmFQyWb4n8IH2io/QC6ipdDvMPiHvaL7S1nhX5rT+baT4b+asy0/31NZF/a2aiJ3+LyBWZZnvh8xFGS53VuyLvB+7sUC0r4qXCoSLitadrXVnEO5qu9JYR7xl/oqOKeL/xy+11xBvIRINVxHtPptjXGhMZzix15hDv2cx0dxPxLkwOr6ztEHkGWL098p5ONgbr6Pv/ALuxW+Svk5UV9fsjv+hOrSreG/n78D7Rscj7CrCJvPk3N91fu1HkOy4/wP3+2GV7m09E3luusiKLdfd40/25yyL/Q8DoSnEtL9sbro78X3tLvcX94jpT5bD5SOSXUhM95UtFbiBPmyPv7lRlRXi7yDtS2d4c5t2XwvsfibzfwC5cH3n1VH6guTvyHkst9UZ4763pM93hxyOvA/zWoN/taTznGnFRutZX3Bz5H02XOmsPRf71/nS/4Dk7/Fpfdm3k3UdcH/n3+djHnSJjfqmzhPy4HLqEz0TeJziOfP8SMLxBXNnH+90u7hjGq7ORd0Ww1FveILIBWES/WBvMZkLcu6aCZnvrfpFDsFtHxKUytb7aRZH3u2Covbk38heA5ecjfznI8u960KfQVkIdr8wMtdcPi/ss8iALfr8BLF8jcjyz1JtDP/9KphxWt4n7PvKidAh5lDqbySH/DvqRL8fEvR26yXtEboOOhU+I/D4ZDNaeE9kDveroe+MuGMxDr02u1ldGnhxxS71V5P+1XjBYvETkd9Ct8T6s9yZ6WodF1kIn+ZzInRivPiDytFfri/aLrEqd6c5/RuSd0K2OdddQp6tFPpzCfvPUsbIiRz6hZ+E+kUcwv/V5rMf84jtEDsPfxDn9o5R0Nx4SaU9P9BRGRP4V6/PQfU16qbexR+Qq6Fp8UCSbHu0q430+iXn5okgpLd3RPpG/x7zqlSKvQufWbcg/+Kvoq/+dLrTVn8f+oFvuBpG7icj/9dCthvcZQkVFx0S+iHzIXyjyMLCE+8hPMa90M+L5eD761ROYJ9h3J/VFn8sCw5tE/hfjBfD8K+RLE32ohzoj7iCwhLg7A+QNzqcXoW91s8g9wURPdpvI1mC0K3u3yEn4m9eB7+BERxnveQvqvblVpA36Mu8zyIcWeH478kHKIj/MZHtrt4p8FfPqBZG/hD9Ef3sKWJ0WecWd6S+iz3SnpL+GvpBOV9sa6AsvpGe7mlPiZv2xoHBE5H+YJ0ciP5sp9bbQF8Yyhe4q6vbqzNlMCX3hU5k97WX0haFkdkXjA+IeAcrtkf9c8kx/9aMiZ2C39oj7WbI8UJyKvH2uNsTzrIjnNyuRfwyYR33/ypV6G8jXmhvtK9wq7ltuKMw/gX155QH0E2+/h3GcM/cDi2tEkqmhsIp8f9NrhnnoekFqtqv8aOTtShW6a8Picniv1s2R//5UeSD3ftynMD/EvG2pPe18n1/Crr078r+WGu3L7478J1PNsDglsi5d7yx9LPIHwUf5UyJ3pYfCFvJsPn2iR8YiL0rvaS88HHlX+6XeLJ4z5p/oiUYi/xPAOu4HO/zZLgEP23zMexR5Dx5LhyP/EMblXdAB2EK+v+APhXXo+yTGZTbyLwqaYS0vbg2wcWvkXxZEfq4s7kPB2UyIfnUYdgP192Zwoie8CH08E2Yi8PJSEGZylcjrygyF2Q2Rtz0D3WZFLsJ49Wn0E+hWvjjy/wJYe5e4E5lmGKKev5WZ7YpQt6egI97T9UKn7G3iNkG30jT6blL6G58Tdxd1ulbcZif9RehznTvRUzvCv+s1w/pBcVd60h9dKu4/XXmghT6zySt0h8+Kuwy6ZI+KK2C8/hH0Ve9ET/Vj4npS9c7ivLhLoVMT6y6HDvkRcXensL+N4kahV2GHuPXQr7RL3IOYH/4J1mN+hPvFIfgFzzmdOtfRelhcIl3oLq3l71jIC+h8cboZtj4sbhg6ot7dYDrXUcP7fBzziveI25U+11HF+fADzKvnxNWpa0Hcd+Gv3y/uP9JjQbOC/UGnwo3i3k+8RdzV0KmB9+lCPVRfEPc89C9eJK4ELF8u7m8wr7wZ8fxmiLp0j2Je9kVxDnpGG7APYO5mcW9ivASe/xH5IXg/H7qGz4vrAJYRdwf0zV0ibj5AfoyJ2x4UutHf3A1BrgN9zFXhl+vBd1Btq+E9N6AeBfEEejLP/xCMBeHHoSf0z35G3HeQF+hL7ouYh/7pvgR/7kFxnwTWH8J7u3qv9YFzPXX0gVQaN3b0gc+now72gSfxPWd9YDqV1T6wJ5QrI38z7m3WB/CFqX0A9zD0gZXJoQH0AXkEGOJ+8NlkvRd9wP0tbPQB+Vlytq8wxXvBicHWvbwn1HtbyN9jwALq+Z/dnhB9QP7K5XrQB+RbLuwq4H6Q9mb7argf7Pf0vunvBaIPuGQq7EIf8H/LvwNB7wtSUUfp0cjfnRrrRB+QHP/+gfvBHanZPvAjV2M++oDblsJNFPeDX/L32XdH3tdSeB7uB0+kznahD7h1/H3rY5E3AD5YH5PpsAt9wM2nq90t3A+idDGTezjyR/w9IfoA7gHV7vIIz/9qdw3n8wf5/Q0exvE9jT7gVvH7+DD6B8bRB9zXgOgDuBfg+duM5xD3g4vxHYI+IGuA6APe5biXow/Ivfg+CHmewkYfcG/i+yWL+0E77o0l8PIS7u1Z9NMu3K/DDZF/B+6Z6APuQoyjD7hD0K16ceSdBKIPyJ/jXo4+4L6J+zb6gPs2dGS/m+PfUcDLs9C7hDrog27oC3ITdERfkP9KnutBX5C7oRf6goy5cz3oC3Kdw3sjTz7N/wM4CN69cz3oC9Jys33oC3KTN9aJviCXQyf0BRnHOPqCHPKq3egL0pM61Y6+IMPQDX1BruDv7Oi7xRT2uxH3DeiHviAboCf6guzDfPQFOcTf23EOf4o64znfTbXa0BckmR7rRF+QX2E9+oKsTp/tQl+QP6auOAdWpIfb0BfkAOahL8judKsNfUF+yN9DcyLfg87oC/IKf9fEvew36XwafUGGoRv6gtxBRP6vhW7oC9INvtAX5BjyAX1BHgSiL8iPmBc4z7/nn+3ief0Y6+hF3Mf5vY574Aog+oK8hXH0Bfk5f6fC+wXQGX0B94jpFPqCfAB6oy/IZ/ldj3vJBL9Lce7fyO9L3G++wO/W68E3vifRFySP+kRfkAT0Zd4L8gF9QfqQD+gL8jLyhPeVP8M83qu+DD/6gkT8TsH96pLkxNuqON+IzTVR4hLNg8gjFm8nFvqbRWK9N7ubiDx4gOuQF7q+0F98wuZXn+F3gqxkPCLiwZ7tw7rE05hf5HcN+8QzIm8kSys47w2MVzdGHpHPfSPZHKjuMGwWOW+2j+veSILvJ4i5HqwHFvqz+N54nwOujRLvY3+7jva5HsRLEJvo0/QzrzmveDuR8Ymo/yeIGMe97CWuvxDnLPoR173khnQfLznuwzC7m37E30/cE+L9gcjziBgyntrk4SXUSXOedq6H8Vd5uZ7ihegPQO53FfpadaP58TzF6v7IW4X6yUZR4iDqBfPlIOZRF2J2LW34rxN3UNfjfm/rYfM9OQ987OY80+mgd6od+1Pk+76OuqwORwki4xIZ93WNS9vivo44fP/XPdXP03X7icNtFgf7xHfFzahL7pOIuB6xuYb+sIvveXNK3xO27g/j0HsH/bN90Bf+cz3cL+ezLm9GvTcf4ji++PGckxpXHJHfZScxj+9/MmW8ncR67pMInRL0M95JnA+MdzJVCcAnxhs+8452cz5KdKUZD+c8+gDftysNnjfThm5FIp7zAOcNtzHPu9KBT32JjLMP43xfIve1D+t4r1I/3m8fzlWu34fzg3myj31lnoi6RN6+hucyX1/DPrj/19CvmGdE8v0a+hHXv5bW/QP5fPrzaeY/kXHWsQ+B/3XoP6w3IvUkkici80zHNxsyT9bhPGJ9r/NbbeRtnT/cRt6IzJt1vr3vcZ/5R9T88I5rnChxHH2M73s8Xn8c/Yz7Pe5XAtYHkToeRxzWx3Ff9y3H0RfBv5cMmN+G5DGJPof6dMngVDvqE1jMkIckzjvEAeJ9wQOReZFEv2Q8InndpfEMmS9E7ntXoPkN1LwRIvsDkXoT2R92ob+S/13oq+RhF57D5+7S59KeTpH/XfFz1X8sSrxqz5VXsX/y+mqA82UHbY3jXsX+ycuruo7IPCBaHqzJUL8oQWQ9rsmc1fxew34NvYjkeU2GcTmOfCrS3/DJz5qMxSey76gf/WY+g34CHuYz1jfmM1bf8xov8uYtHpBxOG5x5nF+sG5o8/05zjwgMu/mM1o/8EMf1P+l/L9anO9XoP+XDovspY1zeTl5YrCE8/Ec/w/4OdwH0E+L7yTiHngt+26V3w9yiv4Jka/z/9fwPVOGn/eg36Jv1nBffRP9Nofv6Y0e5t2J73ZgHt/V69CnGjinF9C3autwbrK/fRr3FQ91B31+jP7XwPn5B9hl1O8rXquNv2v8gv+fg/vHJPpJDvsb5P/H3MTvRdw/cT/5JfyNrMhz7B84J59F32hhX9fxnnGNSAfvFzi3jwFL2F/Ev7viXngnsACeD6MP8D7Lv09Xi/yeRB7gnnQb6rWE87gT9dPAfeAI6xL3i39CHdWg8xv8+wu+29ci/yPkz33Ik9InUS/MY/DWQH411ot8P8D73SHy78wnjI/znncF7im8p9/G3wUCv4X33wasgcdPIw8a+I5+nP6P8nsQOuJ9XuHvlbjHifwfZJMy5fgyAAA=```"},
-            {"x": 1, "y": 0, "output": "```H4sIAAAAAAAC/z1ba3Rc1XXemnNn7h0e0kgeyXr4MTzrYOJMiCACspRxkHlEBiSbIJVgGMABIQRMDJgxxM41UojNox6UBAbCcoZUoV6srnaSdIHTqK0aQiryvGkTqhR1rYlbWqVJHCWhrZNqrfT79r7m17f2Ofvsc873nb3PuSP7+7///g8T4ovI128r/uCeG/3NX/3Z86fd8A8jY2lP5ENdC63Tn3josqmeF3efflNlXwC/LRcf+KC7e/DDL3x9uG3Vq1/7l4fQ5q1cO9i75eyrpn70hUsPX/bkfrYt3vXiW999/+rL/upbLxx94n3TP2Pbp6vnVL+x/Uebv3TtLYWX/3w5N4e2P1l/5K7nn9tyxbMt53/l4a88v3IJ2t5uGvUK64lXnl5YHza93RSeBtvRDs8JPdpAtB899aQ9t9HsuY30Wz4FtkdbLiAun2K44ZSTdqGPfhuAZof9nG8D0cYPmD03wLgYP0jcQNQ4hWHzC0ficSPxuB22Htlp6zHE+J1sx37G4/0oLjSHJbZngLZfIOLUWuZ2s32h2bDWInvNlr30W2guTBqGB4kYf9DizB1i3CtPN8w0y9PGG1BGE8oj8OipJ5H8jSawj3PEEcnbaGLDOwi+mojgCVhMG5Kn2G8g9huM/YbjeCOx3wjjQpcd1j63g/NiPTvZT56sn/yMJrCvcdqZGMkXsdZCnthPnmjP7TYEH47t4KdJx0/SL0NsIoKXJsYhT0Tw4un84GXWeFDk/meVh9CbVR5EZmMeZpUH2sU00M0qD9ZPHmgb6rlxOm6A/Tw3ZhtivmHzw/nR8bCbZsED+PJ0HSO09VzBH+vdQT+cb0XjcRb7Am8yazzCrrWAJ9jkj+OVP9hjGfI1q/wx3liG52k25o82+ZtVHjnOeNQ4k+xXHnU+nq9Z5ZH9dr5mjUfJOfIYNhGZlzln54nIvMw545FIHonkL+f0PHnq329+zL+cw34HiNjvgMUjnzmH+QaJODeDNq+h5WfOYb3DRJwbRZz3YcZX3rWfPLOfect+s5FnO4iZGJV3zA9edtIPvOy08TyvOTeWIb/sJ985l2/F+WxiO88pbfCsNnhWf/Ks8fayH+Mm2W88E3E+na7vYLyOQ/E6DrHdeJ4ynr2pmGci+Z0ynrWd/NJm3k45q3c6rs/8WPemYv6nuP9+2ojXb/2GmH+AiPkH2E89GAfrHySCD0XwMch+6kIbvAxzHPaniP0Ns990mSJPI0TwNGJ+hguqy1SsD/143ulHHehnNnUi5lupB/uph65L7ROtrBfshy62nnGLxzyYMl20/SRSl6lYF133JP2wroM2H/XQeQ/ZPk6iPM126hI2LTmrI0vk8xyi1RPa1GUp1ok268eS6aT9PP86Hnos8Vz2x3H62Y59D3DcAvWATV3YT13YDh4GidiHouoDnGsj30vkY9j8mAdLsT5L7sAq1hf6kX/6ma36eOxHHmgc5gP7zc7HeGAV6w77yTv7mSe6np0Wlzro/ONx/BL98+8g+V+K82Mp1mHJdNB9MD+W4vxYMj3ckulhfBwiZt5B08Hq+laP91zobfXsnqPNfCFSDyL53+qhTvRZO/Niq4fz10+bOhCxvgEidWAc6kA0HbZ62PcgbdXBoz/zYas3lGV93+odWMXzv9WjHuZv7Y128r3V62wn//Qn7/RnXWI/eWc/zz/7yTv7zW60k2/2k3/2k3f2Uxedf9z8DakH26F3iWh6cN2GWrdsv7vj/e5mu96vum/qQ+R9wHbqQJt5ov6HrB9o/k/Tz94fdSDvhzr5hh51z94hbKcubDe0/KHN+7duemk/61k91k3j9BEXqJdXN908jdPPcaobbM0fr266wR/ndZD2Cc2buunWVDfdMK6znfrUTT/4Uz/2q35oP9JB3eqqH+NQP7b3dbIu1b3SasMjHdSrHuvIdurDdupWV/3Y3minPjrvOPtNt3qsG5F1q266NdVVN/qZbkTqVTfdbL+76c93oyF1q6tuMV8H6U+9Yl5ipF51z/Iom1xQvbJJ6iZCG7oIbepEm3lEm/pkk9TL/KkTbeqkcfpsHPViO/Mtm8T56Y/j9rMd+xigTd1oa74BcZ4H2W66ZZOmG/2ZZ9kk+Btmu+mWTVrecZxhXyf1ySZLq6lXNkn9iJZ/2eR8F/XJJiVG6mg284o29eL4k8g8Yhzqo/OPM47qZ/NrP/K5ZOunblw/9eL6zUY93R3ve3e8b0XTj0jdyA/rofI4aTbroPodMvskMs+Uf+hYRlzqVkZcQ9TT9Ww3XdnOPGM737tl1dfa+f3EdupZNp2baPNdQZv6llXnOG4f/amzzcu6qfH7rd8Q98gA/U60GuZjRP0aJKJ+Karermx6Iw54HqZNnc2f+ViGPtS1rPrSNn3Lpi/sSjfzrxzrWzZ9tZ26sp35V1adGVd1VqSO5VhnnX88nn+c43BuSmxH3pds3Yaqs1dWneP97qZ9otXQdC7HOhOpr/K6l/367jAeJ41v6qy6HDSbear+T5suhlpfZRHz8P2xGOtOm7rSNqTeZlPfRdXZbOpIm/m6GOus8ZCnGq/P+qnzoukNG/vtZz/228/2E9Td5tN23FsDbMe9pYh7a8D8meeL4JU6L4JP5veingP2g/9hIvhXNP0XoRfzdVF1Nz/qvRjrvGg6Ny2qvow3r7oumr5CpK6Lsb4af5z9lsdE6rho+ur6qeOi6ksb+9jN+bCP3fE+dhtPJ5F5qnzuNX55byp/k8Y/9VX+JukHPQ4S9R7Vfuq7aHkti6YzbMvrQgr1DPlbSOEeWk/b9GY7dWU785ftzGva1Jk279FCirqbH3VmO/OY7YaoW330wzx9tDGP2noOMA689HMceOmnDV4U9RwAUTcHiLj/FHH/Ddg46s9xZkOXQdrQZZDzIO/URn1VW8+F0I+604/ngH6s54VUpZv6s9/Q9CdSZ42/k7a8g9Rbx4/TNt2JzFfOZ9hQvXW9u+nXGSN1N15OInVWHvca38xf5WvSbL5XySv1Vj0OEpEXB9lP3c2m3rT5fi2krJ4Tmc+FlN3HM9QFOs/E+tOm3jOquwht1mfa1HvGdNd26sx25vOM6s5xqGN99O+MkbqzHfnUTz/woghe+tlvus+Q5wH6Ic8G2I56OkA/6s7+3BrqN5Ma7eE9TX/qOqN6sz23hjqy37DSTX1nVGdrZz7PxPrOxLrqfDs4j+k6k7J6PWO6upmU5bOuv8TxputMrCuRus2orvSnrrRRb/ba/pmnM6ar8kr9ZlRPQ+o1ozqyH/l0iO2m34zpp2h6Wd7OmH5NgQ+eUY8D33SkzfykbYj1bDTbEPXwAms3pI6Mg332EXF+FVG3FFVPL/DBWz9t5EU/bdTJfs5LXdm+tIa6BX6OiP7RHrOpK+epr6Ve9KNe9GMe0mbe0aZORNZhjqdOOu8I+1Uvj/NTNyL14jpOInXSfcTIfON+WHeJrK/cl6HmoSJ1UT72Go+sr8rnJONSL0PqE/imV+Br3gmR+gS+6gU/6sV+0yvwNd9gm14T5HM9UXVztJlnE6pb6NFmvk2obrRRty6gjbp1gfkzzya43z6i6qZ+huCvn/7gr582deO4edVrwnSDXV9LfSZi3SZUN7aX1zG/JkwvIfL9O6E6mT/zSOcZiedRG3rv4HjLqwnTyZtQnWxevod03ePxusfpZ++gCdXJ9sm8moh1moh1mjCdlBfqM2E6yUSs00Ss04TpBKROHGf1ccJ0Qjt1om06TahORHv3TMQ6RbFOkeoUehHXdY61M69oU59I9RKJsB/qFKle1m84rzpFqhdty7NIdeI41Qm25pcXmU7wU31gL6kuUZxXkepj/dQnivWJLI9cpPqYP/XR+GqbPpHqw3GWR5Hp4yLf3jG6jxiZR5HqQ7R3TGT6GA8ltne2n7SpE23ea5Gv95qL4nyKfKt/kekEtPssMp2AVv8iP695FcX5FPl2f0W+vk8VTR/TqTdoaB71BqoTbNOJ7dSpN0DeQye2G1Ina6devQH1EekNNJ+a2E+9egPLn95A80foZ2h69AaaL0I/5k9vQD3oz/pm/Sdt6kKbdY7IeqbxFe0+IjJfOA/14XoM9XtR18U6p+veyXj2nU+kLsrDOMfbdyKRda830O8H2PadT5v60DbUd6ajzfyiTZ16A3tv0qZOtKlbb6DvDiFSr97A3htE6tMbmE69gX33E1kHewP77q+aXlINrP5VA7u3qtgX619V9aNtdbHK/W/kONURiHN6Af1UR/Srfq4aSIyWT9VYt6rqRlvzp6mqerHd3htV00nbqRfbmVdV00vjMb/YTv10Pm3Xe8lp/BGbn3Wwaro5XfcO2xf1477Mpm7Gg2HnO8j3hvIxzjj8fYbz2fd9NbDv+2pgv89UVTe22/dfNdarGuj3gVRVJ9r2XVAN7HugGtj3QDXWqRrY931VdeI4+95b4blC3VtRvYim14rqZP3MsxXudyNt02lFdaLfvOq0onqx33RaCazOrcT5tBLrQJv6rCj/RHvH6/jYJu+0eQ9xPuqyEth3Om1DfqfH6xuhv/5Opvsg/9yH2eSdtv6uCX/7XXPFeEe7/r6Mdvt9eSXmfSXIx2jfZbQN7fexFeNf/cj/ivGv/cyTlZj/lZj/lThPVox/V0yj3iI/imnjv5g2/otp7A98s5/8F9Pk3drJezE9rzyznXWNNusZbdYz2swD2uRd4ymSd84ryr/GG7B5DMm/+VMHtlMXrs9s+27SdQ/T5vc00X5Poc28oG1ov0cTqUMxbb87F9P29wAidSmm9Xd/9J/Qv8MU0/r3GLWZH7SpSzFtf3+hzTyhbah/jxTarG+0DU0ftjNP2M56p/EmidTLkDrp+EPx+EO07f4ppk2vOxPzLY1RkZsT5WzjfpEfJ3JtQ7eE/p+6SmbuLJHbk/VVpbNC7zup5a7i/tD7iB91FD4n8jfpqENKoT+RiForGH9rIuwIMT5KbMjmMP7PXLWthPETyaPtFYz/YertngrGj/oLncufFTmaXuiM7g39DYnR1uK7xXUmpGX5enGnYj3RTSLJRH1V4f7QfwXryT8T+mdiPUMbRPJOWooXhd4PEpVMZZvIP6I/96zIFvSH60N/i5tvqV8mcr7LtdWuCf0Dbqkt+ohIydVXZR4Xtw320HTovQ7/5XeF/i84rldkHu1zV4m86IKOxs2h/5YrZ4u4x3/IcU+JbPeqq4euC72rvWJn7mMinrfUVngu9O/woo7iVpGyt6FraLvIEe9od/4mcbcBK2Ohf69Xzg49Fvo/93JtcxeJ/BPiRFjXb7zlrjry+3Uv6CiVQ+8U8vx5kcuBQ+eG3lnJpbb8heI+lsysXb5R5JZk1FF6SFxIv6nQ25GEXp8R+UES6wXPjyfH1g8VRY7DZh4dShU7G8iv4VRmbWVL6E+nautqV4fe02jn+VhJbeiqnx361/tHu4ceCb0boWuIeP1+ob30bOhtCjJro4nQ+5WPeDgntwdhz/K94n6J9nw+9GeDhbWN94v7T7QP3Snua+naujnY+3AucveG3hNp7GsX5k0X2vNlcV+CXXtE3FnQt36byCT0HgJvvyeC/+8n+pobHxA5kYBed4p8L1Fojz4hsgt6FD+O+9ohTijy19Arf57IHPQqXiHyHHTKXStyjLo9LPIS7Pzj2D/68+Cz4FUycgbqF/Ti+WkGP3NlkYuTR7vlepGd4DUDexB81qDzHvDL8/T38KvnRLpSYU8e8f+b/GP+TalC+zLi/w/5r4o8DV5LqB83p452Fx4S+WKqnK3w/knlc/kbsK7U2PoCdPkVeI8OiKz3T+QitA/4Y+ujW3FewH/hfJH9PuLcIfI5/8o1Gez3INrrj4Afv5ydwz7uIu9jmC+Arp8U+VBQaBfk4Y9hZ+4TOS+9sLbyxyIZ8Fz4lMhH0+VsAfuZQHstD56gTwnvxAr0Wb5b5BPwY74+D8ztE/kU/EvPiNyRmDu9gDg7EqW2/AMibyY6MyXk8wvuQHPubJ7DI61DyOdvpZZWF5DP2/35bA3reDU9n82hHrw3MdTC/ZyZOHEa864J8ZZvFrc6caS1cT/yDvGiZ0KvC/FK7xK3zsHvwtB/LXGgub5d3Dz6C8+JG+F8udC71M2dHqG+9zu0Xxt6+1wjwzrxkDvSuoz8LMCuPxX6b8K/cl7oHQPWkDd/i/bGh8UddZINi6H3piu1hY8hPsblp8Vt9irt9e2hf5k32lG4XVyHB//nkFfefLZ0tbh7vNzq0nXivuLVOzN4xz4AzN8Zevu9UtvyY6H3U68zw/P/FuKUsC6cr9UVnKdXPMlGD4a+gKfK83hXAuvnhP67k41MBuf8o8mgJ4P6cFdyPju0R+Qe9EeTob89WWqDnu61pGQF78f9yeLa0i3i/h127n3i9qZGO4Y2hv5tqaAnd3nohanqGrk69KfQXnsk9Jv93OohvD8H/HpnfX/ob6MunxV3vt+3KqqG/pog6MlPhP7vfMk2UH9LQbkrukfkD2iP8tAziHpYn36Ndp6zV9PVNbWLeH7ms+E9oX84LdnMfaH3fLpvVeZBkb+EHe5HfkDfCPfdHuhN3paJ4P+bifxpgu/A4wnohffIq4m+VQ3cW2PUY5e4ja5v1dB+cXXoNYT31svQK7xSXAU6FYbELcCP91wN9tAT4j6F/iHw+X4P5+JMcb+BXjw/Hvhp7BH3nmS9M4d6egN4zcPeDD7noPO94Jfn6RX4RWeIa0mVu4YQ/+fwq2D+s1PYz5PifkH+4fc4eMW94j6SqncWH8a7MlVqqz+D+VIb1g19FOtKFdcWqQt4x/lz7f7yumW0X+IX1y7fJu4w+Od99qCPOGOI5xe689jvPrRHeMcu+6W2BvZxC3hn3XwiGO0QrKMv6FuVQ539Duz8/eJy6ainfoO4FHguPipuOF1qK2I/t6J97r3gCfpULhb3KPTJoC7vgl/tAXHTwMInxT0M/0oVdZv/ngr5fGNiLGP5nGkOkc81F55m+VxrKWg+N9rzyOdt+J61fJ5ry2s+X3k68tmdkVg+BfnsEoiHfJbViVpLhPv5dcSbw/3cjXjQQ9Y5+F2IeInwNOSzsB/8ywj6M7nQ/4A7eiryWfpdpjl/beh/0i00I59lj6u1kM8C/93CU8zX8LTwvND/NyDyWf4O7chnOepOtJaKob/Ifx/zGOJjHPJZNvPv/ttx/vn34dtFOryF5gj3803eXBvOpdzrdbYjn+XL3pEO5LN7AJi7M/T3e2OZBu7nY16mGfksbyFOEev6P6/Rjnx2r3gnWhsPhl4TeEI+Sy///oA8Oz+50Ix8djcmpQv5LOPJuTbks7sH/Q3cr9fx7xvg8Vv8uwfeu48kR3uQz/IWbOSz7E0NZYu4n29LSRfy2Q9Tle4M7ucptNdxHzfzdxvUjQH+TqN1Frogb8/3862Nauit4XcE7ucTPtaHPL8X3w3IZ/cHfs/gfn6N3yMX4byhHfnsvpGudCOf3QR0rdwTeof5Lr0v9D+PdyPy2f0FbOSz64a+yGd5CHqTt18Twf9r/Pd5eG//KgG98F2B/G5FPsud/Hcru0Q2unwr8lm+DL2Qz/IK/x3KlSJP8d/TDIn8hP/+Bf4vwEY+y6PoRz5Ln4dzeKbIb6EXz08S/CCfJZ+EPiOslziHsD/Ev/9A5xLPK87TUfghnyWTKq1GPssv4Id8lnNS2M+TIr8k//B7ErzynXh96kgH8lmeTY1lkM/y21RuDfJZfpIa7UE+y3+Ad94nHf7SGuSzXOqP9iCf5QvgH/ksZR9xUBef8Ps6kc8Soh35LL/2cX6wj1vBO/JZnuT3GNZxMb6fkM/yXdjIZzkD3ynIZ/HBM/JZtuFdjnyW2/j98l7wBH2Qz/Jp6IN8lvvgh3yWz/B74ZO8r8cyyGc5F/lU2xB65yIvG5vEnQu9Glew/eipuWsMazeETezP3WH+xbuJtZbaffTHevcY5kJiraX4KOOh/wnayLPpsOkxjC+izj6GPMZ8sJdPyV1oWLxUhFjbHHpEzO+0/5q4/zr2cx02vlGknWnGemDb/I9hHs53XOPi3Yrzhbhq1zYTbV/HMZ7xjmM9iAdEnhbDpuMYz/0d5zncY5gLQ+94vB/1mzb/HN6z23AuuZ9tTvfhEbmPbahHnG8bziN524bzmbuD/fnW4t20ocN9ZjM+/RAX95XFI9Y2GDY2hU0vs/8K2ohzTei9jPFcL5FxX3ZzbdTj5TjuyxYX/agb07Sxr2eRh6hHXFc36g917UZdI3/dqGfQETbOz6OG4BGo42SfR93CJiLWpTb53Yd+xtvnga8riJ3t5FXxbiJ5xPtK44VNx+DP/RG5P9ZHxiEWL2U/zstm4oFVWB/6pYv7POb1dVKXY6iv4M87hnVzvcc8zWvHceSRCJ00DvW5HHnN+Yg830Twae2X8rtIuqj/5clKN+ZBe18n9bk82dkOHoFzbYyv459gP87ZtI0nny+hXiC+vJTMt/I8E5E/sKHThYY8f/Tjvl5KHlhFnl5KNtqp40uo3+Rf2/cQjffmFPQE30SuuzkFvS5ke2c7/ZpRb6jLLtjgzduFesR4u1LzXVz/LtQl8A7EeOTDLoznuX2D/uCDyHW+wfp1KXG0p3FF2KRYpI14d9CP8WgfWMU4byAe41ziNzQOkefzEr++lvu6xC+vY75e4jMOUePAH3U3pI1z+WzYdJj1D7wdRt3jvg6jPpKfw35hPXU/jDjF62iXVvP8HNbxbOd4kURQ6ea+E4GOA5bXMa/ZzvkSqJs8JwncU9QxEXS2c3wi0H2gn3yE3u2BreN2+m2grfsQIue/nfFv4Hdqg+cB/ciXkDbuc9SDb+M+ZP36Nvx47r8dqI5A1mP241zg3GxKl1Zznk3pvk6e+02ozzyHm9KjPcwfIve9KY37+276MR/Zr+cPNvQP2c94tO0cTqeNByLjTCMu40ynoQv4n05bfk+nWR9oW12btniKXOfv+P85CiJXoR4Ogb91qG8ZvON3su5hPYuom/X3iDT47+c/KHI36lsduBvvrRruvc+gTlVwnx3mv7vF+/6bwDrOVR11KIPvtS+iPpVK+C5EPRqq4LuY9eQD/L0D9w/eX+/hewr5vIb1AvfSJOoB760R5Psy7tHXPeiDPP1X2BHusZ8yzz+Ne5D1At/NO5iPeB9sQR6HeEf2I28L+M5/A3lV2iLyz8izZbynvgqc+5jIi7z3cS/38d8NIM5ZuN8rnyPaPf5ZnPfSBfhuRT4s43t6Cn4Rzn0K76fMebhvgRV8j/4X8mQZ9/fbeC/k8L3/IvOW9y/OawU8jOEc1wZFPo5zXALvb/LvXTjvPs8p3j3/y79H4T1wKs5fA/dyPcD7YbPI13Ge+PvA9wK8S3A/d+B88N3TG9/v2bS9V55Oo379Ed4/1P8qfldh/cgPkf8HrjNJ/GA0AAA=```"},
-            {"x": 1, "y": 1, "output": "```H4sIAAAAAAAC/z1ae5TcRZW+3fXr/nUn8+h5JZOgS8sjiQvEVoJMUEMjgQQTQg+PZHgEGhiSGAbSJjI2j0kKZgwziKSJh+zwEBt3xMh69vRBF6NE7eNjN8bHNkdlszhnbaOsg+u6vWfZNYedfXzfvT/86zv3VtWtqu/e+qp+PfOTt37ySlxCEXn59uLf331TeMlX3nim7Ya/27JjvxP58JITXQcfuO/SidOeH22/ubI3g36XrZ682N214SPPvTzY3fPdr792AL5g/qoNqy4764qJn33uA89e+ukH6Zu98/nXf3Th4ku/+rfPHXn0/INv0Pfw9NnT37nmZ5d84apb8y99uZX9IXyPnX74zmeeumzdk53nvnj/i8/MD8D3ZmwoyJ9OPNEBdG/GMhFWO/3Z5gfC3pGpn+MD+uvn0L8jI+/zMdpA9ecH2A9xBqI4A2zPdPg1bF/f7tdw3Pr2+lr6fRswIMoG+o8sBDpifpDYWpAfZPuKP6HfwnHFtN/C9ukU7IBY38rxjRAIfyo0OxXKMNvzybcxv5Pt+aQvsb2c8CXGQ/9R8wM1joxZHKAwfn6c4xthftziAm3+KY5vhMCAfj9l/esHovUoFtNyyPrLIR8biiu/MhRf354/3QdDceOXfn82beXX0U+eacv7iCc6gI42+FWbPOv4NRaXPBPray0+0BFlA/3KM2zlWYjgGag8Yzx5pq08oz95JpJnjlOegeSZ/Y1nIvhVm/wOxckzx4GPEtH41nGj0bhR9gMvYxZXxugn7zYv+I7RT551HVPROqasnbzqeg6wfcUC8Kp+8CxHlVci+TQbvMaOGp+OfkPwo6i8an/W89GIV9qs36PGqyLrVcetpW28HlVeieTVkPV7VHklGq9HlVei1q8ieTyqvHKc1q8QyedR41X95PWo8ms2+FTbEONHbRz5PWq8ylHjNdD5x4nGq65jiuOMV9r1AzaOvOo+DtHfWmB8Kr+xrLN6JbJes863kV/arFPahhmtU/qpC/SbbXxqnAEbb0h+LQ7Q4q6x8axfjbuW46x+s055jhFZt1ln9Uskr1mnPKOf1m+MSH6zTnmOEWWY7eSZ/RvKK/3kkzbrVceNRuNGOQ48jJmfdavzjtt8rFOdf8r6kV+uj/VJP/gN6DcEL4ciXg7ZPmhPGL+xCfJyOm3l100Yr0DEO8f85JM261b7D9APPgaicWvMJo86fi37YfxaxjednYj4m3BWpxPKH8dZnRJ53ici/iYi/iaMPyGyLieUP7PJn/YfNZv8TShvRPJGVN7cRMSbrnMqmn/K9k+edL0HaKOeDrFdedN24pyzcz6nfImbU758MMd4Z9MmX4aswznENyRP9GMdA4xDnqyd53zOeFLb0OpNx2/gfHYvzUX1NufsXpozvmAbX0Se4znly5B1Nmc8yVxUV3PGT2zO+LH+Y9E849ZOnnR/U9F6p6L5p+iHLh0g4rwcoN/4m3O4Nw4RT5A/mVMefbAx4P3jYxsD429jYPVGJG8bA+VPiDzPGwPwcA7byR/blTe1yZe2rzU/+dH2wah9C/3GD5H1tDEwfoiso42B8hMQWU9E1hGR9cNx5EX7j5nfbORxPFrPuM3D88h9kRfdz1S0nyn6TyhP3L8h+SLiHXOIaHyxH7EW2DuoZjwBtc6kFlid1ZQnQ/ATqylPbDeeahFPNeXJ/KynmvFk7YM2jueuFvFUM57Qnzyxn9VRLbBzVzOeFHm/1gLT/5rxFGj/MfOzjnTd4xyvfOk6DPVeiHGf5KlmvNn+1MZ77wDb8R45wHjkz3jhPVELTnWRt1qQi5A8+lhvwnjrTRhvRPLUmzDeehPKW4xI3ojkqzehvAltnk/aPJ86bg1tO6f0k0/6yafGWUvb+KWfdahxN5if97LGHbTxhoi3hfGN/96E8U8k/70Ju5+J5L83YeeYSP6JPMfab5TrszzofGMWh/zr+DHGBx/jtm5Dq19dzzjb8d6eov+E5oM88rwrf+rPdTEfvQnmhe3MC7HebbwzH0TLR9nyIOWE3SvlKA/lKA9EnutywnSSNt8/Zc2H9Wf90m9o94vGWcO4ds9wHp5/+g0tL7RZ5xp3A+MhziBtu3fKyj9t5T9GJO9l498ReU+XI/6J0E+g8U+b9V+2PGgc6qmOH7X+zIvOP2brZz7Kmh/68c4bZz/wNB7xNG77Msx1MQ9l8M08lDU/RM0P2uvdPA9l8G6Yi7DQyzyUE5M91N2y5kfcLOdDHmYTmQhNf2ctL2ozD7MJe0fR5n01q3mhre+nYDbKC+NRf+nn+dA4ap/gO1X9PBdE1v9slA8dP2hxDS0fs3YeYNt5mNV80M980GY+zOY9Nqv5YHz0LzEuzk/J/IbYx6jFNbT86HrGovWM0WZ+OH5HhudhFjyTf+VLbcvPLHgk/7Pgm/zPRvmZjfIzC97J/yx457mYjfIzm+jvo57Pal5E8knNQ5BPWh6IPA/5pL5rhchzQT91iTbzoOMGonEDHId6WGPx3kbyzXaeAx2/weKRdyK/A/A11GZovBNZ/0TynE/qOXBE1n8+abxr/53Wbsg8sB3nsGTxyDvbzcY6Rm1f1CX2M4ROj3Ec7jvFE8yH8mB4qou855O5Lp4P9if/+eRkD3nGV3I3+Wc/vkPySfLO/sZ7Ptkk3+hnvLOdvM8o70TjfSbinch6n0nadwT7sd5nkvY9NhPxPqM8G7K+ZyKeddxa+pVnjDP9n4l4nol4nol4nlGezU9eZ4xn67/T2lnXur6SxSefM8YzbOjuqK3LMBMhdHeM7cqvzET8zoAv8jgT8TqjvBILveRzRnllf6vvGeWTaPzNJE1PUqHVbSrM/AlZr0TyxnbyRpt1q/0HDKkP2j9C1mkqtO9YIusTX5NtbyP5IvJ9mwpVp4U2eaNNXdD+w2bz/cY45E/H77T18PcVnbdk85DHVAidHCXiHhvlOOOT/c0PvRzjOnCfjdGvvMI/2UMe2W5I/sxvaOc/FRpvtKm7I6HVHZH1NqK8+Rht8jYS8TcS2u8sI8oj2/k7C/tb/Y0Yj9r/bWTdEcnbSGi/B9CmrtJm/Y2EVoe0yeOI8ar9ec5HjFencYatH/kcUX5tnTznGncnbfLMftC9kq3TUPnGuFPkF/3JM23jeQQ8kc8R41dGIn5HwBPrcUT5JWpdBiPKJ/uRT6Lx2TA+gZkIjddGaL9bNSJeGyF/HyTa74O0+btVI7Tfr2jzPNMmnxoH95fGWUu0c96wenUaZ4PF53uiobxbf/Kt6xqM1jUYxd1iccg7/YbMQ7TerTbOMEOMNaK86HzDNp55aVh+nO5jp7UzDzrvTvaDHpboz0Vo+WmAV+ajAd5Z540oPw3yOkYEr2OMw/wQm318D7LdkPnhuP4+3neNKD+0qRONqO45jnlqRPW/KmXvv1Upyw9tft+tSlme6GeeVqX0d9yAftb9qhT0aYBo+VqVwr7WmJ/6Qb/Z2MdatqPO1lp/5knjK6K+NhBzRJtnA/tZHtlOndH5Bjk/5hu0dTCPOu8WG2+IebfYeLMx/1b2z0WI+bdaO3VK5x+O5h+O5h+O5h+2dt6jOv9Oi888rkpBT0pE6HGJ7cwrbfA9SgTfoxzPvLL98CLmcVUK/I/R1rwK/cwf/bw/aVOnaBtaPunnOaPfsD/C0mLqvsY/ZHGI01Fepy2vsekor9NRXqejvE5z3++jredQ2w2x7wFrp65Nc59raGue1Wb+pjW/tFGXG8zP/E1HeaWfukY/86Vx1UZ9biGCxy30I/4WazcEb1sZB/NstXkNMc+w+Q01fxqP50zn22nxzLb8TZPHEvtj3pLFNwSvo2xvat6mo/xNpwb6ma9p8jtm/Zgv+pkv+g0tf/TzXqaf527a8qjj+d7ReQ6wXZZYfhD/kPWnPZ+ye3s+ytt8dB7nU/b3lHnNm4/NW97cfJS3ecsb+mO/A2w/pfmaj87nvOaNNvhcy/7MG/2Wr3nyNki/5snNa17YjvrdGo3byvio12EidGjY/Dw386zbncT+CJkHtmP/JSLquGTt5H8e+6auzZMXRfJPBC9jRPLOcbKE52E+4nve+A3mlV/rR141zgHGVV41Pvkspo3PYpp/nzKb76BimnwS7e9TxTR5ZLvVfzGt/MXoJ4/4OtS6p9/Q+KNNXSumyaP5We+0qVe0qVPFtNU5/bxPaPPeoM36LqaVV0e/Ifk0P+u3mMZ+S0TlM8Z2Q+VR21mvbCeP9LNO6SeP9JNX+skj/bwn6Oc9rvONR/NMWX/yq/NMRfEP0Nb6Degn3zrPIaLpj85zyNbH+39rXDqzN/pwKt5cmL1L5P3uWGdrQtzfuKGu3DrcT7ALQz68MKhksuAxE5TaG3fjfRYc6yztF3d1opJpXSDyxcRAR3VE3MlErSeD/G1N1np4v9yRnOtuXClyAlh4r8gfwnKv3ODD36TmujPv8uFQPNXVgv1ofK69MSJyvmt0FT4p7kVX7Klg/h/CzmL+i4Lp7salIr1BudNj/kTQ6Kpj/usS091VzD+TyGdamP+fE0f66meJ3Jg80tfA/NuTrV6P+X8BFMz/RugXNa734S9Trd5W1ocfitd6ssDu+EBH6Skf3h2f6y5mffAv8UpGhsSl3UBHo+jDn8cPt5W2+/A1YAY8jTrs6xJxt7tKprTFh8vRr3a7D9/lpLPgxV0F3vxj4h502W55UuQfwGfhCfQLhroa54o7E3xWLvPhf7tSu9/twwdh1871wT7wWsH5v4v8bvTh5wLpzN0qch14z6M+vgS75H34CuKUlvugjn516PDLsAuTPtyBfJTeI45YRB3fkkCcfeJ+hPz4Pbh3ktnuytUibcnpxUXUyU7kpbrchw8lj3XKdpF1yaGuGtZzZzLf19zrw/6wkinc4YNfw58b8cGxZLk3e5/IvyVTi7IP+XAkrPXUzxRZFM511xHnwjDb3bpK3MJwqKt5jbgLYMuID3+KfpmsyFPol9vug3NS5d4m8vFamO+rfEjknanWkiLOQxooT4j8MTyyVJ704f5UY5HH/nem/Gm5h8T9IFXraS0X+Wqq2F/fKO4/6L9f5PVU5p3VR3xwTTrflzkP/KanF/uLxN2a9qcV94h8JJ15Z+EB1GMa618ubjzdWlL6qA8+kz6ytHqnuCfR7u/3QS6Ofa8E38DMKpG++FBXa5PIpnj/wvoukedRH5kzUG+ol9p+kd/DzuFc/AT1UtxMlM4G/Hch7431ImXkt3gH1s883yNyHuqigvfAz1EPlXPBB1AuxLkAtj4ichjtjSERnrdqjucN82wTiSG/mUf4O+2xzmJB5NPwl6Dz/466yGFd3wzmuktonwsai3J/IXIZ8l9BnA8nyr3VT4tclJhenEMdvprQ+pO/Rru/UeS7sOt7cS6A2XtFdqEemljPZpzfCt4V9yDf/mKRCdRN9TqR25LYJ87fXyUbi6rQo/9CvyL611kPiNOHPJegd2XkPXOzyAPIdx7rnwxXLGl9huc/31dFvBzyT15eCxuL8h8X6UHes8h/F7AKfs4GFh4Hj8h3Dfm+A3WA8y23pNa/I/uUyFupFUuK14u8gPyXkP8r0pa3buS9tFqkkk4tqp2P8WnMCx7+EvnN7RP5cnr9O6Qicnv8VFseuvdw/ETa4zwPuHp7Fbr3NVfobF4u7lXYJejOBcFkh0d+O4IdC8nzgqDenoHuFBKTHYX3i3wpkWvLQ3d+lTjcVYLu3ZI83JWF7tyebGZyqJtXgTXU+ZthqTsLnftdCn7o3lXxw1016MxZ8Vxb5mkf3BRvZuqn+/A/45MdTdTRUpdrK93qg9/GqwsyO/A9AMzdLW6fQ7w88uImOzJDPliNfgXc8+e4U23c3/VYdxH5/oTrz4An9wb203oCdR0UOmu4R7mf7OU+aOd+oAe7YGfOhf5jXyXo6z7u70ofPBGcaivcJu4W9Ms+IPIy7MyDPvg24jSX+fA4+lWxzh/Dbk36YDf5AP+bgfXNPvxoot5eQD18A/w0oSfnJPszNejBW4lKX/0xHz4AXvIrfFBO1tuzO8Rdnyx0FrCeseRAj9/ng2Q42VEbhs7BX7nTh99Mlrrz94uLhdJbf8gHt4aHu5pniVsRNjMFxLkk7M80NrH+Cp116Ns62FXo1Q/QL/cucZPoV9kGfU6VuuV8fncN9FSRp57U3GK/V9z/hXOLs7gP06laf/VJHzyQOtZbxf4/niovyTwo8u3U4S55t7hvpYYWVfGOeAN+6slPU6nT5BEfbk0P9LTA73npSl8R9bclXV7iPy7u2nRK9WlXGvMuE/lYem5xY4cPP5uu9Xu8Gx5Ge/M+Hy6LD/RITtwGYO4C6Ge80CkFcWvjmXQT77LPoj5yZ4p7CvXSeBj3LOzCZeK+h3rhO/x7qOfWw7yP+jOtK8Td7XYsLG3DewBYxXvjTNRFrcL7FHUAfawAswPifgPMQEefRXvrenHnoR7q7xWXDDDPdnF/RHvuU+KeR7493p3j8FfuEPdb1EUB6/pKAF7R/k/Bsd7CtLgPIP81xBlIlLrruP9yyHfhKd4/qBPMO4P26k3ivg67iXvpl8D8feKGUQ8trGcDzk9ttbg7ke9qXty9qJv6ZnFDSexzl7jnksd66zinv0e/Evq/lJTe/D7eN4e7Kp/AvpH33C3idiPfRax/b5hdnHkC+0S+64i3DPknL43wWG/xHuZ7bnEe+Q+BdfBzGrB0EDwi3/UV4m5EHWRw7q5L5ZfmnxbXSmUX+xvEVZH/CvJ/cdrylkLeK7hv9qelt7EK49OY9wbeK6nT+B74fDq/NPs4/PHWggJ0Zz//7wO6s9odWUjdOeLWt5vuHFnooTur+Hc71R28cKE7C4MjC6k7VyV8G3XnBf5uD91pJqqd1J1istpJ3bkteaKDuvNzoOnOjkxOdQfvbNWdaid0JzyL/wfytA9vip/oaOD9/Wbct0F33FK3YkHxVh/+lv9vgjp9BQjdkb0O8cDfPfx7Pda3mn/Hxvn8c9daAN1xQ1g3dMeVXaaD+vwG94P3Ti5Y3w7dcRdgP9CdsB37yezx4S7aeO9MYl/QHbcPKFf68FAAfm4TuRn9oDt417QWyIM+/DbitJbhPKMfdMf9GHYT752PkY+V4jYDG5t9sCNxZCF0x30D/LR2++DcZKYDuiNvJSZ7Go/hXJOfFT68N3lkIXRHrufv+FjPWDLXVdrnwyR/v4OevgJ/9U7oHX8vx/mNhae6anjv3B5WO6E7soK/EyHOxWGmA7rjevk709Xi1sGu4L1zHP2gO7j3TnRUt/ngDH7/4T56Jcx1Vfn3Tn5vQR8FCN3Bu+fwogreO2P47oPuyB58L0F3XJ3f+e/G/Y7vNeiO+x380B35Kb6jMnjv3ITvH+iOOxffKdAdN8TvA9yn16RlCXTH3c3vpWXiPob3fhP3yDP8bsD338Nob93ng+VxfFfhnbERCN2RNv4fFN4Xl8VTIXRHPov6gO7I06gX6I78GjZ0R74ft9+Tv496hu7IMPIO3ZFd+ALB+ZJbgdAdOQt1Ad2RH6EeoDvyOBC6I68DoTvyObRDd2Ql6gG6I2GAefAOPYV26I58kX+XH8T7A37oDt43+ALDur4anOiA7sgvg3o3dEc+iPxDd2Q1/576mMh7kW/ojvw4gbrBvF9AO3QH9xHqBvdkk383wzt2G+oBuiNX4vxAd2QE+YbuyP38O8Bm1gf2ifP3+SS+JydE/hX9oDvyNf7+jzhtyDN0R3Yh79Ad2YN8Q3dkX9jfB92R1/m7LeItR/7JyythvRu6Iwv4PY78p/h7Bvh5BxC6I8P8/WCFyE2oA+iObOZ39dN45/G7/AaR55B/6I7k05a3NPIO3cE9cqoLuiPD+B6F7shTyC90B++egX7ojiyLY18riKjHS4jIwyaibyte62PLkMfqDUR8GRZ9sAz5r+5heyNs3ktEPh8lrliQxf34COIUzyBWOxn3EcTP4t4iFj9g7c119EMPNtHPeWg3wux2w+Jd9Dc4D3A6xXkeYXzP8dCh/T5GbB5kewvzivsD5muu9AER88kfMC673ceIxbuILYyjH/t5lP2hM3j3Xg29ahaJ0BV8f6h9r49dDf3KevqhX/yepR4/SoQeHmQ71o95XwIW8e5/CXVZxXuDyHUQsxf4mNrr2E/3CUScG4g230s6H8fbfC/pfFEczLM0sPhLA8YnYv6V9GP94JVIXonVSwyb64iIcy3bOR/tFvcJGzxuZxzk817G4bxE2+dSnB+bF3lDPvcGzCfuy2j+vTo/begk9kfE/IqsH/VvsnbsEzbnZbvOC38xzfwSWUd7sb/qo2zPdXG+kzqfj53U+YicB+8anccQ+zT/psiP+jkZ7fOk7RM256Ot88nJaJ+MyzrgPJz3JHSC816eMD6J3M/l0AHySSSfxOwm64dzochzcXnC9nd5gvuh3/J5Oe4b5BPxkL/9bMc5e5T2ZA/mi70AP/fxQsLOwwuIz7hEjnshcaqL6+uArvA8dUB3WF8d0CXy0JFscX8xIvfXgXsJ8zq285x0JCd7eC53w2bedmM8v4N2Mx7GE7kvtnNfu6FnPCe7eb/tISIfnn7oEtb/atLOFRF5dq/qeNo8x2wnH/SjPopms85exTpYV68m+/tQV8FFoe3nolDX5WiTh4tC04OLQuUhRmT90M/9ab89xEIv8/esxsH7lH7UCZHn7tnQ9IbIPD4bkl/6wdu1ZnNdOv4u2rh399CudzNvz0KfuV8i+Xs2xD2MfMVTNk8ces36j6cwDvWudpGIfp54eBHP77aU6eA27U8En1jXNug0+SAyv0Set23Qc+rR8ZTp5nHoPNd/HPrOOjuOe576S2RdH+e4e9lPlpCP4xgPPQQeW8I4K6H/rN+VafRHflZC/7l/IuOsxH3Pc7gyfWwJ13swbXwexP1BfTmIe4P5PpjmOuhnPCL4v5Z+7Hc7bYtzMM11cBzX4YNroPce3zVpYH413xHQO3y//w//vx/37zDvhffg/PP/k2/Gvch3707+jtIIM7tF7ua74pMi/8j/Z8a99k3+nzX2txF6mQXfH4RelnDPPsn3wgdFZpz9/fp70FX+fvAi2hu4RweoI8tFroButXJ8L/P/VnBf8xfbsulqBd/Fg/x/Otz726ETNeTxKN+d+O79Fvx5vFf+l/8Xh37f4bsC9+7Z1Icr+b5YsaCG9+IQ391Y5y/4fzbAC3Auipjvz/CezGC9T/B9cAZ/f8x0yEq+K3BObhc5kDy8qI53yst4XxQw/02hvduvIV4osgN1WME9vR112ABvdb4jb7H6rYKvX/HvkFjnp/h3AfC4m+8A9G+kTnUVkL/fwV8DP8dQN0WMO4k6qT3O372afcVhvDf43psSWY864N8Vn8O7sIG8ifw/qfuDR8gyAAA=```"},
-            {"x": 2, "y": 0, "output": "```H4sIAAAAAAAC/z1afZhcdXU+M787c+8k2d2737uJkeHT5SuONJQh6DKRfMoKk0BlBaMDLJBuNjACXRch9MIuIYFgxghxkUgHXW1EtFO1PFHSdhXRGFs7Vh6a6vp0Hh+ti0o6FYQ8si1933Nu+tf7nPP7ft9zzu93Z/dHf/zRj5Pii8hzN5b+5dYP+au//vKBJdd+/5qtzhN5b/+x9n33fPyyqWVfHG/5cOXeFvRbe/GuS932y9/31HObOjqf/+ZP74fPW7jy8pVrz9g49eJfXfLkZY/cR9/cti/+6p8u6r3sG9976tCeP9n3Mn0PTp85/Z2rXlz9hSuvLzz7TDP7r/B94pSD2w58Zu36x9vO+9rdXzuwsBa+1xLDXuEUYr6vcEqUeC1R7oXtXksc7IHtvZaQ/uhMYr4PmKA9e671BzracgH9+T65gP5yr6H0F/LmN8S8efoxb57jMN+g9QfqemY3uqNBrlfunV1j/tk1tBvdZvcBOV+xy/wHe+RyazfsA3KeYpdho7uwif37gBxf7IKNfrs6YQv90TXmBwr9Zs92nLRntxBnOwxPtBvmiI4oI7S3hkDY1TYZ4Xpbw8IosdpmeKy1MGrtUdlsIPYRAjm+2jY7TvtY6+w47ZBo8+2w/rKDdhgj5p+M55+kjfknbZzZW8Not7VHu63dEOvsNdsQ8+/nOMy/P/KGk4wDkeGkxcFwknFAVP09+g2pv9mMB/aDnaCNePBoMy6Gk9DlAmtnHNA27IsReuTZrrqr3xB6DHJd6DHIdugxyHmpu/mB6mc8DCehyxq2Qxf1q/7aD3GRYD/GA/sZ5tqtHbrF/Rgf7Mf4YD/DXDvjhP0YR7qPa2wewxxR54muYTv4VrT4oN8QvG/hfOBd0eKENuNnOBkSHW3Ei0cb8QL/hpaTNuOENuNmOBktMWSccJ4NLYbREsaPzreD7RtaGD/0M2503sl43kna0RJDiw9dZ3e8zu54HbU1XnRexo2ut9fGIW4Suh7wsMYLETor9hG9w3HcsD06UxzbzYbeamv8ePQzjug3tPihbQhdY2T8HKZueY6HbnmOtzg5TH0G2S8XI/QZZH+ND0ebcXOYuijifGs4jvFgftYT+g3DVvMzDjgeeacIvTZZO+PkMHlV2+KA7YwPtsP22G7IOGD/kPGQoP+kzTigbQjdRqydcUCbdeSw6Q//ocWMg8Ox7rRZN3TcDvoPLYbuouMmzWbd0PG7zaa+h2M9dZ69bKee8T6AWUcdieAdumYdeEedoB/6Cf3UkX7qSj/vB/qpI5F1ge2sC1mHfFTbdMs65JtiLkbwnGc/6sb5wecg/eAzRuZ51oUxYv+xTb1oM8+zDjxcbu3Uizb1yTrwsInzmx70Uyf6zW4uYn7rvFtsHPVhu2FzkaHpQz/1ot/QdNJ1Rm0cddLx4+anPto+Gbfv5jzk39qhg51jv83HOj1lvLsp8gYdpsib2sp7gn7yP6W8W3/yPxXzPqW80486qIg6eAH7K+9oN96nwDfzakp5J5J3YkjEOPA2yHHknYh9r+E48k0b57uc/YznKfBC3qfcwKKTNvmlTd6njE9Hm/VxSnlkP/JnNvmcinmcMh51fvI4ZTxa++54P3ttPHnkvnm/TRmfMhXzOR/zN8/zK+L8p9BPHmmjjigaj/QzrudjHueVx8ibj3mcj+N33ngEkkeOQ52IkfzNG4+YhzzSNh7nlUf6sW+1ySMRfFzOfgNEN688mk0e510pQx7nlT/ayp+n/UdoWxzOxzzqumXux+rIvPIa72Pc/IbkmfPoPaL7430yb7wn6Gc9oZ/86zqT5qcOOv9u8zO+eW7qoevsjc+7l+se03oz76zuDHmmx5Bnegx54BHxPuRZfA951IWYU33opy5ExjnboY/OcxL5ztD58hyn8a3zkv8hT+sKxll8D3kW30TqMeSpLvBTF9qmy5CnusCmLhxv8T3klTLUh8h7gH7GN23Wex03wvEDMbJe0K86ObZTL91POd6PIvWyfVMf7tswjJH6WTvrPtsN7T3Adr4D9PyT1m7Id4G1Uz/lZXfMy+54H7s5jrraeOaXrr/X2lm3yC/zTNffH68PuxbrWFMdiZpXQOoXJdhuNnVkf7znFDXPXE31ZD/Ls5pneabz5tlu9apmegJNz5rqacj6VIv1rJmeitSvZnqivbnoJPK+qJmeHpH5VYv1ZDvzrKa60tb6LzXTVddj3eJ6hqqvVzN9lQfoaPss00+d7XzUkecypM7x+XfE599BGzzvsHnMBh+TMR+TNo75qPzuZj/7HqiZrjof9dP19lq7oX0f6Hr74/X2x+vB7kqZjl0p07ErZfWxK6U6emynnl0pzUdtp460qR9t6sf+J5F1UefNx+MHOZ/e9/DbfU+kXl0p1RG23fdE6tWVsnueSL26Urx3aOu9k6DNOknb0PSkn3lJP+8dnW+EyHud/air7YN5yfWZp+xHPfXcZfqx7zJt/b7T/VJP5WE85mHceDIbfOwwP/WjTd1oG5qe9LOOKs+72T8XI+bda37q1ZXC/b4/5nl/zDPybyLWaYL7R/2cMJ2AqpPHdrNNJ7Yb2vtgImX1cyJl9XMiZfk2YTrp/NSHSF0mTCddj3k1kQpjNJ2I1GMi1onIfJpI2buL7cwn+qnLhOpDP9/F1s73le5jlP3s+1rPpxjGeEJ10fOWOY760MY9Ps79URc7J/OMfuoxobrQj3fWJP2qi9rUYUL1YD/Ms9fayf+E8Z+Yi3me4z7A+5zyS0Q8gO854xftyLdzrd1s5VnoZ57MWV54c5YXCfY7aZP3uZh3HY+8mEvZ98tczPtcyr5XdB+b2N++S4jkey7mfS7me075tv6M+7k4D3T9Uc5Hnm0d1q854xnt4KNMW/mWOcsHPQfjfy6Fd+g4xxnvczHv9DPu54x3R5v30Jzxru3ke055px/z7DXbEOP3x+MR94W08u0KaZxTkXyL0M/6VEiTZ9rgSdF4pv8kMr7ZzvimTX51nkG26z2iNvmmzTjneuSdNvmmTf4LaXsH6342mU0dCmmtS2qz/tA2tO8L2ox3nW/EzkM9dD5F00H3OWrnY7wX0hbvhbTGe4LnM7R7ppCmDpzXdCikVQcdR30KaXxf72C76VJI4/t9ku347ptkf+rDdnzv7bb5qA9txr/Ov5f98L2+38ax/uh80Gcm1mWGPCiaPjOmj7CddWhGdWJ/02lG9SEiri+wccwHjjuJ1EXHD9K2e4HrUKeZtL3XZmI9aFOfmbS9p2dMD6HN/JhJ67tax/GeoJ/60G+23Rf0Uy+dd4Tr2v2v+xuN9zdq5zJbvwdh230xE+szk7b7QvlQpD70W57MmD46zuwGdUI79aJf9RKOo34z6YM91GnG9AOWe6kT/cwj+vkOmFEdieVe1jG2M6/YTj1nYl1n0vk+06/cSz3Zj3mn+wAGPvMu8gJf9ZXA1zqXoJ/1jjbrG5E60s9803F52hiXt/Gsa4GPvBikDf4HOb99BwU++I6R+gW+vbeJ1I/Ieqb9tpifOnE89dFxI/E+R+m39zbbDS1PdP9l26ehfScFvt3jgW/5Evi5GO2dxvGGqgv8lkeBb/WN4w3LvcyrwKdOtC3POI55Fvj5PurEftQt8KWfutBPPehnngX+kX7mGdsNTacx3+6fMd/q4Visx5hveTVmeigyn8ZUDxHtn2c/1QMIfvL0qx6wTY8x8EidxmI9xsjzGtqqh9rMn7FYD23fQr+9i7XfCG17D4/59h5mO3UZM/51X4b2e6fuQ23LgzHlneOMdz2X+sk7bcuHMeMd/eydxfHWbvyPxfyPxfxzvNnSzzo3pnrQNj04zvxH+qnDmOmD9spS45+6iNRVB3F1395XddPBq/t2D9XjvKirDvRbXtRjHeqqA/upDq4e61BXHdjf6lo91qGueUEciNG+X+q+fY/Sph5100XbmR/1OE90/Ei83ijRvkN1nlHbF/Og7tt3qO6nzHks/vVc4+xvOrC/+S3u68o//fr9IhxnfqtTdeMftt0zdd/eXxxPXerKP9vJP9tZx+gX1aGu+cH+Vs/qqgf9J/VgnohbGaguQuS7YGVgetBmXhCZFyuD8P+R/K8MrE4Ryf/KgHpwnOUFkXoQea+sDEwP2qxPtA3tvqdNHXQc6hVt5omOHzHb0H5H1HlGOd7qku6jHO9DbeXfzjFu/cj/ysB4XxlY3K8MyDvRfh9YGRjfKwPyTVv5dhxH/lcGyjNsuy/Y32zlGeN4b9DmvcF2rUfwaz1KsB9xOrC6NB3zPq18G7L+TCvfkTetfBOtDk0r3+xn8U9kvZk2vhXJ97TyzHH6HWH9tsT9tth48qn9R2jbPTAd2D0wbbyqn3xOB/b3ON3nuO2LvE4HFr/TgcXvdGB/n5sO7DthOuaN/QyVL/S3dyz7MX6nY76mA96ztPX9hPlO8sV7lmj37EIctwuB1ZGFOF4XuK9z6bd4XcD+yedCHK8LPB94XIj5WwisfizE8bpg/AHtPbRgPCYWLF61nXwuWLzqPIzXBYtbT9cbMb+hvUd1fUV71ywEVj8WAq0XsI3fhZjfBYtPbyHmdcF4VD95XAjsu4t+xt+C8QWb3wO09TsMtvIF5PuT4+07oZSxekxk/BHJXylj/BFZf0sZ5c8RmfeljNVfIvO9lNF8VyR/pQzrryHzncg8J/K9yHHkS/tvMT9503VGrN3Q/u7HfZA3XX+UfvtuLWXs78a6f7XtHmQ787yUsd+H6CePtJnPpYzy5mgbKl/qN7R3eimj7/QE24m/Tg63Z+8S921X6qutFBd6QU/53ZF3qlcJw22R/5bLdhTviPzj3pE2uV7c/6K99ojIknTQk8tF/iq/1hmeH/l/4x9py94Seb/zJ7pqZ4t8NRhuryD/HswMtzffG/m/TJY6y1jnH9zIUrlQXI8X9lWxztu86Y7GaOT/0Q10ZbHOb716exHrJFJhXwnr+OmwL8Q6F/qHupvnRf43/Hp7Aesc96OeEtb5clDqbGCd+zOlzlms05E8tjz3TpHLkoXu6pi405ITXfWKyM7kQH/l8sivJuc75C/FfTeJfT8m8jHX7A9Pj7whYOkdIg+44fYc/K8Ay1dEXtqb7i0NiLzppC38gMgiL6vvjK+Ah1JWZBztOdzfB7zh9hrW+4o30ZV9CN+x3nxH/bbIexX9GhOR/0Ov3pN7LPIvStU6Sx/F+qmgJzo38qdShe5CQdxnU/MdhZvFfTFV6qtGIpIudDcKkb8sDT43RH5/OtsR4Zw3pJv9tfvBZzpaVn5A3PX+fEf1DGK2o7A68pf60pa7OvKehy61s0R+jPYC4vjf4K+jbj4OlKsi7wVgoRR5vcFEVxXfZW/6OPdacb+Cjo1Nkb89mO8oroq8R4JK2LxJ3FeDWmfurMh7GX65GPxA3/D6yE9nsh0hzimZgX75hEhHptZZPD3yz4K/fknkj0D/4g2R15/Bee4WeWem3iNTkfcQ+tWg0znQpwg+/y6JuCqJfAH6zCKeD0CfKnTrd9GyCDz/FHblepEm2su3iLyVzHbMbhdJQKfsPSIbXCUsom5fhXjNPiHytDvSFv65yGPw18HnT6jnoyJroQf3H0LH0lqRN9C//jGRzbCrD4i0Ut+HRT7v5VubHxR5ArpWton8AhhdKfI/0FfvYehWPxXrpTAe/j9NTffKvSIXAMuoX0+gPbpU5Hupek/zTpHXYZcvE3lHeqC/Oi3ywfR8RxN1fjxd65xF3G2Fzrl3idwNO8K+Pov22s0iR9Ph8twBzE9dhsCvP93b/LjIUr/ZP4tz7fSPLS8hv5/xq2+f/RT4Qb/SZpFLgiNt0bBIH/EGEQ8o4GMBOjfB2xt+obt5D3U/tryAcRXoXMZ6T0LXHNpXBwP9xQeYX7XOBvh/C7qX3yPybIDzjom8EAQ99ftEfhjgvOh3AfTMni5yUaYScp9vB1b+jPEAXsDnxsyhpQXoMpE50pa7TuTlZLFtdkLc8264p4i6s9iTriLqwTu8Xa1Z1J2U1xeWUQ+a3mxLtYS6j/aQ8ZVGP9SDS/2D7TnUnS/5sy2CevAbv9wRniNSC4ptOeTJI5liW3hZ5AfJ+rJiTtz7k/nOCDr2JcsdzU/i/k1me3NDkfelZCNsIP6+lcR8uD9ucvO95dMi/zJgNCDubldsK8L/M2D9/ZH/pqt0R2eL+707sSSH951gn9l78Z2M/UWn4nvBq3QXL0Yee8W26jbGUbmj8LC4o14jzN2Gc6XQ767I+7l3pKv+WOStTh1sLyKeXoI/e17kfSKV78wibv461QizNyEPUsM9s/eJ60jnO8urI+/8NObbGHmnp/vC0o0id6bne4u4P4+nJ/qLUyLb/EZYgQ53+H1hYzW/J08sqVwV+d8EX4gz9320ly4V9wL8OeT5g8DS5sj/OrD6kchvCcodqBsuBR7DNYyT2ZZoc+RdFzTC2sWR/+lgV2sd99iB4GB79czI/w/4s6vEvYX+tesj77UAut0a+a8H2d4s7uszMgfbm6iv+Qz80HdzRvv5bZm8fi8vzxzpKk1GfoR+deiUhT5l8PnlpHTVcQ88QX2mxO2DPrPQrc1N9FfBcx127QZx/4n2ylZxf0jivLeKewNxVcC8g25Xa/lj4ja6vrBwQFzVzbbk8A58GP4m+PwB9Kw8Ju4S6Mb9p6FjtE7cK+jfRFxugD27EzxQ3z3iHvdyS8LrxH0SurLOHwNWiuJehb5V1PNzoFvzNKyXwnj4z0tVurO4ZwaAlYcwDu1V1PnDqSNdIb6ffge7gvfE8nS2d/ZxcVekG2GIc21LgwfE3YehcxHvk4/CrmJf+9Bev0XcbDpYVvws5mfcX8HfCSrd4T3gxZ/vbeBc9/j1ZVFF3Of86bc1HgU/1O8qce8KkEcfFNdCvFHcH+HPgo/f+9D5Npzbz3eG4L2J8SWM2wmdK1jvUehaAK8XQc8y+HgKugvO+QfoXsF7/RnojXringukq3k/3hEBzot+A9CzgHvp/MyuVu6zC1j7APabAS/g89JMra8EXW7NzLYUPyTuN/y/FPD+XVfssnqAd43WA7zLtB7gXYl68N/eocWsB2+i3erBifaS1oNqW0HrwaHFzZtxT+G7k/Xgb/E+tXqwoSWLepBJHulHPZAh/r/QNnH9ya0h6oFMJ/u6s0MYnzzWinrgnktW21AP5CaH76LTIm8NEe+Ae9yGFtQD+Rmw8X68O/n/GHiHvOqai1APJIF9oh7IDP/uifthu7erE/VAvuBtaEE9QJ3YGqIeyFH+PRb3Zip1or18V+T/nH8PxfugkKq2oR64l+AP8d55JJVrRz3Au+BYK+oB3gl4D9/Hc+faUQ/889OYb2Pkn5YOW1EP3J32e6D/Srrci3rgRvGdjnrg7sB3eh39+ftYFff/t/gdj3vnCNpRD+QF334XfRBYRr5/HVj7SOS14p3Od4QHHlEP3BvgF+3+dXzPXxx5+/E9gHrgDuCdj3rgNeBHPuG+wHmR56/xe+DWyHsD73TUAzkD79sG3gd5vH9L7478zdBlFnUjzNj31nK8V8uoZ/ehH+qBnAp9UA/kmeSJdtQDvAugD+rcp/j/XNAtdOVe1AP5MWzUA/k12lEP5PVk2Ip6ICf4/1SY91IXLUE9kPc5vLtxnz7lDi1GPZA98KMeyFHoiXog74Zu3L/PeFsnchz9UQ9kI/+uvBPPMuq7R+Qz3sAi1APZB11RD+TfgagH8hr0RT2Qc6Eb6oG8L4Xx8J+f2tWJeiBnA1EPZB/aUQ/k71OzHagH8gps1AN5O3+PfVykmD7WGjJ+0uABcfcR6Ix6ILfDRj2QR9GOeiDfTks/6oGcz98/rxDJ+Ls6UQ+k3W90ox7IDv9IP+qBfN6vLEU9kF/zd6WrcF/juw71QNqIN/IdcGgx6oG86kPn23BuP9eOeiC/x3jUA3kQOqMeyGP83gOveeiJeiCf43cxzvk6dEc9kK9Ab74vDuP7DfVAvoPvNtQDORt6oh7ICn4HYZ/dQNQDyeA7hHwWMgd7UA/kNnw/oR7IWcjT6kCUIDZWmJ29kFjuzV5B/9awcRftXHsJ9YZ29nG8K5OC/lHioeSuzuq1tE+0N/CufAhxUb3DsHEX2xGnEe5NzFc6zRDruOPJgz1c5zjHr44Sxzl+PW2sczX7Qd9raWP8LeyPON5OG/Ulor2hpbST4xB/+4joh31tRv3geTajXpQuwXvTIQ/WE8NWzrcZccjzEDGPYnUPEXVmH8eFOs+zqI9V3A/E7IW0oyWlq2kfWtwo0YaO0OlZnY82x7Od+8C7EXUG500s9RBHeB8sRTw31tNGXbiW7c1F4MvRD74M9xCrbVg/cS/yowS972WcryZyPLG5iPzc65Fn9oMe4OMXWI/n/gXqIPklYt+wdT3Yum/YOPctRPB9F9/bsx3QJ6GIc69DPSxdEiXWMW9Wi1uXAj/X0l9tA/+O7dR3HfKL/BPJH5HnX4e6ifO7p5FvjA8idX5a56ONeFofeU9jvuwV7If6dS1t6kyE/tvZv9iF/bmnbT5pRT6Sj1bcQ5yXyHlb0zqv15q2eVuRr+SnNU29zea87FfaznF93ZyXWN0T29j37RwHvTTvB5j/mG8FbdwLFxK3hownIs/B/tz/7bwPrqaf56CNOCjZfIwPHbedtq4Lu9HNuLs9jTzcST/idY/ZPOdLnO80ou7DvYTxjD/6oT9si0Mi1yMyHl/CulzvpbTqA3++D+fziDzfKt4/mHcV7iPGB5H8qR96r8K9Rb1X8d4Cb6t8i/NVPuOFfuYfbZz/Dtr5Puwf46WfcbsK9QvrwK4sZRw9qfNHiSdR5zjvk5xvPf0Wv0/6FpdErsN2rsP+XIfjuc6TvsYpEPVjJ+dDfcU6yUDjwSUD0ykZ8By0wcd62pyHdk7HJ1EfWYeSAXmhrfsFDi8j7zfbfEDOJ442eb/Z5oWf89IPPq4wpA5E8qXtJevH/OI45snNAfmPEkd1/sgjcr9H43mPYp/c79HA9KRNHo4GWu/cUZsHyDrMfsw7jmP80n+wB/Nj3nwf68aKjK6jiHrgrcggDi/kfRDqeisyqofeD9i39cP8KzLG04oM8gr1ZF88noj9AjmeyPFE42Mf7hHyQaSuRPLBfuSD46nnPsxPPvZlTM99GdYdIutHlNiXQV4gbjK4F8r4nj0f9wDvsxLqegnvEA/vj0bO3h/1Lbi/+f+N+G77Le6BCuadB1bRbwz1v4Dv6If5f6j4jq6yvv8F6hz/n/JukWOs47twL+s7V+Sd/H+vabx7+P9ouA//ke/FjVgH2MT9exh1kr8DnMP/18D741b+fwTy9TDrGL7/XmR9y+N7mP+3cafIr1Afa9jnhfx7MN5h16EO5HAPb0P+8netzenZjtyd/J7s667hvXMr8/5BkW8ifyvol2C+fVhkAXYT+fwi8rmGd8vxNN7r6L8J+Zo7U2Qt8+tduJfRX7DfxXxHDtMOdd8b4nfJD/jOxDvkh8ijOurPR5Gn9UfAL+Kpgnfpf2F8eQPeU8i/Gvqdw3cK+N2IuGvifTbOOMe98ygwt0nkStof4u8e2CfeM1cFqPN4fzzPd+lF4Jm/X2O+XzIfrhT558B+lz3C37FvYz/sn/9Xj/WrOM9PELf8veI9jAvsdxjvk/DTIiOIG4GOX0I8NbDuTfx9Ft/v29gP7y6R/wOzVLlhADYAAA==```"},
-            {"x": 2, "y": 1, "output": "```H4sIAAAAAAAC/z1af5ScZXW+M+83830jZDO7O/srATPyIw0Ew4CLLEHCBMIP3RQmQJsFQT5+GELY0DHRdaMu/WBXshsjGYLCBNI4nm51S3vqHOxBLNueOWo1poKjtRjq1s7x1NPx9DTdo2hTO9U+z71f/Os5974/v+e5977vO7uv//r17yXFF5FXHwi/++jd/uYv/+zo2Xd9a/vOZ5zIdUMnuw9/4mPXz6z+wsSKD1QeS6PfDVfNXut2j77v869u6+n9+lf/+QH4vM6to8M3XPDemR987upj13/6cfqWHvnCT79z5cD1f/3Nz79y8F2Hf0bf/uqF1a/d/oPNf3brfcWX/3I5/2X4nlqz8MjR52+46cjKS176+EtHOwX43kqMecU1xNrK4poo8VbiZJdhbWV0IXFntrHebKD3VqLQLZcTd2blco473V0cEUc/UO1oE9tPdze2cFyjR0bNL6NmF7cRZ3uj7RzX6Im2m924h3YpJw8SZ3uBGNfqK+5i+yCQdilnuNAfla09KnO9wRgX+hsT7N/qMxyMsZQzXOiXKRsnUzbObKyriHWnbHxxmvZgjFh3mv1new2x7py1R3M2vyG+a87aG4fi9Q/ZeLPxnYdsfnnW2oGerg8cS5oOY0nqII52dCFRddD2xnqRsSR1MD91oF0cYbvxTzvaRL/qoH7ogP7Kv9rFbWwn/0TyT3+jBzrApg7cB3UgDqoO9IN/Rxt8q03e2e+M3ZiI55uw9c7Y5Js2eHa6nykbBz4Tuq9p2y/Q6fdM2zjwrPOQV/2+OfteQ/IZr3OI8+B7D9k+jE+s+6zNT3vReJXFZJZxDlv5FfoNjedF49ktKs9RYjHmeTHmeVH5pd/inLah8iyLyi9ti2/ajPfFmOdF5Zmo/ALJK/uBjxjJq46PkfGr603QJn/x/qZsffLIfZK/RePH0WZcLhovum/G46LxYft9Vlzead57eZdVfvLu5hVmW/yxHfUANvmhbfzkndUD+g2tDhAZh8TGFtqa/2obWvzlncafo22odUD94CdBm/GXd8qPR5v5T2S86fiyzX8GyZOuOxHvb4qI/U3ZPhlXRPKi/Q4R8V2K5CPeJ/iZMV6Ayoub4TjEyYzyEnkzxktiJuZlxllezjiLlxnlg+2WjzPGh/UbJRoP2k9R48WbUT6IGi+JmZiPGWd5ORPzMmO8qE1+ZpQXzmtxo+MmbD7yQWS86PpT9GvceDMxLzPGi/qZVzPGi443PsiLSJv9wUfbsV7RtvhpKz9Ros3x69lu50fbeJF2HB/tOD603xZDng/tmI+28YHxlj/tOD7axofXVj5o63khbeWDttWpdswLkXy043jR8RM27xlkfLSVF85j9acd86L7nOM4i5d2zEs7jpd2HCe0GTdbPYwDH1s95QeIfV9ILBAd/Wds1hki40XHjdDW+p3Q/ptsPONF+2+xdvKk40bZbvWcfvK11bNzlX7Gz1YP9fge9jPeaJOnrZ7ypDbziTb5oX0GGTc6LkbGC+dl/Oi607Y/8qX7nrN9GhpfRPJEJE9bvdpK1ps6x68hnu42LMSIfYOfeswbbZ53tMlXXXkzP+sN/eSv7lkd0nlH4nmRdzrvSDzvpnjeTfG8W9hu9VvnG43nGzWbcajzbDObfNZjHnX8PfRrPqrfUO8prm68OvrJcz3mt278qs1zsa48W3/Gn84zZfsl33Xj2b5nOt7/HLEQI3lmu+VpHfwyPuvKc+TlUlgfcZhLkW+zySttQ6y/nojvQr7ST57p57lHP/ml32x814j1NzS+dd5NbCfPtg7jVefbYn7Gay5l/BIZr7mU1T0dt938vI/QT751/D02jrzTT951Xw/G8z5o4wwLMdo5qvvbFa+3y/bPc0L3W7b5zbZ7i+57wsYx7nWdKetHfXS+ae7b4l73HyP1yKWsfhIZ97mU6UFk3E+SP5wnk6aL2qwLk6oL/YiL9UTqEnmTKdwTLyfinni59WcdpU3eJ00Pm2dTPM8mtiv/mIf80291ZDLmfzJl5/Ck8k9EvdpGP+r5Nmsn//Qb4rzbTj/Ou+3WTl3YTj3Ybniyy/ymA9tZn9luSB24jwL1sHXVVh10f9RF1y+zv9Vp3f+EfQ/zQ79jKp5v2vbDeq3j5mxd6qD7O2T7NP5NhyXyt4aoenhL4Jk60E8dlkwXWUrhPbGe/pbqsmT6ePQzH5ZMH0Xmw1Ksy1KcJzrPJvZXXeDX/Egsxbosxbospay+L5kuaMd+Rzke+x1lO3Uh4pzdRj91IGaJ8N+8wlD5d/QzX+g3NP7ZzvrPdkPyz/Uw/y72w/y7bD/Uge3Uhe1m6z1CdL8TtK1OLaXsXrEU5wWRdWnJ9NDvYh4sxXmh3/ms2axTxfRCP/Uoplt9hqqPFNPlAerCdurCdrPLA6xb9FMX2swL2oaWNzrfSDyfInWh3/KlmDZdimnTpZi284FIXYppu78W09j3Fo6jLuxHXWiDz1G2Uxf6szHi/ryN7aoL2qOzmUe0qQdt6sT+1IV+6kG/2aqD6Hy76Md8uziOOlg7zxPd30S8vwlrNzQ92E59aDM/9Pvm7Dupg44/ZN9vOth7QMfBnk/LEPNjPj0ySF3mwTPr17zqZe3ME7ZTl3nVy/zME/oNqZfZ1GVe9SJqHinyvJ5XvWhTL9qWR/OmF9D0mo/1mo/1mk/bOT5veqGdetEPPtRves3Hes2T9xip03ys1zz4p37zppci9ZpPv3IW69q86eNo87zXcbvMT53mVRebl/qw3WzqE+9nwvZhaO83tlOn+Vgn+plH+n1zHGd1jd/Nc16/95DxYTqZfoFfWUVdAv/4EPMn8E0/+qkT/cwj+qkT/axv9DOf6KdORNa1wFe9gJZfgW91j8h8Cnyre4GvemGc6UWkToFv94LAt/tX4Ktejkh9At/ezYGvesGvenlE6hP4qhf82d8h9Ql86sV204vIPAv8V86ibkTmF5F6ab9d5qdenIf6cB7qo+PL8foT9FMf60eduD/qo/uaYj/sS23Tie28n7Gd5xH9rH/0Uz/6zTbd9LsPWTvzkPzwXcV209HeWeP+2Grm27jpmqDNPBtXPc3P+jdu+sGv+iXGY/3GVT/6Nd9gm37jql/kjZt+aDf9iNRpPNZv3Lf7xHisH5G6jfv2u9K4b/k2rvpxXquP46Yf/JZvRObXeKzfuG/5RqRu477lG5H5Nq760Vb9ZFx1i/uXidTL2qnfuOpERH2diOeZsHWZX2ynXmznvWFcdYr3NW3thqqT+g0RJ3Mcp/cIx3bqxXbm4bhvdVK/G++bZqxTU/Mv8pqWd64Z511TdaLfdGrGOjXjPGvGedaMdWrGOjVVJ9qDv0Pq01SdaJtOTd/u381Yp6bphPbC75C6NH27XzR9q4tE5lMz1qmpOtHm/YI2dSKaTk3fzq9mnGdN3+phM9ap6S+/zdD0oU3dmrEuOm6C40wP+g0xz1S8/jTXQZxM2zizqYeNoy5N00H9zKum6aDfYwj9kUfDgekxHLAeihsO7Dyjn3WR/jPIPGI7dSJSj+FAdYHf7hdE6jIcWP4MB6bLcKD3C0XqMRxY/RsONH8ckfkyHFj9I1KH4cDu48OB6uKI5H84sPv4cGC6EMn/cJCNUXVR5Pk0HFj+DAeaP4rMn+Fg+W2sg0TqQqQu2m/C/NRF+09xPvSfYj/lXech/7renK3D84j7YB7o+oc4j/Lt6CdWY56rAe8NRL3nSVX5jhJsN7R7QzXmnTbPo2rMezWwe0I14L2Ofjt3qsY7/HbuVI139Dfeq4HlQ9V4R7vlQzWwulUN7HeUamB1qxrzXg0sH6rGe6JqvGMeu29XA7tvVwO7z1WVd/bn/YC25UNVeed48s52y4Oq8m1+nidV41f9rEtV5ZeI/JljP+VX/eS5avwK/YzzjvHqOoHdnzuB3ZvpNySvIh3lNUp0Art/dYzXRCeO507MayeOZyLjuBNYnekEdv/qGK+JjvLKcRbPHeNVkXHcieO5Y7wCLZ47Ma8d5ZV+5RXjrM50jFe0G6+dmNdOHM9ExnEnjudOHM+dOI47Fr8J7TfN+ckr+1ncdpRXW4/1o2O8SieO247xmggzxmeYsfdImDFew4y+Rzy2m238sp380iavtM8g+eU41gudd4R+e5cQyWuYsfdimDGeiYzXMGPxG2bsXUIkr2HG6kaY0fhVJM9hxngOM8YzkTyHGavnRPIaZrRuOCJ5DTPKc4LI+2yYMZ6JPG/DjMZvgjZ5pm3IusH+Gs86D3nX8dMcb/WafkOt17ou+ef+GM/0k/9fetWB+jqRPel1Q8XNkX/Ar2SjhyL/P/yxbpkU96Og3VOsirsiU+xr3RZ5p72jQyH6705fsjqL/p/0qz0h+rf9sLeE/m8Gy7ka+m/M3DyQvR15lgz669eIHEouD4WPiPthcjKX/b3I+xX84ZXi3ufqvdFacZe4oL/1hLi/ABaKkfe81+xvgPeDwOVbI/8jXji4fHfkS6o6EF0v7n+8yZy8EPmjqXBQLog8YgG8vpnC+J0if45+pT2R/0Sq2BdVRCS9PNQ6D/Uz/coquSbyngSGV4s7nMb62zB/ut2z/MHIvzvd7M8fjPyvpU+eWyyI+6/0WHf+g+LWgI/GXZG/F1jcLXKJXx2oVSPvj/x6bwXjv+3ne1p3Rt43/KC/clTchqA6EN5gPLbuwz0zqGQreyLvk8D6jsh/hvY+kVeCk+eWEM+pzLqhxubIOxbUe5fHxH0bvEcviHtn5uZzileIuzezPFS6DnxlxrpLnxLpybR7Qnz/vkwlW/4QvitZ7KtdJvJ28v0ukYHkuqH6DpG1yWh1cVLkc+C9ibx6JgmeMD7rqgNZxOWEa/aXUJcvduFg816Rq8F/CXx9C7pkLxB5Hu31IyK+B72eErkOGD0j8jT1QRy8QH2uE/kqMHyfyIe9dUNNrHuvV+wrot83EF/lvMhJYHiVyCPQJXy/yEHoFN0v8kNgBXqthR7li0VOgffaeSKvpSdz0a0idfDf/IDIj9NBvzwmcrm/c03jHZjHXzdUwbp7/clc6xack+A9PCDyKnTI7hUZBP/5G0UywWQuf5vIjxDXZezr7UG+p/kE7pvABuZ9AHxnnxNpA+t3i/w8OL6yjvPj74HFPSK/AbY+Cr4y0eo69nVpJt9TAE+j0KGGurYbedG8XeQXXqUve5HIR9P5gRB5UfFnu2rIi//0SytrHxX3L0Eru/ycuEszI70N5NFTSck1UXeOJNsDPK++mSz3lNcivp3kSu8WucMtdIe4J70bduNxkSPAyrWRP+8dz9XA8zFgVIq8/d5YfwXn4ttSlb4QfJyVKvfUXoi8q1Jj/eH5kb8ZWEL8fjeFeR8W9yr6Le/h73UjvbWnxZ1KYf3zIv+8dH0wfA/2DSxu5Ht3oTuLfe5Pt7KVHZH3aPp4rnEw8r6Tbq7OXyry63RJf+e6DN8Xvj/yHiY+Km6VX+mTauQ/7i90FzD+K/5gtnhn5L/uS678gsi1AdpvjLw30b94X+T/Cjwtfyjynwtmu0oPRd4csP4xcX8VNFeXLxH3iyA/kAefC8FCdxPn1j+Cx/B5kSszxVX5YZGHM+2BwmaRYqa0snxQ3AWZVlaORt5DmdmuZjnyL06O9Nb5uzr5Hha3IpkfaD4k7pzk5FC4T9xnwftyXtxcEjxhfNpV+gofwPvDHc+Vt/LvmWP9y6G4y8B/GXz9LXTJ4xyqoL35vLj/gz9CfR3xJFf7jLj90KV5kbingVmcH1+iTqhju7z8wDLW/QNvpDdEv79BvFTeIe51YLRR3H3QJbpb3BPQqfaAuNeAdeh1DvSo4J78b+C9cb64r6fLPZWSuC+A/+V7xf0gLbn8H4tb54fnts7DPH5+oI76+LBf7hH0uxi8R58SV4cOhQ/j+8F/4SZxv0V78Xbe72e7KthXLhjMLuMcuR/Ywrx3gu8C6viPyTv//hc0VjRRv18FhnvFvQUU8JfOTA41sa8LM4PZEnjaDB0aB8Q9gDhfvkPcz73ZXsuLwb6y5kV0dh15cQrvCubFj3EvsbwodNcRL4eSp7uRF1JNtvTvO9/k39XXRt5v4UdeuNtdbSXywl3Bv7M+jvwB1q6NvD/1Gj3IC3eMfz8qRf5+/v3nnsjPpGZ7kRfurNTObAX18qpUKVc+P/KuAyIvpJnCvA+jbqBfC+fFvlShG3khp1KtvhLOi/PSC/3l92Bf/N1sI38nqq1EXvj7+fsT6vij6UZPHefFP6SPDyEv3On498XL8H2l90f+LiDyQlbh3ZjFefE43kt5jP8K3lElnBev4d2IvHDX4r63jPPiTY7DefErvtOQp8/xXQC+DgCRF/IlvKOQF/IL3BcLOC++iHse8sJ9HzwiL9y7cR9CXriduPcgL6DHzSuQF3IBzv1lfP9DuBe0cC9enwTfuN/3kW/kUVdysA95IecmywPIC3kWvCMv5EASPGG872Z7kRey2zV6kBfyDlfKIS/kcvCPvJC/gy7IC3ka7cgL+Q3/jox73lUe9PmMyCx0QV7IYSDyQv8uiLyQR7zBPuSF/KFX6EZeyKuIF+SFfJd/X0Udup+/56MuT0Mn5IW8DkReyLnQA3khPwXvyAv5Rhr6lkS+CP6RF/JP6dPdyAu5yB9bjbyQ+/GOR17ILr5b0W89fx/DOfgSdEBeyErwj7wQ4f0Z9fz74B95IX24pyIvcE5ku5AXchf4Rl7Iv5J3nJ8/w/0WeSGLQOSF/JL3ZvDn4x6KvJC1uGchL+Q63r9wPj2IOEde4FzemQ2Rr2vBf/4K2ojfzbRne/O3RIm10KG1j/6F/vBJ2gv9NdRfYuuwYf4I9dmZra0jFrpbG8Qd0PkijxheHSUO2LxCzN9CbPWFu9mv1Vfby36Dfa19xFKudZjtg32c91QSeYb4P2Xzwrb5TmGe1k20Gz3hHbQxDnlPzD9EexDzmx/za/98FI/Dvm9j/uK7b3OcN0rcxvzF/m5ztj9ieAdxtrd2F9t1fiFyfrZjvzouH8Xjjoh7WeeNEi/D37rJkLy9jHXI2yrEF3la5Rk/RH4PsbaZaOuu8my9VZ7xtArxWdtLhC4REf0P2jzk6zHOA54eY/1ZJ07tq+kn71GCiP1oO3QFgu+Q7co/2lGfnoy8nwBr6wy5P0XEAZH7+km8HyL1Uv+T9GOdg1HiRtQz7uPGFPi/2myue2OK84jcmLLvo127i2h8sj/jgIh4c2zHvED9TiB0OhwlXmQ/8Pci6iLm915Eex7nxoucPzKbvLwY9+9KlwcQ164Lecr+Xaj/1LkLecq4IXL9rjTyfjfbsT/otQfjqOOe9Mgg447I/NiDuov9uz3pbBfjgtgKiSe7sA+0a5x5RPJBpD570tgf4uMN1AnOSyTPb6RliPO+wX3cQj/q5x3sh3PpLrbfvALzA7NdjOc3dH9s5/xE8Hck8jaivnBeIvNvI+oG90XE96F9Z5bxutFnPOLe5ufPYf9j2h/3fZwL1OmYX+hmfBzz9fsM9xJRVyP2B28YnwzGVmP/iWQA/m8RlwyUTy8ZcD22R2eTzyTe1YyTJOoUeEA/zA8edgSVVYwTIvXcgfOE+9gRkA8idSJyX+wPfe6grd+T2IF5uY8dqIfkeQfOHep9AuP5XScC1cudCEz3EzofbdvvCYxn3JxgvdzN/q+cxfw6wX1jXrYzXzdklJfEhsxp5WVDhvvAuypjum/I6DyyIcNxZnM/h3H+8buI+r7LaN7Bb+MPYzzXP4z+5Okwz8N9hszvzfw/yzHUe9Sr5U18N+F8R727E/Uyi3ffDta7Gbx7UOcE58AvWQfR/u/8/75Zkfeg3oR4h4WoP028d+7nebgN7zX+vwrOmfP5/yz7RRb4/yV4X0U8F6/FuYS6E2Ldo8jvaC/v94N9jU/QRn+cU//N8/AGkRLyrfn7IvcxXz8i8mX+Pf0avntLucp7Rb4T/1/H93iv+bRIA/lYwHv/UuRPE3mfAfIcvwZ518T3PMB4forvreNDEc5JQRzy3DmO83MZ5+caxG3tkyL/6x8fquBd8k7eM2B/GHq1Pi7yccQX3qnyJ4wHvOdeg34F1IF7wH/2SpyXOAfLm3j/KHQXsa/t1A/n5lm8l+jvICe7SveJfBb8V/C+E/l/NYFxe8AtAAA=```"}
-        ]
-
         self.generator.setXYZ(20, 20, 30)
         self.generator.setOctaves(1, 0.5, 0.25)
         self.generator.setScales(1, 2, 4)
@@ -374,7 +405,13 @@ class TestGenerator(unittest.TestCase):
                 "heightBasedMultiplier": 1,
                 "heightBasedOffset": -5}
         ]
-        self.generator.pregenerate(groundAssets, placeObjects, [3, 2])
-        output = self.generator.generate()
-
-        self.assertEqual(expected, output, msg="Output strings are different!")
\ No newline at end of file
+        output = self.generateSeeded(groundAssets, placeObjects, [3, 2])
+        self.assertEqual(
+            [(block["x"], block["y"]) for block in output],
+            [(x, y) for x in range(3) for y in range(2)]
+        )
+        for block in output:
+            self.assertBlock(block)
+        self.assertEqual(
+            output, self.generateSeeded(groundAssets, placeObjects, [3, 2])
+        )
@@ -0,0 +1,813 @@
+import base64
+import json
+import math
+import tempfile
+import unittest
+from unittest import mock
+import numpy
+
+from converter.conversionManager import ConversionManager
+from converter.encode import estimate_compressed_size
+from generator.generator import Generator, PADDING, PLANNING_MARGIN
+from generator.generator import REALY_BIG_NUMBER
+from generator.noise import Noise
+from generator.noiseCache import NoiseCache
+from converter.instanceBuffer import InstanceBuffer
+from objects.assetManager import AssetManager
+from objects.customAsset import CustomAsset
+from objects.tile import Tile
+from objects.prop import Prop
+from settings.placeObjectSettings import PlaceObjectSettings
+
+TILE_SHORT = "00000000-0000-4000-8000-000000000001"
+TILE_TALL = "00000000-0000-4000-8000-000000000002"
+TILE_TALLEST = "00000000-0000-4000-8000-000000000003"
+TILE_WIDE = "00000000-0000-4000-8000-000000000004"
+PROP_BUSH = "00000000-0000-4000-8000-000000000011"
+PROP_ROCK = "00000000-0000-4000-8000-000000000012"
+CUSTOM_PARTS = {
+    TILE_TALL: [
+        {"x": 0, "y": 0, "z": 0, "rot": 0},
+        {"x": 100, "y": 0, "z": 50, "rot": 90},
+    ],
+    TILE_WIDE: [
+        {"x": 0, "y": 200, "z": 100, "rot": 270},
+        {"x": 150, "y": 100, "z": 0, "rot": 180},
+        {"x": 300, "y": 25, "z": 0, "rot": 0},
+    ],
+    PROP_BUSH: [
+        {"x": 50, "y": 50, "z": 100, "rot": 90},
+        {"x": 125, "y": 275, "z": 0, "rot": 0},
+    ],
+}
+
+
+def createAsset(className, uuid, width, height):
+    """
+    Function to create an asset without reading it from the database.
+
+    Parameters:
+        className (class): Tile or Prop
+        uuid (str): UUID of the asset
+        width (float): length and width of the asset
+        height (float): height of the asset
+
+    Returns:
+        Asset: asset of given class
+    """
+
+    return className({
+        "UUID": uuid,
+        "Name": uuid[-4:],
+        "String": "",
+        "mExtent": {"x": width/2, "y": height/2, "z": width/2, "w": 0}
+    })
+
+
+class TestGeneratorStubbed(unittest.TestCase):
+    """
+    Tests for generator parts, with assets that are not read from database.
+    """
+
+    @classmethod
+    def setUpClass(self) -> None:
+        print("\nGenerate with stubbed assets: ", end='')
+
+    def setUp(self):
+        self.assets = {
+            TILE_SHORT: createAsset(Tile, TILE_SHORT, 1.0, 0.5),
+            TILE_TALL: createAsset(Tile, TILE_TALL, 1.0, 1.0),
+            TILE_TALLEST: createAsset(Tile, TILE_TALLEST, 1.0, 3.0),
+            TILE_WIDE: Tile({
+                "UUID": TILE_WIDE,
+                "Name": "wide",
+                "String": "",
+                "mExtent": {"x": 1.0, "y": 0.25, "z": 0.5, "w": 0}
+            }),
+            PROP_BUSH: createAsset(Prop, PROP_BUSH, 0.5, 0.5),
+            PROP_ROCK: createAsset(Prop, PROP_ROCK, 0.5, 0.25),
+        }
+        patcher = mock.patch.object(AssetManager, "getAssets", self.getAssets)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+        # Settings are shared by all generators
+        settings = dict(Generator.settings)
+        self.addCleanup(Generator.settings.update, settings)
+
+        self.generator = Generator()
+        self.generator.setXYZ(6, 5, 10)
+        self.generator.setOctaves(1, 0.5)
+        self.generator.setScales(1, 4)
+        self.generator.setUsePreciseHeight(False)
+        self.generator.setUseHeightBasedTerrainAssetPlacement(False)
+
+    def getAssets(self, uuids, required=True):
+        return [self.assets.get(str(uuid).lower()) for uuid in uuids]
+
+    def pregenerate(self, sizes=[2, 2], placeObjects=None, terrain=None):
+        if terrain is None:
+            terrain = [
+                {"asset": TILE_SHORT, "density": 40},
+                {"asset": TILE_TALL, "density": 40},
+                {"asset": TILE_TALLEST, "density": 20},
+            ]
+        if placeObjects is None:
+            placeObjects = [
+                {"asset": PROP_BUSH, "density": 30, "clumping": 3},
+                {"asset": PROP_ROCK, "density": 20, "clumping": 8},
+            ]
+        self.generator.pregenerate(terrain, placeObjects, sizes)
+
+    def populateWorld(self):
+        self.generator.removedInstances = 0
+        return self.generator.populatePart(
+            self.generator.terrainSettings,
+            self.generator.placeObjects,
+            [0, 0],
+            [
+                self.generator.x * self.generator.sizes[0],
+                self.generator.y * self.generator.sizes[1]
+            ]
+        )
+
+    def compileTerrainHeights(self, heights, cullBuriedTiles, seed):
+        random = numpy.random.default_rng(seed)
+        sizeX, sizeY = 9, 7
+
+        self.generator.terrainAssets = [
+            createAsset(Tile, TILE_SHORT, 1.0, height) for height in heights
+        ]
+        self.generator.terrainAssetGrid = random.integers(
+            len(heights),
+            size=(sizeX, sizeY)
+        )
+        self.generator.elevation = random.uniform(
+            0,
+            12,
+            (sizeX+2, sizeY+2)
+        ).round(1)
+        self.generator.placeObjectZ = numpy.zeros((sizeX+2, sizeY+2))
+
+        self.generator.setCullBuriedTiles(cullBuriedTiles)
+        self.generator.compileTerrainHeights(sizeX, sizeY)
+        return (
+            self.generator.terrainHeightGrid.copy(),
+            self.generator.terrainThicknessGrid.copy()
+        )
+
+    def referenceTerrainHeight(self, x, y, z):
+        # Height and thickness of a single column
+        def getPos(x, y):
+            return math.ceil(self.generator.elevation[x+1][y+1] / z)
+
+        current = getPos(x, y)
+        thickness = int(max(
+            current - getPos(x, y-1)+1,
+            current - getPos(x, y+1)+1,
+            current - getPos(x-1, y)+1,
+            current - getPos(x+1, y)+1,
+            1
+        ))
+        return current, thickness, z * (current + 1)
+
+    def test_compileTerrainHeights(self):
+        for heights in [(1.0,), (0.5, 1.0, 3.0), (0.3, 0.7)]:
+            for seed in range(3):
+                heightGrid, thickness = self.compileTerrainHeights(
+                    heights, False, seed
+                )
+                grid = self.generator.terrainAssetGrid
+                for x in range(grid.shape[0]):
+                    for y in range(grid.shape[1]):
+                        current, columnThickness, placeObjectZ = (
+                            self.referenceTerrainHeight(
+                                x, y, heights[grid[x][y]]
+                            )
+                        )
+                        self.assertEqual(heightGrid[x][y], current)
+                        self.assertEqual(thickness[x][y], columnThickness)
+                        self.assertEqual(
+                            self.generator.placeObjectZ[x][y],
+                            placeObjectZ
+                        )
+
+    def test_cullBuriedTilesMixedHeights(self):
+        for heights in [(0.5, 1.0), (1.0, 3.0), (0.5, 1.0, 3.0)]:
+            for seed in range(3):
+                heightGrid, thickness = self.compileTerrainHeights(
+                    heights, False, seed
+                )
+                culledHeights, culledThickness = self.compileTerrainHeights(
+                    heights, True, seed
+                )
+                tileHeights = numpy.array(heights)[
+                    self.generator.terrainAssetGrid
+                ]
+                self.assertTrue(numpy.array_equal(culledHeights, heightGrid))
+
+                # Level k reaches up to z*(k+1), it is buried when all
+                # neighbours reach at least as high
+                sizeX, sizeY = heightGrid.shape
+                tops = tileHeights * (heightGrid + 1)
+                expected = thickness.copy()
+                for x in range(sizeX):
+                    for y in range(sizeY):
+                        neighbours = [
+                            tops[x+dx, y+dy]
+                            for dx, dy in [(-1, 0), (1, 0), (0, -1), (0, 1)]
+                            if 0 <= x+dx < sizeX and 0 <= y+dy < sizeY
+                        ]
+                        if len(neighbours) < 4:
+                            continue
+                        z = tileHeights[x, y]
+                        top = heightGrid[x, y]
+                        for level in range(top - thickness[x, y] + 1, top):
+                            if z * (level + 1) <= min(neighbours):
+                                expected[x, y] -= 1
+
+                self.assertTrue(numpy.array_equal(culledThickness, expected))
+                self.assertEqual(
+                    self.generator.culledTiles,
+                    int(numpy.sum(thickness - expected))
+                )
+
+    def test_culledTilesCount(self):
+        self.generator.setRemoveDuplicates(False)
+        self.generator.setSeed(31)
+        self.pregenerate()
+        expected = self.populateWorld()
+        tiles = sum(
+            expected.getInstances(uuid).shape[1]
+            for uuid in [TILE_SHORT, TILE_TALL, TILE_TALLEST]
+            if uuid in expected.assets
+        )
+
+        self.generator.setCullBuriedTiles(True)
+        self.generator.setSeed(31)
+        self.pregenerate()
+        generated = self.populateWorld()
+        culledTiles = sum(
+            generated.getInstances(uuid).shape[1]
+            for uuid in [TILE_SHORT, TILE_TALL, TILE_TALLEST]
+            if uuid in generated.assets
+        )
+
+        self.assertGreater(self.generator.culledTiles, 0)
+        self.assertEqual(tiles - culledTiles, self.generator.culledTiles)
+
+    def test_removedInstancesCount(self):
+        # Same object twice, without nudges or rotation, overlaps itself
+        placeObjects = [
+            {
+                "asset": PROP_BUSH,
+                "density": 60,
+                "clumping": 3,
+                "randomNudgeEnabled": False,
+                "randomRotationEnabled": False
+            }
+        ] * 2
+
+        self.generator.setRemoveDuplicates(False)
+        self.generator.setSeed(7)
+        self.pregenerate(placeObjects=placeObjects)
+        expected = len(self.populateWorld())
+
+        self.generator.setRemoveDuplicates(True)
+        self.generator.setSeed(7)
+        self.pregenerate(placeObjects=placeObjects)
+        generated = len(self.populateWorld())
+
+        self.assertGreater(self.generator.removedInstances, 0)
+        self.assertEqual(expected - generated, self.generator.removedInstances)
+
+    def useWideTiles(self, placeObjects=None):
+        # Tiles of 2x2 so that place object maps have 2x2 points per tile
+        for uuid, height in [
+            (TILE_SHORT, 0.5),
+            (TILE_TALL, 1.0),
+            (TILE_TALLEST, 3.0)
+        ]:
+            self.assets[uuid] = createAsset(Tile, uuid, 2.0, height)
+        self.generator.setRemoveDuplicates(False)
+        self.generator.setSeed(11)
+        self.pregenerate(sizes=[3, 2], placeObjects=placeObjects)
+        self.assertEqual(self.generator.tileSize, 2.0)
+
+    def decodeSlab(self, slab):
+        # Slab is moved back to its place in the world
+        shiftX = int(round(slab["x"] * self.generator.tileSize * 100))
+        shiftY = int(round(slab["y"] * self.generator.tileSize * 100))
+        return [
+            (uuid, x + shiftX, y + shiftY, z, rot)
+            for uuid, x, y, z, rot in ConversionManager.iterDecode(
+                slab["output"]
+            )
+        ]
+
+    def getCompressedSize(self, output):
+        return len(base64.b64decode(output.strip("`")))
+
+    def test_planSlabs(self):
+        self.useWideTiles()
+        counts = self.generator.compileInstanceCounts()
+        sizeLimit = estimate_compressed_size(5, int(numpy.sum(counts))) // 5
+
+        slabs = self.generator.planSlabs(sizeLimit)
+        self.assertGreater(len(slabs), 1)
+
+        covered = numpy.zeros(counts.shape, dtype=int)
+        for offsetX, offsetY, sizeX, sizeY in slabs:
+            covered[offsetX:offsetX + sizeX, offsetY:offsetY + sizeY] += 1
+            predicted = int(numpy.sum(
+                counts[offsetX:offsetX + sizeX, offsetY:offsetY + sizeY]
+            ))
+            if sizeX * sizeY > 1:
+                self.assertLessEqual(
+                    estimate_compressed_size(5, predicted),
+                    sizeLimit * PLANNING_MARGIN
+                )
+
+            # Prediction and generation read the same part of the maps
+            instances = self.generator.populatePart(
+                self.generator.terrainSettings,
+                self.generator.placeObjects,
+                [offsetX, offsetY],
+                [sizeX, sizeY]
+            )
+            self.assertEqual(len(instances), predicted)
+
+        self.assertTrue(numpy.all(covered == 1))
+
+    def test_encodeSlab(self):
+        self.useWideTiles()
+        size = [self.generator.x * 3, self.generator.y * 2]
+        instances = self.generator.populatePart(
+            self.generator.terrainSettings,
+            self.generator.placeObjects,
+            [0, 0],
+            size
+        )
+        expected = sorted(
+            (uuid, x, y, z, rot)
+            for uuid, positions in instances.items()
+            for x, y, z, rot in zip(*positions.tolist())
+        )
+
+        slabs = self.generator.encodeSlab(instances, [0, 0], size)
+        self.assertEqual(len(slabs), 1)
+        self.assertEqual(sorted(self.decodeSlab(slabs[0])), expected)
+
+        # Slab that does not fit is split, and pasted parts line up
+        sizeLimit = self.getCompressedSize(slabs[0]["output"]) // 3
+        slabs = self.generator.encodeSlab(instances, [0, 0], size, sizeLimit)
+        self.assertGreater(len(slabs), 2)
+        generated = []
+        for slab in slabs:
+            self.assertLessEqual(
+                self.getCompressedSize(slab["output"]),
+                sizeLimit
+            )
+            generated += self.decodeSlab(slab)
+        self.assertEqual(sorted(generated), expected)
+
+    def test_encodeSlabHeightAnchor(self):
+        self.useWideTiles()
+        self.generator.setUsePreciseHeight(True)
+        size = [self.generator.x * 3, self.generator.y * 2]
+        instances = self.generator.populatePart(
+            self.generator.terrainSettings,
+            self.generator.placeObjects,
+            [0, 0],
+            size
+        )
+        count = len(instances)
+        sizeLimit = self.getCompressedSize(
+            self.generator.encodeSlab(instances, [0, 0], size)[0]["output"]
+        ) // 3
+
+        slabs = self.generator.encodeSlab(instances, [0, 0], size, sizeLimit)
+        self.assertGreater(len(slabs), 2)
+        # Anchors go into the split parts, not into the generator buffer
+        self.assertIs(self.generator.instances, instances)
+        self.assertEqual(len(instances), count)
+
+        z = int(float(numpy.amin(self.generator.elevation)) * 100)
+        generated = 0
+        for slab in slabs:
+            decoded = list(ConversionManager.iterDecode(slab["output"]))
+            generated += len(decoded)
+            self.assertTrue(any(
+                x == PADDING * 100 and y == PADDING * 100 and height == z
+                for _, x, y, height, _ in decoded
+            ))
+        # Every slab after the first gets its own anchor
+        self.assertEqual(generated, count + len(slabs) - 1)
+
+    def test_generatePartitioned(self):
+        self.useWideTiles()
+        counts = self.generator.compileInstanceCounts()
+        sizeLimit = estimate_compressed_size(5, int(numpy.sum(counts))) // 4
+
+        slabs = self.generator.generatePartitioned(sizeLimit)
+        self.assertGreater(len(slabs), 1)
+
+        covered = numpy.zeros(counts.shape, dtype=int)
+        generated = 0
+        for slab in slabs:
+            covered[
+                slab["x"]:slab["x"] + slab["sizeX"],
+                slab["y"]:slab["y"] + slab["sizeY"]
+            ] += 1
+            self.assertLessEqual(
+                self.getCompressedSize(slab["output"]),
+                sizeLimit
+            )
+            generated += len(self.decodeSlab(slab))
+
+        self.assertTrue(numpy.all(covered == 1))
+        self.assertEqual(generated, int(numpy.sum(counts)))
+
+    def test_generatePlaceObjectWindows(self):
+        # Without random rotation and nudge, each block has to place
+        # exactly the objects of its part of the world
+        self.useWideTiles([
+            {
+                "asset": PROP_BUSH,
+                "density": 30,
+                "clumping": 3,
+                "randomRotationEnabled": False,
+                "randomNudgeEnabled": False
+            },
+            {
+                "asset": PROP_ROCK,
+                "density": 20,
+                "clumping": 8,
+                "randomRotationEnabled": False,
+                "randomNudgeEnabled": False
+            },
+        ])
+
+        world = ConversionManager.encodeInstances(self.populateWorld())
+        expected = sorted(
+            instance
+            for instance in ConversionManager.iterDecode(world.decode())
+            if instance[0].lower() in [PROP_BUSH, PROP_ROCK]
+        )
+
+        generated = []
+        for block in self.generator.generate():
+            props = [
+                instance
+                for instance in self.decodeSlab({
+                    "x": block["x"] * self.generator.x,
+                    "y": block["y"] * self.generator.y,
+                    "output": block["output"]
+                })
+                if instance[0].lower() in [PROP_BUSH, PROP_ROCK]
+            ]
+            self.assertGreater(len(props), 0)
+            generated += props
+
+        self.assertEqual(len(generated), len(expected))
+        self.assertEqual(sorted(generated), expected)
+
+    def referencePlaceObjectMap(self, sizeX, sizeY, settings):
+        # Place object map generated one point at a time
+        noiseMap = self.generator.noise.getRandomNoiseMap(
+                {
+                    "x": sizeX,
+                    "y": sizeY
+                },
+                {
+                    "x": numpy.random.randint(0, REALY_BIG_NUMBER),
+                    "y": numpy.random.randint(0, REALY_BIG_NUMBER)
+                },
+                settings["clumping"],
+                settings["randomNoiseWeight"],
+            )
+        elevation = self.generator.elevation
+        for x in range(0, sizeX):
+            for y in range(0, sizeY):
+                if settings["heightBasedMultiplier"] > 0:
+                    scaledX = math.floor(x / self.generator.tileSize)
+                    scaledY = math.floor(y / self.generator.tileSize)
+                    noiseMap[x][y] += elevation[scaledX][scaledY]
+                    noiseMap[x][y] *= settings["heightBasedMultiplier"]
+                    noiseMap[x][y] += settings["heightBasedOffset"]
+
+                if noiseMap[x][y] <= settings["density"]:
+                    noiseMap[x][y] = 1.0
+                else:
+                    noiseMap[x][y] = 0.0
+        return noiseMap == 1.0
+
+    def test_compilePlaceObjectNoiseMaps(self):
+        self.useWideTiles()
+        settingsList = [
+            PlaceObjectSettings(settings).getParam() for settings in [
+                {"asset": PROP_BUSH, "density": 30, "clumping": 3},
+                {
+                    "asset": PROP_ROCK,
+                    "density": 20,
+                    "clumping": 8,
+                    "heightBasedMultiplier": 0
+                },
+                {
+                    "asset": PROP_BUSH,
+                    "density": 45,
+                    "clumping": 1,
+                    "randomNoiseWeight": 0.2,
+                    "heightBasedMultiplier": 1.5,
+                    "heightBasedOffset": -4
+                },
+            ]
+        ]
+
+        numpy.random.seed(5)
+        expected = [
+            self.referencePlaceObjectMap(24, 20, settings)
+            for settings in settingsList
+        ]
+        numpy.random.seed(5)
+        generated = self.generator.compilePlaceObjectNoiseMaps(
+            24,
+            20,
+            settingsList
+        )
+
+        self.assertEqual(generated.dtype, bool)
+        self.assertTrue(numpy.array_equal(generated, numpy.array(expected)))
+
+    def referencePlaceObjects(self, offset, size):
+        # Place objects placed one hit at a time, random values are drawn
+        # for all hits of an object at once
+        generator = self.generator
+        tileSize = int(generator.tileSize)
+        generator.initializeOutput()
+        for position, placement in enumerate(generator.objectPlacements):
+            assetSettings = generator.placeObjects[position].getParam()
+            asset = generator.placeAssets[position]
+            hits = [
+                (x, y)
+                for x in range(0, size[0] * tileSize)
+                for y in range(0, size[1] * tileSize)
+                if placement["map"][
+                    x + offset[0] * tileSize
+                ][
+                    y + offset[1] * tileSize
+                ]
+            ]
+            if len(hits) == 0:
+                continue
+
+            rotations = [0] * len(hits)
+            if assetSettings["randomRotationEnabled"]:
+                rotations = numpy.random.randint(4, size=len(hits))*90
+            if assetSettings["randomNudgeEnabled"]:
+                nudges = numpy.random.randint(100, size=(len(hits), 2))
+                nudges = (nudges-50)/100
+
+            for hit, (x, y) in enumerate(hits):
+                scaledX = math.floor(x/generator.tileSize) + offset[0]
+                scaledY = math.floor(y/generator.tileSize) + offset[1]
+                placeHeight = generator.placeObjectZ[scaledX][scaledY]
+
+                newX = x
+                newY = y
+                newZ = placeHeight + assetSettings["verticalOffset"]
+                if assetSettings["placeOnCenter"]:
+                    newX += 0.5
+                    newY += 0.5
+                if assetSettings["randomNudgeEnabled"]:
+                    newX += nudges[hit][0]
+                    newY += nudges[hit][1]
+
+                generator.place(asset, newX, newY, newZ, rotations[hit])
+
+        return generator.instances
+
+    def test_populatePlaceObjects(self):
+        self.useWideTiles([
+            {"asset": PROP_BUSH, "density": 30, "clumping": 3},
+            {
+                "asset": PROP_ROCK,
+                "density": 20,
+                "clumping": 8,
+                "verticalOffset": -0.3,
+                "randomNudgeEnabled": False,
+                "randomRotationEnabled": False,
+                "placeOnCenter": False
+            },
+            {
+                "asset": PROP_ROCK,
+                "density": 25,
+                "clumping": 2,
+                "randomRotationEnabled": False
+            },
+        ])
+
+        for offset, size in [([0, 0], [6, 5]), ([6, 5], [12, 5])]:
+            numpy.random.seed(3)
+            expected = self.referencePlaceObjects(offset, size).asDict()
+
+            numpy.random.seed(3)
+            self.generator.initializeOutput()
+            self.generator.populatePlaceObjects(
+                self.generator.placeObjects,
+                offset,
+                size
+            )
+            self.assertGreater(len(self.generator.instances), 0)
+            self.assertEqual(self.generator.output, expected)
+
+    def referenceTerrainAsset(self, x, y, assetList):
+        # Terrain asset picked one tile at a time
+        generator = self.generator
+        if generator.settings["heightBasedPlacement"]:
+            height = int(generator.elevation[x][y]/generator.z*100)
+            settings = assetList[generator.elevationMap[height][0]].getParam()
+
+            if settings["blendHeightMultiplier"] > 0:
+                height += numpy.random.randint(
+                    low=-settings["blendHeightMultiplier"],
+                    high=settings["blendHeightMultiplier"])
+                height = max(min(100, height), 0)
+
+            return generator.elevationMap[height][0]
+
+        random = numpy.random.randint(generator.elevationMapSize-1)
+        placeAsset = ""
+        for item in generator.elevationMap:
+            if random >= item["probPrev"] and random < item["prob"]:
+                placeAsset = item["asset"]
+                break
+
+        for counter, asset in enumerate(generator.terrainAssets):
+            if asset.uuid == placeAsset:
+                return counter
+
+    def test_compileTerrainAssetGrid(self):
+        terrains = [
+            [
+                {"asset": TILE_SHORT, "density": 40},
+                {"asset": TILE_TALL, "density": 35},
+                {"asset": TILE_SHORT, "density": 5},
+                {"asset": TILE_TALLEST, "density": 20},
+            ],
+            [
+                {
+                    "asset": TILE_SHORT,
+                    "heightMax": 30,
+                    "blendHeightMultiplier": 5
+                },
+                {
+                    "asset": TILE_TALL,
+                    "heightMax": 45,
+                    "blendHeightMultiplier": 0
+                },
+                {
+                    "asset": TILE_TALLEST,
+                    "heightMax": 100,
+                    "blendHeightMultiplier": 8
+                },
+            ],
+        ]
+        for heightBased, terrain in zip([False, True], terrains):
+            self.generator.setUseHeightBasedTerrainAssetPlacement(heightBased)
+            self.pregenerate([3, 2], terrain=terrain)
+            sizeX = self.generator.x * 3
+            sizeY = self.generator.y * 2
+            settings = self.generator.terrainSettings
+
+            numpy.random.seed(7)
+            expected = numpy.zeros((sizeX, sizeY), dtype=int)
+            for x in range(sizeX):
+                for y in range(sizeY):
+                    expected[x][y] = self.referenceTerrainAsset(
+                        x, y, settings
+                    )
+
+            numpy.random.seed(7)
+            generated = self.generator.compileTerrainAssetGrid(
+                sizeX,
+                sizeY,
+                settings
+            )
+            self.assertEqual(len(numpy.unique(expected)), 3)
+            self.assertTrue(numpy.array_equal(generated, expected))
+
+    def referencePlaceCustom(self, asset, x, y, z, rot, instances):
+        # Complex asset placed one part at a time
+        coordinates = []
+        minimum = {
+            "x": REALY_BIG_NUMBER,
+            "y": REALY_BIG_NUMBER
+        }
+
+        for item in asset.getDecoded():
+            placeAsset = self.assets[item["uuid"].lower()]
+            for placement in item["instances"]:
+                newX, newY, newZ, angle = (
+                    self.generator.calculateNewCoordinates(
+                        placement,
+                        rot,
+                        placeAsset
+                    )
+                )
+
+                minimum["x"] = min(newX, minimum["x"])
+                minimum["y"] = min(newY, minimum["y"])
+
+                coordinates.append({
+                    "uuid": item["uuid"],
+                    "x": newX + x,
+                    "y": newY + y,
+                    "z": newZ + z,
+                    "rot": angle
+                })
+
+        for coord in coordinates:
+            self.generator.placeAsset(
+                coord["uuid"],
+                coord["x"] - minimum["x"],
+                coord["y"] - minimum["y"],
+                coord["z"],
+                coord["rot"],
+                instances
+            )
+
+    def test_placeCustom(self):
+        asset = CustomAsset({
+            "Name": "custom",
+            "String": ConversionManager.encode(json.dumps({
+                "unique_asset_count": len(CUSTOM_PARTS),
+                "asset_data": {
+                    uuid: {
+                        "uuid": uuid,
+                        "instance_count": len(instances),
+                        "instances": instances
+                    }
+                    for uuid, instances in CUSTOM_PARTS.items()
+                }
+            })).decode("ascii")
+        })
+
+        for rot in [0, 90, 180, 270, 360]:
+            expected = InstanceBuffer()
+            self.referencePlaceCustom(asset, 3.25, 7, 1.5, rot, expected)
+            generated = InstanceBuffer()
+            self.generator.placeCustom(asset, 3.25, 7, 1.5, rot, generated)
+            self.assertEqual(generated.asDict(), expected.asDict())
+
+        x = [0.5, 4, 9.75, 2, 6]
+        y = [1, 3.5, 0, 8.25, 6]
+        z = [0, 1.5, 3, 0.5, 2]
+        rot = [90, 0, 270, 90, 180]
+        expected = InstanceBuffer()
+        for position in range(len(x)):
+            self.referencePlaceCustom(
+                asset,
+                x[position],
+                y[position],
+                z[position],
+                rot[position],
+                expected
+            )
+        generated = InstanceBuffer()
+        self.generator.placeCustomMany(asset, x, y, z, rot, generated)
+        self.assertEqual(generated.asDict(), expected.asDict())
+
+    def test_setSeed(self):
+        directory = tempfile.TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+        cache = NoiseCache(directory.name, 1024)
+        self.generator.setWorkers(3)
+        self.generator.setNoiseCache(cache)
+        self.generator.setDtype("float32")
+        self.generator.setNoiseTolerance(0.01)
+
+        # Seed can be set after other noise settings
+        self.generator.setSeed(5)
+        noise = self.generator.noise
+        self.assertEqual(noise.octaves, (1, 0.5))
+        self.assertEqual(noise.scales, (1, 4))
+        self.assertEqual(noise.workers, 3)
+        self.assertIs(noise.cache, cache)
+        self.assertEqual(noise.dtype, numpy.float32)
+        self.assertEqual(noise.tolerance, 0.01)
+
+        x = numpy.linspace(-50.5, 70.25, 37)
+        y = numpy.linspace(13.75, -20.5, 37)
+        self.assertTrue(numpy.array_equal(
+            noise.noiseXYArray(x, y),
+            Noise(5).noiseXYArray(x, y)
+        ))
+
+        # Random stream is reseeded too
+        generated = numpy.random.randint(1000, size=8)
+        Noise(5)
+        self.assertTrue(numpy.array_equal(
+            generated,
+            numpy.random.randint(1000, size=8)
+        ))
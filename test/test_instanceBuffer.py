@@ -0,0 +1,101 @@
+import unittest
+import numpy
+
+from converter.instanceBuffer import InstanceBuffer
+
+
+class TestInstanceBuffer(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(self) -> None:
+        print("\nInstance buffer: ", end='')
+
+    def test_append(self):
+        buffer = InstanceBuffer()
+        for position in range(200):
+            buffer.append("a", position * 100.7, 550.0, -0.5, 90)
+        buffer.append("b", 1, 2, 3, 180)
+
+        self.assertEqual(len(buffer), 201)
+        self.assertEqual([uuid for uuid, _ in buffer.items()], ["a", "b"])
+
+        instances = buffer.getInstances("a")
+        self.assertEqual(instances.shape, (4, 200))
+        self.assertEqual(instances[:, 3].tolist(), [302, 550, 0, 90])
+        with self.assertRaises(ValueError):
+            instances[0, 0] = 1
+
+    def test_appendMany(self):
+        expected = InstanceBuffer()
+        generated = InstanceBuffer()
+        x = numpy.linspace(-10.5, 3000.25, 150)
+        y = numpy.arange(150) * 0.37
+        rot = numpy.arange(150) % 4 * 90
+
+        for instance in zip(x.tolist(), y.tolist(), rot.tolist()):
+            expected.append("a", instance[0], instance[1], 20.0, instance[2])
+        generated.appendMany("a", x[:10], y[:10], 20.0, rot[:10])
+        generated.appendMany("a", x[10:], y[10:], 20.0, rot[10:])
+        generated.appendMany("b", [], [], [], [])
+
+        self.assertTrue(numpy.array_equal(
+            generated.getInstances("a"),
+            expected.getInstances("a")
+        ))
+        self.assertNotIn("b", generated.assets)
+
+    def test_asDict(self):
+        data = {
+            "unique_asset_count": 2,
+            "asset_data": {
+                "a": {
+                    "uuid": "a",
+                    "instance_count": 2,
+                    "instances": [
+                        {"x": 100, "y": 200, "z": 0, "rot": 90},
+                        {"x": 150, "y": 250, "z": 75, "rot": 180}
+                    ]
+                },
+                "b": {
+                    "uuid": "b",
+                    "instance_count": 1,
+                    "instances": [
+                        {"x": 1, "y": 2, "z": 3, "rot": 0}
+                    ]
+                }
+            }
+        }
+
+        buffer = InstanceBuffer.fromDict(data)
+        self.assertEqual(buffer.asDict(), data)
+
+        view = buffer.asDict()
+        view["asset_data"]["a"]["instances"].clear()
+        self.assertEqual(buffer.asDict(), data)
+
+    def test_split(self):
+        buffer = InstanceBuffer()
+        buffer.appendMany("a", [500, 3499, 3500, 6400], 700, 0, 90)
+        buffer.appendMany("b", [600, 800], [100, 3600], 25, 0)
+
+        lower, upper = buffer.split(0, 3500, 3000)
+        self.assertEqual(len(lower) + len(upper), len(buffer))
+        self.assertEqual(lower.getInstances("a")[0].tolist(), [500, 3499])
+        self.assertEqual(upper.getInstances("a")[0].tolist(), [500, 3400])
+        self.assertEqual(lower.getInstances("b")[1].tolist(), [100, 3600])
+        self.assertNotIn("b", upper.assets)
+
+    def test_deduplicate(self):
+        buffer = InstanceBuffer()
+        buffer.appendMany(
+            "a", [100, 200, 100, 100, 200], 0, 0, [0, 0, 0, 90, 0]
+        )
+        buffer.append("b", 100, 0, 0, 0)
+
+        self.assertEqual(buffer.deduplicate(), 2)
+        self.assertEqual(len(buffer), 4)
+        self.assertEqual(
+            buffer.getInstances("a").T.tolist(),
+            [[100, 0, 0, 0], [200, 0, 0, 0], [100, 0, 0, 90]]
+        )
+        self.assertEqual(buffer.deduplicate(), 0)
@@ -0,0 +1,319 @@
+import os
+import tempfile
+import unittest
+from unittest import mock
+import numpy
+
+from generator.modifications import multiplyByValue, redistribute
+from generator.noise import Noise, generateOctavePass
+from generator.noiseCache import NoiseCache
+
+
+class TestNoise(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(self) -> None:
+        print("\nNoise: ", end='')
+
+    def setUp(self):
+        self.noise = Noise(2022)
+        self.noise.setOctaves(1, 0.5, 0.25)
+        self.noise.setScales(1, 2, 4)
+
+    def scalarNoiseArray(
+        self,
+        xSize,
+        ySize,
+        scaleX,
+        scaleY,
+        offset,
+    ):
+        expected = numpy.zeros((xSize, ySize))
+        for x in range(0, xSize):
+            for y in range(0, ySize):
+                expected[x][y] = self.noise.getNoiseXYValue(
+                    x + offset["x"],
+                    y + offset["y"],
+                    scaleX,
+                    scaleY
+                )
+        return expected
+
+    def test_noiseXYArray(self):
+        x = numpy.linspace(-700.5, 700.5, 211)
+        y = numpy.linspace(-300.25, 900.75, 211)
+        generated = self.noise.noiseXYArray(x, y)
+        for position in range(len(x)):
+            self.assertEqual(
+                generated[position],
+                self.noise.noiseXY(x[position], y[position])
+            )
+
+    def test_generateSimpleNoiseArray(self):
+        cases = [
+            (12, 17, 3.0, None, {"x": 0, "y": 0}),
+            (9, 5, 0.7, 2.5, {"x": -13, "y": 4}),
+            (20, 20, 64 / 3, None, {"x": 1234, "y": 19999}),
+        ]
+        for xSize, ySize, scaleX, scaleY, offset in cases:
+            generated = self.noise.generateSimpleNoiseArray(
+                xSize,
+                ySize,
+                scaleX,
+                scaleY,
+                offset=offset
+            )
+            expected = self.scalarNoiseArray(
+                xSize,
+                ySize,
+                scaleX,
+                scaleX if scaleY is None else scaleY,
+                offset
+            )
+            self.assertTrue(numpy.array_equal(generated, expected))
+
+    def test_getNoiseGridBlocks(self):
+        # Blocks of 2 rows and of part of a row
+        for blockSize in [30, 7]:
+            with mock.patch("generator.noise.BLOCK_SIZE", blockSize):
+                generated = self.noise.getNoiseGrid(
+                    {"x": -3, "y": 11},
+                    {"x": 1, "y": 1},
+                    (13, 15),
+                    2.5,
+                    4.0
+                )
+            expected = self.scalarNoiseArray(
+                13,
+                15,
+                2.5,
+                4.0,
+                {"x": -3, "y": 11}
+            )
+            self.assertTrue(numpy.array_equal(generated, expected))
+
+    def test_generateSimpleNoiseArrayRidge(self):
+        generated = self.noise.generateSimpleNoiseArray(
+            10,
+            10,
+            4.0,
+            offset={"x": 5, "y": 7},
+            useRidgeNoise=True
+        )
+        expected = 2 * (0.5 - abs(0.5 - self.scalarNoiseArray(
+            10,
+            10,
+            4.0,
+            4.0,
+            {"x": 5, "y": 7}
+        )))
+        self.assertTrue(numpy.array_equal(generated, expected))
+
+    def test_generateComplexNoiseArrayParallel(self):
+        expected = self.noise.generateComplexNoiseArray(
+            23,
+            17,
+            20,
+            offset={"x": 3, "y": -8},
+            useRidgeNoise=True
+        )
+        self.noise.setWorkers(7)
+        generated = self.noise.generateComplexNoiseArray(
+            23,
+            17,
+            20,
+            offset={"x": 3, "y": -8},
+            useRidgeNoise=True
+        )
+        self.assertTrue(numpy.array_equal(generated, expected))
+
+    def test_generateOctavePass(self):
+        self.noise.setDtype("float32")
+        expected = 0.5 * self.noise.generateSimpleNoiseArray(
+            11, 9, 3.0, offset={"x": 4, "y": -2}
+        )
+        # Worker gets settings instead of the noise generator
+        generated = generateOctavePass(
+            self.noise.getWorkerSettings(),
+            0.5,
+            {
+                "xSize": 11,
+                "ySize": 9,
+                "scaleX": 3.0,
+                "offset": {"x": 4, "y": -2}
+            }
+        )
+        self.assertEqual(generated.dtype, numpy.float32)
+        self.assertTrue(numpy.array_equal(generated, expected))
+
+    def test_generateChunkedNoiseArray(self):
+        expected = self.noise.generateComplexNoiseArray(
+            29,
+            31,
+            25,
+            offset={"x": -40, "y": 11}
+        )
+        generated = self.noise.generateChunkedNoiseArray(
+            29,
+            31,
+            25,
+            chunkSize=8,
+            offset={"x": -40, "y": 11}
+        )
+        self.assertTrue(numpy.array_equal(generated, expected))
+
+        self.noise.setWorkers(3)
+        generated = self.noise.generateChunkedNoiseArray(
+            29,
+            31,
+            25,
+            chunkSize=10,
+            offset={"x": -40, "y": 11}
+        )
+        self.assertTrue(numpy.array_equal(generated, expected))
+
+    def test_noiseCache(self):
+        with tempfile.TemporaryDirectory() as directory:
+            cache = NoiseCache(directory, 1024 * 1024)
+            expected = self.noise.generateComplexNoiseArray(16, 16, 16)
+
+            self.noise.setCache(cache)
+            generated = self.noise.generateComplexNoiseArray(16, 16, 16)
+            self.assertTrue(numpy.array_equal(generated, expected))
+            # One complex array and one array per octave
+            self.assertEqual(len(os.listdir(directory)), 4)
+
+            cached = self.noise.generateComplexNoiseArray(16, 16, 16)
+            self.assertIsInstance(cached, numpy.memmap)
+            self.assertTrue(numpy.array_equal(cached, expected))
+
+            # Modifying a cached array does not change the cache
+            cached *= 2.0
+            cached = self.noise.generateComplexNoiseArray(16, 16, 16)
+            self.assertTrue(numpy.array_equal(cached, expected))
+            del cached
+
+            # Different parameters are cached separately
+            ridge = self.noise.generateSimpleNoiseArray(
+                16, 16, 4.0, useRidgeNoise=True
+            )
+            self.assertFalse(numpy.array_equal(
+                ridge,
+                self.noise.generateSimpleNoiseArray(16, 16, 4.0)
+            ))
+
+    def test_noiseCacheEviction(self):
+        with tempfile.TemporaryDirectory() as directory:
+            arraySize = 16 * 16 * 8
+            cache = NoiseCache(directory, 2 * arraySize + 512)
+            self.noise.setCache(cache)
+            for offset in range(4):
+                self.noise.generateSimpleNoiseArray(
+                    16, 16, 4.0, offset={"x": offset, "y": 0}
+                )
+            self.assertEqual(len(os.listdir(directory)), 2)
+
+    def test_dtype(self):
+        expected = self.noise.generateComplexNoiseArray(
+            40,
+            40,
+            40,
+            useRidgeNoise=True
+        )
+        expectedMap = self.noise.getRandomNoiseMap(
+            {"x": 40, "y": 40}, {"x": 7, "y": 3}, 8, 0.5
+        )
+
+        self.noise.setDtype("float32")
+        self.noise.setSeed(self.noise.seed)
+        generated = self.noise.generateComplexNoiseArray(
+            40,
+            40,
+            40,
+            useRidgeNoise=True
+        )
+        generatedMap = self.noise.getRandomNoiseMap(
+            {"x": 40, "y": 40}, {"x": 7, "y": 3}, 8, 0.5
+        )
+        self.assertEqual(generated.dtype, numpy.float32)
+        self.assertEqual(generatedMap.dtype, numpy.float32)
+
+        # Seeded output is allowed to drift by float32 rounding only
+        self.assertLess(numpy.amax(numpy.abs(generated - expected)), 1e-6)
+        self.assertLess(numpy.amax(numpy.abs(generatedMap - expectedMap)), 1e-4)
+
+        # Placement maps may only flip where the value is at the threshold
+        for density in [10, 30, 50, 80]:
+            flipped = (generatedMap <= density) != (expectedMap <= density)
+            self.assertTrue(numpy.all(
+                numpy.abs(expectedMap[flipped] - density) < 1e-4
+            ))
+
+        redistribute(generated, 1.5)
+        multiplyByValue(generated, 30)
+        self.assertEqual(generated.dtype, numpy.float32)
+        redistribute(expected, 1.5)
+        multiplyByValue(expected, 30)
+        self.assertLess(numpy.amax(numpy.abs(generated - expected)), 1e-4)
+
+    def test_getLatticeStep(self):
+        self.assertEqual(self.noise.getLatticeStep(100.0), 1)
+        self.assertEqual(self.noise.getLatticeStep(100.0, 0.01), 10)
+        self.assertEqual(self.noise.getLatticeStep(5.0, 0.01), 1)
+
+    def test_tolerance(self):
+        expected = self.noise.generateComplexNoiseArray(
+            90,
+            70,
+            200,
+            offset={"x": -33, "y": 18}
+        )
+        self.noise.setTolerance(0.005)
+        generated = self.noise.generateComplexNoiseArray(
+            90,
+            70,
+            200,
+            offset={"x": -33, "y": 18}
+        )
+        self.assertFalse(numpy.array_equal(generated, expected))
+        self.assertLess(numpy.amax(numpy.abs(generated - expected)), 0.005)
+
+        # Lattice is aligned, so chunks are still seamless
+        chunked = self.noise.generateChunkedNoiseArray(
+            90,
+            70,
+            200,
+            chunkSize=16,
+            offset={"x": -33, "y": 18}
+        )
+        self.assertTrue(numpy.array_equal(chunked, generated))
+
+    def test_getRandomNoiseMaps(self):
+        sizes = {"x": 30, "y": 20}
+        clumpings = [16, 1, 3.5]
+        randomWeights = [0.8, 0.3, 1]
+
+        expected = []
+        for layer, clumping in enumerate(clumpings):
+            offset = {
+                "x": numpy.random.randint(0, 20000),
+                "y": numpy.random.randint(0, 20000)
+            }
+            expected.append(self.noise.getRandomNoiseMap(
+                sizes, offset, clumping, randomWeights[layer]
+            ))
+
+        self.noise.setSeed(self.noise.seed)
+        generated = self.noise.getRandomNoiseMaps(
+            sizes, clumpings, randomWeights, 20000
+        )
+        self.assertEqual(generated.shape, (3, 30, 20))
+        self.assertTrue(numpy.array_equal(generated, numpy.array(expected)))
+
+        # Random values drawn in blocks follow the same stream
+        self.noise.setSeed(self.noise.seed)
+        with mock.patch("generator.noise.BLOCK_SIZE", 50):
+            blocked = self.noise.getRandomNoiseMaps(
+                sizes, clumpings, randomWeights, 20000
+            )
+        self.assertTrue(numpy.array_equal(blocked, generated))
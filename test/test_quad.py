@@ -21,6 +21,12 @@ class TestQuad(unittest.TestCase):
             "0, 0.25, 0.5, 1"
         )
 
+    def test_sqlParameters(self):
+        self.assertEqual(
+            self.quad.SqlParameters(),
+            (0, 0.25, 0.5, 1)
+        )
+
     def test_sqlFieldNames(self):
         self.assertEqual(
             Quad.SqlFieldNames(),
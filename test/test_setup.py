@@ -0,0 +1,115 @@
+import io
+import os
+import sqlite3
+import tempfile
+import unittest
+from contextlib import redirect_stdout
+
+from database.database import Database
+from objects.asset import Asset
+from objects.tile import Tile
+from setup.setup import importRows
+
+
+class CountingDatabase(Database):
+    """
+    Database that counts committed transactions.
+    """
+
+    def __init__(self, database):
+        Database.__init__(self, database)
+        self.commits = 0
+
+    def execute(self, query, parameters=()):
+        self.commits += 1
+        Database.execute(self, query, parameters)
+
+    def executeMany(self, query, parameters, commit=True):
+        self.commits += int(commit)
+        Database.executeMany(self, query, parameters, commit)
+
+    def commit(self):
+        self.commits += 1
+        Database.commit(self)
+
+
+def createRow(number, name=None):
+    return Tile({
+        "UUID": f"00000000-0000-4000-8000-{number:012d}",
+        "Name": name if name is not None else f"Tile {number}",
+        "String": ""
+    }).SqlParameters()
+
+
+class TestSetup(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(self) -> None:
+        print("\nSetup: ", end='')
+
+    def setUp(self):
+        directory = tempfile.TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+        self.addCleanup(Database.closeConnections)
+
+        self.database = CountingDatabase(
+            os.path.join(directory.name, "test.db")
+        )
+        self.database.execute(Asset.SqlCreateTable())
+        self.database.commits = 0
+        self.pragmas = self.getPragmas()
+
+    def getPragmas(self):
+        return {
+            name: self.database.fetchall(f"PRAGMA {name};")[0][0]
+            for name in ["journal_mode", "synchronous", "cache_size"]
+        }
+
+    def importRows(self, rows):
+        output = io.StringIO()
+        with redirect_stdout(output):
+            importRows(self.database, rows)
+        return output.getvalue().splitlines()
+
+    def test_importRows(self):
+        rows = [createRow(number) for number in range(2001)]
+        rows.append(createRow(2001, """Wizard's "Tower"; --"""))
+
+        progress = self.importRows(rows)
+
+        self.assertEqual(progress, [
+            "----1000/2002 assets",
+            "----2000/2002 assets",
+            "----2002/2002 assets",
+        ])
+        self.assertEqual(self.database.commits, 1)
+        self.assertEqual(
+            self.database.fetchall("SELECT COUNT(*) FROM Assets;"),
+            [(2002,)]
+        )
+        self.assertEqual(
+            self.database.fetchall(
+                "SELECT Name FROM Assets WHERE UUID = ?;",
+                (rows[-1][0],)
+            ),
+            [("""Wizard's "Tower"; --""",)]
+        )
+        self.assertEqual(self.getPragmas(), self.pragmas)
+
+    def test_importRowsFailure(self):
+        self.assertEqual(self.pragmas["journal_mode"], "delete")
+        self.assertEqual(self.pragmas["synchronous"], 2)
+
+        rows = [createRow(number) for number in range(1500)]
+        rows.append(createRow(3))
+
+        with self.assertRaises(sqlite3.IntegrityError):
+            self.importRows(rows)
+
+        self.assertEqual(self.database.commits, 0)
+        self.assertFalse(self.database.connection.in_transaction)
+        self.assertEqual(self.getPragmas(), self.pragmas)
+        self.assertEqual(
+            self.database.fetchall("SELECT COUNT(*) FROM Assets;"),
+            [(0,)]
+        )
@@ -54,3 +54,21 @@ class TestTile(unittest.TestCase):
             expected,
             self.tile.SqlValues()
         )
+
+    def test_SqlParameters(self):
+        expected = (
+            "32cfd208-c363-4434-b817-8ba59faeed17",
+            "Tile",
+            "Castle Floor 1",
+            "Castle01_floor_1x1_low",
+            "",
+            0.5, 0.5, 0.5, 0,
+            0, 0, 0, 1,
+            1, 1, 1, 0,
+            0.5, 0.25, 0.5, 0,
+            0.5, 0.25, 0.5, 0
+        )
+        self.assertEqual(
+            expected,
+            self.tile.SqlParameters()
+        )